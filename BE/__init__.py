@@ -7,7 +7,4 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# 서브패키지 import
-import BE.function
-import BE.settings
-import BE.log
+# 서브패키지는 여기서 불러오지 않음 (필요한 모듈만 불러오도록 시작 시간과 GUI/win32 의존을 줄임)
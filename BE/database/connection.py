@@ -3,6 +3,9 @@ from pathlib import Path
 import logging
 from typing import Optional
 
+# 스키마 버전 (PRAGMA user_version), 테이블을 추가하거나 바꾸면 올림
+SCHEMA_VERSION = 1
+
 class DatabaseConnection:
     _instance: Optional['DatabaseConnection'] = None
     
@@ -31,10 +34,17 @@ class DatabaseConnection:
             self.connection = None
             
     def initialize_database(self):
-        """DB 스키마를 초기화합니다."""
+        """DB 스키마를 초기화합니다.
+
+        스키마 버전이 이미 최신이면 테이블 생성과 커밋(디스크 동기화)을 건너뜁니다.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
         try:
             # logic_data 테이블 생성
             cursor.execute("""
@@ -62,6 +72,22 @@ class DatabaseConnection:
                 )
             """)
             
+            # template_pyramids 테이블 생성 (이미지 서치 템플릿 전처리 결과)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS template_pyramids (
+                    template_key TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    level INTEGER NOT NULL,
+                    scale REAL NOT NULL,
+                    width INTEGER NOT NULL,
+                    height INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (template_key, kind, level)
+                )
+            """)
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
             logging.info("Database initialized successfully")
             
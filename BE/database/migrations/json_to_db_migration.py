@@ -16,13 +16,17 @@ class JsonToDbMigration:
         
     def should_migrate(self) -> bool:
         """마이그레이션이 필요한지 확인"""
-        cursor = self.db.get_connection().cursor()
-        
-        # logic_data 테이블의 레코드 수 확인
-        cursor.execute("SELECT COUNT(*) FROM logic_data")
-        count = cursor.fetchone()[0]
+        # 옮길 JSON 파일이 없으면 DB를 조회하지 않음
+        if not self.json_file_path.exists():
+            return False
         
-        return count == 0  # 테이블이 비어있으면 마이그레이션 필요
+        return self.is_db_empty()  # 테이블이 비어있으면 마이그레이션 필요
+    
+    def is_db_empty(self) -> bool:
+        """logic_data 테이블이 비어있는지 확인 (전체 행을 세지 않고 첫 행만 확인)"""
+        cursor = self.db.get_connection().cursor()
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM logic_data LIMIT 1)")
+        return cursor.fetchone()[0] == 0
         
     def migrate(self) -> tuple[bool, str]:
         """JSON 파일의 데이터를 DB로 마이그레이션
@@ -108,9 +112,7 @@ class JsonToDbMigration:
         key_input_delays_path = Path("BE") / "settings" / "setting files" / "key_input_delays_data.json"
         
         # DB가 비어있는지 확인
-        cursor = self.db.get_connection().cursor()
-        cursor.execute("SELECT COUNT(*) FROM logic_data")
-        is_db_empty = cursor.fetchone()[0] == 0
+        is_db_empty = self.is_db_empty()
         
         message = "기존 JSON 데이터를 DB로 마이그레이션하시겠습니까?"
         
@@ -1,8 +1,2 @@
 # function 패키지 초기화
-from BE.function import main_window
-from BE.function import make_logic
-from BE.function.make_logic import repository_and_service
-from BE.function import execute_logic
-from BE.function import etc_function
-from BE.function import constants
-from BE.function import _common_components 
\ No newline at end of file
+# 하위 모듈은 사용하는 곳에서 직접 불러옴 (main_window 등 GUI 모듈을 패키지와 함께 불러오지 않음)
@@ -0,0 +1,219 @@
+import os
+import queue
+import threading
+from BE.function._common_components.lazy_import import lazy_import
+from BE.log.base_log_manager import BaseLogManager
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+
+class DebugCaptureWriter:
+    """디버그 캡처 이미지 비동기 저장기 (싱글톤)
+
+    캡처 경로에서 PNG 인코딩과 파일 쓰기를 하지 않도록, 샘플링된 프레임만 복사하여
+    크기가 제한된 큐에 넣고 백그라운드 스레드가 저장합니다.
+    큐가 가득 차면 새 프레임은 버려지므로 캡처 경로가 디스크 속도에 막히지 않습니다.
+
+    샘플링 모드:
+        off: 저장하지 않음 (기본값)
+        every_n: N번째 프레임마다 저장
+        on_failure: 매칭 실패 등 failed=True로 제출된 프레임만 저장
+
+    디렉토리별 디스크 사용량이 max_bytes를 넘으면 오래된 파일부터 삭제합니다.
+    """
+
+    MODE_OFF = "off"
+    MODE_EVERY_N = "every_n"
+    MODE_ON_FAILURE = "on_failure"
+    MODES = (MODE_OFF, MODE_EVERY_N, MODE_ON_FAILURE)
+
+    DEFAULT_EVERY_N = 30
+    DEFAULT_MAX_QUEUE = 16
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 디렉토리당 50MB
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if DebugCaptureWriter._instance is not None:
+            raise RuntimeError("DebugCaptureWriter는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self.mode = self.MODE_OFF
+        self.every_n = self.DEFAULT_EVERY_N
+        self.max_bytes = self.DEFAULT_MAX_BYTES
+        self._queue = queue.Queue(maxsize=self.DEFAULT_MAX_QUEUE)
+        self._frame_count = 0
+        self._directory_sizes = {}  # 디렉토리 -> 현재 사용량 (bytes), 작업 스레드에서만 사용
+        self._lock = threading.Lock()
+        self._worker = None
+
+        # 지표
+        self._metrics = {'submitted': 0, 'sampled_out': 0, 'dropped': 0, 'written': 0, 'failed': 0, 'evicted': 0}
+
+    def configure(self, mode=None, every_n=None, max_bytes=None):
+        """샘플링과 디스크 사용량 제한을 설정합니다.
+
+        Args:
+            mode (str, optional): 샘플링 모드 ("off", "every_n", "on_failure")
+            every_n (int, optional): every_n 모드에서 저장할 프레임 간격
+            max_bytes (int, optional): 디렉토리별 최대 디스크 사용량 (bytes)
+        """
+        if mode is not None:
+            if mode not in self.MODES:
+                raise ValueError(f"지원하지 않는 샘플링 모드입니다: {mode}")
+            self.mode = mode
+        if every_n is not None:
+            self.every_n = max(int(every_n), 1)
+        if max_bytes is not None:
+            self.max_bytes = int(max_bytes)
+
+    @property
+    def enabled(self):
+        """저장이 켜져 있는지 여부"""
+        return self.mode != self.MODE_OFF
+
+    def submit(self, image, path, failed=False):
+        """디버그 이미지 저장을 요청합니다.
+
+        샘플링 조건을 통과한 경우에만 이미지를 복사하여 큐에 넣으므로,
+        저장하지 않는 프레임은 복사 비용도 들지 않습니다.
+
+        Args:
+            image (np.ndarray): 저장할 이미지 (BGR/BGRA, 캡처 버퍼의 뷰여도 됨)
+            path (str): 저장할 PNG 경로
+            failed (bool): 매칭 실패 등 문제 상황의 프레임인지 여부
+
+        Returns:
+            bool: 저장 큐에 들어갔으면 True
+        """
+        if self.mode == self.MODE_OFF or image is None:
+            return False
+
+        with self._lock:
+            self._metrics['submitted'] += 1
+            self._frame_count += 1
+            if self.mode == self.MODE_EVERY_N:
+                sampled = self._frame_count % self.every_n == 0
+            else:
+                sampled = failed
+            if not sampled:
+                self._metrics['sampled_out'] += 1
+                return False
+
+            self._ensure_worker()
+            try:
+                self._queue.put_nowait((np.array(image, copy=True), path))
+            except queue.Full:
+                self._metrics['dropped'] += 1
+                return False
+        return True
+
+    def get_metrics(self):
+        """저장 지표를 반환합니다.
+
+        Returns:
+            dict: {'mode', 'submitted', 'sampled_out', 'dropped', 'written', 'failed', 'evicted', 'queued'}
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['queued'] = self._queue.qsize()
+        metrics['mode'] = self.mode
+        return metrics
+
+    def flush(self, timeout=None):
+        """큐에 남은 이미지를 모두 저장할 때까지 기다립니다 (테스트/종료용).
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 모두 저장되었으면 True
+        """
+        done = threading.Event()
+
+        def wait_queue():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait_queue, daemon=True).start()
+        return done.wait(timeout)
+
+    def _ensure_worker(self):
+        """저장 스레드가 없으면 시작합니다. (_lock 보유 상태에서 호출)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="DebugCaptureWriter", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """저장 스레드 루프"""
+        while True:
+            image, path = self._queue.get()
+            try:
+                self._write(image, path)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, image, path):
+        """PNG로 인코딩하여 저장하고 디스크 사용량 제한을 적용합니다."""
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+
+            # 한글 경로도 저장할 수 있도록 imencode 후 직접 쓰기
+            success, encoded = cv2.imencode('.png', image)
+            if not success:
+                raise ValueError("PNG 인코딩 실패")
+            # 같은 이름의 파일을 덮어쓰는 경우 기존 크기는 사용량에서 제외
+            replaced_bytes = os.path.getsize(path) if os.path.exists(path) else 0
+            encoded.tofile(path)
+
+            with self._lock:
+                self._metrics['written'] += 1
+            self._enforce_budget(directory, encoded.size - replaced_bytes)
+        except Exception as e:
+            with self._lock:
+                self._metrics['failed'] += 1
+            self.base_log_manager.log(
+                message=f"디버그 이미지 저장 실패: {path} - {e}",
+                level="ERROR",
+                file_name="debug_capture_writer",
+                method_name="_write",
+                print_to_terminal=True
+            )
+
+    def _enforce_budget(self, directory, written_bytes):
+        """디렉토리 사용량이 제한을 넘으면 오래된 PNG 파일부터 삭제합니다."""
+        used = self._directory_sizes.get(directory)
+        if used is None:
+            used = sum(entry.stat().st_size for entry in os.scandir(directory)
+                       if entry.is_file() and entry.name.endswith('.png'))
+        else:
+            used += written_bytes
+
+        if used > self.max_bytes:
+            entries = sorted(
+                (entry for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith('.png')),
+                key=lambda entry: entry.stat().st_mtime
+            )
+            for entry in entries:
+                if used <= self.max_bytes:
+                    break
+                try:
+                    size = entry.stat().st_size
+                    os.remove(entry.path)
+                    used -= size
+                    with self._lock:
+                        self._metrics['evicted'] += 1
+                except OSError:
+                    continue
+
+        self._directory_sizes[directory] = used
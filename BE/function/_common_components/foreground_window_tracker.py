@@ -0,0 +1,315 @@
+import sys
+from PySide6.QtCore import QObject, Signal, QTimer
+from BE.function._common_components.win_event_hook import (
+    WinEventHook, EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_NAMECHANGE, OBJID_WINDOW
+)
+from BE.log.base_log_manager import BaseLogManager
+
+
+def query_foreground_process():
+    """현재 포그라운드 창의 프로세스 정보를 직접 조회합니다.
+
+    GetForegroundWindow, GetWindowThreadProcessId, GetWindowText를 호출하므로
+    트래커 백엔드에서만 사용하고, 일반 호출자는 ForegroundWindowTracker의 캐시를 읽습니다.
+
+    Returns:
+        dict: 프로세스 정보 딕셔너리 ('pid', 'name', 'title', 'hwnd' 키 포함)
+             창이 없거나 제목이 없으면 None 반환
+    """
+    import win32gui
+    import win32process
+
+    hwnd = win32gui.GetForegroundWindow()
+    if not hwnd:
+        return None
+
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    window_title = win32gui.GetWindowText(hwnd)
+
+    if not window_title:  # 창 제목이 없는 경우
+        return None
+
+    return {
+        'pid': pid,
+        'title': window_title,
+        'hwnd': hwnd,
+        'name': window_title
+    }
+
+
+class ForegroundWindowBackend:
+    """포그라운드 창 변경 감지 백엔드 기본 클래스
+
+    백엔드는 포그라운드 창이 바뀌었을 가능성이 있을 때 on_change 콜백을 호출하고,
+    query()로 현재 포그라운드 프로세스 정보를 제공합니다.
+    """
+
+    def start(self, on_change):
+        """변경 감지를 시작합니다.
+
+        Args:
+            on_change (callable): 포그라운드 창이 바뀌었을 때 호출할 콜백
+
+        Returns:
+            bool: 시작 성공 여부
+        """
+        raise NotImplementedError
+
+    def stop(self):
+        """변경 감지를 중지합니다."""
+        raise NotImplementedError
+
+    def query(self):
+        """현재 포그라운드 프로세스 정보를 반환합니다."""
+        raise NotImplementedError
+
+
+class WinEventForegroundBackend(ForegroundWindowBackend):
+    """SetWinEventHook(EVENT_SYSTEM_FOREGROUND) 기반 백엔드
+
+    WINEVENT_OUTOFCONTEXT 훅은 훅을 설치한 스레드의 메시지 루프에서 콜백되므로
+    Qt 메인 스레드에서 start()를 호출해야 합니다.
+    포그라운드 창의 제목 변경(EVENT_OBJECT_NAMECHANGE)도 함께 감지하되, 모든 프로세스의
+    이름 변경(툴팁, 목록 항목 등)이 콜백되지 않도록 포그라운드 창의 프로세스에만 훅을 설치하고
+    포그라운드 창이 바뀔 때마다 다시 설치합니다.
+    """
+
+    def __init__(self):
+        self._win_event_hook = None
+        self._on_change = None
+        self._foreground_hwnd = None
+        self._name_change_pid = None  # 제목 변경 훅을 설치한 프로세스 ID
+
+    def start(self, on_change):
+        def on_win_event(event, hwnd, idObject, idChild):
+            if event == EVENT_SYSTEM_FOREGROUND:
+                self._foreground_hwnd = hwnd
+                self._watch_name_changes(hwnd)
+                self._on_change()
+            elif idObject == OBJID_WINDOW and hwnd and hwnd == self._foreground_hwnd:
+                # 포그라운드 창의 제목이 바뀐 경우에만 갱신
+                self._on_change()
+
+        self._on_change = on_change
+        self._win_event_hook = WinEventHook(on_win_event)
+
+        if not self._win_event_hook.install(EVENT_SYSTEM_FOREGROUND):
+            self.stop()
+            return False
+
+        self._foreground_hwnd = self._win_event_hook.get_foreground_window()
+        self._watch_name_changes(self._foreground_hwnd)
+        return True
+
+    def stop(self):
+        if self._win_event_hook:
+            self._win_event_hook.uninstall_all()
+            self._win_event_hook = None
+        self._on_change = None
+        self._name_change_pid = None
+
+    def query(self):
+        return query_foreground_process()
+
+    def _watch_name_changes(self, hwnd):
+        """제목 변경 훅을 포그라운드 창의 프로세스로 옮깁니다.
+
+        설치에 실패하면 제목 변경만 감지하지 못하고, 포그라운드 변경 감지는 그대로 동작합니다.
+        """
+        pid = self._win_event_hook.get_window_pid(hwnd) if hwnd else 0
+        if pid == self._name_change_pid:
+            return
+        if self._name_change_pid:
+            self._win_event_hook.uninstall(EVENT_OBJECT_NAMECHANGE, self._name_change_pid)
+        self._name_change_pid = None
+        if pid and self._win_event_hook.install(EVENT_OBJECT_NAMECHANGE, pid):
+            self._name_change_pid = pid
+
+
+class PollingForegroundBackend(ForegroundWindowBackend):
+    """QTimer 폴링 기반 백엔드 (WinEvent 훅 설치 실패 시 대체 수단)"""
+
+    def __init__(self, interval_ms=100):
+        self.interval_ms = interval_ms
+        self._timer = None
+
+    def start(self, on_change):
+        self._timer = QTimer()
+        self._timer.timeout.connect(on_change)
+        self._timer.start(self.interval_ms)
+        return True
+
+    def stop(self):
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+
+    def query(self):
+        return query_foreground_process()
+
+
+class FakeForegroundBackend(ForegroundWindowBackend):
+    """테스트용 가짜 백엔드
+
+    Windows API 없이 set_foreground()로 포그라운드 프로세스를 직접 지정합니다.
+    Windows 이외의 플랫폼에서는 기본 백엔드로 사용됩니다.
+    """
+
+    def __init__(self, process_info=None):
+        self._process_info = process_info
+        self._on_change = None
+
+    def start(self, on_change):
+        self._on_change = on_change
+        return True
+
+    def stop(self):
+        self._on_change = None
+
+    def query(self):
+        return self._process_info
+
+    def set_foreground(self, process_info):
+        """포그라운드 프로세스를 변경하고 변경 이벤트를 발생시킵니다.
+
+        Args:
+            process_info (dict): 새 포그라운드 프로세스 정보 (없으면 None)
+        """
+        self._process_info = process_info
+        if self._on_change:
+            self._on_change()
+
+
+class ForegroundWindowTracker(QObject):
+    """포그라운드 창 추적기 (싱글톤)
+
+    포그라운드 창 변경 이벤트가 올 때만 활성 프로세스 정보를 갱신하여 캐시하므로
+    active_process 조회는 시스템 호출 없이 속성 읽기만으로 끝납니다.
+    활성 프로세스가 바뀌면 active_process_changed 시그널을 발생시킵니다.
+    """
+
+    active_process_changed = Signal(object)  # 활성 프로세스 변경 시그널 (dict 또는 None)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다. 처음 호출될 때 추적을 시작합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.start()
+        return cls._instance
+
+    def __init__(self, backend=None):
+        """초기화
+
+        Args:
+            backend (ForegroundWindowBackend, optional): 사용할 백엔드.
+                None이면 플랫폼에 맞는 기본 백엔드를 사용합니다.
+        """
+        if ForegroundWindowTracker._instance is not None:
+            raise RuntimeError("ForegroundWindowTracker는 싱글톤입니다. instance()를 사용하세요.")
+
+        super().__init__()
+        self.base_log_manager = BaseLogManager.instance()
+        self._backend = backend
+        self._active_process = None
+        self._is_running = False
+
+    @property
+    def active_process(self):
+        """캐시된 활성 프로세스 정보 ('pid', 'name', 'title', 'hwnd' 키 포함, 없으면 None)"""
+        return self._active_process
+
+    @property
+    def backend(self):
+        """현재 사용 중인 백엔드"""
+        return self._backend
+
+    def start(self):
+        """포그라운드 창 추적을 시작합니다."""
+        if self._is_running:
+            return
+
+        if self._backend is None:
+            self._backend = self._create_default_backend()
+        elif not self._backend.start(self.refresh):
+            self.base_log_manager.log(
+                message=f"{type(self._backend).__name__} 시작 실패 - 폴링 방식으로 전환합니다",
+                level="WARNING",
+                file_name="foreground_window_tracker",
+                method_name="start"
+            )
+            self._backend = PollingForegroundBackend()
+            self._backend.start(self.refresh)
+
+        self._is_running = True
+        self.refresh()
+
+    def stop(self):
+        """포그라운드 창 추적을 중지합니다."""
+        if self._is_running and self._backend:
+            self._backend.stop()
+        self._is_running = False
+
+    def set_backend(self, backend):
+        """백엔드를 교체합니다. 추적 중이었다면 새 백엔드로 다시 시작합니다.
+
+        Args:
+            backend (ForegroundWindowBackend): 새 백엔드
+        """
+        was_running = self._is_running
+        self.stop()
+        self._backend = backend
+        if was_running:
+            self.start()
+
+    def refresh(self):
+        """백엔드에서 활성 프로세스를 다시 읽고, 바뀐 경우 시그널을 발생시킵니다."""
+        try:
+            process = self._backend.query()
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"활성 프로세스 정보 가져오기 실패: {e}",
+                level="ERROR",
+                file_name="foreground_window_tracker",
+                method_name="refresh",
+                print_to_terminal=True
+            )
+            process = None
+
+        if process == self._active_process:
+            return
+
+        self._active_process = process
+        self.active_process_changed.emit(process)
+
+    def _create_default_backend(self):
+        """플랫폼에 맞는 기본 백엔드를 생성하고 시작합니다."""
+        if sys.platform != 'win32':
+            backend = FakeForegroundBackend()
+            backend.start(self.refresh)
+            return backend
+
+        backend = WinEventForegroundBackend()
+        try:
+            if backend.start(self.refresh):
+                return backend
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"WinEvent 훅 설치 중 오류 발생: {e}",
+                level="ERROR",
+                file_name="foreground_window_tracker",
+                method_name="_create_default_backend",
+                print_to_terminal=True
+            )
+
+        self.base_log_manager.log(
+            message="WinEvent 훅을 설치할 수 없어 폴링 방식으로 전환합니다",
+            level="WARNING",
+            file_name="foreground_window_tracker",
+            method_name="_create_default_backend"
+        )
+        backend = PollingForegroundBackend()
+        backend.start(self.refresh)
+        return backend
@@ -0,0 +1,445 @@
+import os
+import time
+import zlib
+import threading
+from collections import OrderedDict
+from BE.function._common_components.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+# 기본 일치 임계값 (TM_CCOEFF_NORMED 점수, 0 ~ 1)
+DEFAULT_MATCH_THRESHOLD = 0.9
+
+# 템플릿 피라미드 기본 배율
+DEFAULT_PYRAMID_SCALES = (1.0, 0.75, 0.5)
+
+# 윤곽선 맵 Canny 임계값 (낮은 값, 높은 값)
+EDGE_THRESHOLDS = (50, 150)
+
+
+class MatchResult:
+    """템플릿 매칭 결과
+
+    Attributes:
+        found (bool): 점수가 임계값 이상인지 여부
+        score (float): 최고 일치 점수
+        location (tuple): 최고 일치 위치 (ROI 기준 좌상단 x, y)
+        size (tuple): 템플릿 크기 (width, height)
+        elapsed_ms (float): 매칭에 걸린 시간 (밀리초)
+        cached (bool): 영역이 바뀌지 않아 매칭을 건너뛰고 이전 결과를 재사용했는지 여부
+    """
+
+    def __init__(self, found, score, location, size, elapsed_ms, cached=False):
+        self.found = found
+        self.score = score
+        self.location = location
+        self.size = size
+        self.elapsed_ms = elapsed_ms
+        self.cached = cached  # 영역이 바뀌지 않아 이전 결과를 재사용했는지 여부
+
+    @property
+    def center(self):
+        """일치 영역의 중심 좌표 (ROI 기준 x, y)"""
+        return (self.location[0] + self.size[0] // 2, self.location[1] + self.size[1] // 2)
+
+
+def to_gray(image):
+    """BGR/BGRA 이미지를 매칭용 그레이스케일 이미지로 변환합니다.
+
+    채널 수를 줄여 matchTemplate 연산량을 1/3로 줄입니다.
+    """
+    if image.ndim == 2:
+        gray = image
+    elif image.shape[2] == 4:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    else:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return np.ascontiguousarray(gray)
+
+
+def match_template(frame, template, threshold=DEFAULT_MATCH_THRESHOLD):
+    """ROI 이미지에서 템플릿을 찾습니다.
+
+    Args:
+        frame (np.ndarray): 캡처한 ROI 이미지 (BGR, BGRA 또는 그레이스케일)
+        template (np.ndarray): 찾을 템플릿 이미지 (그레이스케일 권장, load_template 결과)
+        threshold (float): 일치로 판단할 최소 점수
+
+    Returns:
+        MatchResult: 매칭 결과. 템플릿이 ROI보다 크면 found=False, score=0.0
+    """
+    start = time.perf_counter()
+    frame = to_gray(frame)
+    template = to_gray(template)
+    height, width = template.shape[:2]
+
+    if frame.shape[0] < height or frame.shape[1] < width:
+        return MatchResult(False, 0.0, (0, 0), (width, height), (time.perf_counter() - start) * 1000)
+
+    scores = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+    _, max_score, _, max_location = cv2.minMaxLoc(scores)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return MatchResult(max_score >= threshold, float(max_score), max_location, (width, height), elapsed_ms)
+
+
+_template_cache = {}  # 경로 -> (수정 시각, 그레이스케일 템플릿)
+
+
+class TemplatePyramid:
+    """미리 전처리한 템플릿 (배율별 그레이스케일과 선택적 윤곽선 맵)
+
+    Attributes:
+        key (str): 템플릿 식별자 (원본 이미지 내용 해시)
+        levels (list): [(배율, 그레이스케일 이미지, 윤곽선 맵 또는 None), ...] - 배율 1.0이 처음
+        nbytes (int): 전체 이미지 메모리 크기 (bytes)
+    """
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.levels = levels
+        self.nbytes = sum(gray.nbytes + (edges.nbytes if edges is not None else 0)
+                          for _, gray, edges in levels)
+
+    @property
+    def has_edges(self):
+        """윤곽선 맵이 있는지 여부"""
+        return all(edges is not None for _, _, edges in self.levels)
+
+
+def edge_map(gray):
+    """그레이스케일 이미지의 윤곽선 맵을 계산합니다."""
+    return cv2.Canny(gray, *EDGE_THRESHOLDS)
+
+
+def build_template_pyramid(image, scales=DEFAULT_PYRAMID_SCALES, with_edges=False, key=None):
+    """템플릿 이미지를 배율별로 전처리합니다.
+
+    Args:
+        image (np.ndarray): 원본 템플릿 이미지 (BGR, BGRA 또는 그레이스케일)
+        scales (tuple): 만들 배율 목록 (1.0이 없으면 추가)
+        with_edges (bool): 배율별 윤곽선 맵도 만들지 여부
+        key (str, optional): 템플릿 식별자
+
+    Returns:
+        TemplatePyramid: 전처리된 템플릿
+    """
+    gray = to_gray(image)
+    height, width = gray.shape[:2]
+
+    levels = []
+    for scale in sorted(set(scales) | {1.0}, key=lambda value: (value != 1.0, -value)):
+        if scale == 1.0:
+            level_gray = gray
+        else:
+            size = (max(int(round(width * scale)), 1), max(int(round(height * scale)), 1))
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            level_gray = cv2.resize(gray, size, interpolation=interpolation)
+        levels.append((float(scale), level_gray, edge_map(level_gray) if with_edges else None))
+    return TemplatePyramid(key, levels)
+
+
+def match_template_pyramid(frame, pyramid, threshold=DEFAULT_MATCH_THRESHOLD, multi_scale=False, use_edges=False):
+    """전처리된 템플릿 피라미드로 ROI에서 템플릿을 찾습니다.
+
+    Args:
+        frame (np.ndarray): 캡처한 ROI 이미지
+        pyramid (TemplatePyramid): 전처리된 템플릿
+        threshold (float): 일치로 판단할 최소 점수
+        multi_scale (bool): True면 모든 배율에서 찾아 가장 높은 점수를 사용, False면 배율 1.0만 사용
+        use_edges (bool): True면 윤곽선 맵끼리 비교 (피라미드에 윤곽선 맵이 있어야 함)
+
+    Returns:
+        MatchResult: 가장 높은 점수의 매칭 결과 (size는 해당 배율의 템플릿 크기)
+    """
+    start = time.perf_counter()
+    gray = to_gray(frame)
+    use_edges = use_edges and pyramid.has_edges
+    target = edge_map(gray) if use_edges else gray
+
+    best = None
+    for scale, level_gray, level_edges in (pyramid.levels if multi_scale else pyramid.levels[:1]):
+        result = match_template(target, level_edges if use_edges else level_gray, threshold)
+        if best is None or result.score > best.score:
+            best = result
+
+    best.elapsed_ms = (time.perf_counter() - start) * 1000
+    return best
+
+
+def load_template(path):
+    """템플릿 이미지 파일을 그레이스케일로 읽습니다.
+
+    파일 수정 시각이 같으면 이전에 읽은 이미지를 재사용합니다.
+
+    Args:
+        path (str): 템플릿 이미지 경로
+
+    Returns:
+        np.ndarray: 그레이스케일 템플릿 (파일이 없거나 읽을 수 없으면 None)
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    cached = _template_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    # 한글 경로도 읽을 수 있도록 imdecode 사용
+    data = np.fromfile(path, dtype=np.uint8)
+    template = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE)
+    if template is None:
+        return None
+
+    if cached and TemplateMatchCache._instance is not None:
+        # 템플릿 파일이 바뀌었으므로 이전 템플릿으로 캐시한 매칭 결과는 무효
+        TemplateMatchCache._instance.invalidate(path)
+
+    _template_cache[path] = (mtime, template)
+    return template
+
+
+def region_signature(gray):
+    """그레이스케일 영역의 변경 감지용 체크섬을 계산합니다.
+
+    영역 전체에 대한 CRC32이므로 한 픽셀만 바뀌어도 값이 달라집니다.
+    400x300 영역 기준 matchTemplate 비용의 수 % 수준입니다.
+    """
+    return (gray.shape, zlib.crc32(np.ascontiguousarray(gray)))
+
+
+class TemplateMatchCache:
+    """영역 변경 감지 기반 템플릿 매칭 캐시 (싱글톤)
+
+    (템플릿, ROI)마다 마지막으로 매칭한 영역의 체크섬과 결과를 보관하고,
+    영역이 바뀌지 않았으면 matchTemplate을 건너뛰고 이전 결과를 반환합니다.
+    이미지가 나타나기를 기다리며 같은 화면을 반복 확인할 때 대부분의 매칭이 생략됩니다.
+    임계값은 재사용할 때 다시 적용하므로 임계값이 바뀌어도 결과가 정확합니다.
+    """
+
+    MAX_ENTRIES = 256
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if TemplateMatchCache._instance is not None:
+            raise RuntimeError("TemplateMatchCache는 싱글톤입니다. instance()를 사용하세요.")
+
+        self._entries = OrderedDict()  # (template_key, roi_key, multi_scale, use_edges) -> (signature, MatchResult)
+        self._lock = threading.Lock()
+        self.reset_metrics()
+
+    def match(self, frame, template, threshold=DEFAULT_MATCH_THRESHOLD, template_key=None, roi_key=None,
+              multi_scale=False, use_edges=False):
+        """영역이 바뀐 경우에만 템플릿 매칭을 수행합니다.
+
+        Args:
+            frame (np.ndarray): 캡처한 ROI 이미지
+            template (np.ndarray | TemplatePyramid): 찾을 템플릿 이미지 또는 전처리된 템플릿
+            threshold (float): 일치로 판단할 최소 점수
+            template_key: 템플릿 식별자 (예: 템플릿 경로). None이면 id(template)
+            roi_key: ROI 식별자 (예: 저장된 영역 정보). None이면 캐시하지 않음
+            multi_scale (bool): TemplatePyramid인 경우 모든 배율에서 찾을지 여부
+            use_edges (bool): TemplatePyramid인 경우 윤곽선 맵으로 비교할지 여부
+
+        Returns:
+            MatchResult: 매칭 결과 (재사용한 경우 cached=True)
+        """
+        start = time.perf_counter()
+        gray = to_gray(frame)
+
+        if isinstance(template, TemplatePyramid):
+            def run_match():
+                return match_template_pyramid(gray, template, threshold, multi_scale, use_edges)
+        else:
+            def run_match():
+                return match_template(gray, template, threshold)
+
+        if roi_key is None:
+            result = run_match()
+            self._record(checked=True, match_ms=result.elapsed_ms, detect_ms=0.0)
+            return result
+
+        if template_key is None:
+            template_key = id(template)
+        key = (template_key, roi_key, multi_scale, use_edges)
+        signature = region_signature(gray)
+        detect_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and entry[0] == signature:
+            previous = entry[1]
+            self._record(checked=False, match_ms=0.0, detect_ms=detect_ms)
+            return MatchResult(
+                previous.score >= threshold, previous.score, previous.location, previous.size,
+                (time.perf_counter() - start) * 1000, cached=True
+            )
+
+        result = run_match()
+        with self._lock:
+            self._entries[key] = (signature, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        self._record(checked=True, match_ms=result.elapsed_ms, detect_ms=detect_ms)
+        return result
+
+    def invalidate(self, template_key=None):
+        """캐시를 비웁니다.
+
+        Args:
+            template_key: 비울 템플릿 식별자 (None이면 전체)
+        """
+        with self._lock:
+            if template_key is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == template_key]:
+                    del self._entries[key]
+
+    def get_metrics(self):
+        """캐시 지표를 반환합니다.
+
+        Returns:
+            dict: {
+                'requests': 전체 매칭 요청 수,
+                'matched': 실제 matchTemplate 수행 수,
+                'skipped': 영역이 바뀌지 않아 건너뛴 수,
+                'skip_ratio': 건너뛴 비율,
+                'match_ms': 매칭에 쓴 누적 시간,
+                'detect_ms': 변경 감지에 쓴 누적 시간,
+                'saved_ms': 건너뛴 매칭의 예상 절약 시간 (평균 매칭 시간 x 건너뛴 수 - 변경 감지 시간)
+            }
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        requests = metrics['matched'] + metrics['skipped']
+        average_match_ms = metrics['match_ms'] / metrics['matched'] if metrics['matched'] else 0.0
+        metrics['requests'] = requests
+        metrics['skip_ratio'] = metrics['skipped'] / requests if requests else 0.0
+        metrics['saved_ms'] = average_match_ms * metrics['skipped'] - metrics['detect_ms']
+        return metrics
+
+    def reset_metrics(self):
+        """지표를 초기화합니다."""
+        with self._lock:
+            self._metrics = {'matched': 0, 'skipped': 0, 'match_ms': 0.0, 'detect_ms': 0.0}
+
+    def _record(self, checked, match_ms, detect_ms):
+        """지표 기록"""
+        with self._lock:
+            if checked:
+                self._metrics['matched'] += 1
+            else:
+                self._metrics['skipped'] += 1
+            self._metrics['match_ms'] += match_ms
+            self._metrics['detect_ms'] += detect_ms
+
+
+def benchmark_match_template(roi_size=(400, 300), template_size=(48, 48), iterations=200, seed=0):
+    """합성 프레임으로 match_template 성능을 측정합니다.
+
+    실제 창 캡처 없이 동작하므로 Linux에서도 실행할 수 있습니다.
+    매 반복마다 노이즈 배경의 임의 위치에 템플릿을 붙인 프레임을 만들어 매칭합니다.
+
+    Args:
+        roi_size (tuple): ROI 크기 (width, height)
+        template_size (tuple): 템플릿 크기 (width, height)
+        iterations (int): 반복 횟수
+        seed (int): 난수 시드
+
+    Returns:
+        dict: {'iterations', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms', 'hit_rate'}
+    """
+    rng = np.random.default_rng(seed)
+    roi_width, roi_height = roi_size
+    template_width, template_height = template_size
+
+    template = rng.integers(0, 256, (template_height, template_width, 3), dtype=np.uint8)
+    template_gray = to_gray(template)
+    background = rng.integers(0, 256, (roi_height, roi_width, 3), dtype=np.uint8)
+
+    timings = np.empty(iterations)
+    hits = 0
+    for i in range(iterations):
+        x = int(rng.integers(0, roi_width - template_width + 1))
+        y = int(rng.integers(0, roi_height - template_height + 1))
+        frame = background.copy()
+        frame[y:y + template_height, x:x + template_width] = template
+
+        result = match_template(frame, template_gray)
+        timings[i] = result.elapsed_ms
+        if result.found and result.location == (x, y):
+            hits += 1
+
+    return {
+        'iterations': iterations,
+        'mean_ms': float(timings.mean()),
+        'p50_ms': float(np.percentile(timings, 50)),
+        'p95_ms': float(np.percentile(timings, 95)),
+        'max_ms': float(timings.max()),
+        'hit_rate': hits / iterations
+    }
+
+
+def benchmark_wait_loop(polls=300, change_every=50, roi_size=(400, 300), template_size=(48, 48), seed=0):
+    """이미지가 나타나기를 기다리는 폴링 루프를 합성 프레임으로 재현하여 캐시 효과를 측정합니다.
+
+    화면은 change_every번 폴링마다 한 번씩만 바뀌고, 템플릿은 마지막 구간에서만 나타납니다.
+
+    Returns:
+        dict: TemplateMatchCache.get_metrics() 결과에 'total_ms'(캐시 사용 루프 전체 시간) 추가
+    """
+    rng = np.random.default_rng(seed)
+    roi_width, roi_height = roi_size
+    template_width, template_height = template_size
+    template = to_gray(rng.integers(0, 256, (template_height, template_width, 3), dtype=np.uint8))
+
+    cache = TemplateMatchCache.instance()
+    cache.invalidate()
+    cache.reset_metrics()
+
+    frame = None
+    start = time.perf_counter()
+    for poll in range(polls):
+        if poll % change_every == 0:
+            frame = rng.integers(0, 256, (roi_height, roi_width, 3), dtype=np.uint8)
+            if poll + change_every >= polls:
+                frame[10:10 + template_height, 20:20 + template_width] = template[:, :, None]
+        cache.match(frame, template, template_key='benchmark', roi_key=(0, 0) + roi_size)
+
+    metrics = cache.get_metrics()
+    metrics['total_ms'] = (time.perf_counter() - start) * 1000
+    return metrics
+
+
+if __name__ == '__main__':
+    # 프로젝트 루트에서 실행: python -m BE.function._common_components.image_matcher
+    stats = benchmark_match_template()
+    print(
+        f"[이미지 매칭 벤치마크] ROI 400x300, 템플릿 48x48, {stats['iterations']}회 - "
+        f"평균 {stats['mean_ms']:.3f}ms, p50 {stats['p50_ms']:.3f}ms, "
+        f"p95 {stats['p95_ms']:.3f}ms, 최대 {stats['max_ms']:.3f}ms, 적중률 {stats['hit_rate']:.0%}"
+    )
+
+    metrics = benchmark_wait_loop()
+    print(
+        f"[대기 루프 캐시] 폴링 {metrics['requests']}회, 50회마다 화면 변경 - "
+        f"매칭 {metrics['matched']}회, 건너뜀 {metrics['skipped']}회 ({metrics['skip_ratio']:.0%}), "
+        f"변경 감지 {metrics['detect_ms']:.2f}ms, 절약 {metrics['saved_ms']:.2f}ms, 전체 {metrics['total_ms']:.2f}ms"
+    )
@@ -0,0 +1,118 @@
+import importlib
+import sys
+import threading
+import time
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 모듈을 불러오는 대리 객체
+
+    cv2, numpy처럼 불러오는 데 오래 걸리는 모듈을 모듈 맨 위에서 `import`하는 대신 사용합니다.
+    사용하는 쪽 코드는 그대로 `np.zeros(...)`, `cv2.imread(...)`처럼 쓰면 되고,
+    한 번 찾은 속성은 이 객체에 보관하므로 이후 접근은 일반 속성 조회와 같습니다.
+
+        np = lazy_import("numpy")
+        cv2 = lazy_import("cv2")
+
+    모듈 수준 코드(기본 인자, 클래스 속성 등)에서 속성에 접근하면 그 시점에 불러오므로 함수 안에서만 사용합니다.
+    """
+
+    def __init__(self, name):
+        """초기화
+
+        Args:
+            name (str): 모듈 이름 (예: "numpy")
+        """
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def _load(self):
+        """모듈을 불러와 반환합니다."""
+        module = self._lazy_module
+        if module is None:
+            module = load_module(self._lazy_name)
+            self._lazy_module = module
+        return module
+
+    def is_loaded(self):
+        """모듈을 이미 불러왔는지 여부"""
+        return self._lazy_module is not None or self._lazy_name in sys.modules
+
+    def __getattr__(self, attr):
+        if attr.startswith('_lazy_'):
+            raise AttributeError(attr)
+        value = getattr(self._load(), attr)
+        setattr(self, attr, value)  # 다음부터는 __getattr__를 거치지 않음
+        return value
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded() else "not loaded"
+        return f"<LazyModule {self._lazy_name} ({state})>"
+
+
+_load_times = {}  # 모듈 이름 -> 불러오는 데 걸린 시간(ns), 이 모듈을 통해 처음 불러온 경우만
+_load_lock = threading.Lock()
+
+
+def lazy_import(name):
+    """처음 사용할 때 불러오는 모듈 대리 객체를 반환합니다."""
+    return LazyModule(name)
+
+
+def load_module(name):
+    """모듈을 불러오고, 처음 불러온 경우 걸린 시간을 기록합니다.
+
+    다른 스레드(preload)가 불러오는 중이면 sys.modules에 초기화가 끝나지 않은 모듈이 있으므로
+    항상 importlib.import_module을 거쳐 모듈별 import 잠금에서 기다립니다. (이미 불러온 모듈이면 바로 반환)
+
+    Returns:
+        module: 불러온 모듈
+    """
+    was_loaded = name in sys.modules
+    started_ns = time.perf_counter_ns()
+    module = importlib.import_module(name)
+    if not was_loaded:
+        elapsed_ns = time.perf_counter_ns() - started_ns
+        with _load_lock:
+            _load_times.setdefault(name, elapsed_ns)
+    return module
+
+
+def get_load_times():
+    """lazy_import/preload로 처음 불러온 모듈별 시간(ms)을 반환합니다."""
+    with _load_lock:
+        return {name: elapsed_ns / 1e6 for name, elapsed_ns in _load_times.items()}
+
+
+def preload(names, on_loaded=None):
+    """모듈을 백그라운드 스레드에서 미리 불러옵니다.
+
+    창을 띄운 뒤 호출하면 처음 사용할 때 기다리는 시간을 줄일 수 있습니다.
+    같은 모듈을 다른 스레드가 동시에 사용하면 import 잠금에서 기다렸다가 같은 모듈을 받습니다.
+    불러오지 못한 모듈(설치되지 않은 선택 패키지 등)은 건너뜁니다.
+
+    Args:
+        names (iterable): 모듈 이름 목록
+        on_loaded (callable, optional): 모두 끝나면 {모듈 이름: 시간(ms) 또는 None(실패)}로 호출 (작업 스레드)
+
+    Returns:
+        threading.Thread: 시작한 스레드
+    """
+    names = list(names)
+
+    def run():
+        results = {}
+        for name in names:
+            started_ns = time.perf_counter_ns()
+            try:
+                load_module(name)
+            except Exception:
+                results[name] = None
+                continue
+            results[name] = (time.perf_counter_ns() - started_ns) / 1e6
+        if on_loaded is not None:
+            on_loaded(results)
+
+    thread = threading.Thread(target=run, name="ModulePreloader", daemon=True)
+    thread.start()
+    return thread
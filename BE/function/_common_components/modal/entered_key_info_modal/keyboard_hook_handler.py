@@ -1,8 +1,10 @@
 import win32con
 import ctypes
+import time
 from ctypes import wintypes
 from PySide6.QtCore import Qt, QObject, Signal
 import win32api
+from BE.log.instrumentation import instrumented
 
 # Windows hook structures
 LRESULT = ctypes.c_long
@@ -416,6 +418,7 @@ class KeyboardHook(QObject):
         self._hook = None
         self._hook_id = None
         self._last_formatted_key_info = None  # 마지막 키 정보 저장
+        self.last_released_ns = 0  # 마지막으로 키가 떼진 시각 (perf_counter_ns, 트리거 지연 측정용)
     
     @property
     def last_formatted_key_info(self):
@@ -428,6 +431,8 @@ class KeyboardHook(QObject):
     
     def start(self):
         """키보드 후킹을 시작합니다."""
+        # 후킹 콜백이 늦으면 시스템 전체의 키 입력이 지연되므로 소요 시간을 계측
+        @instrumented("keyboard_hook.callback")
         def hook_callback(nCode, wParam, lParam):
             """키보드 이벤트 콜백 함수
             
@@ -460,6 +465,7 @@ class KeyboardHook(QObject):
             
             # 키가 떼졌을 때의 이벤트 처리 (WM_KEYUP: 일반 키, WM_SYSKEYUP: ALT와 함께 떼진 시스템 키)
             elif wParam in (WM_KEYUP, WM_SYSKEYUP):
+                self.last_released_ns = time.perf_counter_ns()
                 # key_released 시그널을 발생시켜 구조화된 키 정보를 전달
                 self.key_released.emit(formatted_key_info)
             
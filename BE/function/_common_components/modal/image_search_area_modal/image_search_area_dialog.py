@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                               QLabel, QPushButton, QFrame, QLineEdit,
                               QGridLayout, QWidget, QRubberBand, QApplication,
-                              QMessageBox)
+                              QMessageBox, QDoubleSpinBox, QCheckBox, QComboBox)
 from PySide6.QtCore import Qt, QRect, QPoint, QSize, QTimer
 from PySide6.QtGui import QScreen, QPixmap, QColor, QPainter, QPen, QBrush, QImage
 import win32gui
@@ -10,9 +10,9 @@ import json
 import os
 from datetime import datetime
 import time
-import cv2
-import numpy as np
 from BE.function._common_components.modal.window_process_selector.window_process_selector_modal import ProcessSelectorDialog
+from BE.function._common_components.image_matcher import DEFAULT_MATCH_THRESHOLD
+from BE.function._common_components.overlay_renderer import OverlayRenderer
 
 class CaptureOverlay(QDialog):
     def __init__(self, target_hwnd, parent=None):
@@ -57,6 +57,7 @@ class CaptureOverlay(QDialog):
         self.window_image = QPixmap()
         self.magnifier_size = QSize(120, 120)
         self.magnifier_scale = 2.0
+        self.renderer = OverlayRenderer(self.magnifier_size, self.magnifier_scale)
         
         # 마우스 추적 활성화
         self.setMouseTracking(True)
@@ -123,124 +124,46 @@ class CaptureOverlay(QDialog):
         screen = QApplication.primaryScreen()
         self.window_image = screen.grabWindow(0, self.window_x, self.window_y, 
                                             self.window_width, self.window_height)
+        self.renderer.set_background(self.window_image)
         
         # 화면 갱신
         self.update()
         
     def paintEvent(self, event):
-        """화면 그리기 이벤트"""
+        """화면 그리기 이벤트 (변경된 영역만 그림)"""
         painter = QPainter(self)
-        
-        # 배경 이미지 그리기
-        if hasattr(self, 'window_image') and not self.window_image.isNull():
-            painter.drawPixmap(0, 0, self.window_image)
-            
-            # 반투명 어두운 오버레이
-            overlay = QColor(0, 0, 0, 128)
-            painter.fillRect(self.rect(), overlay)
-            
-            # 캡처 영역 그리기
-            if self.start_pos and self.current_pos:
-                capture_rect = QRect(self.start_pos, self.current_pos).normalized()
-                
-                # 선택 영역은 원본 이미지 보이게
-                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-                painter.drawPixmap(capture_rect, self.window_image, capture_rect)
-                
-                # 선택 영역 테두리 그리기
-                pen = QPen(QColor(0, 120, 215), 1)
-                painter.setPen(pen)
-                painter.drawRect(capture_rect)
-                
-                # 크기 정보 표시
-                size_text = f"{capture_rect.width()} x {capture_rect.height()}"
-                text_rect = capture_rect.adjusted(0, -25, 0, 0)
-                painter.setPen(Qt.white)
-                painter.drawText(text_rect, Qt.AlignCenter, size_text)
-            
-            # 마우스 위치에 돋보기 그리기
-            if self.mouse_pos:
-                self._draw_magnifier(painter, self.mouse_pos)
-    
-    def _draw_magnifier(self, painter, pos):
-        """돋보기 그리기"""
-        # 확대경이 표시될 위치 계산
-        magnifier_x = pos.x() + 20
-        magnifier_y = pos.y() - self.magnifier_size.height() - 20
-        
-        # 화면 경계를 벗어나지 않도록 조정
-        if magnifier_x + self.magnifier_size.width() > self.width():
-            magnifier_x = pos.x() - self.magnifier_size.width() - 20
-        if magnifier_y < 0:
-            magnifier_y = pos.y() + 20
-            
-        # 확대할 영역 계산
-        source_rect = QRect(
-            pos.x() - self.magnifier_size.width() / (2 * self.magnifier_scale),
-            pos.y() - self.magnifier_size.height() / (2 * self.magnifier_scale),
-            self.magnifier_size.width() / self.magnifier_scale,
-            self.magnifier_size.height() / self.magnifier_scale
+        self.renderer.paint(painter, event.region(), self._current_selection(), self.mouse_pos, self.width())
+        
+    def _current_selection(self):
+        """현재 선택 영역 (없으면 None)"""
+        if self.start_pos and self.current_pos:
+            return QRect(self.start_pos, self.current_pos).normalized()
+        return None
+        
+    def _update_changed_region(self, old_selection, old_pos):
+        """이전 상태와 비교하여 바뀐 영역만 다시 그리도록 요청"""
+        region = self.renderer.dirty_region(
+            old_selection, old_pos, self._current_selection(), self.mouse_pos, self.width()
         )
-        
-        # 확대경 배경
-        painter.fillRect(
-            QRect(magnifier_x, magnifier_y, self.magnifier_size.width(), self.magnifier_size.height()),
-            QColor(255, 255, 255, 200)
-        )
-        
-        # 확대된 이미지 그리기
-        painter.drawPixmap(
-            QRect(magnifier_x, magnifier_y, self.magnifier_size.width(), self.magnifier_size.height()),
-            self.window_image,
-            source_rect
-        )
-        
-        # 확대경 테두리
-        painter.setPen(QPen(QColor(0, 120, 215), 2))
-        painter.drawRect(
-            magnifier_x, magnifier_y,
-            self.magnifier_size.width(), self.magnifier_size.height()
-        )
-        
-        # 십자선 그리기
-        center_x = magnifier_x + self.magnifier_size.width() / 2
-        center_y = magnifier_y + self.magnifier_size.height() / 2
-        
-        painter.setPen(QPen(QColor(255, 0, 0), 1))
-        painter.drawLine(
-            center_x - 10, center_y,
-            center_x + 10, center_y
-        )
-        painter.drawLine(
-            center_x, center_y - 10,
-            center_x, center_y + 10
-        )
-        
-        # 현재 좌표 표시
-        coord_text = f"X: {pos.x()}, Y: {pos.y()}"
-        text_rect = QRect(
-            magnifier_x,
-            magnifier_y + self.magnifier_size.height() + 5,
-            self.magnifier_size.width(),
-            20
-        )
-        painter.setPen(Qt.white)
-        painter.drawText(text_rect, Qt.AlignCenter, coord_text)
+        if not region.isEmpty():
+            self.update(region)
     
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
         if event.button() == Qt.LeftButton:
+            old_selection = self._current_selection()
             self.start_pos = event.pos()
             self.current_pos = event.pos()
             self.is_capturing = True
-            self.update()
+            self._update_changed_region(old_selection, self.mouse_pos)
     
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트"""
+        old_selection, old_pos = self._current_selection(), self.mouse_pos
         self.mouse_pos = event.pos()
         if self.is_capturing:
             self.current_pos = event.pos()
-        self.update()
+        self._update_changed_region(old_selection, old_pos)
     
     def mouseReleaseEvent(self, event):
         """마우스 릴리즈 이벤트"""
@@ -267,22 +190,31 @@ class CaptureOverlay(QDialog):
 class ImageSearchAreaDialog(QDialog):
     """이미지 서치 체크 설정 모달"""
     
+    # 찾지 못했을 때 동작 (표시 이름, 저장 값)
+    NOT_FOUND_ACTIONS = [
+        ("로직 중지", "stop"),
+        ("다음 스텝 건너뛰기", "skip_next"),
+        ("계속 진행", "continue")
+    ]
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_DeleteOnClose)
         
         self.setWindowTitle("이미지 서치 체크 설정 모달")
-        self.setFixedSize(600, 500)
+        self.setFixedSize(600, 600)
         
         # 변수 초기화
         self.selected_process = None
         self.captured_image = None
         self.captured_rect = None
+        self.template_path = None
         
         # 설정 파일 경로
         self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
         self.captures_dir = os.path.join(self.base_path, 'captures')
-        os.makedirs(self.captures_dir, exist_ok=True)
+        self.templates_dir = os.path.join(self.captures_dir, 'image_search_templates')
+        os.makedirs(self.templates_dir, exist_ok=True)
         
         # UI 초기화
         self.init_ui()
@@ -331,6 +263,42 @@ class ImageSearchAreaDialog(QDialog):
         
         layout.addWidget(capture_frame)
         
+        # 검색 설정 영역
+        self.search_frame = QFrame()
+        self.search_frame.setStyleSheet("QFrame { background-color: #f0f0f0; border-radius: 5px; }")
+        search_layout = QGridLayout(self.search_frame)
+        
+        search_layout.addWidget(QLabel("일치 임계값:"), 0, 0)
+        self.threshold_spin = QDoubleSpinBox()
+        self.threshold_spin.setRange(0.5, 1.0)
+        self.threshold_spin.setSingleStep(0.01)
+        self.threshold_spin.setDecimals(2)
+        self.threshold_spin.setValue(DEFAULT_MATCH_THRESHOLD)
+        search_layout.addWidget(self.threshold_spin, 0, 1)
+        
+        self.wait_check = QCheckBox("찾을 때까지 대기")
+        search_layout.addWidget(self.wait_check, 1, 0)
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.1, 600.0)
+        self.timeout_spin.setDecimals(1)
+        self.timeout_spin.setSuffix(" 초")
+        self.timeout_spin.setValue(5.0)
+        self.timeout_spin.setEnabled(False)
+        search_layout.addWidget(self.timeout_spin, 1, 1)
+        
+        search_layout.addWidget(QLabel("찾지 못했을 때:"), 2, 0)
+        self.not_found_combo = QComboBox()
+        for text, value in self.NOT_FOUND_ACTIONS:
+            self.not_found_combo.addItem(text, value)
+        search_layout.addWidget(self.not_found_combo, 2, 1)
+        
+        self.multi_scale_check = QCheckBox("여러 배율로 찾기")
+        search_layout.addWidget(self.multi_scale_check, 3, 0)
+        self.use_edges_check = QCheckBox("윤곽선으로 비교")
+        search_layout.addWidget(self.use_edges_check, 3, 1)
+        
+        layout.addWidget(self.search_frame)
+        
         # 버튼 영역
         button_layout = QHBoxLayout()
         self.save_btn = QPushButton("저장")
@@ -347,6 +315,7 @@ class ImageSearchAreaDialog(QDialog):
         self.process_select_btn.clicked.connect(self._select_process)
         self.process_reset_btn.clicked.connect(self._reset_process)
         self.capture_btn.clicked.connect(self._capture_area)
+        self.wait_check.toggled.connect(self.timeout_spin.setEnabled)
         self.save_btn.clicked.connect(self.accept)
         self.cancel_btn.clicked.connect(self.reject)
         
@@ -369,6 +338,7 @@ class ImageSearchAreaDialog(QDialog):
         """캡처 영역 초기화"""
         self.captured_rect = None
         self.captured_image = None
+        self.template_path = None
         self.capture_info.setText("캡처된 영역: 없음")
         self.capture_image_label.clear()
         self.capture_image_label.setText("캡처된 이미지 없음")
@@ -443,6 +413,33 @@ class ImageSearchAreaDialog(QDialog):
             )
             self.capture_image_label.setPixmap(scaled_image)
             
+    def accept(self):
+        """저장 버튼 클릭 시 캡처된 이미지를 템플릿 파일로 저장"""
+        if self.captured_image and not self.captured_image.isNull():
+            file_name = f"template_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+            template_path = os.path.join(self.templates_dir, file_name)
+            if not self.captured_image.save(template_path, "PNG"):
+                QMessageBox.warning(self, "경고", "템플릿 이미지를 저장할 수 없습니다.")
+                return
+            self.template_path = template_path
+        super().accept()
+        
+    def get_search_settings(self):
+        """이미지 서치 실행 설정 반환
+        
+        Returns:
+            dict: 템플릿 경로, 임계값, 대기 여부, 대기 시간, 찾지 못했을 때 동작, 배율/윤곽선 사용 여부
+        """
+        return {
+            'template_path': self.template_path,
+            'threshold': round(self.threshold_spin.value(), 2),
+            'wait_until_found': self.wait_check.isChecked(),
+            'timeout': self.timeout_spin.value(),
+            'not_found_action': self.not_found_combo.currentData(),
+            'multi_scale': self.multi_scale_check.isChecked(),
+            'use_edges': self.use_edges_check.isChecked()
+        }
+            
     def closeEvent(self, event):
         """다이얼로그가 닫힐 때 호출되는 이벤트"""
         if self.current_overlay:
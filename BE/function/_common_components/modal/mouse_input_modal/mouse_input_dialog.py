@@ -7,6 +7,7 @@ from win32api import GetCursorPos
 import win32gui
 import win32con
 from BE.function._common_components.modal.window_process_selector.window_process_selector_modal import ProcessSelectorDialog
+from BE.function._common_components.overlay_renderer import OverlayRenderer
 from BE.log.base_log_manager import BaseLogManager
 
 class CaptureOverlay(QDialog):
@@ -21,6 +22,7 @@ class CaptureOverlay(QDialog):
         self.client_rect = None
         self.magnifier_size = QSize(150, 150)
         self.magnifier_scale = 2
+        self.renderer = OverlayRenderer(self.magnifier_size, self.magnifier_scale)
         self.parent = parent
         
         # 반투명 오버레이 설정
@@ -98,6 +100,7 @@ class CaptureOverlay(QDialog):
             screen = QApplication.primaryScreen()
             self.window_image = screen.grabWindow(0, self.client_x, self.client_y, 
                                                 self.client_width, self.client_height)
+            self.renderer.set_background(self.window_image)
             
             # 오버레이 위치 설정
             self.setGeometry(QRect(self.client_x, self.client_y, 
@@ -123,94 +126,21 @@ class CaptureOverlay(QDialog):
             self.reject()
             
     def paintEvent(self, event):
-        """화면 그리기 이벤트"""
-        if not self.window_image:
+        """화면 그리기 이벤트 (변경된 영역만 그림)"""
+        if not self.renderer.is_ready:
             return
             
         painter = QPainter(self)
-        
-        # 배경 이미지 그리기
-        if not self.window_image.isNull():
-            painter.drawPixmap(0, 0, self.window_image)
-            
-            # 반투명 어두운 오버레이
-            overlay = QColor(0, 0, 0, 128)
-            painter.fillRect(self.rect(), overlay)
-            
-            # 마우스 위치에 돋보기 그리기
-            if self.mouse_pos:
-                self._draw_magnifier(painter, self.mouse_pos)
-                
-    def _draw_magnifier(self, painter, pos):
-        """돋보기 그리기"""
-        # 확대경이 표시될 위치 계산
-        magnifier_x = pos.x() + 20
-        magnifier_y = pos.y() - self.magnifier_size.height() - 20
-        
-        # 화면 경계를 벗어나지 않도록 조정
-        if magnifier_x + self.magnifier_size.width() > self.width():
-            magnifier_x = pos.x() - self.magnifier_size.width() - 20
-        if magnifier_y < 0:
-            magnifier_y = pos.y() + 20
-            
-        # 확대할 영역 계산
-        source_rect = QRect(
-            pos.x() - self.magnifier_size.width() / (2 * self.magnifier_scale),
-            pos.y() - self.magnifier_size.height() / (2 * self.magnifier_scale),
-            self.magnifier_size.width() / self.magnifier_scale,
-            self.magnifier_size.height() / self.magnifier_scale
-        )
-        
-        # 확대경 배경
-        painter.fillRect(
-            QRect(magnifier_x, magnifier_y, self.magnifier_size.width(), self.magnifier_size.height()),
-            QColor(255, 255, 255, 200)
-        )
-        
-        # 확대된 이미지 그리기
-        if not source_rect.intersected(self.rect()).isEmpty():
-            painter.drawPixmap(
-                QRect(magnifier_x, magnifier_y, self.magnifier_size.width(), self.magnifier_size.height()),
-                self.window_image,
-                source_rect
-            )
-        
-        # 확대경 테두리
-        painter.setPen(QPen(QColor(0, 120, 215), 2))
-        painter.drawRect(
-            magnifier_x, magnifier_y,
-            self.magnifier_size.width(), self.magnifier_size.height()
-        )
-        
-        # 십자선 그리기
-        center_x = magnifier_x + self.magnifier_size.width() / 2
-        center_y = magnifier_y + self.magnifier_size.height() / 2
-        
-        painter.setPen(QPen(QColor(255, 0, 0), 1))
-        painter.drawLine(
-            center_x - 10, center_y,
-            center_x + 10, center_y
-        )
-        painter.drawLine(
-            center_x, center_y - 10,
-            center_x, center_y + 10
-        )
-        
-        # 현재 좌표 표시
-        coord_text = f"X: {pos.x()}, Y: {pos.y()}"
-        text_rect = QRect(
-            magnifier_x,
-            magnifier_y + self.magnifier_size.height() + 5,
-            self.magnifier_size.width(),
-            20
-        )
-        painter.setPen(Qt.white)
-        painter.drawText(text_rect, Qt.AlignCenter, coord_text)
+        self.renderer.paint(painter, event.region(), mouse_pos=self.mouse_pos, widget_width=self.width())
         
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트"""
+        old_pos = self.mouse_pos
         self.mouse_pos = event.pos()
-        self.update()
+        # 이전/현재 확대경 주변만 다시 그림
+        region = self.renderer.dirty_region(None, old_pos, None, self.mouse_pos, self.width())
+        if not region.isEmpty():
+            self.update(region)
         
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
@@ -0,0 +1,126 @@
+from PySide6.QtWidgets import (QDialog, QFrame, QGridLayout, QLabel, QListWidget, QPushButton,
+                              QSpinBox, QCheckBox, QDoubleSpinBox, QComboBox, QMessageBox)
+from BE.function._common_components.modal.image_search_area_modal.image_search_area_dialog import ImageSearchAreaDialog
+from BE.function._common_components.pixel_probe import DEFAULT_PIXEL_TOLERANCE
+
+
+class PixelCheckDialog(ImageSearchAreaDialog):
+    """픽셀 색상 확인 설정 모달
+    
+    프로세스 선택과 영역 캡처는 이미지 서치 체크 모달과 같으며,
+    영역을 캡처할 때마다 영역 중앙의 픽셀 색상을 확인 지점으로 추가합니다.
+    """
+    
+    # 여러 지점의 결과를 합치는 방식 (표시 이름, 저장 값)
+    MODES = [
+        ("모든 지점 일치", "all"),
+        ("한 지점 이상 일치", "any")
+    ]
+    
+    # 일치하지 않을 때 동작 (표시 이름, 저장 값)
+    NOT_MATCHED_ACTIONS = ImageSearchAreaDialog.NOT_FOUND_ACTIONS
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("픽셀 색상 확인 설정 모달")
+        self.capture_btn.setText("지점 추가 (영역 중앙의 색상)")
+        
+    def init_ui(self):
+        """UI 초기화"""
+        super().init_ui()
+        self.probes = []
+        
+        # 이미지 서치 설정 대신 픽셀 확인 설정 표시
+        self.search_frame.hide()
+        
+        check_frame = QFrame()
+        check_frame.setStyleSheet("QFrame { background-color: #f0f0f0; border-radius: 5px; }")
+        check_layout = QGridLayout(check_frame)
+        
+        self.probe_list = QListWidget()
+        self.probe_list.setFixedHeight(90)
+        check_layout.addWidget(self.probe_list, 0, 0, 1, 2)
+        
+        self.remove_probe_btn = QPushButton("선택한 지점 삭제")
+        check_layout.addWidget(self.remove_probe_btn, 1, 0)
+        self.tolerance_spin = QSpinBox()
+        self.tolerance_spin.setRange(0, 255)
+        self.tolerance_spin.setPrefix("허용 오차: ")
+        self.tolerance_spin.setValue(DEFAULT_PIXEL_TOLERANCE)
+        check_layout.addWidget(self.tolerance_spin, 1, 1)
+        
+        check_layout.addWidget(QLabel("확인 방식:"), 2, 0)
+        self.mode_combo = QComboBox()
+        for text, value in self.MODES:
+            self.mode_combo.addItem(text, value)
+        check_layout.addWidget(self.mode_combo, 2, 1)
+        
+        self.wait_check = QCheckBox("일치할 때까지 대기")
+        check_layout.addWidget(self.wait_check, 3, 0)
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.1, 600.0)
+        self.timeout_spin.setDecimals(1)
+        self.timeout_spin.setSuffix(" 초")
+        self.timeout_spin.setValue(5.0)
+        self.timeout_spin.setEnabled(False)
+        check_layout.addWidget(self.timeout_spin, 3, 1)
+        
+        check_layout.addWidget(QLabel("일치하지 않을 때:"), 4, 0)
+        self.not_matched_combo = QComboBox()
+        for text, value in self.NOT_MATCHED_ACTIONS:
+            self.not_matched_combo.addItem(text, value)
+        check_layout.addWidget(self.not_matched_combo, 4, 1)
+        
+        # 저장/취소 버튼 위에 배치
+        self.layout().insertWidget(self.layout().indexOf(self.search_frame) + 1, check_frame)
+        
+        self.wait_check.toggled.connect(self.timeout_spin.setEnabled)
+        self.remove_probe_btn.clicked.connect(self._remove_selected_probe)
+        
+    def _update_capture_display(self):
+        """캡처한 영역 중앙의 픽셀을 확인 지점으로 추가"""
+        super()._update_capture_display()
+        if not self.captured_rect or not self.captured_image or self.captured_image.isNull():
+            QMessageBox.warning(self, "경고", "지점을 추가하려면 1픽셀 이상 드래그하세요.")
+            return
+        
+        image = self.captured_image.toImage()
+        color = image.pixelColor(image.width() // 2, image.height() // 2)
+        probe = {
+            'x': self.captured_rect['x'] + self.captured_rect['width'] // 2,
+            'y': self.captured_rect['y'] + self.captured_rect['height'] // 2,
+            'rgb': [color.red(), color.green(), color.blue()],
+            'tolerance': self.tolerance_spin.value()
+        }
+        self.probes.append(probe)
+        self.probe_list.addItem(
+            f"({probe['x']}, {probe['y']}) RGB{tuple(probe['rgb'])} ±{probe['tolerance']}"
+        )
+        
+    def _remove_selected_probe(self):
+        """선택한 지점 삭제"""
+        row = self.probe_list.currentRow()
+        if row >= 0:
+            self.probe_list.takeItem(row)
+            del self.probes[row]
+        
+    def accept(self):
+        """저장 버튼 클릭 시 지점이 있는지 확인 (템플릿 이미지는 저장하지 않음)"""
+        if not self.probes:
+            QMessageBox.warning(self, "경고", "확인할 지점을 하나 이상 추가하세요.")
+            return
+        QDialog.accept(self)
+        
+    def get_check_settings(self):
+        """픽셀 확인 실행 설정 반환
+        
+        Returns:
+            dict: 지점 목록, 확인 방식, 대기 여부, 대기 시간, 일치하지 않을 때 동작
+        """
+        return {
+            'probes': list(self.probes),
+            'mode': self.mode_combo.currentData(),
+            'wait_until_matched': self.wait_check.isChecked(),
+            'timeout': self.timeout_spin.value(),
+            'not_matched_action': self.not_matched_combo.currentData()
+        }
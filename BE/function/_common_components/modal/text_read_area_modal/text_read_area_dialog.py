@@ -0,0 +1,88 @@
+import re
+from PySide6.QtWidgets import (QDialog, QFrame, QGridLayout, QLabel, QLineEdit,
+                              QCheckBox, QDoubleSpinBox, QComboBox, QMessageBox)
+from BE.function._common_components.modal.image_search_area_modal.image_search_area_dialog import ImageSearchAreaDialog
+
+
+class TextReadAreaDialog(ImageSearchAreaDialog):
+    """텍스트 읽기(OCR) 설정 모달
+    
+    프로세스 선택과 영역 캡처는 이미지 서치 체크 모달과 같고,
+    템플릿 대신 저장할 변수 이름과 확인할 정규식을 설정합니다.
+    """
+    
+    # 정규식과 일치하지 않을 때 동작 (표시 이름, 저장 값)
+    NOT_MATCHED_ACTIONS = ImageSearchAreaDialog.NOT_FOUND_ACTIONS
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("텍스트 읽기 설정 모달")
+        
+    def init_ui(self):
+        """UI 초기화"""
+        super().init_ui()
+        
+        # 이미지 서치 설정 대신 텍스트 읽기 설정 표시
+        self.search_frame.hide()
+        
+        read_frame = QFrame()
+        read_frame.setStyleSheet("QFrame { background-color: #f0f0f0; border-radius: 5px; }")
+        read_layout = QGridLayout(read_frame)
+        
+        read_layout.addWidget(QLabel("저장할 변수 이름:"), 0, 0)
+        self.variable_edit = QLineEdit()
+        self.variable_edit.setPlaceholderText("예: hp (텍스트 입력에서 {{hp}}로 사용)")
+        read_layout.addWidget(self.variable_edit, 0, 1)
+        
+        read_layout.addWidget(QLabel("확인할 정규식:"), 1, 0)
+        self.pattern_edit = QLineEdit()
+        self.pattern_edit.setPlaceholderText(r"예: HP (?P<hp>\d+) (비워두면 확인하지 않음)")
+        read_layout.addWidget(self.pattern_edit, 1, 1)
+        
+        self.wait_check = QCheckBox("일치할 때까지 대기")
+        read_layout.addWidget(self.wait_check, 2, 0)
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.1, 600.0)
+        self.timeout_spin.setDecimals(1)
+        self.timeout_spin.setSuffix(" 초")
+        self.timeout_spin.setValue(5.0)
+        self.timeout_spin.setEnabled(False)
+        read_layout.addWidget(self.timeout_spin, 2, 1)
+        
+        read_layout.addWidget(QLabel("일치하지 않을 때:"), 3, 0)
+        self.not_matched_combo = QComboBox()
+        for text, value in self.NOT_MATCHED_ACTIONS:
+            self.not_matched_combo.addItem(text, value)
+        read_layout.addWidget(self.not_matched_combo, 3, 1)
+        
+        # 저장/취소 버튼 위에 배치
+        self.layout().insertWidget(self.layout().indexOf(self.search_frame) + 1, read_frame)
+        
+        self.wait_check.toggled.connect(self.timeout_spin.setEnabled)
+        
+    def accept(self):
+        """저장 버튼 클릭 시 입력값 확인 (템플릿 이미지는 저장하지 않음)"""
+        variable_name = self.variable_edit.text().strip()
+        if variable_name and not re.fullmatch(r'\w+', variable_name):
+            QMessageBox.warning(self, "경고", "변수 이름은 문자, 숫자, 밑줄(_)만 사용할 수 있습니다.")
+            return
+        try:
+            re.compile(self.pattern_edit.text())
+        except re.error as e:
+            QMessageBox.warning(self, "경고", f"정규식이 올바르지 않습니다: {e}")
+            return
+        QDialog.accept(self)
+        
+    def get_read_settings(self):
+        """텍스트 읽기 실행 설정 반환
+        
+        Returns:
+            dict: 변수 이름, 정규식, 대기 여부, 대기 시간, 일치하지 않을 때 동작
+        """
+        return {
+            'variable_name': self.variable_edit.text().strip(),
+            'pattern': self.pattern_edit.text(),
+            'wait_until_matched': self.wait_check.isChecked(),
+            'timeout': self.timeout_spin.value(),
+            'not_matched_action': self.not_matched_combo.currentData()
+        }
@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from BE.function._common_components.window_process_handler import ProcessManager
+from BE.function._common_components.window_process_handler import ProcessSnapshotCache
 from BE.function.constants.styles import BUTTON_STYLE, LIST_STYLE
 
 class ProcessSelectorDialog(QDialog):
@@ -14,10 +14,17 @@ class ProcessSelectorDialog(QDialog):
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
         self.selected_process = None
+        self.snapshot_cache = ProcessSnapshotCache.instance()
+        self._items = []  # (검색 키, QListWidgetItem) 튜플의 리스트
         
         self._init_ui()
         self._connect_signals()
         
+        # 스냅샷이 없으면 한 번만 동기로 채우고, 이후에는 백그라운드에서 갱신
+        if not self.snapshot_cache.has_snapshot:
+            self.snapshot_cache.refresh()
+        self._reload_process_list()
+        
         # 초기 검색 실행
         self._search_processes()
     
@@ -58,27 +65,83 @@ class ProcessSelectorDialog(QDialog):
         self.SelectButton__QPushButton.clicked.connect(self._on_select)
         self.CancelButton__QPushButton.clicked.connect(self.reject)
         self.SearchInput__QLineEdit.returnPressed.connect(self._search_processes)
+        self.SearchInput__QLineEdit.textChanged.connect(self._filter_process_list)
+        # 백그라운드 갱신 완료 시그널은 QueuedConnection으로 UI 스레드에서 처리
+        self.snapshot_cache.snapshot_updated.connect(self._reload_process_list, Qt.QueuedConnection)
     
-    def _search_processes(self):
-        """프로세스 검색 및 결과 표시"""
-        search_text = self.SearchInput__QLineEdit.text().lower()
+    def done(self, result):
+        """다이얼로그 종료 시 스냅샷 시그널 연결 해제"""
+        try:
+            self.snapshot_cache.snapshot_updated.disconnect(self._reload_process_list)
+        except (RuntimeError, TypeError):
+            pass  # 이미 연결 해제된 경우
+        super().done(result)
+    
+    def _reload_process_list(self):
+        """스냅샷 전체로 목록을 다시 만들고 현재 검색어로 필터링
+        
+        백그라운드 갱신 중에 사용자가 고른 항목이 있으면 같은 창(pid, hwnd)을 다시 선택합니다.
+        """
+        current_item = self.ProcessList__QListWidget.currentItem()
+        current_process = current_item.data(Qt.UserRole) if current_item else None
+        
         self.ProcessList__QListWidget.clear()
+        self._items = []
         
-        processes = ProcessManager.get_processes(search_text)
-        for process in processes:
+        # 검색 키는 스냅샷 캐시가 만든 것을 그대로 사용 (캐시의 search()와 같은 기준으로 필터링)
+        for search_key, process in self.snapshot_cache.entries():
             item_text = f"[ PID : {process['pid']} ] {process['name']} - {process['title']}"
             item = QListWidgetItem(item_text)
             item.setData(Qt.UserRole, process)
             self.ProcessList__QListWidget.addItem(item)
+            self._items.append((search_key, item))
+        
+        self._filter_process_list(self.SearchInput__QLineEdit.text(), keep_process=current_process)
+    
+    def _filter_process_list(self, search_text, keep_process=None):
+        """목록을 다시 만들지 않고 검색어에 맞지 않는 항목만 숨김
+        
+        Args:
+            search_text (str): 검색어
+            keep_process (dict, optional): 검색어에 맞으면 첫 번째 항목 대신 선택할 프로세스 정보
+            
+        Returns:
+            QListWidgetItem: 검색어에 맞는 첫 번째 항목 (없으면 None)
+        """
+        search_text = ProcessSnapshotCache.normalize_search_text(search_text)
+        first_match = None
+        kept_item = None
+        for item_key, item in self._items:
+            matched = search_text in item_key
+            item.setHidden(not matched)
+            if not matched:
+                continue
+            if first_match is None:
+                first_match = item
+            if keep_process is not None and kept_item is None:
+                process = item.data(Qt.UserRole)
+                if (process['pid'], process['hwnd']) == (keep_process['pid'], keep_process['hwnd']):
+                    kept_item = item
+        
+        current_item = kept_item or first_match
+        if current_item is not None:
+            self.ProcessList__QListWidget.setCurrentItem(current_item)
+        return first_match
+    
+    def _search_processes(self):
+        """프로세스 검색 및 결과 표시"""
+        first_match = self._filter_process_list(self.SearchInput__QLineEdit.text())
         
         # 검색 결과에 따른 포커스 처리
-        if self.ProcessList__QListWidget.count() > 0:
+        if first_match is not None:
             # 검색 결과가 있으면 첫 번째 항목 선택
-            self.ProcessList__QListWidget.setCurrentRow(0)
             self.ProcessList__QListWidget.setFocus()
         else:
             # 검색 결과가 없으면 검색어 입력창에 포커스
             self.SearchInput__QLineEdit.setFocus()
+        
+        # 검색 버튼이나 엔터로 검색하면 최신 창 목록도 백그라운드에서 갱신
+        self.snapshot_cache.refresh_async()
     
     def _on_select(self):
         current_item = self.ProcessList__QListWidget.currentItem()
@@ -1,8 +1,11 @@
 import win32api
 import win32con
-import win32gui
 import time
 from BE.log.base_log_manager import BaseLogManager
+from BE.function._common_components.window_geometry_cache import WindowGeometryCache
+from BE.function._common_components.mouse_path import (
+    DEFAULT_PATH_RATE_HZ, generate_mouse_path, play_mouse_path, get_default_mouse_backend
+)
 from BE.settings.key_input_delays_data_settingfiles_manager import KeyInputDelaysDataSettingFilesManager
 
 class MouseHandler:
@@ -45,33 +48,19 @@ class MouseHandler:
             # 윈도우 핸들이 제공된 경우 클라이언트 영역 기준으로 계산
             if hwnd:
                 try:
-                    # 클라이언트 영역 정보 가져오기
-                    client_rect = win32gui.GetClientRect(hwnd)
-                    client_width = client_rect[2]
-                    client_height = client_rect[3]
-                    
-                    # 클라이언트 영역의 화면 좌표 얻기
-                    client_point = win32gui.ClientToScreen(hwnd, (0, 0))
-                    client_x = client_point[0]
-                    client_y = client_point[1]
-                    
-                    # DPI 스케일링 고려
-                    try:
-                        dpi = win32gui.GetDpiForWindow(hwnd)
-                        scale_factor = dpi / 96.0
-                    except AttributeError:
-                        scale_factor = 1.0
+                    # 클라이언트 영역과 DPI 정보는 창이 움직이기 전까지 캐시된 값 사용
+                    geometry_cache = WindowGeometryCache.instance()
+                    geometry = geometry_cache.get(hwnd)
                     
                     # 비율이 제공된 경우 비율 사용, 아니면 상대 좌표 사용
                     if x_ratio is not None and y_ratio is not None:
-                        screen_x = client_x + int(client_width * x_ratio)
-                        screen_y = client_y + int(client_height * y_ratio)
+                        screen_point = geometry_cache.ratios_to_screen(hwnd, (x_ratio, y_ratio))[0]
                     else:
-                        screen_x = client_x + int(x * scale_factor)
-                        screen_y = client_y + int(y * scale_factor)
+                        screen_point = geometry_cache.client_points_to_screen(hwnd, (x, y))[0]
+                    screen_x, screen_y = int(screen_point[0]), int(screen_point[1])
                     
                     base_log_manager.log(
-                        message=f"마우스 클릭 좌표 계산 - 클라이언트 영역: {client_width}x{client_height}, 시작점: ({client_x}, {client_y}), DPI 스케일: {scale_factor}, 화면 좌표: ({screen_x}, {screen_y})",
+                        message=f"마우스 클릭 좌표 계산 - 클라이언트 영역: {geometry.client_size[0]}x{geometry.client_size[1]}, 시작점: ({geometry.client_origin[0]}, {geometry.client_origin[1]}), DPI 스케일: {geometry.scale_factor}, 화면 좌표: ({screen_x}, {screen_y})",
                         level="DEBUG",
                         file_name="mouse_handler",
                         method_name="click"
@@ -134,19 +123,32 @@ class MouseHandler:
             return False
     
     @staticmethod
-    def move(x, y):
+    def move(x, y, duration=0.0, curve="ease", rate_hz=DEFAULT_PATH_RATE_HZ, backend=None):
         """마우스 이동
         
+        duration이 0이면 바로 이동하고, 0보다 크면 현재 위치에서 보간한 경로를
+        rate_hz 주기로 나누어 duration 동안 부드럽게 이동합니다.
+        
         Args:
             x (int): 이동할 X 좌표
             y (int): 이동할 Y 좌표
+            duration (float): 이동에 걸리는 시간 (초)
+            curve (str): 보간 곡선 ("linear", "ease", "bezier")
+            rate_hz (int): 이동 이벤트 발생 주기 (Hz)
+            backend (MouseInputBackend, optional): 이벤트를 보낼 백엔드 (테스트용)
             
         Returns:
             bool: 성공 여부
         """
         base_log_manager = BaseLogManager.instance()
         try:
-            win32api.SetCursorPos((x, y))
+            if duration > 0:
+                backend = backend or get_default_mouse_backend()
+                start_x, start_y = win32api.GetCursorPos()
+                points, offsets = generate_mouse_path((start_x, start_y), (x, y), duration, rate_hz, curve)
+                play_mouse_path(points, offsets, backend)
+            else:
+                win32api.SetCursorPos((x, y))
             base_log_manager.log(
                 message=f"마우스 이동 완료 (좌표: {x}, {y})",
                 level="INFO",
@@ -165,46 +167,44 @@ class MouseHandler:
             return False
     
     @staticmethod
-    def drag(start_x, start_y, end_x, end_y, button="left"):
+    def drag(start_x, start_y, end_x, end_y, button="left", duration=0.2, curve="ease",
+             rate_hz=DEFAULT_PATH_RATE_HZ, backend=None):
         """마우스 드래그
         
+        시작 위치에서 버튼을 누른 뒤, 보간한 경로를 rate_hz 주기의 마감 시각에 맞춰
+        보내며 끝 위치까지 이동하고 버튼을 뗍니다.
+        
         Args:
             start_x (int): 시작 X 좌표
             start_y (int): 시작 Y 좌표
             end_x (int): 끝 X 좌표
             end_y (int): 끝 Y 좌표
             button (str): 마우스 버튼 ("left", "right", "middle")
+            duration (float): 드래그 이동에 걸리는 시간 (초)
+            curve (str): 보간 곡선 ("linear", "ease", "bezier")
+            rate_hz (int): 이동 이벤트 발생 주기 (Hz, 예: 500 ~ 1000)
+            backend (MouseInputBackend, optional): 이벤트를 보낼 백엔드 (테스트용)
             
         Returns:
             bool: 성공 여부
         """
         base_log_manager = BaseLogManager.instance()
         try:
-            # 버튼에 따른 이벤트 플래그 설정
-            if button == "right":
-                down_flag = win32con.MOUSEEVENTF_RIGHTDOWN
-                up_flag = win32con.MOUSEEVENTF_RIGHTUP
-            elif button == "middle":
-                down_flag = win32con.MOUSEEVENTF_MIDDLEDOWN
-                up_flag = win32con.MOUSEEVENTF_MIDDLEUP
-            else:  # left
-                down_flag = win32con.MOUSEEVENTF_LEFTDOWN
-                up_flag = win32con.MOUSEEVENTF_LEFTUP
-            
-            # 시작 위치로 이동
-            win32api.SetCursorPos((start_x, start_y))
-            
-            # 버튼 누르기
-            win32api.mouse_event(down_flag, start_x, start_y, 0, 0)
-            
-            # 끝 위치로 이동
-            win32api.SetCursorPos((end_x, end_y))
-            
-            # 버튼 떼기
-            win32api.mouse_event(up_flag, end_x, end_y, 0, 0)
+            backend = backend or get_default_mouse_backend()
+            
+            # 시작 위치로 이동 후 버튼 누르기
+            backend.move_batch([(start_x, start_y)])
+            backend.button(button, True)
+            try:
+                # 끝 위치까지 보간한 경로로 이동
+                points, offsets = generate_mouse_path((start_x, start_y), (end_x, end_y), duration, rate_hz, curve)
+                play_mouse_path(points, offsets, backend)
+            finally:
+                # 경로 재생 중 오류가 나도 버튼이 눌린 채로 남지 않도록 항상 떼기
+                backend.button(button, False)
             
             base_log_manager.log(
-                message=f"마우스 드래그 완료 ({button} 버튼, 시작: {start_x}, {start_y}, 끝: {end_x}, {end_y})",
+                message=f"마우스 드래그 완료 ({button} 버튼, 시작: {start_x}, {start_y}, 끝: {end_x}, {end_y}, 좌표 {len(points)}개)",
                 level="INFO",
                 file_name="mouse_handler",
                 method_name="drag"
@@ -219,4 +219,4 @@ class MouseHandler:
                 method_name="drag",
                 print_to_terminal=True
             )
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,268 @@
+import sys
+import time
+import ctypes
+from BE.function._common_components.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# 경로 곡선 종류
+PATH_CURVES = ('linear', 'ease', 'bezier')
+
+# 기본 이벤트 발생 주기 (Hz)
+DEFAULT_PATH_RATE_HZ = 500
+
+# 남은 시간이 이보다 길면 이만큼 남기고 sleep, 짧으면 바쁜 대기로 마감 시간을 맞춤 (초)
+# 좌표 간격(500Hz면 2ms)보다 충분히 짧아야 경로 재생 중 CPU를 계속 쓰지 않음
+SPIN_THRESHOLD = 0.0005
+
+
+def generate_mouse_path(start, end, duration, rate_hz=DEFAULT_PATH_RATE_HZ, curve='linear', control_points=None):
+    """시작점에서 끝점까지 일정한 주기로 보간한 마우스 경로를 생성합니다.
+
+    Args:
+        start (tuple): 시작 화면 좌표 (x, y)
+        end (tuple): 끝 화면 좌표 (x, y)
+        duration (float): 이동에 걸리는 시간 (초)
+        rate_hz (int): 좌표 발생 주기 (Hz, 예: 500 ~ 1000)
+        curve (str): 보간 곡선 ('linear', 'ease', 'bezier')
+        control_points (list, optional): bezier 곡선의 제어점 두 개 [(x1, y1), (x2, y2)].
+            없으면 이동 방향의 수직으로 살짝 휘어진 기본 제어점을 사용합니다.
+
+    Returns:
+        tuple: (points, offsets)
+            points (np.ndarray): 화면 좌표 배열 (N x 2, int64). 시작점은 제외하고 끝점은 포함
+            offsets (np.ndarray): 각 좌표를 보낼 시각 (시작 기준 초, 길이 N)
+    """
+    if curve not in PATH_CURVES:
+        raise ValueError(f"지원하지 않는 경로 곡선입니다: {curve}")
+
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+
+    count = max(int(round(duration * rate_hz)), 1)
+    t = np.arange(1, count + 1, dtype=np.float64) / count
+    offsets = t * duration
+
+    if curve == 'linear':
+        points = start + (end - start) * t[:, None]
+    elif curve == 'ease':
+        # smoothstep: 시작과 끝에서 감속
+        eased = t * t * (3.0 - 2.0 * t)
+        points = start + (end - start) * eased[:, None]
+    else:
+        if control_points is None:
+            delta = end - start
+            normal = np.array([-delta[1], delta[0]]) * 0.1
+            control_points = (start + delta / 3.0 + normal, start + delta * 2.0 / 3.0 + normal)
+        p1 = np.asarray(control_points[0], dtype=np.float64)
+        p2 = np.asarray(control_points[1], dtype=np.float64)
+        u = 1.0 - t
+        points = (
+            (u ** 3)[:, None] * start +
+            (3.0 * u * u * t)[:, None] * p1 +
+            (3.0 * u * t * t)[:, None] * p2 +
+            (t ** 3)[:, None] * end
+        )
+
+    return np.rint(points).astype(np.int64), offsets
+
+
+def play_mouse_path(points, offsets, backend, clock=time.perf_counter, sleep=time.sleep):
+    """각 좌표의 마감 시각에 맞춰 마우스 이동 이벤트를 보냅니다.
+
+    마감 시각이 지난 좌표들은 한 번의 배치로 묶어 보내므로, 스케줄이 밀려도
+    남은 좌표의 시각은 누적 오차 없이 시작 시각 기준으로 유지됩니다.
+
+    Args:
+        points (np.ndarray): 화면 좌표 배열 (N x 2)
+        offsets (np.ndarray): 각 좌표를 보낼 시각 (시작 기준 초, 길이 N, 오름차순)
+        backend (MouseInputBackend): 이벤트를 보낼 백엔드
+        clock (callable): 현재 시각(초)을 반환하는 함수
+        sleep (callable): 대기 함수
+
+    Returns:
+        float: 경로 재생 시작 시각 (clock 기준)
+    """
+    start_time = clock()
+    index = 0
+    count = len(points)
+
+    while index < count:
+        elapsed = clock() - start_time
+        due = int(np.searchsorted(offsets, elapsed, side='right'))
+        if due > index:
+            backend.move_batch(points[index:due])
+            index = due
+            continue
+
+        remaining = offsets[index] - elapsed
+        if remaining > SPIN_THRESHOLD:
+            sleep(remaining - SPIN_THRESHOLD)
+
+    return start_time
+
+
+class MouseInputBackend:
+    """마우스 이벤트 전송 백엔드 기본 클래스"""
+
+    def move_batch(self, points):
+        """좌표들로 순서대로 이동하는 이벤트를 한 번에 보냅니다.
+
+        Args:
+            points (np.ndarray): 화면 좌표 배열 (N x 2)
+        """
+        raise NotImplementedError
+
+    def button(self, button, is_down):
+        """마우스 버튼 누르기/떼기 이벤트를 보냅니다.
+
+        Args:
+            button (str): 마우스 버튼 ("left", "right", "middle")
+            is_down (bool): True면 누르기, False면 떼기
+        """
+        raise NotImplementedError
+
+
+class SendInputMouseBackend(MouseInputBackend):
+    """SendInput 기반 백엔드
+
+    한 배치의 이동 이벤트를 INPUT 배열 하나로 묶어 SendInput을 한 번만 호출합니다.
+    """
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_MIDDLEDOWN = 0x0020
+    MOUSEEVENTF_MIDDLEUP = 0x0040
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    SM_XVIRTUALSCREEN = 76
+    SM_YVIRTUALSCREEN = 77
+    SM_CXVIRTUALSCREEN = 78
+    SM_CYVIRTUALSCREEN = 79
+
+    def __init__(self):
+        from ctypes import wintypes
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ('dx', wintypes.LONG),
+                ('dy', wintypes.LONG),
+                ('mouseData', wintypes.DWORD),
+                ('dwFlags', wintypes.DWORD),
+                ('time', wintypes.DWORD),
+                ('dwExtraInfo', ctypes.POINTER(wintypes.ULONG))
+            ]
+
+        class INPUT(ctypes.Structure):
+            # INPUT union 중 MOUSEINPUT이 가장 크므로 mi만 정의해도 구조체 크기가 같음
+            _fields_ = [
+                ('type', wintypes.DWORD),
+                ('mi', MOUSEINPUT)
+            ]
+
+        self._INPUT = INPUT
+        self._user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+    def _virtual_screen(self):
+        """가상 데스크톱 영역 (x, y, width, height)"""
+        metrics = self._user32.GetSystemMetrics
+        return (
+            metrics(self.SM_XVIRTUALSCREEN),
+            metrics(self.SM_YVIRTUALSCREEN),
+            metrics(self.SM_CXVIRTUALSCREEN),
+            metrics(self.SM_CYVIRTUALSCREEN)
+        )
+
+    def move_batch(self, points):
+        left, top, width, height = self._virtual_screen()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+        # 화면 좌표를 0 ~ 65535 범위의 절대 좌표로 정규화
+        normalized = np.empty_like(points)
+        normalized[:, 0] = (points[:, 0] - left) * 65535.0 / max(width - 1, 1)
+        normalized[:, 1] = (points[:, 1] - top) * 65535.0 / max(height - 1, 1)
+        normalized = np.rint(normalized).astype(np.int64)
+
+        flags = self.MOUSEEVENTF_MOVE | self.MOUSEEVENTF_ABSOLUTE | self.MOUSEEVENTF_VIRTUALDESK
+        inputs = (self._INPUT * len(normalized))()
+        for i, (dx, dy) in enumerate(normalized):
+            inputs[i].type = self.INPUT_MOUSE
+            inputs[i].mi.dx = int(dx)
+            inputs[i].mi.dy = int(dy)
+            inputs[i].mi.dwFlags = flags
+
+        self._user32.SendInput(len(inputs), inputs, ctypes.sizeof(self._INPUT))
+
+    def button(self, button, is_down):
+        if button == "right":
+            flag = self.MOUSEEVENTF_RIGHTDOWN if is_down else self.MOUSEEVENTF_RIGHTUP
+        elif button == "middle":
+            flag = self.MOUSEEVENTF_MIDDLEDOWN if is_down else self.MOUSEEVENTF_MIDDLEUP
+        else:  # left
+            flag = self.MOUSEEVENTF_LEFTDOWN if is_down else self.MOUSEEVENTF_LEFTUP
+
+        inputs = (self._INPUT * 1)()
+        inputs[0].type = self.INPUT_MOUSE
+        inputs[0].mi.dwFlags = flag
+        self._user32.SendInput(1, inputs, ctypes.sizeof(self._INPUT))
+
+
+class RecordingMouseBackend(MouseInputBackend):
+    """테스트용 기록 백엔드
+
+    실제 이벤트를 보내지 않고 이동 좌표와 전송 시각, 버튼 이벤트를 기록하여
+    좌표 간격과 타이밍 오차를 검사할 수 있게 합니다.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.points = []      # [(x, y), ...]
+        self.timestamps = []  # 각 좌표를 보낸 시각 (clock 기준)
+        self.batch_sizes = []
+        self.button_events = []  # [(button, is_down, 시각), ...]
+
+    def move_batch(self, points):
+        now = self._clock()
+        for x, y in np.asarray(points).reshape(-1, 2):
+            self.points.append((int(x), int(y)))
+            self.timestamps.append(now)
+        self.batch_sizes.append(len(points))
+
+    def button(self, button, is_down):
+        self.button_events.append((button, is_down, self._clock()))
+
+    def get_point_spacing(self):
+        """연속한 좌표 사이의 거리 배열을 반환합니다."""
+        points = np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            return np.zeros(0)
+        return np.hypot(*np.diff(points, axis=0).T)
+
+    def get_timing_errors(self, offsets, start_time):
+        """좌표별 실제 전송 시각과 예정 시각의 차이(초)를 반환합니다.
+
+        Args:
+            offsets (np.ndarray): generate_mouse_path가 반환한 예정 시각
+            start_time (float): play_mouse_path가 반환한 시작 시각
+        """
+        actual = np.asarray(self.timestamps[-len(offsets):], dtype=np.float64) - start_time
+        return actual - np.asarray(offsets, dtype=np.float64)
+
+
+_default_backend = None
+
+
+def get_default_mouse_backend():
+    """플랫폼에 맞는 기본 백엔드를 반환합니다. Windows 이외에서는 기록 백엔드를 사용합니다."""
+    global _default_backend
+    if _default_backend is None:
+        if sys.platform == 'win32':
+            _default_backend = SendInputMouseBackend()
+        else:
+            _default_backend = RecordingMouseBackend()
+    return _default_backend
@@ -0,0 +1,50 @@
+"""OCR 작업 프로세스 진입점
+
+OcrWorker가 spawn으로 시작하는 프로세스는 이 모듈만 불러옵니다.
+표준 라이브러리 외에는 프로세스 안에서 numpy, torch, easyocr만 불러오며,
+로그 매니저나 Qt, win32 모듈을 불러오는 BE 모듈은 여기서 불러오지 않습니다.
+"""
+import time
+
+
+def ocr_process_main(requests, responses, languages, gpu, num_threads):
+    """OCR 작업 프로세스 루프
+
+    easyocr/torch는 이 프로세스에서만 import하므로 UI 프로세스는 모델 로딩 비용을 지지 않습니다.
+    모델을 로드한 뒤 빈 이미지로 한 번 추론하여(워밍업) 첫 요청의 지연을 줄입니다.
+
+    응답 형식: (request_id, 상태, 값)
+        (None, 'ready', 워밍업 시간 ms) / (None, 'error', 메시지)
+        (request_id, 'result', (텍스트 목록, 추론 시간 ms)) / (request_id, 'error', 메시지)
+    """
+    try:
+        started = time.perf_counter()
+        import numpy as np
+        import torch
+        import easyocr
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        reader = easyocr.Reader(list(languages), gpu=gpu, verbose=False)
+        reader.readtext(np.zeros((32, 128), dtype=np.uint8), detail=0)
+        responses.put((None, 'ready', (time.perf_counter() - started) * 1000))
+    except Exception as e:
+        responses.put((None, 'error', f"{type(e).__name__}: {e}"))
+        return
+
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+
+        request_id, images = request
+        try:
+            started = time.perf_counter()
+            if len(images) > 1 and len({image.shape for image in images}) == 1:
+                # 크기가 같은 영역은 한 번의 배치 추론으로 처리
+                results = reader.readtext_batched(images, detail=0, batch_size=len(images))
+            else:
+                results = [reader.readtext(image, detail=0) for image in images]
+            texts = [' '.join(result).strip() for result in results]
+            responses.put((request_id, 'result', (texts, (time.perf_counter() - started) * 1000)))
+        except Exception as e:
+            responses.put((request_id, 'error', f"{type(e).__name__}: {e}"))
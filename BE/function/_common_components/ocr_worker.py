@@ -0,0 +1,334 @@
+import sys
+import time
+import queue
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future
+from BE.function._common_components.lazy_import import lazy_import
+from BE.function._common_components.image_matcher import to_gray, region_signature
+from BE.function._common_components.ocr_process import ocr_process_main
+from BE.log.base_log_manager import BaseLogManager
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+
+class OcrWorker:
+    """EasyOCR 전용 작업 프로세스 관리자 (싱글톤)
+
+    OCR 모델은 처음 필요할 때 별도 프로세스에 한 번만 로드되며, 요청은 큐로 보내고
+    결과는 수신 스레드가 Future로 돌려주므로 UI/실행 스레드는 import나 추론에 막히지 않습니다.
+
+    같은 영역 이미지(그레이스케일 체크섬 기준)는 다시 추론하지 않고 캐시된 텍스트를 반환합니다.
+    여러 영역을 한 번에 요청하면 프로세스 간 통신이 한 번으로 줄고, 크기가 같으면 배치 추론됩니다.
+    """
+
+    DEFAULT_LANGUAGES = ('ko', 'en')
+    MAX_CACHE_ENTRIES = 256
+    READY_TIMEOUT = 180.0  # CPU에서 모델을 처음 로드할 때까지 기다리는 최대 시간 (초)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, languages=DEFAULT_LANGUAGES, gpu=False, num_threads=None):
+        """초기화
+
+        Args:
+            languages (tuple): 인식할 언어 코드
+            gpu (bool): GPU 사용 여부
+            num_threads (int, optional): 작업 프로세스의 torch 스레드 수
+        """
+        if OcrWorker._instance is not None:
+            raise RuntimeError("OcrWorker는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self.languages = tuple(languages)
+        self.gpu = gpu
+        self.num_threads = num_threads
+
+        self._process = None
+        self._requests = None
+        self._responses = None
+        self._receiver = None
+        self._ready = threading.Event()
+        self._error = None
+        self._pending = {}  # request_id -> Future
+        self._next_request_id = 0
+        self._cache = OrderedDict()  # 영역 체크섬 -> 텍스트
+        self._lock = threading.Lock()
+
+        # 지표
+        self._metrics = {'requests': 0, 'images': 0, 'cache_hits': 0, 'ocr_ms': 0.0, 'warmup_ms': 0.0}
+
+    @property
+    def is_ready(self):
+        """모델 로딩과 워밍업이 끝났는지 여부"""
+        return self._ready.is_set()
+
+    @property
+    def error(self):
+        """작업 프로세스 시작 실패 메시지 (없으면 None)"""
+        return self._error
+
+    def start(self):
+        """작업 프로세스를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다.
+
+        모델 로딩은 작업 프로세스에서 진행되므로 이 메서드는 바로 반환됩니다.
+        """
+        with self._lock:
+            if self._process is not None and self._process.is_alive():
+                return
+
+            self._ready.clear()
+            self._error = None
+            context = multiprocessing.get_context('spawn')
+            self._requests = context.Queue()
+            self._responses = context.Queue()
+            self._process = context.Process(
+                target=ocr_process_main,
+                args=(self._requests, self._responses, self.languages, self.gpu, self.num_threads),
+                name="OcrWorker",
+                daemon=True
+            )
+            self._process.start()
+            self._receiver = threading.Thread(
+                target=self._receive_loop, args=(self._process, self._responses),
+                name="OcrWorkerReceiver", daemon=True
+            )
+            self._receiver.start()
+
+        self.base_log_manager.log(
+            message=f"OCR 작업 프로세스 시작 (언어: {', '.join(self.languages)}, GPU: {self.gpu})",
+            level="INFO",
+            file_name="ocr_worker",
+            method_name="start"
+        )
+
+    def wait_ready(self, timeout=None):
+        """모델 로딩과 워밍업이 끝날 때까지 기다립니다.
+
+        Returns:
+            bool: 준비되었으면 True (시작 실패 또는 시간 초과 시 False)
+        """
+        return self._ready.wait(timeout) and self._error is None
+
+    def read_texts(self, images):
+        """여러 영역 이미지의 텍스트를 한 번의 요청으로 인식합니다.
+
+        Args:
+            images (list): 영역 이미지 목록 (BGR, BGRA 또는 그레이스케일). 캡처 버퍼의 뷰여도 됨
+
+        Returns:
+            Future: 이미지 순서대로의 텍스트 목록 (list[str])을 결과로 가지는 Future
+        """
+        # 그레이스케일 변환 시 새 배열이 만들어지므로 캡처 버퍼가 덮어써져도 안전함
+        grays = [to_gray(image) for image in images]
+        keys = [region_signature(gray) for gray in grays]
+
+        future = Future()
+        texts = [None] * len(grays)
+        missing = []
+        with self._lock:
+            self._metrics['requests'] += 1
+            for index, key in enumerate(keys):
+                text = self._cache.get(key)
+                if text is not None:
+                    self._cache.move_to_end(key)
+                    texts[index] = text
+                    self._metrics['cache_hits'] += 1
+                else:
+                    missing.append(index)
+
+        if not missing:
+            future.set_result(texts)
+            return future
+
+        self.start()
+        inner = self._submit([grays[index] for index in missing])
+
+        def on_done(done):
+            try:
+                results = done.result()
+            except Exception as e:
+                future.set_exception(e)
+                return
+            with self._lock:
+                for index, text in zip(missing, results):
+                    texts[index] = text
+                    self._cache[keys[index]] = text
+                    self._cache.move_to_end(keys[index])
+                while len(self._cache) > self.MAX_CACHE_ENTRIES:
+                    self._cache.popitem(last=False)
+            future.set_result(texts)
+
+        inner.add_done_callback(on_done)
+        return future
+
+    def clear_cache(self):
+        """인식 결과 캐시를 비웁니다."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_metrics(self):
+        """OCR 지표를 반환합니다.
+
+        Returns:
+            dict: {'ready', 'requests', 'images', 'cache_hits', 'ocr_ms', 'warmup_ms', 'pending'}
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['pending'] = len(self._pending)
+        metrics['ready'] = self.is_ready
+        return metrics
+
+    def stop(self, timeout=2.0):
+        """작업 프로세스를 종료합니다."""
+        with self._lock:
+            process, requests = self._process, self._requests
+            self._process = None
+        if process is None:
+            return
+        try:
+            requests.put(None)
+            process.join(timeout)
+        finally:
+            if process.is_alive():
+                process.terminate()
+            self._ready.clear()
+
+    def _submit(self, grays):
+        """작업 프로세스에 인식 요청을 보냅니다."""
+        future = Future()
+        with self._lock:
+            request_id = self._next_request_id
+            self._next_request_id += 1
+            self._pending[request_id] = future
+            self._metrics['images'] += len(grays)
+            requests = self._requests
+        requests.put((request_id, grays))
+        return future
+
+    def _receive_loop(self, process, responses):
+        """작업 프로세스의 응답을 받아 Future를 완료하는 스레드 루프"""
+        while True:
+            try:
+                request_id, status, value = responses.get(timeout=0.5)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                self._fail_pending("OCR 작업 프로세스가 종료되었습니다.")
+                return
+            except (EOFError, OSError):
+                self._fail_pending("OCR 작업 프로세스와의 연결이 끊어졌습니다.")
+                return
+
+            if request_id is None:
+                if status == 'ready':
+                    with self._lock:
+                        self._metrics['warmup_ms'] = value
+                    self.base_log_manager.log(
+                        message=f"OCR 모델 준비 완료 (로딩 및 워밍업: {value:.0f}ms)",
+                        level="INFO",
+                        file_name="ocr_worker",
+                        method_name="_receive_loop"
+                    )
+                else:
+                    self._error = value
+                    self.base_log_manager.log(
+                        message=f"OCR 모델 로딩 실패: {value}",
+                        level="ERROR",
+                        file_name="ocr_worker",
+                        method_name="_receive_loop",
+                        print_to_terminal=True
+                    )
+                self._ready.set()
+                continue
+
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+                if status == 'result':
+                    self._metrics['ocr_ms'] += value[1]
+            if future is None:
+                continue
+            if status == 'result':
+                future.set_result(value[0])
+            else:
+                future.set_exception(RuntimeError(value))
+
+    def _fail_pending(self, message):
+        """응답을 기다리는 모든 요청을 실패 처리합니다."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if self._error is None:
+            self._error = message
+        self._ready.set()
+        for future in pending.values():
+            future.set_exception(RuntimeError(message))
+
+
+def _make_text_roi(text, size=(200, 48)):
+    """벤치마크용 텍스트 영역 이미지를 만듭니다."""
+    image = np.full((size[1], size[0], 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (8, size[1] - 14), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 0), 2)
+    return image
+
+
+def benchmark_ocr(roi_count=8, repeats=3):
+    """CPU OCR 지연 시간을 측정합니다.
+
+    워밍업 시간, 영역별 단건 요청, 여러 영역의 배치 요청, 캐시 적중 시의 지연을 비교합니다.
+
+    Returns:
+        dict: {'warmup_ms', 'single_ms_per_roi', 'batched_ms_per_roi', 'cached_ms_per_roi', 'texts'}
+    """
+    worker = OcrWorker.instance()
+    worker.start()
+    if not worker.wait_ready(OcrWorker.READY_TIMEOUT):
+        raise RuntimeError(f"OCR 모델을 준비할 수 없습니다: {worker.error}")
+
+    single_ms = []
+    batched_ms = []
+    texts = []
+    for repeat in range(repeats):
+        # 캐시에 걸리지 않도록 반복마다 다른 텍스트 사용
+        rois = [_make_text_roi(f"HP {repeat}{index:03d}") for index in range(roi_count)]
+        worker.clear_cache()
+        started = time.perf_counter()
+        texts = [worker.read_texts([roi]).result()[0] for roi in rois]
+        single_ms.append((time.perf_counter() - started) * 1000 / roi_count)
+
+        rois = [_make_text_roi(f"MP {repeat}{index:03d}") for index in range(roi_count)]
+        worker.clear_cache()
+        started = time.perf_counter()
+        worker.read_texts(rois).result()
+        batched_ms.append((time.perf_counter() - started) * 1000 / roi_count)
+
+    started = time.perf_counter()
+    worker.read_texts(rois).result()
+    cached_ms = (time.perf_counter() - started) * 1000 / roi_count
+
+    return {
+        'warmup_ms': worker.get_metrics()['warmup_ms'],
+        'single_ms_per_roi': float(np.mean(single_ms)),
+        'batched_ms_per_roi': float(np.mean(batched_ms)),
+        'cached_ms_per_roi': cached_ms,
+        'texts': texts
+    }
+
+
+if __name__ == '__main__':
+    result = benchmark_ocr()
+    print(f"플랫폼: {sys.platform}")
+    print(f"모델 로딩 및 워밍업: {result['warmup_ms']:.0f}ms")
+    print(f"영역별 단건 요청: {result['single_ms_per_roi']:.1f}ms/영역")
+    print(f"배치 요청: {result['batched_ms_per_roi']:.1f}ms/영역")
+    print(f"캐시 적중: {result['cached_ms_per_roi']:.3f}ms/영역")
+    print(f"인식 결과 예시: {result['texts'][:3]}")
+    OcrWorker.instance().stop()
@@ -0,0 +1,264 @@
+import time
+from BE.function._common_components.lazy_import import lazy_import
+from PySide6.QtCore import Qt, QRect, QPoint, QSize
+from PySide6.QtGui import QPixmap, QImage, QColor, QPainter, QPen, QRegion
+
+np = lazy_import("numpy")
+
+
+class OverlayRenderer:
+    """영역/좌표 선택 오버레이의 부분 다시 그리기 도우미
+
+    오버레이는 창 스크린샷 위에 어두운 막, 선택 영역, 확대경을 그립니다.
+    마우스가 움직일 때마다 전체를 다시 그리면 4K 창에서는 커서를 따라가지 못하므로,
+    배경은 미리 어둡게 합성해 두고 확대경 샘플링용 QImage도 한 번만 변환해 둔 뒤
+    이전/현재 확대경과 선택 영역 주변의 변경된 영역(dirty region)만 다시 그립니다.
+
+    사용 방법:
+        set_background()로 스크린샷을 설정하고, 마우스 이동 시 dirty_region()으로
+        계산한 영역만 update()한 뒤 paintEvent에서 paint()를 호출합니다.
+    """
+
+    DIM_COLOR = QColor(0, 0, 0, 128)
+    ACCENT_COLOR = QColor(0, 120, 215)
+    CROSSHAIR_COLOR = QColor(255, 0, 0)
+    MAGNIFIER_BACKGROUND = QColor(255, 255, 255, 200)
+
+    MAGNIFIER_OFFSET = 20
+    LABEL_SIZE = QSize(120, 20)
+    PEN_MARGIN = 2  # 테두리 펜 두께만큼 다시 그릴 영역을 넓힘
+
+    def __init__(self, magnifier_size=QSize(120, 120), magnifier_scale=2.0):
+        """초기화
+
+        Args:
+            magnifier_size (QSize): 확대경 크기
+            magnifier_scale (float): 확대 배율
+        """
+        self.magnifier_size = magnifier_size
+        self.magnifier_scale = magnifier_scale
+        self.background = QPixmap()
+        self.dimmed = QPixmap()
+        self.sample_image = QImage()
+
+    @property
+    def is_ready(self):
+        """배경이 설정되었는지 여부"""
+        return not self.background.isNull()
+
+    def set_background(self, pixmap):
+        """스크린샷을 설정하고 어두운 배경과 샘플링용 이미지를 미리 만듭니다.
+
+        Args:
+            pixmap (QPixmap): 대상 창 스크린샷
+        """
+        self.background = pixmap
+        self.sample_image = pixmap.toImage().convertToFormat(QImage.Format_RGB32)
+
+        self.dimmed = QPixmap(pixmap)
+        painter = QPainter(self.dimmed)
+        painter.fillRect(self.dimmed.rect(), self.DIM_COLOR)
+        painter.end()
+
+    def magnifier_rect(self, pos, widget_width):
+        """확대경 사각형을 계산합니다.
+
+        Args:
+            pos (QPoint): 마우스 위치
+            widget_width (int): 오버레이 너비 (확대경이 오른쪽으로 벗어나지 않도록 조정)
+
+        Returns:
+            QRect: 확대경 사각형 (좌표 텍스트 제외)
+        """
+        width, height = self.magnifier_size.width(), self.magnifier_size.height()
+        x = pos.x() + self.MAGNIFIER_OFFSET
+        y = pos.y() - height - self.MAGNIFIER_OFFSET
+        if x + width > widget_width:
+            x = pos.x() - width - self.MAGNIFIER_OFFSET
+        if y < 0:
+            y = pos.y() + self.MAGNIFIER_OFFSET
+        return QRect(x, y, width, height)
+
+    def selection_label_rect(self, selection):
+        """선택 영역 크기 텍스트가 그려지는 사각형"""
+        center = selection.adjusted(0, -25, 0, 0).center()
+        label = QRect(QPoint(0, 0), self.LABEL_SIZE)
+        label.moveCenter(center)
+        return label
+
+    def dirty_region(self, old_selection, old_pos, new_selection, new_pos, widget_width):
+        """이전 상태와 현재 상태 사이에 다시 그려야 하는 영역을 계산합니다.
+
+        선택 영역은 안쪽이 그대로이므로 이전/현재 영역의 차이(xor)와 테두리, 크기 텍스트만 포함합니다.
+
+        Args:
+            old_selection (QRect): 이전 선택 영역 (없으면 None)
+            old_pos (QPoint): 이전 마우스 위치 (없으면 None)
+            new_selection (QRect): 현재 선택 영역 (없으면 None)
+            new_pos (QPoint): 현재 마우스 위치 (없으면 None)
+            widget_width (int): 오버레이 너비
+
+        Returns:
+            QRegion: 다시 그릴 영역
+        """
+        margin = self.PEN_MARGIN
+        region = QRegion()
+
+        if old_selection != new_selection:
+            region = QRegion(old_selection or QRect()).xored(QRegion(new_selection or QRect()))
+            for selection in (old_selection, new_selection):
+                if selection is None:
+                    continue
+                outline = QRegion(selection.adjusted(-margin, -margin, margin, margin))
+                inner = selection.adjusted(margin, margin, -margin, -margin)
+                if inner.isValid():
+                    outline = outline.subtracted(QRegion(inner))
+                region = region.united(outline).united(QRegion(self.selection_label_rect(selection)))
+
+        if old_pos != new_pos:
+            for pos in (old_pos, new_pos):
+                if pos is None:
+                    continue
+                magnifier = self.magnifier_rect(pos, widget_width)
+                # 확대경 아래 좌표 텍스트까지 포함
+                region = region.united(QRegion(magnifier.adjusted(-margin, -margin, margin, 25 + margin)))
+
+        return region
+
+    def paint(self, painter, region, selection=None, mouse_pos=None, widget_width=0):
+        """다시 그릴 영역만 그립니다.
+
+        Args:
+            painter (QPainter): 오버레이 painter
+            region (QRegion): 다시 그릴 영역 (paintEvent의 event.region())
+            selection (QRect, optional): 현재 선택 영역
+            mouse_pos (QPoint, optional): 현재 마우스 위치
+            widget_width (int): 오버레이 너비
+        """
+        if not self.is_ready:
+            return
+
+        # 어두운 배경은 미리 합성해 두었으므로 해당 부분만 복사
+        for rect in region:
+            painter.drawPixmap(rect, self.dimmed, rect)
+
+        if selection is not None:
+            # 선택 영역은 원본 이미지 보이게
+            for rect in region:
+                inside = rect.intersected(selection)
+                if not inside.isEmpty():
+                    painter.drawPixmap(inside, self.background, inside)
+
+            painter.setPen(QPen(self.ACCENT_COLOR, 1))
+            painter.drawRect(selection)
+
+            painter.setPen(Qt.white)
+            painter.drawText(
+                self.selection_label_rect(selection), Qt.AlignCenter,
+                f"{selection.width()} x {selection.height()}"
+            )
+
+        if mouse_pos is not None:
+            self._paint_magnifier(painter, mouse_pos, widget_width)
+
+    def _paint_magnifier(self, painter, pos, widget_width):
+        """확대경 그리기"""
+        target = self.magnifier_rect(pos, widget_width)
+        source_width = int(self.magnifier_size.width() / self.magnifier_scale)
+        source_height = int(self.magnifier_size.height() / self.magnifier_scale)
+        source = QRect(pos.x() - source_width // 2, pos.y() - source_height // 2, source_width, source_height)
+
+        # 확대경 배경
+        painter.fillRect(target, self.MAGNIFIER_BACKGROUND)
+
+        # 미리 변환해 둔 QImage에서 확대할 부분만 샘플링
+        if not source.intersected(self.sample_image.rect()).isEmpty():
+            painter.drawImage(target, self.sample_image, source)
+
+        # 확대경 테두리
+        painter.setPen(QPen(self.ACCENT_COLOR, 2))
+        painter.drawRect(target)
+
+        # 십자선 그리기
+        center = target.center()
+        painter.setPen(QPen(self.CROSSHAIR_COLOR, 1))
+        painter.drawLine(center.x() - 10, center.y(), center.x() + 10, center.y())
+        painter.drawLine(center.x(), center.y() - 10, center.x(), center.y() + 10)
+
+        # 현재 좌표 표시
+        text_rect = QRect(target.x(), target.bottom() + 6, target.width(), 20)
+        painter.setPen(Qt.white)
+        painter.drawText(text_rect, Qt.AlignCenter, f"X: {pos.x()}, Y: {pos.y()}")
+
+
+def benchmark_overlay_repaint(size=(3840, 2160), moves=120):
+    """마우스 이동 한 번당 오버레이 다시 그리기 시간을 측정합니다.
+
+    큰 합성 스크린샷에서 매번 전체를 다시 그리는 방식(배경 + 전체 어두운 막 + 픽스맵 확대)과
+    변경된 영역만 다시 그리는 방식을 비교합니다. QApplication이 필요합니다.
+
+    Returns:
+        dict: {'size', 'full_ms', 'dirty_ms', 'full_p95_ms', 'dirty_p95_ms', 'dirty_area_ratio'}
+    """
+    width, height = size
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    image = QImage(pixels.data, width, height, width * 4, QImage.Format_RGB32).copy()
+    pixmap = QPixmap.fromImage(image)
+    target = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+
+    renderer = OverlayRenderer()
+    renderer.set_background(pixmap)
+
+    # 드래그하며 대각선으로 이동하는 마우스 경로
+    start = QPoint(width // 4, height // 4)
+    path = [QPoint(start.x() + i * 7, start.y() + i * 4) for i in range(moves)]
+
+    full_times = []
+    painter = QPainter(target)
+    for pos in path:
+        started = time.perf_counter()
+        painter.setClipping(False)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.fillRect(target.rect(), OverlayRenderer.DIM_COLOR)
+        selection = QRect(start, pos).normalized()
+        painter.drawPixmap(selection, pixmap, selection)
+        magnifier = renderer.magnifier_rect(pos, width)
+        source = QRect(pos.x() - 30, pos.y() - 30, 60, 60)
+        painter.drawPixmap(magnifier, pixmap, source)
+        full_times.append((time.perf_counter() - started) * 1000)
+
+    dirty_times = []
+    dirty_area = 0
+    old_selection, old_pos = None, None
+    for pos in path:
+        selection = QRect(start, pos).normalized()
+        started = time.perf_counter()
+        region = renderer.dirty_region(old_selection, old_pos, selection, pos, width)
+        painter.setClipRegion(region)
+        renderer.paint(painter, region, selection, pos, width)
+        dirty_times.append((time.perf_counter() - started) * 1000)
+        dirty_area += sum(rect.width() * rect.height() for rect in region)
+        old_selection, old_pos = selection, pos
+    painter.end()
+
+    return {
+        'size': size,
+        'full_ms': float(np.mean(full_times)),
+        'dirty_ms': float(np.mean(dirty_times)),
+        'full_p95_ms': float(np.percentile(full_times, 95)),
+        'dirty_p95_ms': float(np.percentile(dirty_times, 95)),
+        'dirty_area_ratio': dirty_area / (moves * width * height)
+    }
+
+
+if __name__ == '__main__':
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    for size in ((1920, 1080), (3840, 2160)):
+        result = benchmark_overlay_repaint(size)
+        print(
+            f"{size[0]}x{size[1]}: 전체 다시 그리기 {result['full_ms']:.2f}ms (p95 {result['full_p95_ms']:.2f})"
+            f" / 변경 영역만 {result['dirty_ms']:.2f}ms (p95 {result['dirty_p95_ms']:.2f})"
+            f" - 다시 그린 면적 {result['dirty_area_ratio'] * 100:.1f}%"
+        )
@@ -0,0 +1,145 @@
+import time
+from BE.function._common_components.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# 여러 지점의 결과를 합치는 방식
+PIXEL_CHECK_MODES = ('all', 'any')
+
+# 채널별 허용 오차 기본값 (0 ~ 255)
+DEFAULT_PIXEL_TOLERANCE = 10
+
+
+class PixelProbeSet:
+    """여러 지점의 픽셀 색상 조건
+
+    지점 좌표, 기대 색상, 허용 오차를 미리 NumPy 배열로 만들어 두고,
+    캡처한 프레임에서 팬시 인덱싱 한 번으로 모든 지점을 동시에 비교합니다.
+    수십 개 지점도 수 마이크로초 단위로 평가되므로 템플릿 매칭보다 훨씬 가볍습니다.
+
+    지점 좌표는 클라이언트 좌표이며, bounds는 모든 지점을 포함하는 최소 영역입니다.
+    이 영역만 캡처하여 origin으로 넘기면 됩니다.
+    """
+
+    def __init__(self, probes):
+        """초기화
+
+        Args:
+            probes (list): 지점 목록. 각 지점은 dict {'x', 'y', 'rgb': [r, g, b], 'tolerance'}
+        """
+        if not probes:
+            raise ValueError("픽셀 확인 지점이 없습니다.")
+
+        self._xs = np.array([int(probe['x']) for probe in probes], dtype=np.intp)
+        self._ys = np.array([int(probe['y']) for probe in probes], dtype=np.intp)
+        # 캡처 프레임은 BGR(A)이므로 기대 색상도 BGR 순서로 저장하고,
+        # 허용 범위를 uint8 하한/상한으로 미리 계산하여 평가 시 형 변환을 하지 않음
+        bgr = np.array([list(probe['rgb'])[::-1] for probe in probes], dtype=np.int16)
+        tolerance = np.array(
+            [int(probe.get('tolerance', DEFAULT_PIXEL_TOLERANCE)) for probe in probes], dtype=np.int16
+        )[:, None]
+        self._lower = np.clip(bgr - tolerance, 0, 255).astype(np.uint8)
+        self._upper = np.clip(bgr + tolerance, 0, 255).astype(np.uint8)
+
+        left, top = int(self._xs.min()), int(self._ys.min())
+        self.bounds = (left, top, int(self._xs.max()) - left + 1, int(self._ys.max()) - top + 1)
+
+    def __len__(self):
+        return len(self._xs)
+
+    def evaluate(self, frame, origin=None):
+        """지점별 조건 충족 여부를 계산합니다.
+
+        Args:
+            frame (np.ndarray): 캡처 이미지 (BGR 또는 BGRA)
+            origin (tuple, optional): frame 왼쪽 위의 클라이언트 좌표 (x, y). 없으면 bounds의 시작점
+
+        Returns:
+            np.ndarray: 지점별 결과 (bool, 길이 N). 프레임 밖의 지점은 False
+        """
+        left, top = origin if origin is not None else self.bounds[:2]
+        height, width = frame.shape[:2]
+        bounds_left, bounds_top, bounds_width, bounds_height = self.bounds
+        xs = self._xs - left
+        ys = self._ys - top
+
+        # 모든 지점이 프레임 안에 있는지는 bounds로 한 번만 확인
+        if (bounds_left >= left and bounds_top >= top and
+                bounds_left + bounds_width <= left + width and bounds_top + bounds_height <= top + height):
+            return self._compare(frame[ys, xs], slice(None))
+
+        inside = (xs >= 0) & (ys >= 0) & (xs < width) & (ys < height)
+        result = np.zeros(len(xs), dtype=bool)
+        result[inside] = self._compare(frame[ys[inside], xs[inside]], inside)
+        return result
+
+    def check(self, frame, mode='all', origin=None):
+        """모든 지점(all) 또는 한 지점 이상(any)이 조건을 충족하는지 확인합니다.
+
+        Args:
+            frame (np.ndarray): 캡처 이미지 (BGR 또는 BGRA)
+            mode (str): 'all' 또는 'any'
+            origin (tuple, optional): frame 왼쪽 위의 클라이언트 좌표 (x, y)
+
+        Returns:
+            bool: 조건 충족 여부
+        """
+        if mode not in PIXEL_CHECK_MODES:
+            raise ValueError(f"지원하지 않는 픽셀 확인 방식입니다: {mode}")
+        result = self.evaluate(frame, origin)
+        return bool(result.all() if mode == 'all' else result.any())
+
+    def _compare(self, pixels, index):
+        """샘플링한 픽셀과 기대 색상을 채널별로 비교합니다."""
+        pixels = pixels[:, :3]
+        return ((pixels >= self._lower[index]) & (pixels <= self._upper[index])).all(axis=1)
+
+
+def benchmark_pixel_check(probe_count=48, repeats=20000, frame_size=(1920, 1080)):
+    """픽셀 조건 평가 시간을 측정합니다.
+
+    벡터화된 평가와 지점마다 파이썬으로 비교하는 방식을 같은 프레임에서 비교합니다.
+
+    Returns:
+        dict: {'probes', 'vectorized_us', 'loop_us', 'speedup'}
+    """
+    rng = np.random.default_rng(0)
+    width, height = frame_size
+    frame = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    probes = []
+    for _ in range(probe_count):
+        x, y = int(rng.integers(0, width)), int(rng.integers(0, height))
+        b, g, r = (int(v) for v in frame[y, x, :3])
+        probes.append({'x': x, 'y': y, 'rgb': [r, g, b], 'tolerance': DEFAULT_PIXEL_TOLERANCE})
+    probe_set = PixelProbeSet(probes)
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        probe_set.check(frame, 'all', origin=(0, 0))
+    vectorized_us = (time.perf_counter() - started) * 1e6 / repeats
+
+    loop_repeats = max(repeats // 10, 1)
+    started = time.perf_counter()
+    for _ in range(loop_repeats):
+        all(
+            all(abs(int(frame[probe['y'], probe['x'], 2 - c]) - probe['rgb'][c]) <= probe['tolerance'] for c in range(3))
+            for probe in probes
+        )
+    loop_us = (time.perf_counter() - started) * 1e6 / loop_repeats
+
+    return {
+        'probes': probe_count,
+        'vectorized_us': vectorized_us,
+        'loop_us': loop_us,
+        'speedup': loop_us / vectorized_us if vectorized_us else 0.0
+    }
+
+
+if __name__ == '__main__':
+    # 프로젝트 루트에서 실행: python -m BE.function._common_components.pixel_probe
+    for count in (8, 48, 200):
+        result = benchmark_pixel_check(probe_count=count)
+        print(
+            f"지점 {result['probes']}개: 벡터화 {result['vectorized_us']:.1f}us"
+            f" / 파이썬 반복 {result['loop_us']:.1f}us ({result['speedup']:.1f}배)"
+        )
@@ -0,0 +1,459 @@
+import sys
+import time
+import threading
+from PySide6.QtCore import Qt, QObject, Signal
+from BE.function._common_components.capture_backend import (
+    SyntheticCaptureBackend, crop_regions, get_default_capture_backend
+)
+from BE.function._common_components.image_matcher import (
+    DEFAULT_MATCH_THRESHOLD, TemplateMatchCache, load_template
+)
+from BE.function._common_components.pixel_probe import PixelProbeSet
+from BE.log.base_log_manager import BaseLogManager
+
+# 폴링 간격 기본값 (초). 화면이 바뀌면 최소 간격, 바뀌지 않으면 최대 간격까지 점점 늘림
+DEFAULT_MIN_INTERVAL = 0.033
+DEFAULT_MAX_INTERVAL = 0.5
+INTERVAL_BACKOFF = 1.5
+
+# 감시 작업이 한 코어에서 차지할 수 있는 최대 시간 비율
+DEFAULT_CPU_BUDGET = 0.1
+
+# 같은 조건이 다시 발생해도 트리거하지 않는 시간 (초)
+DEFAULT_COOLDOWN = 1.0
+
+WATCH_TYPES = ('image_search', 'pixel_check')
+
+# 공유 캡처 백엔드에서 감시 스레드가 쓰는 버퍼 이름 (실행기의 캡처 프레임을 덮어쓰지 않도록)
+CAPTURE_SLOT = 'roi_watcher'
+
+
+class RoiWatcher:
+    """화면 트리거 조건 하나
+
+    조건은 이미지 서치/픽셀 확인 아이템과 같은 형식의 dict이며, 조건이 거짓에서 참으로
+    바뀌는 순간(상승 에지)에만 트리거하고 cooldown 동안은 다시 트리거하지 않습니다.
+    """
+
+    def __init__(self, watcher_id, condition):
+        """초기화
+
+        Args:
+            watcher_id (str): 감시 ID (로직 ID)
+            condition (dict): 감시 조건
+                - type: "image_search" 또는 "pixel_check"
+                - image_search: area, template_path, template_key, threshold, multi_scale, use_edges
+                - pixel_check: probes, mode
+                - cooldown: 다시 트리거하지 않는 시간 (초)
+        """
+        self.watcher_id = watcher_id
+        self.condition = condition
+        self.type = condition.get('type')
+        if self.type not in WATCH_TYPES:
+            raise ValueError(f"지원하지 않는 화면 트리거 종류입니다: {self.type}")
+
+        self.cooldown = float(condition.get('cooldown', DEFAULT_COOLDOWN))
+        self.matched = False
+        self.last_fired = 0.0
+        self._last_probe_result = None
+
+        if self.type == 'pixel_check':
+            self.probe_set = PixelProbeSet(condition.get('probes') or [])
+        else:
+            self.template_key, self.template = self._load_template(condition)
+            self.roi_key = ('roi_watcher', watcher_id)
+
+    @staticmethod
+    def _load_template(condition):
+        """저장 시 전처리된 템플릿 피라미드를 우선 사용하고, 없으면 원본 이미지를 읽습니다."""
+        template_key = condition.get('template_key')
+        if template_key:
+            from BE.function._common_components.template_pyramid_store import TemplatePyramidStore
+            pyramid = TemplatePyramidStore.instance().get(template_key)
+            if pyramid is not None:
+                return template_key, pyramid
+
+        template_path = condition.get('template_path')
+        template = load_template(template_path) if template_path else None
+        if template is None:
+            raise ValueError(f"템플릿 이미지를 불러올 수 없습니다: {template_path}")
+        return template_path, template
+
+    def region(self, frame_width, frame_height):
+        """캡처 프레임에서 잘라낼 클라이언트 좌표 영역 (x, y, width, height)"""
+        if self.type == 'pixel_check':
+            return self.probe_set.bounds
+        area = self.condition.get('area') or {}
+        x = int(frame_width * area.get('x_ratio', 0))
+        y = int(frame_height * area.get('y_ratio', 0))
+        width = int(frame_width * (area.get('x_ratio', 0) + area.get('width_ratio', 0))) - x
+        height = int(frame_height * (area.get('y_ratio', 0) + area.get('height_ratio', 0))) - y
+        return (x, y, width, height)
+
+    def evaluate(self, view, match_cache):
+        """영역 이미지로 조건을 평가합니다.
+
+        Returns:
+            tuple: (matched, changed) 조건 충족 여부, 지난 평가 이후 영역이 바뀌었는지 여부
+        """
+        if view is None:
+            return False, False
+
+        if self.type == 'pixel_check':
+            result = self.probe_set.evaluate(view)
+            changed = self._last_probe_result is None or (result != self._last_probe_result).any()
+            self._last_probe_result = result
+            if self.condition.get('mode', 'all') == 'any':
+                return bool(result.any()), bool(changed)
+            return bool(result.all()), bool(changed)
+
+        # 영역이 바뀌지 않았으면 TemplateMatchCache가 matchTemplate을 건너뜀
+        result = match_cache.match(
+            view, self.template, float(self.condition.get('threshold', DEFAULT_MATCH_THRESHOLD)),
+            template_key=self.template_key, roi_key=self.roi_key,
+            multi_scale=self.condition.get('multi_scale', False),
+            use_edges=self.condition.get('use_edges', False)
+        )
+        return result.found, not result.cached
+
+    def should_fire(self, matched, now):
+        """상승 에지이고 cooldown이 지났으면 True를 반환합니다."""
+        rising = matched and not self.matched
+        self.matched = matched
+        if rising and now - self.last_fired >= self.cooldown:
+            self.last_fired = now
+            return True
+        return False
+
+
+class RoiWatcherService(QObject):
+    """화면 영역 변화 감시 트리거 서비스 (싱글톤)
+
+    등록된 모든 감시 조건이 한 번의 캡처 프레임을 공유합니다. 틱마다 클라이언트 영역을
+    한 번 캡처하고 각 조건의 영역 뷰를 잘라 평가하며, 조건이 새로 충족되면 triggered
+    시그널로 감시 ID(로직 ID)를 알립니다. 시그널은 작업 스레드에서 발생하므로
+    QObject 슬롯에 연결하면 메인 스레드에서 처리됩니다.
+
+    CPU 사용량 제한:
+        - 영역이 바뀌지 않은 틱이 이어지면 폴링 간격을 최대 간격까지 늘림
+        - 한 틱의 작업 시간이 cpu_budget 비율을 넘지 않도록 대기 시간을 늘림
+    """
+
+    triggered = Signal(str)  # 감시 ID (로직 ID)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if RoiWatcherService._instance is not None:
+            raise RuntimeError("RoiWatcherService는 싱글톤입니다. instance()를 사용하세요.")
+        super().__init__()
+
+        self.base_log_manager = BaseLogManager.instance()
+        self.min_interval = DEFAULT_MIN_INTERVAL
+        self.max_interval = DEFAULT_MAX_INTERVAL
+        self.cpu_budget = DEFAULT_CPU_BUDGET
+        self.interval = DEFAULT_MIN_INTERVAL
+
+        self._watchers = []
+        self._hwnd = None
+        self._backend = None
+        self._owns_backend = False  # 직접 만든 백엔드만 중지할 때 닫음 (주입된 백엔드는 소유자가 닫음)
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.reset_metrics()
+
+    def configure(self, min_interval=None, max_interval=None, cpu_budget=None):
+        """폴링 간격과 CPU 사용 비율을 설정합니다.
+
+        Args:
+            min_interval (float, optional): 최소 폴링 간격 (초)
+            max_interval (float, optional): 최대 폴링 간격 (초)
+            cpu_budget (float, optional): 감시 작업의 최대 CPU 시간 비율 (0 ~ 1)
+        """
+        if min_interval is not None:
+            self.min_interval = max(float(min_interval), 0.001)
+        if max_interval is not None:
+            self.max_interval = max(float(max_interval), self.min_interval)
+        if cpu_budget is not None:
+            self.cpu_budget = min(max(float(cpu_budget), 0.01), 1.0)
+
+    def set_watchers(self, conditions):
+        """감시 조건을 교체합니다. 잘못된 조건은 로그를 남기고 제외합니다.
+
+        Args:
+            conditions (dict): {감시 ID: 조건 dict}
+
+        Returns:
+            int: 등록된 감시 조건 수
+        """
+        watchers = []
+        for watcher_id, condition in conditions.items():
+            try:
+                watchers.append(RoiWatcher(watcher_id, condition))
+            except Exception as e:
+                self.base_log_manager.log(
+                    message=f"화면 트리거 등록 실패 ({watcher_id}): {e}",
+                    level="WARNING",
+                    file_name="roi_watcher",
+                    method_name="set_watchers"
+                )
+        with self._lock:
+            self._watchers = watchers
+            self.interval = self.min_interval
+        return len(watchers)
+
+    @property
+    def is_running(self):
+        """감시 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, hwnd, backend=None):
+        """대상 창 감시를 시작합니다. 이미 실행 중이면 대상 창만 바꿉니다. (메인 스레드에서 호출)
+
+        Args:
+            hwnd: 대상 윈도우 핸들
+            backend (CaptureBackend, optional): 공유할 캡처 백엔드 (예: 실행기 WindowController의 백엔드).
+                캡처 세션과 버퍼 풀을 함께 쓰며, 감시 스레드는 CAPTURE_SLOT 버퍼에 캡처합니다.
+                없으면 플랫폼 기본 백엔드를 직접 만들어 사용합니다.
+        """
+        # 창 위치 변경 훅은 메시지 루프가 있는 메인 스레드에 설치되어야 감시 스레드의 조회도 캐시됨
+        if sys.platform == 'win32' and hwnd:
+            from BE.function._common_components.window_geometry_cache import WindowGeometryCache
+            WindowGeometryCache.instance().warm(hwnd)
+
+        with self._lock:
+            if backend is not None and backend is not self._backend:
+                self._close_backend()
+                self._backend = backend
+                self._owns_backend = False
+            elif self._backend is None:
+                self._backend = get_default_capture_backend()
+                self._owns_backend = True
+            self._hwnd = hwnd
+            self.interval = self.min_interval
+
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="RoiWatcherService", daemon=True)
+        self._thread.start()
+        self.base_log_manager.log(
+            message=f"화면 트리거 감시 시작 (조건 {len(self._watchers)}개)",
+            level="INFO",
+            file_name="roi_watcher",
+            method_name="start"
+        )
+
+    def stop(self, timeout=1.0):
+        """감시를 중지하고 캡처 세션을 닫습니다."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout)
+        self._thread = None
+        with self._lock:
+            self._close_backend()
+        self.base_log_manager.log(
+            message="화면 트리거 감시 중지",
+            level="INFO",
+            file_name="roi_watcher",
+            method_name="stop"
+        )
+
+    def _close_backend(self):
+        """직접 만든 백엔드를 닫습니다. 주입된 백엔드는 감시 slot만 해제하고 그대로 둡니다. (잠금 상태에서 호출)"""
+        if self._backend is None:
+            return
+        if self._owns_backend:
+            self._backend.close()
+            self._backend = None
+            self._owns_backend = False
+        else:
+            self._backend.release_slot(CAPTURE_SLOT)
+
+    def tick(self):
+        """한 번 캡처하여 모든 감시 조건을 평가합니다.
+
+        Returns:
+            bool: 영역이 바뀌었거나 트리거가 발생했으면 True
+        """
+        # 캡처 중에 백엔드가 닫히거나 바뀌지 않도록 잠금 상태에서 캡처하고,
+        # 공유 백엔드의 버퍼는 다른 스레드(실행기)가 닫거나 교체할 수 있으므로 잠금 안에서 감시 영역만 복사
+        with self._lock:
+            watchers = list(self._watchers)
+            if not watchers or self._backend is None:
+                return False
+            frame = self._backend.capture(self._hwnd, slot=CAPTURE_SLOT)
+            self._metrics['captures'] += 1
+            if frame is None:
+                return False
+            frame_height, frame_width = frame.shape[:2]
+            views = [
+                view.copy() if view is not None else None
+                for view in crop_regions(frame, [watcher.region(frame_width, frame_height) for watcher in watchers])
+            ]
+            del frame
+
+        match_cache = TemplateMatchCache.instance()
+        now = time.perf_counter()
+        active = False
+        fired = []
+        for watcher, view in zip(watchers, views):
+            matched, changed = watcher.evaluate(view, match_cache)
+            self._metrics['evaluations'] += 1
+            if changed:
+                active = True
+            if watcher.should_fire(matched, now):
+                fired.append(watcher.watcher_id)
+
+        for watcher_id in fired:
+            self._metrics['fired'] += 1
+            self.triggered.emit(watcher_id)
+        return active or bool(fired)
+
+    def get_metrics(self):
+        """감시 지표를 반환합니다.
+
+        Returns:
+            dict: {'ticks', 'captures', 'evaluations', 'fired', 'busy_ms', 'cpu_ratio', 'interval_ms', 'watchers'}
+        """
+        metrics = dict(self._metrics)
+        elapsed = time.perf_counter() - self._metrics_started
+        metrics['cpu_ratio'] = metrics['busy_ms'] / 1000 / elapsed if elapsed > 0 else 0.0
+        metrics['interval_ms'] = self.interval * 1000
+        metrics['watchers'] = len(self._watchers)
+        return metrics
+
+    def reset_metrics(self):
+        """지표를 초기화합니다."""
+        self._metrics = {'ticks': 0, 'captures': 0, 'evaluations': 0, 'fired': 0, 'busy_ms': 0.0}
+        self._metrics_started = time.perf_counter()
+
+    def _run(self):
+        """감시 스레드 루프"""
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                active = self.tick()
+            except Exception as e:
+                active = False
+                self.base_log_manager.log(
+                    message=f"화면 트리거 감시 중 오류 발생: {e}",
+                    level="ERROR",
+                    file_name="roi_watcher",
+                    method_name="_run",
+                    print_to_terminal=True
+                )
+            busy = time.perf_counter() - started
+            self._metrics['ticks'] += 1
+            self._metrics['busy_ms'] += busy * 1000
+
+            self.interval = self.min_interval if active else min(self.interval * INTERVAL_BACKOFF, self.max_interval)
+            # 작업 시간이 길면 CPU 사용 비율을 넘지 않도록 더 쉼
+            wait = max(self.interval - busy, busy * (1.0 / self.cpu_budget - 1.0))
+            self._stop_event.wait(wait)
+
+
+def benchmark_roi_watcher(watcher_count=8, frame_size=(1920, 1080), idle_seconds=2.0):
+    """합성 프레임으로 화면 트리거 감시 성능을 측정합니다.
+
+    1. 모든 조건이 한 프레임을 공유할 때와 조건마다 캡처할 때의 틱 비용 비교
+    2. 화면이 바뀌지 않는 동안의 폴링 간격과 CPU 사용 비율
+    3. 조건이 충족되는 순간부터 트리거까지의 지연
+
+    Returns:
+        dict: {'shared_tick_ms', 'per_watcher_tick_ms', 'idle_interval_ms', 'idle_cpu_ratio', 'trigger_latency_ms'}
+    """
+    import os
+    import tempfile
+    import cv2
+    import numpy as np
+
+    width, height = frame_size
+    backend = SyntheticCaptureBackend(size=frame_size, seed=1)
+    base_frame = np.random.default_rng(1).integers(0, 256, (height, width, 4), dtype=np.uint8)
+    backend.set_frame(base_frame)
+
+    # 짝수 번째는 템플릿 조건(화면에 없는 무늬), 홀수 번째는 픽셀 조건으로 구성하고
+    # 마지막 조건(픽셀)을 트리거 대상으로 둠
+    conditions = {}
+    rng = np.random.default_rng(2)
+    template_dir = tempfile.mkdtemp(prefix="roi_watcher_")
+    for index in range(watcher_count):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(0, height - 150))
+        if index % 2 == 0 and index != watcher_count - 1:
+            template_path = os.path.join(template_dir, f"template_{index}.png")
+            cv2.imwrite(template_path, rng.integers(0, 256, (40, 40), dtype=np.uint8))
+            conditions[f"watcher_{index}"] = {
+                'type': 'image_search', 'template_path': template_path,
+                'area': {'x_ratio': x / width, 'y_ratio': y / height,
+                         'width_ratio': 200 / width, 'height_ratio': 150 / height},
+                'cooldown': 0
+            }
+        else:
+            probes = [{'x': x + dx, 'y': y + dy, 'rgb': [255, 0, 255], 'tolerance': 0}
+                      for dx in (0, 20, 39) for dy in (0, 20, 39)]
+            conditions[f"watcher_{index}"] = {'type': 'pixel_check', 'probes': probes, 'mode': 'all', 'cooldown': 0}
+
+    service = RoiWatcherService.instance()
+    service.set_watchers(conditions)
+    service._backend, service._hwnd = backend, None
+
+    iterations = 50
+    started = time.perf_counter()
+    for _ in range(iterations):
+        service.tick()
+    shared_tick_ms = (time.perf_counter() - started) * 1000 / iterations
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for watcher in service._watchers:
+            frame = backend.capture(None)
+            view = crop_regions(frame, [watcher.region(width, height)])[0]
+            watcher.evaluate(view, TemplateMatchCache.instance())
+    per_watcher_tick_ms = (time.perf_counter() - started) * 1000 / iterations
+
+    fired_at = []
+    # 이벤트 루프 없이 측정하므로 감시 스레드에서 바로 호출되도록 직접 연결
+    service.triggered.connect(lambda watcher_id: fired_at.append(time.perf_counter()), Qt.DirectConnection)
+    service.reset_metrics()
+    service.start(None, backend)
+    time.sleep(idle_seconds)
+    idle_metrics = service.get_metrics()
+
+    # 마지막 조건의 지점들을 기대 색상으로 칠해 조건 충족
+    changed_frame = base_frame.copy()
+    for probe in conditions[f"watcher_{watcher_count - 1}"]['probes']:
+        changed_frame[probe['y'], probe['x']] = (255, 0, 255, 255)
+    changed_at = time.perf_counter()
+    backend.set_frame(changed_frame)
+    deadline = changed_at + 2.0
+    while not fired_at and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    service.stop()
+
+    return {
+        'shared_tick_ms': shared_tick_ms,
+        'per_watcher_tick_ms': per_watcher_tick_ms,
+        'idle_interval_ms': idle_metrics['interval_ms'],
+        'idle_cpu_ratio': idle_metrics['cpu_ratio'],
+        'trigger_latency_ms': (fired_at[0] - changed_at) * 1000 if fired_at else None
+    }
+
+
+if __name__ == '__main__':
+    result = benchmark_roi_watcher()
+    print(f"틱 비용: 공유 캡처 {result['shared_tick_ms']:.2f}ms / 조건별 캡처 {result['per_watcher_tick_ms']:.2f}ms")
+    print(f"변화 없을 때: 폴링 간격 {result['idle_interval_ms']:.0f}ms, CPU {result['idle_cpu_ratio'] * 100:.2f}%")
+    latency = result['trigger_latency_ms']
+    print(f"트리거 지연: {latency:.1f}ms" if latency is not None else "트리거 지연: 시간 초과")
@@ -0,0 +1,332 @@
+import sys
+import time
+from PySide6.QtCore import QObject, QTimer
+from BE.function._common_components.foreground_window_tracker import ForegroundWindowTracker
+from BE.log.base_log_manager import BaseLogManager
+
+
+class StateSubscription:
+    """상태 버스 구독 정보와 콜백 비용 지표
+
+    Attributes:
+        topic (str): 구독한 상태 이름
+        callback (callable): 상태가 바뀌었을 때 호출할 콜백
+        name (str): 지표에 표시할 구독자 이름
+        keys (tuple): buttons 토픽에서 감시할 가상 키 코드 목록
+        call_count (int): 콜백 호출 횟수
+        total_ns (int): 콜백 누적 실행 시간 (나노초)
+        max_ns (int): 콜백 최대 실행 시간 (나노초)
+    """
+
+    def __init__(self, topic, callback, name, keys=()):
+        self.topic = topic
+        self.callback = callback
+        self.name = name
+        self.keys = tuple(keys)
+        self.call_count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def dispatch(self, value):
+        """콜백을 호출하고 실행 시간을 기록합니다."""
+        start_ns = time.perf_counter_ns()
+        try:
+            self.callback(value)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            self.call_count += 1
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+
+
+class SystemStateBus(QObject):
+    """여러 컴포넌트가 공유하는 시스템 상태 버스 (싱글톤)
+
+    컴포넌트마다 타이머를 두고 같은 OS 상태를 따로 폴링하지 않도록,
+    하나의 타이머로 상태를 샘플링하고 값이 바뀔 때만 구독자에게 알립니다.
+
+    토픽:
+        foreground: 활성 프로세스 정보 (ForegroundWindowTracker 이벤트로 갱신, 폴링 없음)
+        process_alive: 선택된 프로세스 창의 생존 여부 (bool)
+        buttons: 구독자가 지정한 가상 키의 눌림 상태 ({가상 키: bool})
+
+    폴링이 필요한 토픽(process_alive, buttons)에 구독자가 있을 때만 타이머가 동작하며,
+    토픽마다 폴링 간격(POLL_INTERVALS_MS)이 따로 있어 타이머는 구독자가 있는 토픽 중
+    가장 짧은 간격으로 돌고 각 토픽은 자기 간격이 지났을 때만 샘플링합니다.
+    따라서 5ms 간격의 buttons 폴링은 클릭 대기처럼 buttons 구독자가 있는 동안에만 일어납니다.
+    """
+
+    TOPIC_FOREGROUND = "foreground"
+    TOPIC_PROCESS_ALIVE = "process_alive"
+    TOPIC_BUTTONS = "buttons"
+
+    POLLED_TOPICS = (TOPIC_PROCESS_ALIVE, TOPIC_BUTTONS)
+
+    # 토픽별 폴링 간격 (밀리초)
+    POLL_INTERVALS_MS = {
+        TOPIC_PROCESS_ALIVE: 250,  # 창이 닫혔는지는 느리게 확인해도 충분
+        TOPIC_BUTTONS: 5,  # 클릭 대기의 기존 체크 간격과 동일
+    }
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, intervals_ms=None):
+        """초기화
+
+        Args:
+            intervals_ms (dict, optional): 토픽 -> 폴링 간격(밀리초). 없는 토픽은 POLL_INTERVALS_MS 사용
+        """
+        if SystemStateBus._instance is not None:
+            raise RuntimeError("SystemStateBus는 싱글톤입니다. instance()를 사용하세요.")
+
+        super().__init__()
+        self.base_log_manager = BaseLogManager.instance()
+        self._subscriptions = {topic: [] for topic in (self.TOPIC_FOREGROUND,) + self.POLLED_TOPICS}
+        self._selected_process = None
+        self._state = {
+            self.TOPIC_FOREGROUND: None,
+            self.TOPIC_PROCESS_ALIVE: None,
+            self.TOPIC_BUTTONS: {}
+        }
+
+        self._intervals_ms = dict(self.POLL_INTERVALS_MS)
+        self._intervals_ms.update(intervals_ms or {})
+        self._last_polled = {topic: 0.0 for topic in self.POLLED_TOPICS}  # 토픽별 마지막 샘플 시각
+
+        # 지표
+        self._wakeup_count = 0
+        self._metrics_start = time.perf_counter()
+
+        self._timer = QTimer()
+        self._timer.setInterval(min(self._intervals_ms.values()))
+        self._timer.timeout.connect(self._poll)
+
+        self._foreground_tracker = ForegroundWindowTracker.instance()
+        self._state[self.TOPIC_FOREGROUND] = self._foreground_tracker.active_process
+        self._foreground_tracker.active_process_changed.connect(self._on_foreground_changed)
+
+    @property
+    def interval_ms(self):
+        """타이머 간격 (밀리초, 구독자가 있는 폴링 토픽 중 가장 짧은 간격)"""
+        return self._timer.interval()
+
+    @property
+    def is_polling(self):
+        """폴링 타이머가 동작 중인지 여부"""
+        return self._timer.isActive()
+
+    def get_interval(self, topic):
+        """토픽의 폴링 간격(밀리초)을 반환합니다."""
+        return self._intervals_ms[topic]
+
+    def set_interval(self, topic, interval_ms):
+        """토픽의 폴링 간격을 변경합니다.
+
+        Args:
+            topic (str): 폴링 토픽 (TOPIC_PROCESS_ALIVE, TOPIC_BUTTONS)
+            interval_ms (int): 폴링 간격 (밀리초)
+        """
+        if topic not in self._intervals_ms:
+            raise ValueError(f"폴링하지 않는 토픽입니다: {topic}")
+        self._intervals_ms[topic] = interval_ms
+        self._update_timer()
+
+    def get_state(self, topic):
+        """토픽의 마지막 샘플 값을 반환합니다."""
+        return self._state[topic]
+
+    def subscribe(self, topic, callback, name=None, keys=()):
+        """상태 변경을 구독합니다.
+
+        Args:
+            topic (str): 구독할 토픽 (TOPIC_FOREGROUND, TOPIC_PROCESS_ALIVE, TOPIC_BUTTONS)
+            callback (callable): 값이 바뀌었을 때 새 값을 인자로 호출할 콜백
+            name (str, optional): 지표에 표시할 구독자 이름. 없으면 콜백 이름 사용
+            keys (iterable): TOPIC_BUTTONS 구독 시 감시할 가상 키 코드 목록
+
+        Returns:
+            StateSubscription: unsubscribe()에 전달할 구독 정보
+        """
+        if topic not in self._subscriptions:
+            raise ValueError(f"알 수 없는 토픽입니다: {topic}")
+
+        subscription = StateSubscription(
+            topic, callback, name or getattr(callback, '__qualname__', repr(callback)), keys
+        )
+        self._subscriptions[topic].append(subscription)
+
+        if topic == self.TOPIC_BUTTONS:
+            # 새 키는 현재 상태로 초기화하여 구독 직후 잘못된 변경 알림이 가지 않도록 함
+            buttons = dict(self._state[self.TOPIC_BUTTONS])
+            for vk in subscription.keys:
+                if vk not in buttons:
+                    buttons[vk] = self._is_key_pressed(vk)
+            self._state[self.TOPIC_BUTTONS] = buttons
+        elif topic == self.TOPIC_PROCESS_ALIVE and self._state[topic] is None:
+            self._state[topic] = self._is_selected_process_alive()
+            self._last_polled[topic] = time.perf_counter()
+
+        self._update_timer()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """구독을 해제합니다.
+
+        Args:
+            subscription (StateSubscription): subscribe()가 반환한 구독 정보
+        """
+        subscriptions = self._subscriptions.get(subscription.topic, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+
+        if subscription.topic == self.TOPIC_BUTTONS:
+            watched = self._watched_keys()
+            self._state[self.TOPIC_BUTTONS] = {
+                vk: pressed for vk, pressed in self._state[self.TOPIC_BUTTONS].items() if vk in watched
+            }
+
+        self._update_timer()
+
+    def set_selected_process(self, process_info):
+        """생존 여부를 감시할 선택 프로세스를 설정합니다.
+
+        Args:
+            process_info (dict): 선택된 프로세스 정보 (없으면 None)
+        """
+        self._selected_process = process_info
+        if self._subscriptions[self.TOPIC_PROCESS_ALIVE]:
+            self._publish(self.TOPIC_PROCESS_ALIVE, self._is_selected_process_alive())
+
+    def get_metrics(self):
+        """폴링 지표를 반환합니다.
+
+        Returns:
+            dict: {
+                'interval_ms': int,            # 현재 타이머 간격
+                'polling': bool,               # 타이머 동작 여부
+                'topic_intervals_ms': {토픽: int},
+                'wakeups_per_second': float,   # 타이머 틱과 이벤트 알림을 합친 초당 깨어난 횟수
+                'subscribers': [
+                    {'name', 'topic', 'calls', 'total_ms', 'avg_ms', 'max_ms'}, ...
+                ]
+            }
+        """
+        elapsed = time.perf_counter() - self._metrics_start
+        subscribers = []
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                calls = subscription.call_count
+                subscribers.append({
+                    'name': subscription.name,
+                    'topic': subscription.topic,
+                    'calls': calls,
+                    'total_ms': subscription.total_ns / 1e6,
+                    'avg_ms': subscription.total_ns / calls / 1e6 if calls else 0.0,
+                    'max_ms': subscription.max_ns / 1e6
+                })
+
+        return {
+            'interval_ms': self.interval_ms,
+            'polling': self.is_polling,
+            'topic_intervals_ms': dict(self._intervals_ms),
+            'wakeups_per_second': self._wakeup_count / elapsed if elapsed > 0 else 0.0,
+            'subscribers': subscribers
+        }
+
+    def reset_metrics(self):
+        """지표를 초기화합니다."""
+        self._wakeup_count = 0
+        self._metrics_start = time.perf_counter()
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.call_count = 0
+                subscription.total_ns = 0
+                subscription.max_ns = 0
+
+    def _update_timer(self):
+        """폴링이 필요한 구독자가 있을 때만, 그 토픽들 중 가장 짧은 간격으로 타이머를 동작시킵니다."""
+        intervals = [self._intervals_ms[topic] for topic in self.POLLED_TOPICS if self._subscriptions[topic]]
+        if not intervals:
+            if self._timer.isActive():
+                self._timer.stop()
+            return
+
+        interval_ms = min(intervals)
+        if self._timer.interval() != interval_ms:
+            self._timer.setInterval(interval_ms)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _is_due(self, topic, now):
+        """토픽의 폴링 간격이 지났는지 여부 (타이머 지연을 고려해 틱 간격의 절반까지 일찍 허용)"""
+        elapsed_ms = (now - self._last_polled[topic]) * 1000
+        return elapsed_ms + self._timer.interval() / 2 >= self._intervals_ms[topic]
+
+    def _on_foreground_changed(self, process):
+        """ForegroundWindowTracker의 활성 프로세스 변경 이벤트 처리"""
+        self._wakeup_count += 1
+        self._publish(self.TOPIC_FOREGROUND, process)
+
+    def _poll(self):
+        """간격이 지난 폴링 토픽만 샘플링하고 바뀐 값만 알립니다."""
+        self._wakeup_count += 1
+        now = time.perf_counter()
+
+        if self._subscriptions[self.TOPIC_PROCESS_ALIVE] and self._is_due(self.TOPIC_PROCESS_ALIVE, now):
+            self._last_polled[self.TOPIC_PROCESS_ALIVE] = now
+            self._publish(self.TOPIC_PROCESS_ALIVE, self._is_selected_process_alive())
+
+        if self._subscriptions[self.TOPIC_BUTTONS] and self._is_due(self.TOPIC_BUTTONS, now):
+            self._last_polled[self.TOPIC_BUTTONS] = now
+            buttons = {vk: self._is_key_pressed(vk) for vk in self._state[self.TOPIC_BUTTONS]}
+            self._publish(self.TOPIC_BUTTONS, buttons)
+
+    def _publish(self, topic, value):
+        """값이 바뀐 경우에만 저장하고 구독자에게 알립니다."""
+        if self._state[topic] == value:
+            return
+        self._state[topic] = value
+
+        # 콜백 안에서 구독 해제될 수 있으므로 복사본으로 순회
+        for subscription in list(self._subscriptions[topic]):
+            try:
+                subscription.dispatch(value)
+            except Exception as e:
+                self.base_log_manager.log(
+                    message=f"구독자 '{subscription.name}' 콜백 실행 중 오류 발생: {e}",
+                    level="ERROR",
+                    file_name="system_state_bus",
+                    method_name="_publish",
+                    print_to_terminal=True
+                )
+
+    def _watched_keys(self):
+        """buttons 구독자들이 감시하는 가상 키 집합"""
+        return {vk for subscription in self._subscriptions[self.TOPIC_BUTTONS] for vk in subscription.keys}
+
+    def _is_selected_process_alive(self):
+        """선택된 프로세스의 창이 아직 존재하는지 확인합니다."""
+        if not self._selected_process or not self._selected_process.get('hwnd'):
+            return False
+        if sys.platform != 'win32':
+            return True
+
+        import win32gui
+        return bool(win32gui.IsWindow(self._selected_process['hwnd']))
+
+    @staticmethod
+    def _is_key_pressed(virtual_key):
+        """가상 키가 현재 눌려 있는지 확인합니다."""
+        if sys.platform != 'win32':
+            return False
+
+        import win32api
+        return bool(win32api.GetAsyncKeyState(virtual_key) & 0x8000)
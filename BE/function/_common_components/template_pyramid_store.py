@@ -0,0 +1,206 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from BE.function._common_components.lazy_import import lazy_import
+from BE.database.connection import DatabaseConnection
+from BE.function._common_components.image_matcher import (
+    DEFAULT_PYRAMID_SCALES, TemplatePyramid, build_template_pyramid
+)
+from BE.log.base_log_manager import BaseLogManager
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+
+class TemplatePyramidStore:
+    """이미지 서치 템플릿 피라미드 저장소 (싱글톤)
+
+    로직을 저장할 때 템플릿을 배율별 그레이스케일(과 선택적 윤곽선 맵)로 미리 전처리하여
+    로직 DB의 template_pyramids 테이블에 PNG BLOB으로 저장합니다.
+    템플릿 키는 원본 이미지 파일 내용의 해시이므로 같은 이미지는 한 번만 저장됩니다.
+
+    실행 중에는 처음 사용할 때만 DB에서 읽고, 메모리 제한이 있는 LRU 캐시에 보관합니다.
+    SQLite 연결은 스레드마다 따로 엽니다.
+    """
+
+    DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024  # 64MB
+
+    KIND_GRAY = "gray"
+    KIND_EDGE = "edge"
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_cache_bytes=DEFAULT_MAX_CACHE_BYTES):
+        """초기화
+
+        Args:
+            max_cache_bytes (int): 메모리에 보관할 피라미드의 최대 크기 (bytes)
+        """
+        if TemplatePyramidStore._instance is not None:
+            raise RuntimeError("TemplatePyramidStore는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self.db_path = str(DatabaseConnection.get_instance().db_path)
+        self.max_cache_bytes = max_cache_bytes
+        self._cache = OrderedDict()  # template_key -> TemplatePyramid
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def store_from_file(self, path, scales=DEFAULT_PYRAMID_SCALES, with_edges=False):
+        """템플릿 이미지 파일을 전처리하여 저장합니다.
+
+        같은 키와 구성(배율, 윤곽선 여부)으로 이미 저장되어 있으면 다시 계산하지 않습니다.
+
+        Args:
+            path (str): 템플릿 이미지 경로
+            scales (tuple): 만들 배율 목록
+            with_edges (bool): 윤곽선 맵도 저장할지 여부
+
+        Returns:
+            str: 템플릿 키 (파일을 읽을 수 없으면 None)
+        """
+        try:
+            data = np.fromfile(path, dtype=np.uint8)
+        except OSError:
+            return None
+
+        key = hashlib.sha1(data.tobytes()).hexdigest()
+        if self._is_stored(key, scales, with_edges):
+            return key
+
+        image = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            return None
+
+        pyramid = build_template_pyramid(image, scales, with_edges, key=key)
+        rows = []
+        for level, (scale, gray, edges) in enumerate(pyramid.levels):
+            rows.append((key, self.KIND_GRAY, level, scale, gray.shape[1], gray.shape[0], self._encode(gray)))
+            if edges is not None:
+                rows.append((key, self.KIND_EDGE, level, scale, edges.shape[1], edges.shape[0], self._encode(edges)))
+
+        connection = self._get_connection()
+        with connection:
+            connection.execute("DELETE FROM template_pyramids WHERE template_key = ?", (key,))
+            connection.executemany("""
+                INSERT INTO template_pyramids (template_key, kind, level, scale, width, height, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+        # 구성이 바뀌었을 수 있으므로 메모리 캐시에서도 제거
+        self._evict(key)
+
+        self.base_log_manager.log(
+            message=f"템플릿 피라미드 저장 완료 (키: {key[:12]}, 배율 {len(pyramid.levels)}개, 윤곽선: {with_edges})",
+            level="DEBUG",
+            file_name="template_pyramid_store",
+            method_name="store_from_file"
+        )
+        return key
+
+    def get(self, key):
+        """템플릿 피라미드를 반환합니다. 메모리에 없으면 DB에서 읽습니다.
+
+        Args:
+            key (str): 템플릿 키
+
+        Returns:
+            TemplatePyramid: 전처리된 템플릿 (저장되어 있지 않으면 None)
+        """
+        with self._lock:
+            pyramid = self._cache.get(key)
+            if pyramid is not None:
+                self._cache.move_to_end(key)
+                return pyramid
+
+        rows = self._get_connection().execute("""
+            SELECT kind, level, scale, data FROM template_pyramids
+            WHERE template_key = ? ORDER BY level
+        """, (key,)).fetchall()
+        if not rows:
+            return None
+
+        levels = {}
+        for kind, level, scale, data in rows:
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+            entry = levels.setdefault(level, [scale, None, None])
+            entry[1 if kind == self.KIND_GRAY else 2] = image
+        pyramid = TemplatePyramid(key, [tuple(levels[level]) for level in sorted(levels)])
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = pyramid
+                self._cache_bytes += pyramid.nbytes
+            self._shrink()
+        return pyramid
+
+    def delete_unused(self, used_keys):
+        """사용하지 않는 템플릿 피라미드를 DB에서 삭제합니다.
+
+        Args:
+            used_keys (iterable): 아직 로직에서 사용 중인 템플릿 키 목록
+        """
+        used_keys = set(used_keys)
+        connection = self._get_connection()
+        stored_keys = [row[0] for row in connection.execute("SELECT DISTINCT template_key FROM template_pyramids")]
+        unused_keys = [key for key in stored_keys if key not in used_keys]
+        with connection:
+            connection.executemany("DELETE FROM template_pyramids WHERE template_key = ?",
+                                   [(key,) for key in unused_keys])
+        for key in unused_keys:
+            self._evict(key)
+
+    def get_cache_info(self):
+        """메모리 캐시 상태를 반환합니다.
+
+        Returns:
+            dict: {'entries', 'bytes', 'max_bytes'}
+        """
+        with self._lock:
+            return {'entries': len(self._cache), 'bytes': self._cache_bytes, 'max_bytes': self.max_cache_bytes}
+
+    def _is_stored(self, key, scales, with_edges):
+        """같은 구성의 피라미드가 이미 저장되어 있는지 확인합니다."""
+        rows = self._get_connection().execute(
+            "SELECT kind, scale FROM template_pyramids WHERE template_key = ?", (key,)
+        ).fetchall()
+        stored_scales = {scale for kind, scale in rows if kind == self.KIND_GRAY}
+        has_edges = any(kind == self.KIND_EDGE for kind, _ in rows)
+        return bool(rows) and stored_scales == set(scales) | {1.0} and has_edges == with_edges
+
+    def _evict(self, key):
+        """메모리 캐시에서 피라미드를 제거합니다."""
+        with self._lock:
+            pyramid = self._cache.pop(key, None)
+            if pyramid is not None:
+                self._cache_bytes -= pyramid.nbytes
+
+    def _shrink(self):
+        """메모리 제한을 넘으면 오래 사용하지 않은 피라미드부터 제거합니다. (_lock 보유 상태에서 호출)"""
+        while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+            _, pyramid = self._cache.popitem(last=False)
+            self._cache_bytes -= pyramid.nbytes
+
+    def _get_connection(self):
+        """현재 스레드의 DB 연결을 반환합니다."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.db_path)
+        return connection
+
+    @staticmethod
+    def _encode(image):
+        """이미지를 무손실 PNG 바이트로 인코딩합니다."""
+        success, encoded = cv2.imencode('.png', image)
+        if not success:
+            raise ValueError("템플릿 PNG 인코딩 실패")
+        return encoded.tobytes()
@@ -0,0 +1,98 @@
+import ctypes
+
+# WinEvent 상수
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+
+
+class WinEventHook:
+    """SetWinEventHook 래퍼
+
+    WINEVENT_OUTOFCONTEXT 훅은 훅을 설치한 스레드의 메시지 루프에서 콜백되므로
+    Qt 메인 스레드에서 install()을 호출해야 합니다.
+    콜백은 (event, hwnd, idObject, idChild) 인자로 호출됩니다.
+    """
+
+    def __init__(self, callback):
+        """초기화
+
+        Args:
+            callback (callable): WinEvent 발생 시 (event, hwnd, idObject, idChild)로 호출할 콜백
+        """
+        from ctypes import wintypes
+
+        self._user32 = ctypes.WinDLL('user32', use_last_error=True)
+        WINEVENTPROC = ctypes.WINFUNCTYPE(
+            None,
+            wintypes.HANDLE,  # hWinEventHook
+            wintypes.DWORD,   # event
+            wintypes.HWND,    # hwnd
+            wintypes.LONG,    # idObject
+            wintypes.LONG,    # idChild
+            wintypes.DWORD,   # dwEventThread
+            wintypes.DWORD    # dwmsEventTime
+        )
+        self._user32.SetWinEventHook.restype = wintypes.HANDLE
+        self._user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WINEVENTPROC,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        ]
+        self._user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        self._user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+        self._user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+
+        def win_event_callback(hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsEventTime):
+            callback(event, hwnd, idObject, idChild)
+
+        # 콜백 객체가 가비지 컬렉션되지 않도록 참조 유지
+        self._callback = WINEVENTPROC(win_event_callback)
+        self._hooks = {}  # (event, pid) -> 훅 핸들
+
+    def install(self, event, pid=0):
+        """이벤트 훅을 설치합니다.
+
+        Args:
+            event (int): 감시할 WinEvent
+            pid (int): 감시할 프로세스 ID (0이면 모든 프로세스)
+
+        Returns:
+            bool: 설치 성공 여부 (이미 설치된 경우 True)
+        """
+        if (event, pid) in self._hooks:
+            return True
+
+        hook = self._user32.SetWinEventHook(
+            event, event, None, self._callback, pid, 0, WINEVENT_OUTOFCONTEXT
+        )
+        if not hook:
+            return False
+        self._hooks[(event, pid)] = hook
+        return True
+
+    def uninstall(self, event, pid=0):
+        """이벤트 훅을 제거합니다."""
+        hook = self._hooks.pop((event, pid), None)
+        if hook:
+            self._user32.UnhookWinEvent(hook)
+
+    def uninstall_all(self):
+        """설치된 모든 이벤트 훅을 제거합니다."""
+        for hook in self._hooks.values():
+            self._user32.UnhookWinEvent(hook)
+        self._hooks = {}
+
+    def get_foreground_window(self):
+        """현재 포그라운드 창 핸들을 반환합니다."""
+        return self._user32.GetForegroundWindow()
+
+    def get_window_pid(self, hwnd):
+        """창을 만든 프로세스 ID를 반환합니다. (창이 없으면 0)"""
+        from ctypes import wintypes
+
+        pid = wintypes.DWORD(0)
+        self._user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        return pid.value
@@ -1,21 +1,27 @@
 import win32gui
-import win32ui
-import win32con
-import win32api
-from ctypes import windll
-import numpy as np
-import cv2
 import os
+from BE.function._common_components.capture_backend import get_default_capture_backend, crop_regions
+from BE.function._common_components.debug_capture_writer import DebugCaptureWriter
+from BE.function._common_components.window_geometry_cache import WindowGeometryCache
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.instrumentation import instrumented, count
 
 class WindowController:
     """윈도우 제어 및 화면 캡처를 위한 클래스"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, capture_backend=None):
+        """초기화
+        
+        Args:
+            capture_backend (CaptureBackend, optional): 사용할 캡처 백엔드.
+                None이면 플랫폼에 맞는 기본 백엔드를 사용합니다.
+        """
         self.target_hwnd = None
         self.debug_counter = 0
         self.base_log_manager = BaseLogManager.instance()
+        self.geometry_cache = WindowGeometryCache.instance()
+        self.capture_backend = capture_backend or get_default_capture_backend()
+        self.debug_writer = DebugCaptureWriter.instance()
         
         try:
             # BE 폴더 경로 찾기
@@ -61,6 +67,7 @@ class WindowController:
             )
             self.debug_dir = None
     
+    @instrumented("window_controller.is_target_window_active")
     def is_target_window_active(self) -> bool:
         """대상 윈도우가 활성화되어 있는지 확인"""
         if not self.target_hwnd:
@@ -82,10 +89,67 @@ class WindowController:
     
     def set_target_window(self, hwnd):
         """대상 윈도우 설정"""
+        if self.target_hwnd and self.target_hwnd != hwnd:
+            # 이전 대상 창의 캡처 세션 정리
+            self.capture_backend.close(self.target_hwnd)
         self.target_hwnd = hwnd
     
+    def set_capture_backend(self, capture_backend):
+        """캡처 백엔드 교체
+        
+        Args:
+            capture_backend (CaptureBackend): 새 캡처 백엔드
+        """
+        self.capture_backend.close()
+        self.capture_backend = capture_backend
+    
+    def close(self):
+        """캡처 세션 정리"""
+        self.capture_backend.close()
+    
+    @instrumented("window_controller.capture_client")
+    def capture_client(self):
+        """대상 윈도우의 클라이언트 영역 전체 캡처
+        
+        캡처 백엔드의 세션과 버퍼 풀을 사용하므로 호출마다 DC나 비트맵을 새로 만들지 않습니다.
+        
+        Returns:
+            np.ndarray: 클라이언트 영역 프레임 (BGRA, H x W x 4). 다음 캡처 때 덮어써지는 버퍼의 뷰
+                        실패 시 None
+        """
+        if not self.target_hwnd:
+            self.base_log_manager.log(
+                message="대상 윈도우가 설정되지 않았습니다",
+                level="WARNING",
+                file_name="window_controller",
+                method_name="capture_client"
+            )
+            return None
+        
+        frame = self.capture_backend.capture(self.target_hwnd)
+        if frame is None:
+            count("window_controller.capture_failed")
+            self.base_log_manager.log(
+                message=f"{type(self.capture_backend).__name__} 캡처 실패",
+                level="ERROR",
+                file_name="window_controller",
+                method_name="capture_client",
+                print_to_terminal=True
+            )
+        return frame
+    
+    @instrumented("window_controller.capture_screen")
     def capture_screen(self, x, y, width, height):
-        """화면 캡처"""
+        """화면 캡처
+        
+        Args:
+            x, y (int): 캡처할 영역의 화면 좌표
+            width, height (int): 캡처할 영역의 크기
+        
+        Returns:
+            np.ndarray: 캡처 영역 이미지 (BGR). 캡처 버퍼의 뷰이므로 보관하려면 copy() 필요
+                        실패 시 None
+        """
         try:
             if not self.target_hwnd:
                 self.base_log_manager.log(
@@ -96,57 +160,11 @@ class WindowController:
                 )
                 return None
             
-            if not self.debug_dir or not os.path.exists(self.debug_dir):
-                self.base_log_manager.log(
-                    message="디버그 디렉토리가 존재하지 않습니다",
-                    level="WARNING",
-                    file_name="window_controller",
-                    method_name="capture_screen"
-                )
-                return None
-            
-            # 윈도우 정보 가져오기
-            window_rect = win32gui.GetWindowRect(self.target_hwnd)
-            client_rect = win32gui.GetClientRect(self.target_hwnd)
-            
-            # 윈도우 프레임 크기 계산
-            frame_x = ((window_rect[2] - window_rect[0]) - client_rect[2]) // 2
-            frame_y = (window_rect[3] - window_rect[1]) - client_rect[3] - frame_x
-            
-            # 클라이언트 영역의 실제 좌표 계산
-            client_x = window_rect[0] + frame_x
-            client_y = window_rect[1] + frame_y
-            
             # 전체 화면 좌표를 클라이언트 영역 좌표로 변환
-            capture_x = x - client_x
-            capture_y = y - client_y
-            capture_width = width
-            capture_height = height
+            client_point = self.geometry_cache.get(self.target_hwnd).client_origin
+            capture_x = x - int(client_point[0])
+            capture_y = y - int(client_point[1])
             
-            self.base_log_manager.log(
-                message=f"윈도우 위치 = {window_rect}",
-                level="DEBUG",
-                file_name="window_controller",
-                method_name="capture_screen"
-            )
-            self.base_log_manager.log(
-                message=f"클라이언트 영역 = {client_rect}",
-                level="DEBUG",
-                file_name="window_controller",
-                method_name="capture_screen"
-            )
-            self.base_log_manager.log(
-                message=f"프레임 크기 = x:{frame_x}, y:{frame_y}",
-                level="DEBUG",
-                file_name="window_controller",
-                method_name="capture_screen"
-            )
-            self.base_log_manager.log(
-                message=f"클라이언트 시작점 = x:{client_x}, y:{client_y}",
-                level="DEBUG",
-                file_name="window_controller",
-                method_name="capture_screen"
-            )
             self.base_log_manager.log(
                 message=f"요청된 전체화면 좌표 = x:{x}, y:{y}, width:{width}, height:{height}",
                 level="DEBUG",
@@ -154,210 +172,26 @@ class WindowController:
                 method_name="capture_screen"
             )
             self.base_log_manager.log(
-                message=f"변환된 클라이언트 좌표 = x:{capture_x}, y:{capture_y}, width:{capture_width}, height:{capture_height}",
+                message=f"변환된 클라이언트 좌표 = x:{capture_x}, y:{capture_y}, width:{width}, height:{height}",
                 level="DEBUG",
                 file_name="window_controller",
                 method_name="capture_screen"
             )
             
-            # DC 및 비트맵 생성
-            hwnd_dc = win32gui.GetWindowDC(self.target_hwnd)
-            mfc_dc = win32ui.CreateDCFromHandle(hwnd_dc)
-            save_dc = mfc_dc.CreateCompatibleDC()
-            save_bitmap = win32ui.CreateBitmap()
-            save_bitmap.CreateCompatibleBitmap(mfc_dc, client_rect[2], client_rect[3])
-            save_dc.SelectObject(save_bitmap)
-            
-            # 화면 캡처
-            result = windll.user32.PrintWindow(self.target_hwnd, save_dc.GetSafeHdc(), 3)
-            self.base_log_manager.log(
-                message=f"PrintWindow 결과 = {result}",
-                level="DEBUG",
-                file_name="window_controller",
-                method_name="capture_screen"
-            )
+            full_img = self.capture_client()
+            if full_img is None:
+                return None
             
-            if result:
-                try:
-                    # 전체 이미지를 numpy 배열로 변환
-                    bmp_str = save_bitmap.GetBitmapBits(True)
-                    full_img = np.frombuffer(bmp_str, dtype='uint8')
-                    full_img.shape = (client_rect[3], client_rect[2], 4)
-                    full_img = full_img[:, :, :3]  # BGR로 변환
-                    
-                    # 지정된 영역 추출
-                    if (capture_x >= 0 and capture_y >= 0 and 
-                        capture_x + capture_width <= client_rect[2] and 
-                        capture_y + capture_height <= client_rect[3]):
-                        
-                        img = full_img[capture_y:capture_y+capture_height, 
-                                     capture_x:capture_x+capture_width].copy()
-                        
-                        # 디버그: 캡처된 이미지 저장
-                        self.debug_counter += 1
-                        debug_path = os.path.join('BE', 'captures', 'capture_setting_img', f"capture_{self.debug_counter}.png")
-                        
-                        # 디렉토리가 없으면 생성
-                        os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-                        
-                        # 이미지 저장 시도
-                        try:
-                            if img is not None and img.size > 0 and len(img.shape) == 3:
-                                if not img.flags['C_CONTIGUOUS']:
-                                    img = np.ascontiguousarray(img)
-                                
-                                # 방법 1: PIL 사용
-                                try:
-                                    from PIL import Image
-                                    # BGR에서 RGB로 변환
-                                    rgb_img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                                    pil_img = Image.fromarray(rgb_img)
-                                    pil_img.save(debug_path)
-                                    success = os.path.exists(debug_path)
-                                    if success:
-                                        self.base_log_manager.log(
-                                            message=f"디버그 이미지 저장됨 = {debug_path}",
-                                            level="INFO",
-                                            file_name="window_controller",
-                                            method_name="capture_screen"
-                                        )
-                                        self.base_log_manager.log(
-                                            message=f"파일 크기 = {os.path.getsize(debug_path)} bytes",
-                                            level="DEBUG",
-                                            file_name="window_controller",
-                                            method_name="capture_screen"
-                                        )
-                                    else:
-                                        self.base_log_manager.log(
-                                            message="PIL 저장 실패",
-                                            level="ERROR",
-                                            file_name="window_controller",
-                                            method_name="capture_screen",
-                                            print_to_terminal=True
-                                        )
-                                except Exception as e:
-                                    self.base_log_manager.log(
-                                        message=f"PIL 저장 실패 - {str(e)}",
-                                        level="ERROR",
-                                        file_name="window_controller",
-                                        method_name="capture_screen",
-                                        print_to_terminal=True
-                                    )
-                                    success = False
-                                
-                                # 방법 2: OpenCV 시도 (PIL이 실패한 경우)
-                                if not success:
-                                    try:
-                                        success = cv2.imwrite(str(debug_path), img)
-                                        if success:
-                                            self.base_log_manager.log(
-                                                message=f"OpenCV로 이미지 저장됨 = {debug_path}",
-                                                level="INFO",
-                                                file_name="window_controller",
-                                                method_name="capture_screen"
-                                            )
-                                        else:
-                                            self.base_log_manager.log(
-                                                message="OpenCV 저장 실패",
-                                                level="ERROR",
-                                                file_name="window_controller",
-                                                method_name="capture_screen",
-                                                print_to_terminal=True
-                                            )
-                                    except Exception as e:
-                                        self.base_log_manager.log(
-                                            message=f"OpenCV 저장 실패 - {str(e)}",
-                                            level="ERROR",
-                                            file_name="window_controller",
-                                            method_name="capture_screen",
-                                            print_to_terminal=True
-                                        )
-                            else:
-                                self.base_log_manager.log(
-                                    message=f"유효하지 않은 이미지 데이터 - shape: {img.shape if img is not None else 'None'}",
-                                    level="ERROR",
-                                    file_name="window_controller",
-                                    method_name="capture_screen",
-                                    print_to_terminal=True
-                                )
-                        except Exception as e:
-                            self.base_log_manager.log(
-                                message=f"이미지 저장 실패 - {str(e)}",
-                                level="ERROR",
-                                file_name="window_controller",
-                                method_name="capture_screen",
-                                print_to_terminal=True
-                            )
-                            import traceback
-                            traceback.print_exc()
-                        
-                        # 이미지 정보 출력
-                        self.base_log_manager.log(
-                            message=f"이미지 shape = {img.shape}",
-                            level="DEBUG",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        self.base_log_manager.log(
-                            message=f"이미지 dtype = {img.dtype}",
-                            level="DEBUG",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        self.base_log_manager.log(
-                            message=f"이미지 min/max = {np.min(img)}/{np.max(img)}",
-                            level="DEBUG",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        
-                        # 리소스 해제
-                        win32gui.DeleteObject(save_bitmap.GetHandle())
-                        save_dc.DeleteDC()
-                        mfc_dc.DeleteDC()
-                        win32gui.ReleaseDC(self.target_hwnd, hwnd_dc)
-                        
-                        return img
-                    else:
-                        self.base_log_manager.log(
-                            message="캡처 영역이 클라이언트 영역을 벗어났습니다",
-                            level="WARNING",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        self.base_log_manager.log(
-                            message=f"요청 영역: ({capture_x}, {capture_y}, {capture_width}, {capture_height})",
-                            level="DEBUG",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        self.base_log_manager.log(
-                            message=f"클라이언트 영역: (0, 0, {client_rect[2]}, {client_rect[3]})",
-                            level="DEBUG",
-                            file_name="window_controller",
-                            method_name="capture_screen"
-                        )
-                        return None
-                except Exception as e:
-                    self.base_log_manager.log(
-                        message=f"이미지 처리 중 오류 발생 - {str(e)}",
-                        level="ERROR",
-                        file_name="window_controller",
-                        method_name="capture_screen",
-                        print_to_terminal=True
-                    )
-                    import traceback
-                    traceback.print_exc()
-                    return None
-            else:
-                self.base_log_manager.log(
-                    message="PrintWindow 실패",
-                    level="ERROR",
-                    file_name="window_controller",
-                    method_name="capture_screen",
-                    print_to_terminal=True
-                )
+            img = self._crop_client_region(full_img, capture_x, capture_y, width, height, "capture_screen")
+            if img is None:
                 return None
+            
+            # 디버그: 캡처된 이미지 저장
+            self.debug_counter += 1
+            debug_path = os.path.join('BE', 'captures', 'capture_setting_img', f"capture_{self.debug_counter}.png")
+            self._save_debug_image(img, debug_path, "capture_screen")
+            
+            return img
         except Exception as e:
             self.base_log_manager.log(
                 message=f"캡처 중 오류 발생 - {str(e)}",
@@ -370,118 +204,98 @@ class WindowController:
             traceback.print_exc()
             return None 
 
+    @instrumented("window_controller.capture_window_region")
     def capture_window_region(self, x, y, width, height):
-        if not self.is_window_active():
+        """클라이언트 좌표 기준 영역 캡처
+        
+        Args:
+            x, y (int): 캡처할 영역의 클라이언트 좌표
+            width, height (int): 캡처할 영역의 크기
+        
+        Returns:
+            np.ndarray: 캡처 영역 이미지 (BGR). 캡처 버퍼의 뷰이므로 보관하려면 copy() 필요
+                        실패 시 None
+        """
+        if not self.is_target_window_active():
+            return None
+
+        full_img = self.capture_client()
+        if full_img is None:
+            return None
+
+        img = self._crop_client_region(full_img, x, y, width, height, "capture_window_region")
+        if img is None:
+            return None
+
+        # 디버그용 이미지 저장
+        self.debug_counter += 1
+        debug_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'captures', 'Real_time_Capture', f'capture_{self.debug_counter}.png')
+        self._save_debug_image(img, debug_path, "capture_window_region")
+
+        return img
+
+    @instrumented("window_controller.capture_regions")
+    def capture_regions(self, regions):
+        """여러 영역을 한 번의 캡처로 가져오기
+        
+        클라이언트 영역을 한 번만 캡처하고 영역별 뷰를 잘라내므로, 같은 순간에 여러 영역을
+        확인할 때 영역 수만큼 캡처하지 않아도 됩니다.
+        
+        Args:
+            regions (list): 클라이언트 좌표 기준 영역 목록 [(x, y, width, height), ...]
+        
+        Returns:
+            list: 영역별 이미지 (BGR) 뷰 목록. 영역이 클라이언트 영역을 벗어나면 해당 항목은 None
+                  캡처 실패 시 None
+        """
+        full_img = self.capture_client()
+        if full_img is None:
             return None
+        
+        views = crop_regions(full_img, regions)
+        for region, view in zip(regions, views):
+            if view is None:
+                self._log_out_of_bounds(region, full_img, "capture_regions")
+        return views
 
-        # 클라이언트 영역 크기 확인
-        client_rect = win32gui.GetClientRect(self.target_hwnd)
+    def _crop_client_region(self, full_img, x, y, width, height, method_name):
+        """클라이언트 영역 프레임에서 지정 영역의 BGR 뷰를 잘라냅니다 (복사 없음).
         
-        # 입력받은 좌표는 이미 클라이언트 좌표이므로 그대로 사용
-        client_x = x
-        client_y = y
+        Returns:
+            np.ndarray: 영역 이미지 뷰 (영역이 클라이언트 영역을 벗어나면 None)
+        """
+        img = crop_regions(full_img, [(x, y, width, height)])[0]
+        if img is None:
+            self._log_out_of_bounds((x, y, width, height), full_img, method_name)
+        return img
 
+    def _log_out_of_bounds(self, region, full_img, method_name):
+        """캡처 영역이 클라이언트 영역을 벗어났을 때 로그"""
+        count("window_controller.out_of_bounds")
+        client_height, client_width = full_img.shape[:2]
         self.base_log_manager.log(
-            message=f"클라이언트 영역 = {client_rect}",
-            level="DEBUG",
+            message="캡처 영역이 클라이언트 영역을 벗어났습니다",
+            level="WARNING",
             file_name="window_controller",
-            method_name="capture_window_region"
+            method_name=method_name
         )
         self.base_log_manager.log(
-            message=f"캡처 좌표 = x:{client_x}, y:{client_y}, width:{width}, height:{height}",
+            message=f"요청 영역: {tuple(region)}, 클라이언트 영역: (0, 0, {client_width}, {client_height})",
             level="DEBUG",
             file_name="window_controller",
-            method_name="capture_window_region"
+            method_name=method_name
         )
 
-        # 캡처할 영역이 클라이언트 영역을 벗어나는지 확인
-        if (client_x < 0 or client_y < 0 or 
-            client_x + width > client_rect[2] or 
-            client_y + height > client_rect[3]):
+    def _save_debug_image(self, img, debug_path, method_name):
+        """디버그용 캡처 이미지 저장 요청
+        
+        PNG 인코딩과 파일 쓰기는 DebugCaptureWriter의 백그라운드 스레드에서 처리하며,
+        샘플링 설정(기본값: 저장 안 함)을 통과한 프레임만 저장됩니다.
+        """
+        if self.debug_writer.submit(img, debug_path):
             self.base_log_manager.log(
-                message="캡처 영역이 클라이언트 영역을 벗어남",
-                level="WARNING",
+                message=f"디버그 이미지 저장 요청됨 = {debug_path}",
+                level="DEBUG",
                 file_name="window_controller",
-                method_name="capture_window_region"
+                method_name=method_name
             )
-            return None
-
-        # 윈도우 캡처
-        wDC = win32gui.GetWindowDC(self.target_hwnd)
-        dcObj = win32ui.CreateDCFromHandle(wDC)
-        cDC = dcObj.CreateCompatibleDC()
-        dataBitMap = win32ui.CreateBitmap()
-        dataBitMap.CreateCompatibleBitmap(dcObj, width, height)
-        cDC.SelectObject(dataBitMap)
-        
-        result = win32gui.PrintWindow(self.target_hwnd, cDC.GetSafeHdc(), 2)
-        self.base_log_manager.log(
-            message=f"PrintWindow 결과 = {result}",
-            level="DEBUG",
-            file_name="window_controller",
-            method_name="capture_window_region"
-        )
-
-        if result == 1:
-            cDC.BitBlt((0, 0), (width, height), dcObj, (client_x, client_y), win32con.SRCCOPY)
-            
-            # 비트맵을 numpy 배열로 변환
-            bmpinfo = dataBitMap.GetInfo()
-            bmpstr = dataBitMap.GetBitmapBits(True)
-            img = np.frombuffer(bmpstr, dtype=np.uint8)
-            img = img.reshape((height, width, 4))
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-
-            # 디버그용 이미지 저장
-            debug_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'captures', 'Real_time_Capture', f'capture_{self.capture_count}.png')
-            self.capture_count += 1
-            
-            try:
-                cv2.imwrite(debug_path, img)
-                file_size = os.path.getsize(debug_path)
-                self.base_log_manager.log(
-                    message=f"디버그 이미지 저장됨 = {debug_path}",
-                    level="INFO",
-                    file_name="window_controller",
-                    method_name="capture_window_region"
-                )
-                self.base_log_manager.log(
-                    message=f"파일 크기 = {file_size} bytes",
-                    level="DEBUG",
-                    file_name="window_controller",
-                    method_name="capture_window_region"
-                )
-                self.base_log_manager.log(
-                    message=f"이미지 shape = {img.shape}",
-                    level="DEBUG",
-                    file_name="window_controller",
-                    method_name="capture_window_region"
-                )
-                self.base_log_manager.log(
-                    message=f"이미지 dtype = {img.dtype}",
-                    level="DEBUG",
-                    file_name="window_controller",
-                    method_name="capture_window_region"
-                )
-                self.base_log_manager.log(
-                    message=f"이미지 min/max = {img.min()}/{img.max()}",
-                    level="DEBUG",
-                    file_name="window_controller",
-                    method_name="capture_window_region"
-                )
-            except Exception as e:
-                self.base_log_manager.log(
-                    message=f"디버그 이미지 저장 실패: {str(e)}",
-                    level="ERROR",
-                    file_name="window_controller",
-                    method_name="capture_window_region",
-                    print_to_terminal=True
-                )
-
-        # 리소스 해제
-        win32gui.DeleteObject(dataBitMap.GetHandle())
-        cDC.DeleteDC()
-        dcObj.DeleteDC()
-        win32gui.ReleaseDC(self.target_hwnd, wDC)
-
-        return img if result == 1 else None 
\ No newline at end of file
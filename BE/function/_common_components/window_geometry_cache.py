@@ -0,0 +1,253 @@
+import threading
+import win32gui
+import win32process
+from PySide6.QtCore import QObject, Signal, Slot, Qt, QCoreApplication
+from BE.function._common_components.lazy_import import lazy_import
+from BE.function._common_components.win_event_hook import (
+    WinEventHook, EVENT_OBJECT_LOCATIONCHANGE, EVENT_OBJECT_DESTROY, OBJID_WINDOW
+)
+from BE.log.base_log_manager import BaseLogManager
+
+np = lazy_import("numpy")
+
+
+class WindowGeometry:
+    """대상 윈도우의 클라이언트 영역 정보
+
+    Attributes:
+        hwnd: 윈도우 핸들
+        client_origin (np.ndarray): 클라이언트 영역 시작점의 화면 좌표 [x, y]
+        client_size (np.ndarray): 클라이언트 영역 크기 [width, height]
+        scale_factor (float): DPI 배율 (기본 DPI 96 기준)
+        scaled_client_size (np.ndarray): DPI 배율을 적용한 클라이언트 영역 크기 [width, height]
+    """
+
+    def __init__(self, hwnd, client_origin, client_size, scale_factor):
+        self.hwnd = hwnd
+        self.client_origin = np.array(client_origin, dtype=np.int64)
+        self.client_size = np.array(client_size, dtype=np.int64)
+        self.scale_factor = scale_factor
+        # 기존 계산식 int(client_width * scale_factor)와 같게 소수점 이하 버림
+        self.scaled_client_size = (self.client_size * scale_factor).astype(np.int64)
+
+
+class _HookInstaller(QObject):
+    """다른 스레드의 훅 설치 요청을 메인 스레드로 전달하는 객체 (메인 스레드에 소속)"""
+
+    requested = Signal(int)  # 프로세스 ID
+
+    def __init__(self, cache):
+        super().__init__()
+        self._cache = cache
+        self.requested.connect(self._install, Qt.QueuedConnection)
+
+    @Slot(int)
+    def _install(self, pid):
+        self._cache._install_hooks(pid)
+
+
+class WindowGeometryCache:
+    """윈도우별 클라이언트 영역/DPI 캐시 (싱글톤)
+
+    GetClientRect, ClientToScreen, GetDpiForWindow 결과를 hwnd별로 캐시하고,
+    창 위치/크기 변경(EVENT_OBJECT_LOCATIONCHANGE)이나 창 파괴 이벤트가 오면 무효화합니다.
+    모니터 간 이동이나 디스플레이 배율 변경으로 인한 DPI 변경도 창 위치 변경을 동반하므로
+    같은 이벤트로 무효화됩니다.
+    이벤트 훅을 설치할 수 없는 경우에는 캐시하지 않고 매번 조회합니다.
+
+    get()은 어느 스레드에서나 호출할 수 있습니다. WINEVENT_OUTOFCONTEXT 훅은 설치한 스레드의
+    메시지 루프에서만 콜백되므로 훅은 항상 메인(Qt) 스레드에서 설치합니다.
+    다른 스레드(ROI 감시 등)에서 처음 조회한 프로세스는 메인 스레드에 설치를 요청하고,
+    설치될 때까지는 캐시하지 않고 매번 조회합니다.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if WindowGeometryCache._instance is not None:
+            raise RuntimeError("WindowGeometryCache는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self._lock = threading.Lock()  # _geometries, _generation, 프로세스 집합 보호
+        self._geometries = {}  # hwnd -> WindowGeometry
+        self._generation = 0  # 무효화할 때마다 증가 (조회 중에 무효화된 결과를 저장하지 않도록)
+        self._hooked_pids = set()  # 훅을 설치한 프로세스
+        self._requested_pids = set()  # 메인 스레드에 설치를 요청했거나 설치에 실패한 프로세스
+        self._hook_installer = None
+        try:
+            self._win_event_hook = WinEventHook(self._on_win_event)
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"WinEvent 훅을 사용할 수 없어 창 정보를 캐시하지 않습니다: {e}",
+                level="WARNING",
+                file_name="window_geometry_cache",
+                method_name="__init__"
+            )
+            self._win_event_hook = None
+
+        if self._win_event_hook is not None:
+            self._hook_installer = _HookInstaller(self)
+            app = QCoreApplication.instance()
+            if app is not None and self._hook_installer.thread() is not app.thread():
+                self._hook_installer.moveToThread(app.thread())
+
+    def get(self, hwnd):
+        """윈도우의 클라이언트 영역 정보를 반환합니다.
+
+        Args:
+            hwnd: 윈도우 핸들
+
+        Returns:
+            WindowGeometry: 클라이언트 영역 정보
+        """
+        with self._lock:
+            geometry = self._geometries.get(hwnd)
+            generation = self._generation
+        if geometry is not None:
+            return geometry
+
+        # 훅을 먼저 설치한 뒤 조회해야 그 사이의 창 이동을 놓치지 않음
+        cacheable = self._watch(hwnd)
+        geometry = self._query(hwnd)
+        if cacheable:
+            with self._lock:
+                if self._generation == generation:
+                    self._geometries[hwnd] = geometry
+        return geometry
+
+    def invalidate(self, hwnd=None):
+        """캐시를 무효화합니다.
+
+        Args:
+            hwnd: 무효화할 윈도우 핸들 (None이면 전체)
+        """
+        with self._lock:
+            self._generation += 1
+            if hwnd is None:
+                self._geometries.clear()
+            else:
+                self._geometries.pop(hwnd, None)
+
+    def ratios_to_screen(self, hwnd, ratios, scale_size=False):
+        """클라이언트 영역 비율 좌표들을 한 번에 화면 좌표로 변환합니다.
+
+        Args:
+            hwnd: 윈도우 핸들
+            ratios: (x 비율, y 비율) 쌍의 배열 (N x 2) 또는 한 쌍
+            scale_size (bool): True면 DPI 배율을 적용한 클라이언트 크기를 기준으로 계산
+
+        Returns:
+            np.ndarray: 화면 좌표 배열 (N x 2, int64)
+        """
+        geometry = self.get(hwnd)
+        ratios = np.asarray(ratios, dtype=np.float64).reshape(-1, 2)
+        size = geometry.scaled_client_size if scale_size else geometry.client_size
+        return geometry.client_origin + (size * ratios).astype(np.int64)
+
+    def client_points_to_screen(self, hwnd, points):
+        """클라이언트 영역 상대 좌표들을 DPI 배율을 적용하여 한 번에 화면 좌표로 변환합니다.
+
+        Args:
+            hwnd: 윈도우 핸들
+            points: (x, y) 쌍의 배열 (N x 2) 또는 한 쌍
+
+        Returns:
+            np.ndarray: 화면 좌표 배열 (N x 2, int64)
+        """
+        geometry = self.get(hwnd)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return geometry.client_origin + (points * geometry.scale_factor).astype(np.int64)
+
+    def _query(self, hwnd):
+        """윈도우 API로 클라이언트 영역 정보를 조회합니다."""
+        client_rect = win32gui.GetClientRect(hwnd)
+        client_point = win32gui.ClientToScreen(hwnd, (0, 0))
+
+        # DPI 스케일링 고려
+        try:
+            dpi = win32gui.GetDpiForWindow(hwnd)
+            scale_factor = dpi / 96.0  # 기본 DPI는 96
+        except AttributeError:
+            scale_factor = 1.0
+
+        return WindowGeometry(hwnd, client_point, (client_rect[2], client_rect[3]), scale_factor)
+
+    def warm(self, hwnd):
+        """메인 스레드에서 윈도우의 이벤트 훅을 미리 설치합니다.
+
+        다른 스레드에서 조회할 윈도우(예: ROI 감시 대상)는 감시를 시작하기 전에 호출하면
+        첫 조회부터 캐시를 사용할 수 있습니다.
+        """
+        self._watch(hwnd)
+
+    def _watch(self, hwnd):
+        """윈도우가 속한 프로세스의 위치 변경/파괴 이벤트 훅이 설치되어 있는지 확인합니다.
+
+        메인 스레드에서는 바로 설치하고, 다른 스레드에서는 메인 스레드에 설치를 요청합니다.
+
+        Returns:
+            bool: 이벤트로 무효화할 수 있으면 True (캐시 가능)
+        """
+        if self._win_event_hook is None:
+            return False
+
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        with self._lock:
+            if pid in self._hooked_pids:
+                return True
+            if pid in self._requested_pids:
+                return False
+            on_main_thread = threading.current_thread() is threading.main_thread()
+            if not on_main_thread:
+                self._requested_pids.add(pid)
+
+        if on_main_thread:
+            return self._install_hooks(pid)
+        # 이 스레드에는 메시지 루프가 없어 훅이 콜백되지 않으므로 메인 스레드에서 설치
+        self._hook_installer.requested.emit(pid)
+        return False
+
+    def _install_hooks(self, pid):
+        """프로세스의 위치 변경/파괴 이벤트 훅을 설치합니다. (메인 스레드)
+
+        Returns:
+            bool: 설치 성공 여부
+        """
+        with self._lock:
+            if pid in self._hooked_pids:
+                return True
+
+        if (self._win_event_hook.install(EVENT_OBJECT_LOCATIONCHANGE, pid) and
+                self._win_event_hook.install(EVENT_OBJECT_DESTROY, pid)):
+            with self._lock:
+                self._hooked_pids.add(pid)
+                self._requested_pids.discard(pid)
+            return True
+
+        # 실패한 프로세스는 다시 설치하지 않고 매번 조회
+        with self._lock:
+            self._requested_pids.add(pid)
+        self._win_event_hook.uninstall(EVENT_OBJECT_LOCATIONCHANGE, pid)
+        self.base_log_manager.log(
+            message=f"창 위치 변경 훅 설치 실패 (PID: {pid}) - 캐시하지 않고 매번 조회합니다",
+            level="WARNING",
+            file_name="window_geometry_cache",
+            method_name="_install_hooks"
+        )
+        return False
+
+    def _on_win_event(self, event, hwnd, idObject, idChild):
+        """창 위치 변경/파괴 이벤트 처리 (메인 스레드)"""
+        if idObject != OBJID_WINDOW:
+            return
+        with self._lock:
+            self._generation += 1
+            self._geometries.pop(hwnd, None)
@@ -1,8 +1,10 @@
 import win32gui
 import win32process
 import psutil
+import threading
 from PySide6.QtCore import QObject, Signal
 import logging
+from BE.function._common_components.foreground_window_tracker import ForegroundWindowTracker
 
 class ProcessManager(QObject):
     """윈도우 프로세스 검색 및 관리 클래스
@@ -24,6 +26,9 @@ class ProcessManager(QObject):
     def get_processes(search_text=""):
         """실행 중인 윈도우 프로세스 목록을 검색합니다.
         
+        창 목록을 새로 열거한 뒤 ProcessSnapshotCache의 스냅샷에서 검색합니다.
+        프로세스 이름은 PID별 캐시를 재사용하므로 새로 뜬 프로세스만 조회합니다.
+        
         Args:
             search_text (str): 검색할 텍스트 (프로세스 이름이나 창 제목에 포함된 텍스트)
             
@@ -31,80 +36,22 @@ class ProcessManager(QObject):
             list: 프로세스 정보 딕셔너리의 리스트
                  각 딕셔너리는 'pid', 'name', 'title', 'hwnd' 키를 포함
         """
-        processes = []
-        
-        def enum_window_callback(hwnd, results):
-            if not win32gui.IsWindowVisible(hwnd):
-                return True
-            
-            try:
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                title = win32gui.GetWindowText(hwnd)
-                
-                if not title:  # 창 제목이 없는 경우 스킵
-                    return True
-                
-                try:
-                    process = psutil.Process(pid)
-                    process_name = process.name()
-                    
-                    # 검색어가 있는 경우 필터링
-                    if search_text:
-                        if (search_text not in title.lower() and 
-                            search_text not in process_name.lower()):
-                            return True
-                    
-                    process_info = {
-                        'pid': pid,
-                        'name': process_name,
-                        'title': title,
-                        'hwnd': hwnd
-                    }
-                    results.append(process_info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    logging.error(f"[프로세스 매니저] 프로세스 정보 접근 실패 (PID: {pid}): {e}")
-                    pass
-            except Exception as e:
-                logging.error(f"[프로세스 매니저] 윈도우 정보 가져오기 실패: {e}")
-                pass
-            return True
-        
-        try:
-            win32gui.EnumWindows(enum_window_callback, processes)
-        except Exception as e:
-            logging.error(f"[프로세스 매니저] 프로세스 목록 검색 실패: {e}")
-        return processes
+        snapshot_cache = ProcessSnapshotCache.instance()
+        snapshot_cache.refresh()
+        return snapshot_cache.search(search_text)
 
     @staticmethod
     def get_active_process():
         """현재 활성화된 창의 프로세스 정보를 반환합니다.
         
+        ForegroundWindowTracker가 포그라운드 창 변경 시점에 갱신해 둔 캐시를 반환하므로
+        호출할 때마다 윈도우 API를 호출하지 않습니다.
+        
         Returns:
             dict: 프로세스 정보 딕셔너리 ('pid', 'name', 'title', 'hwnd' 키 포함)
                  실패 시 None 반환
         """
-        try:
-            hwnd = win32gui.GetForegroundWindow()
-            if not hwnd:
-                return None
-
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            window_title = win32gui.GetWindowText(hwnd)
-            
-            if not window_title:  # 창 제목이 없는 경우
-                return None
-            
-            active_process = {
-                'pid': pid,
-                'title': window_title,
-                'hwnd': hwnd,
-                'name': window_title
-            }
-            
-            return active_process
-        except Exception as e:
-            logging.error(f"[프로세스 매니저] 활성 프로세스 정보 가져오기 실패: {e}")
-            return None
+        return ForegroundWindowTracker.instance().active_process
     
     def set_selected_process(self, process_info):
         """프로세스를 선택 상태로 설정합니다.
@@ -138,3 +85,161 @@ class ProcessManager(QObject):
             return False
             
         return active_process['pid'] == self._selected_process.get('pid')
+
+
+
+class ProcessSnapshotCache(QObject):
+    """윈도우 프로세스 목록 스냅샷 캐시 (싱글톤)
+    
+    창 목록을 열거한 결과를 스냅샷으로 보관하고, 검색은 스냅샷을 메모리에서
+    필터링하는 것으로 처리합니다. 프로세스 이름은 PID별로 캐시하며
+    프로세스 생성 시간이 같을 때만 재사용하므로 PID가 재사용되어도 안전합니다.
+    """
+    
+    snapshot_updated = Signal()  # 스냅샷 내용이 바뀌었을 때 발생하는 시그널 (백그라운드 스레드에서 발생할 수 있음)
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        """초기화"""
+        if ProcessSnapshotCache._instance is not None:
+            raise RuntimeError("ProcessSnapshotCache는 싱글톤입니다. instance()를 사용하세요.")
+            
+        super().__init__()
+        self._process_names = {}  # pid -> (create_time, name)
+        self._snapshot = []  # (검색 키, 프로세스 정보) 튜플의 리스트
+        self._has_snapshot = False
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
+    
+    @property
+    def has_snapshot(self):
+        """한 번 이상 갱신되어 스냅샷이 있는지 여부"""
+        return self._has_snapshot
+    
+    def refresh(self):
+        """창 목록을 다시 열거하여 스냅샷을 갱신합니다.
+        
+        새로 나타난 PID나 생성 시간이 바뀐 PID만 프로세스 이름을 조회하고,
+        사라진 PID는 캐시에서 제거합니다.
+        """
+        with self._refresh_lock:
+            windows = []
+            
+            def enum_window_callback(hwnd, results):
+                if not win32gui.IsWindowVisible(hwnd):
+                    return True
+                try:
+                    title = win32gui.GetWindowText(hwnd)
+                    if not title:  # 창 제목이 없는 경우 스킵
+                        return True
+                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                    results.append((pid, title, hwnd))
+                except Exception as e:
+                    logging.error(f"[프로세스 매니저] 윈도우 정보 가져오기 실패: {e}")
+                return True
+            
+            try:
+                win32gui.EnumWindows(enum_window_callback, windows)
+            except Exception as e:
+                logging.error(f"[프로세스 매니저] 프로세스 목록 검색 실패: {e}")
+                return
+            
+            process_names = {}
+            snapshot = []
+            for pid, title, hwnd in windows:
+                if pid not in process_names:
+                    process_names[pid] = self._resolve_process_name(pid)
+                cached = process_names[pid]
+                if cached is None:
+                    continue
+                
+                process_name = cached[1]
+                process_info = {
+                    'pid': pid,
+                    'name': process_name,
+                    'title': title,
+                    'hwnd': hwnd
+                }
+                snapshot.append((self.make_search_key(process_name, title), process_info))
+            
+            # 살아있는 PID만 남기고 스냅샷은 참조 교체로 원자적으로 바꿈
+            self._process_names = {pid: cached for pid, cached in process_names.items() if cached is not None}
+            changed = not self._has_snapshot or snapshot != self._snapshot
+            self._snapshot = snapshot
+            self._has_snapshot = True
+        
+        # 창 목록이 그대로면 목록을 다시 그리지 않도록 바뀐 경우에만 알림
+        if changed:
+            self.snapshot_updated.emit()
+    
+    def refresh_async(self):
+        """백그라운드 스레드에서 스냅샷을 갱신합니다. 이미 갱신 중이면 무시합니다."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+        self._refresh_thread.start()
+    
+    @staticmethod
+    def make_search_key(process_name, title):
+        """프로세스 이름과 창 제목으로 검색 키를 만듭니다. (소문자, 이름과 제목 사이는 줄바꿈)"""
+        return f"{process_name}\n{title}".lower()
+    
+    @staticmethod
+    def normalize_search_text(search_text):
+        """검색어를 검색 키와 비교할 수 있도록 소문자로 바꿉니다."""
+        return search_text.lower()
+    
+    def entries(self):
+        """현재 스냅샷의 (검색 키, 프로세스 정보) 튜플 리스트를 반환합니다.
+        
+        목록을 한 번 만들고 검색어가 바뀔 때마다 항목을 숨기는 UI에서
+        검색 키를 다시 만들지 않고 그대로 쓸 수 있도록 제공합니다.
+        """
+        return list(self._snapshot)
+    
+    def search(self, search_text=""):
+        """현재 스냅샷에서 프로세스를 검색합니다.
+        
+        창 열거나 프로세스 조회 없이 미리 소문자로 만들어 둔 검색 키에 대한
+        부분 문자열 검색만 수행합니다.
+        
+        Args:
+            search_text (str): 검색할 텍스트 (프로세스 이름이나 창 제목에 포함된 텍스트)
+            
+        Returns:
+            list: 프로세스 정보 딕셔너리의 리스트
+        """
+        snapshot = self._snapshot
+        if not search_text:
+            return [process_info for _, process_info in snapshot]
+        
+        search_text = self.normalize_search_text(search_text)
+        return [process_info for search_key, process_info in snapshot if search_text in search_key]
+    
+    def _resolve_process_name(self, pid):
+        """PID의 (생성 시간, 프로세스 이름)을 반환합니다. 캐시가 유효하면 재사용합니다.
+        
+        Args:
+            pid (int): 프로세스 ID
+            
+        Returns:
+            tuple: (create_time, name), 접근할 수 없는 프로세스면 None
+        """
+        try:
+            process = psutil.Process(pid)
+            create_time = process.create_time()
+            cached = self._process_names.get(pid)
+            if cached and cached[0] == create_time:
+                return cached
+            return (create_time, process.name())
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            logging.error(f"[프로세스 매니저] 프로세스 정보 접근 실패 (PID: {pid}): {e}")
+            return None
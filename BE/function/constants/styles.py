@@ -60,14 +60,13 @@ BUTTON_STYLE = """
     }
 """
 
-# Log text style
-LOG_TEXT_STYLE = """
-    QTextEdit {
+# Log list style
+LOG_LIST_STYLE = """
+    QTableView {
         background-color: white;
         border: none;
         font-family: 'Consolas', monospace;
         font-size: 12px;
-        line-height: 0.5;
     }
 """
 
@@ -17,6 +17,7 @@
 import time
 from PySide6.QtCore import QTimer, QObject
 from BE.function._common_components.window_process_handler import ProcessManager
+from BE.function._common_components.system_state_bus import SystemStateBus
 from BE.function.etc_function.countdown.Controller.countdown_controller__main import CountdownController
 from BE.log.base_log_manager import BaseLogManager
 
@@ -65,10 +66,14 @@ class CountdownControllerInputSequence(QObject):
         self._sequence_timer.timeout.connect(self._on_sequence_timeout)
         self._sequence_timer.setSingleShot(True)
         
-        # 활성 프로세스 체크 타이머 설정
-        self.process_check_timer = QTimer()
-        self.process_check_timer.timeout.connect(self._check_process_state)
-        self.process_check_timer.start(100)  # 100ms 간격으로 체크
+        # 활성 프로세스 또는 선택 프로세스가 바뀔 때마다 상태 체크
+        self.system_state_bus = SystemStateBus.instance()
+        self.system_state_bus.subscribe(
+            SystemStateBus.TOPIC_FOREGROUND,
+            self._check_process_state,
+            name="countdown_controller_input_sequence._check_process_state"
+        )
+        self.process_manager.process_selected.connect(self._check_process_state)
         
         self._connect_signals()
         self.widget.set_controller(self)  # 위젯에 컨트롤러 참조 설정
@@ -283,9 +288,14 @@ class CountdownControllerInputSequence(QObject):
             'tab_pressed_time': None
         })
         
-    def _check_process_state(self):
+    def _check_process_state(self, process_info=None):
         """프로세스 상태 체크
         
+        활성 프로세스 변경 또는 프로세스 선택 시그널에 의해 호출됩니다.
+        
+        Args:
+            process_info (dict, optional): 시그널이 전달한 프로세스 정보 (사용하지 않음)
+        
         동작 순서:
         1. 프로세스 상태 검사
         2. 카운트다운 중지 (비활성화 시)
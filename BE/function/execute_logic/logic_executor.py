@@ -1,20 +1,42 @@
+import os
+import re
 import time
 import win32api
 import win32con
-import win32gui
 from PySide6.QtCore import QObject, Signal, QTimer, Qt
 from PySide6.QtWidgets import QApplication
 from BE.function._common_components.modal.entered_key_info_modal.keyboard_hook_handler import KeyboardHook
 from BE.function._common_components.mouse_handler import MouseHandler
+from BE.function._common_components.window_geometry_cache import WindowGeometryCache
+from BE.function._common_components.system_state_bus import SystemStateBus
+from BE.function._common_components.window_controller import WindowController
+from BE.function._common_components.debug_capture_writer import DebugCaptureWriter
+from BE.function._common_components.template_pyramid_store import TemplatePyramidStore
+from BE.function._common_components.ocr_worker import OcrWorker
+from BE.function._common_components.pixel_probe import PixelProbeSet
+from BE.function._common_components.roi_watcher import RoiWatcherService
+from BE.function._common_components.image_matcher import (
+    DEFAULT_MATCH_THRESHOLD, TemplateMatchCache, load_template
+)
 import threading
 from BE.settings.force_stop_key_data_settingfile import ForceStopKeyDataSettingFilesManager
 from BE.settings.key_input_delays_data_settingfiles_manager import KeyInputDelaysDataSettingFilesManager
 import keyboard
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.log_category import LogCategory, legacy_log_category
+from BE.log.instrumentation import INSTRUMENTATION_ENABLED, instrumented, count, observe
 
 class LogicExecutor(QObject):
     """로직 실행기"""
     
+    # 연속으로 배치되면 한 번의 캡처 프레임을 공유하는 확인 스텝 타입
+    CHECK_STEP_TYPES = ('image_search', 'read_text', 'pixel_check')
+    
+    # 마우스 입력 스텝의 버튼 이름 -> MouseHandler 버튼
+    MOUSE_BUTTONS = {'왼쪽 버튼': 'left', '오른쪽 버튼': 'right', '가운데 버튼': 'middle'}
+    # 마우스 이동/드래그 스텝의 경로 재생 시간 (초)
+    MOUSE_PATH_DURATION = 0.2
+    
     # 기본 딜레이 값 (key_input_delays_data.json의 기본값)
     DEFAULT_DELAYS = {
         'press': 0.026,
@@ -98,34 +120,55 @@ class LogicExecutor(QObject):
         # 실행 중지 플래그 추가
         self._should_stop = False
         
+        # 실행 번호 (로직을 시작하거나 실행 상태를 초기화할 때 증가)
+        # processEvents()로 대기하는 스텝이 대기 중에 강제 중지되었는지 확인하는 데 사용
+        self._run_id = 0
+        
         # ESC 키 시뮬레이션 시간 추적
         self.last_simulated_esc_time = 0
+        
+        # 화면 트리거 감시 서비스 (작업 스레드에서 발생한 시그널은 메인 스레드에서 처리됨)
+        RoiWatcherService.instance().triggered.connect(self._on_screen_triggered)
+        
+        # 이미지 서치용 창 캡처 (처음 사용할 때 생성)
+        self._window_controller = None
+        
+        # 연속된 확인 스텝이 공유하는 영역 뷰 [(스텝, 영역 이미지), ...]
+        self._shared_check_regions = []
+        
+        # 텍스트 읽기 스텝이 저장한 변수 (텍스트 입력에서 {{변수명}}으로 사용)
+        self._variables = {}
+        
+        # 픽셀 확인 스텝별로 미리 만든 지점 배열 {id(스텝): (스텝, PixelProbeSet)}
+        # 실행 한 번 동안만 유지 (로직을 시작할 때와 정리할 때 비움)
+        self._pixel_probe_sets = {}
+        
+        # 다음 스텝을 예약한 시각 (perf_counter_ns, 계측이 켜져 있을 때 스텝 간 지연 측정용)
+        self._step_scheduled_ns = 0
 
+    @instrumented("logic_executor.update_state")
     def _update_state(self, **kwargs):
         """상태 업데이트 및 알림"""
-        self.base_log_manager.start_timer("상태업데이트모달")
-        self.base_log_manager.log(
-            message=f"상태 업데이트 시작: {kwargs}",
-            level="INFO",
-            file_name="logic_executor",
-            include_time=True
-        )
-        with self._state_lock:
+        # 스텝마다 호출되므로 DEBUG가 꺼져 있으면 메시지 생성을 건너뜀 (소요 시간은 계측 히스토그램으로 확인)
+        debug_enabled = self.base_log_manager.is_enabled("DEBUG", "logic_executor")
+        if debug_enabled:
             self.base_log_manager.log(
-                message="상태 락 획득",
-                level="INFO", 
+                message="상태 업데이트 시작: %s",
+                args=(kwargs,),
+                level="DEBUG",
                 file_name="logic_executor",
                 include_time=True
             )
+        with self._state_lock:
             self.execution_state.update(kwargs)
             self.execution_state_changed.emit(self.execution_state.copy())
+        if debug_enabled:
             self.base_log_manager.log(
                 message="상태 변경 알림 완료",
-                level="INFO",
+                level="DEBUG",
                 file_name="logic_executor",
                 include_time=True
             )
-        self.base_log_manager.stop_timer("상태업데이트모달")
     
     def start_monitoring(self):
         """트리거 키 모니터링 시작"""
@@ -143,6 +186,7 @@ class LogicExecutor(QObject):
                     file_name="logic_executor",
                     include_time=True
                 )
+                self._start_screen_triggers()
             except Exception as e:
                 self.base_log_manager.log(
                     message=f"키보드 모니터링 시작 실패: {str(e)}",
@@ -153,6 +197,7 @@ class LogicExecutor(QObject):
     
     def stop_monitoring(self):
         """트리거 키 모니터링 중지"""
+        RoiWatcherService.instance().stop()
         with self._hook_lock:
             if self.keyboard_hook:
                 try:
@@ -172,9 +217,9 @@ class LogicExecutor(QObject):
                         file_name="logic_executor"
                     )
     
+    @instrumented("logic_executor.safe_cleanup")
     def _safe_cleanup(self):
         """안전한 정리 작업"""
-        self.base_log_manager.start_timer("정리모달")
         self.base_log_manager.log(
             message="안전한 정리 작업 시작",
             level="INFO",
@@ -220,6 +265,8 @@ class LogicExecutor(QObject):
                 include_time=True
             )
             self._update_state(current_step=0, current_repeat=1)
+            # 이번 실행의 스텝을 참조하는 픽셀 확인 지점 배열 해제
+            self._pixel_probe_sets = {}
             self.base_log_manager.log(
                 message="단계와 반복 횟수 초기화 완료",
                 level="INFO",
@@ -240,6 +287,7 @@ class LogicExecutor(QObject):
                 file_name="logic_executor",
                 include_time=True
             )
+            self.base_log_manager.set_logic_context(None)
         except Exception as e:
             self.base_log_manager.log(
                 message=f"정리 작업 중 오류 발생: {str(e)}",
@@ -259,22 +307,27 @@ class LogicExecutor(QObject):
         self.base_log_manager.log(
             message=f"강제 중지 키가 변경되었습니다 (가상 키 코드: {virtual_key})",
             level="INFO",
+            category=LogCategory.FORCE_STOP,
             file_name="logic_executor"
         )
 
+    @instrumented("logic_executor.on_key_released")
     def _on_key_released(self, formatted_key_info):
         """키를 뗄 때 호출
         
         Args:
             formatted_key_info (dict): 입력된 키 정보
         """
+        # 후킹 콜백에서 키가 떼진 시각 (트리거 지연 측정용)
+        released_ns = self.keyboard_hook.last_released_ns if INSTRUMENTATION_ENABLED and self.keyboard_hook else 0
         self.base_log_manager.log(
-            message=f"""
+            message="""
             키 이벤트 상세 정보
-            - 입력된 키: {formatted_key_info}
-            - 스텝 입력 여부: {self.is_step_input}
-            - 시뮬레이션 여부: {self.is_simulated_input}
+            - 입력된 키: %s
+            - 스텝 입력 여부: %s
+            - 시뮬레이션 여부: %s
             """,
+            args=(formatted_key_info, self.is_step_input, self.is_simulated_input),
             level="DEBUG", 
             file_name="logic_executor",
             print_to_terminal=True
@@ -300,6 +353,7 @@ class LogicExecutor(QObject):
                 self.base_log_manager.log(
                     message="강제 중지 키 감지 - 로직 강제 중지 실행",
                     level="INFO",
+                    category=LogCategory.FORCE_STOP,
                     file_name="logic_executor",
                     include_time=True
                 )
@@ -309,6 +363,7 @@ class LogicExecutor(QObject):
                 self.base_log_manager.log(
                     message="강제 중지 키가 감지되었으나, 활성 프로세스가 선택된 프로세스와 다르므로 무시됩니다.",
                     level="WARNING",
+                    category=LogCategory.FORCE_STOP,
                     file_name="logic_executor"
                 )
             return
@@ -346,41 +401,10 @@ class LogicExecutor(QObject):
                     )
                     return
                     
-                try:
-                    self.selected_logic = logic
-                    self.selected_logic['id'] = logic_id  # ID 정보 추가
-                    self._update_state(
-                        is_executing=True,
-                        current_step=0,
-                        current_repeat=1
-                    )
-                    # 로직 실행 시작 시간 초기화
-                    self._start_time = time.time()
-                    self.base_log_manager.log(
-                        message=(
-                            f""
-                            f"[로직 실행 시작]"
-                            f"- 로직 이름: {logic.get('name')}"
-                            f"- 로직 UUID: {logic_id}"
-                        ),
-                        level="INFO",
-                        file_name="logic_executor",
-                        include_time=True
-                    )
-                    
-                    self.execution_started.emit()
-                    
-                    # 비동기적으로 첫 번째 스텝 실행
-                    QTimer.singleShot(0, self._execute_next_step)
-                    return
-                    
-                except Exception as e:
-                    self.base_log_manager.log(
-                        message=f"로직 시작 중 오류 발생: {str(e)}",
-                        level="ERROR",
-                        file_name="logic_executor"
-                    )
-                    self._safe_cleanup()
+                self._start_logic(logic_id, logic)
+                if released_ns:
+                    observe("logic_executor.trigger_dispatch", time.perf_counter_ns() - released_ns)
+                return
                     
         if not found_matching_logic:
             self.base_log_manager.log(
@@ -388,8 +412,114 @@ class LogicExecutor(QObject):
                 level="WARNING",
                 file_name="logic_executor"
             )
+    @instrumented("logic_executor.start_logic")
+    def _start_logic(self, logic_id, logic):
+        """로직 실행을 시작합니다 (트리거 키, 화면 트리거 공통).
+        
+        Args:
+            logic_id (str): 로직 ID
+            logic (dict): 로직 데이터
+        """
+        try:
+            self._run_id += 1
+            self.selected_logic = logic
+            self.selected_logic['id'] = logic_id  # ID 정보 추가
+            self._variables = {}
+            self._pixel_probe_sets = {}
+            self.base_log_manager.set_logic_context(logic_id)
+            self._update_state(
+                is_executing=True,
+                current_step=0,
+                current_repeat=1
+            )
+            # 로직 실행 시작 시간 초기화
+            self._start_time = time.time()
+            self.base_log_manager.log(
+                message=(
+                    f""
+                    f"[로직 실행 시작]"
+                    f"- 로직 이름: {logic.get('name')}"
+                    f"- 로직 UUID: {logic_id}"
+                ),
+                level="INFO",
+                category=LogCategory.LOGIC_RUN,
+                file_name="logic_executor",
+                include_time=True
+            )
+            
+            self.execution_started.emit()
+            
+            # 비동기적으로 첫 번째 스텝 실행
+            QTimer.singleShot(0, self._execute_next_step)
+            
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"로직 시작 중 오류 발생: {str(e)}",
+                level="ERROR",
+                file_name="logic_executor"
+            )
+            self._safe_cleanup()
+
+    def _get_window_controller(self):
+        """창 캡처에 쓰는 WindowController를 반환합니다. (처음 사용할 때 생성)"""
+        if self._window_controller is None:
+            self._window_controller = WindowController()
+        return self._window_controller
+
+    def _start_screen_triggers(self):
+        """화면 트리거(screen_trigger)가 있는 로직들의 감시를 시작합니다."""
+        try:
+            service = RoiWatcherService.instance()
+            process = self.process_manager.get_selected_process()
+            logics = self.all_logics_data_repository_and_service.get_all_logics_list(force=True)
+            conditions = {
+                logic_id: logic['screen_trigger']
+                for logic_id, logic in logics.items()
+                if logic.get('screen_trigger') and not logic.get('isNestedLogicCheckboxSelected', False)
+            }
+            if not process or not process.get('hwnd') or not service.set_watchers(conditions):
+                service.stop()
+                return
+            # 실행기와 같은 캡처 백엔드(캡처 세션, 버퍼 풀)를 공유
+            service.start(process['hwnd'], backend=self._get_window_controller().capture_backend)
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"화면 트리거 감시 시작 실패: {str(e)}",
+                level="ERROR",
+                file_name="logic_executor",
+                print_to_terminal=True
+            )
+
+    def _on_screen_triggered(self, logic_id):
+        """화면 트리거 조건이 충족되었을 때 호출 (메인 스레드)
+        
+        Args:
+            logic_id (str): 조건이 충족된 로직 ID
+        """
+        if not self.is_logic_enabled or self.execution_state['is_executing']:
+            return
+        if not self._should_execute_logic():
+            return
+        
+        logics = self.all_logics_data_repository_and_service.get_all_logics_list(force=True)
+        logic = logics.get(logic_id)
+        if not logic:
+            return
+        
+        self.base_log_manager.log(
+            message=f"화면 트리거 조건 충족: {logic.get('name')}",
+            level="INFO",
+            file_name="logic_executor",
+            include_time=True
+        )
+        self._start_logic(logic_id, logic)
+
+    @instrumented("logic_executor.execute_next_step")
     def _execute_next_step(self):
         """현재 실행할 스텝이 무엇인지 결정하는 관련자 함수"""
+        if INSTRUMENTATION_ENABLED and self._step_scheduled_ns:
+            observe("logic_executor.step_jitter", time.perf_counter_ns() - self._step_scheduled_ns)
+            self._step_scheduled_ns = 0
         if not self.selected_logic or self.execution_state['is_stopping']:
             return
             
@@ -400,6 +530,8 @@ class LogicExecutor(QObject):
             
             # 모든 스텝이 완료되었는지 확인
             if current_step >= len(items):
+                # 반복이나 부모 로직으로 넘어가면 공유 캡처 프레임은 더 이상 유효하지 않음
+                self._shared_check_regions = []
                 repeat_count = self.selected_logic.get('repeat_count', 1)
                 current_repeat = self.execution_state['current_repeat']
                 
@@ -422,6 +554,7 @@ class LogicExecutor(QObject):
                             f"- 중첩로직 UUID: {current_logic_id}"
                         ),
                         level="INFO",
+                        category=LogCategory.NESTED_LOGIC,
                         file_name="logic_executor",
                         include_time=True,
                     )
@@ -435,6 +568,7 @@ class LogicExecutor(QObject):
                             f"- 로직 UUID: {current_logic_id}"
                         ),
                         level="INFO",
+                        category=LogCategory.LOGIC_RUN,
                         file_name="logic_executor",
                         include_time=True,
                     )
@@ -474,6 +608,7 @@ class LogicExecutor(QObject):
                 include_time=True
             )
             self._safe_cleanup()
+    @instrumented("logic_executor.execute_item")
     def _execute_item(self, item):
         """아이템 실행
         
@@ -483,6 +618,11 @@ class LogicExecutor(QObject):
         try:
             if not self.is_logic_enabled:
                 return
+            run_id = self._run_id
+            
+            # 확인 스텝이 아닌 스텝(입력 등) 이후에는 화면이 바뀌므로 공유 프레임을 버림
+            if item['type'] not in self.CHECK_STEP_TYPES:
+                self._shared_check_regions = []
                 
             # 아이템 타입에 따라 실행
             if item['type'] == 'key_input':
@@ -497,8 +637,20 @@ class LogicExecutor(QObject):
                 self._execute_wait_click(item)
             elif item['type'] == 'write_text':
                 self._execute_text_input(item)
+            elif item['type'] == 'image_search':
+                self._execute_image_search(item)
+            elif item['type'] == 'read_text':
+                self._execute_read_text(item)
+            elif item['type'] == 'pixel_check':
+                self._execute_pixel_check(item)
+            
+            # 스텝이 대기하는 동안 강제 중지되었거나 다른 실행이 시작되었으면 다음 스텝을 예약하지 않음
+            if run_id != self._run_id:
+                return
             
             # 다음 스텝 실행을 위해 비동기 호출
+            if INSTRUMENTATION_ENABLED:
+                self._step_scheduled_ns = time.perf_counter_ns()
             QTimer.singleShot(0, self._execute_next_step)
         except Exception as e:
             self.base_log_manager.log(
@@ -509,13 +661,14 @@ class LogicExecutor(QObject):
             )
             self._safe_cleanup()
     
+    @instrumented("logic_executor.key_input")
     def _execute_key_input(self, step):
         """키 입력 실행"""
         try:
             self.is_step_input = True  # 스텝 입력 플래그 설정
             self.is_simulated_input = True  # 시뮬레이션 입력 플래그 설정
             self.base_log_manager.log(
-                message=f"""
+                message=lambda: f"""
                 키 입력 실행 시작
                 - 스텝 정보: {step}
                 - 현재 스레드 ID: {threading.get_ident()}
@@ -556,12 +709,13 @@ class LogicExecutor(QObject):
             # 키 입력 실행
             if step['action'] == '누르기':
                 self.base_log_manager.log(
-                    message=f"""
+                    message="""
                     키 누르기 실행
-                    - 가상 키: {virtual_key}
-                    - 스캔 코드: {hw_key_scan_code} 
-                    - 플래그: {flags}
+                    - 가상 키: %s
+                    - 스캔 코드: %s
+                    - 플래그: %s
                     """,
+                    args=(virtual_key, hw_key_scan_code, flags),
                     level="DEBUG",
                     file_name="logic_executor",
                     print_to_terminal=True
@@ -569,12 +723,13 @@ class LogicExecutor(QObject):
                 win32api.keybd_event(virtual_key, hw_key_scan_code, flags, 0)
             else:  # 떼기
                 self.base_log_manager.log(
-                    message=f"""
+                    message="""
                     키 떼기 실행
-                    - 가상 키: {virtual_key}
-                    - 스캔 코드: {hw_key_scan_code}
-                    - 플래그: {flags | win32con.KEYEVENTF_KEYUP}
-                    """, 
+                    - 가상 키: %s
+                    - 스캔 코드: %s
+                    - 플래그: %s
+                    """,
+                    args=(virtual_key, hw_key_scan_code, flags | win32con.KEYEVENTF_KEYUP),
                     level="DEBUG",
                     file_name="logic_executor",
                     print_to_terminal=True
@@ -591,7 +746,8 @@ class LogicExecutor(QObject):
             # 키 입력 후 지연
             delay = self.key_input_delays_data.get(step['action'], self.key_input_delays_data['기본'])
             self.base_log_manager.log(
-                message=f"키 입력 후 대기 시작 (대기 시간: {delay}초)",
+                message="키 입력 후 대기 시작 (대기 시간: %s초)",
+                args=(delay,),
                 level="DEBUG", 
                 file_name="logic_executor",
                 print_to_terminal=True
@@ -628,12 +784,13 @@ class LogicExecutor(QObject):
             
         finally:
             self.base_log_manager.log(
-                message=f"""
+                message="""
                 키 입력 실행 종료
-                - 종료 시간: {time.time()}
-                - 스텝 입력 상태: {self.is_step_input}
-                - 시뮬레이션 상태: {self.is_simulated_input}
+                - 종료 시간: %s
+                - 스텝 입력 상태: %s
+                - 시뮬레이션 상태: %s
                 """,
+                args=(time.time(), self.is_step_input, self.is_simulated_input),
                 level="DEBUG",
                 file_name="logic_executor",
                 print_to_terminal=True
@@ -641,6 +798,7 @@ class LogicExecutor(QObject):
             self.is_step_input = False  # 스텝 입력 플래그 해제
             self.is_simulated_input = False  # 시뮬레이션 입력 플래그 해제
 
+    @instrumented("logic_executor.delay")
     def _execute_delay(self, step):
         """지연시간 실행"""
         try:
@@ -704,6 +862,7 @@ class LogicExecutor(QObject):
                 - 중첩로직 UUID: {nested_logic.get('id')}
                 """,
                 level="INFO",
+                category=LogCategory.NESTED_LOGIC,
                 file_name="logic_executor",
                 include_time=True,
                 print_to_terminal=True
@@ -719,6 +878,7 @@ class LogicExecutor(QObject):
             )
             raise
 
+    @instrumented("logic_executor.mouse_input")
     def _execute_mouse_input(self, step):
         """마우스 입력 실행"""
         try:
@@ -735,30 +895,22 @@ class LogicExecutor(QObject):
 
             hwnd = process['hwnd']
             
-            # DPI 스케일링 고려
-            try:
-                dpi = win32gui.GetDpiForWindow(hwnd)
-                scale_factor = dpi / 96.0  # 기본 DPI는 96
-            except AttributeError:
-                scale_factor = 1.0
-            
-            # 클라이언트 영역의 크기와 화면상 시작점 가져오기
-            client_rect = win32gui.GetClientRect(hwnd)
-            client_width = int(client_rect[2] * scale_factor)
-            client_height = int(client_rect[3] * scale_factor)
-            client_point = win32gui.ClientToScreen(hwnd, (0, 0))
+            # 클라이언트 영역의 크기와 화면상 시작점, DPI 배율은 캐시된 값 사용
+            geometry_cache = WindowGeometryCache.instance()
+            geometry = geometry_cache.get(hwnd)
+            scale_factor = geometry.scale_factor
+            client_width, client_height = (int(v) for v in geometry.scaled_client_size)
+            client_point = (int(geometry.client_origin[0]), int(geometry.client_origin[1]))
             
             # 저장된 비율 가져오기
             x_ratio = step.get('ratios_x', 0)
             y_ratio = step.get('ratios_y', 0)
             
-            # 클라이언트 영역 크기를 기준으로 상대 좌표 계산
-            client_x = int(client_width * x_ratio)
-            client_y = int(client_height * y_ratio)
-            
-            # 클라이언트 영역의 화면상 좌표 계산
-            screen_x = client_point[0] + client_x
-            screen_y = client_point[1] + client_y
+            # DPI 배율이 적용된 클라이언트 영역 크기를 기준으로 화면 좌표 계산
+            screen_point = geometry_cache.ratios_to_screen(hwnd, (x_ratio, y_ratio), scale_size=True)[0]
+            screen_x, screen_y = int(screen_point[0]), int(screen_point[1])
+            client_x = screen_x - client_point[0]
+            client_y = screen_y - client_point[1]
             
             # 마우스 입력 상세 정보 로깅
             self.base_log_manager.log(
@@ -776,17 +928,28 @@ class LogicExecutor(QObject):
                 include_time=True
             )
             
-            # 클릭 실행
-            success = MouseHandler.click(screen_x, screen_y)
+            # 동작 실행 (이동/드래그는 보간한 경로를 일정 주기로 보냄)
+            action = step.get('action', '클릭')
+            button = self.MOUSE_BUTTONS.get(step.get('button'), 'left')
+            if action == '이동':
+                success = MouseHandler.move(screen_x, screen_y, duration=self.MOUSE_PATH_DURATION)
+            elif action == '드래그':
+                # 현재 커서 위치에서 저장된 좌표까지 드래그
+                start_x, start_y = win32api.GetCursorPos()
+                success = MouseHandler.drag(
+                    start_x, start_y, screen_x, screen_y, button=button, duration=self.MOUSE_PATH_DURATION
+                )
+            else:
+                success = MouseHandler.click(screen_x, screen_y, button=button)
             if not success:
                 self.base_log_manager.log(
-                    message="마우스 클릭 실행 실패",
+                    message=f"마우스 {action} 실행 실패",
                     level="ERROR",
                     file_name="logic_executor",
                     include_time=True,
                     print_to_terminal=True
                 )
-                raise Exception("마우스 클릭 실행 실패")
+                raise Exception(f"마우스 {action} 실행 실패")
             
             self.base_log_manager.log(
                 message=f"마우스 입력 '{step.get('name')}' 실행 완료",
@@ -809,112 +972,502 @@ class LogicExecutor(QObject):
         """클릭 대기 실행
         
         이 메서드는 사용자가 마우스 왼쪽 버튼을 클릭할 때까지 대기합니다.
-        QTimer를 사용하여 주기적으로 마우스 상태를 체크하며,
+        자체 타이머 대신 SystemStateBus의 buttons 토픽을 구독하여
+        공유 폴링 주기마다 바뀐 버튼 상태만 전달받으며,
         이 과정에서 UI는 계속 반응하며 강제 중지(ESC)도 가능합니다.
         
         동작 과정:
-        1. QTimer 생성 및 설정 (50ms 간격)
-        2. 마우스 클릭 감지를 위한 check_click 함수 연결
-        3. 타이머 시작 및 마우스 클릭 대기
-        4. 클릭 감지 시 다음 단계로 진행
+        1. 마우스 왼쪽 버튼과 스페이스바 상태 구독
+        2. 버튼/키가 눌렸다가 떼지면 대기 종료
+        3. 구독 해제 후 다음 단계로 진행
         
         Args:
             item (dict): 클릭 대기 아이템 정보를 담은 딕셔너리
         """
-        # 시작 시간 기록
-        start_time = self._start_time
-        
         # 로그 출력으로 현재 상태 알림
-        elapsed_time = time.time() - start_time
         self.base_log_manager.log(
             message="마우스 왼쪽 버튼 클릭 또는 스페이스바 입력 -- 입력 대기 중...",
             level="INFO",
+            category=LogCategory.MOUSE_CLICK,
             file_name="logic_executor",
             include_time=True
         )
         
-        # 마우스 버튼의 눌림/뗌 상태를 추적하기 위한 변수
+        # 마우스 버튼의 눌림/뗌 상태와 대기 종료 여부를 추적하기 위한 변수
         button_pressed = False
+        is_waiting = True
         
-        # QTimer 객체 생성 및 설정
-        # setSingleShot(False): 타이머가 반복적으로 실행되도록 설정
-        # setInterval(5): 5밀리초(0.0005초) 간격으로 체크
-        wait_timer = QTimer()
-        wait_timer.setSingleShot(False)
-        wait_timer.setInterval(5) # 5밀리초(0.0005초) 간격
-        
-        def check_click():
-            """마우스 클릭 상태나 스페이스바 입력을 확인하는 콜백 함수
+        def on_buttons_changed(buttons):
+            """마우스 왼쪽 버튼이나 스페이스바 상태가 바뀌었을 때 호출되는 콜백 함수
             
-            매 타이머 간격(5ms)마다 실행되며:
-            1. 강제 중지 여부 확인
-            2. 마우스 왼쪽 버튼 상태 또는 스페이스바 입력 확인
-            3. 버튼/키 상태 변화에 따른 처리
+            Args:
+                buttons (dict): {가상 키: 눌림 여부}
             """
-            nonlocal button_pressed, start_time
+            nonlocal button_pressed, is_waiting
             
-            # 강제 중지 요청이 있는 경우 타이머 정리
-            if self._should_stop:
-                elapsed_time = time.time() - start_time
-                self.base_log_manager.log(
-                    message="마우스 왼쪽 버튼 클릭 또는 스페이스바 입력 -- 강제 중지되었습니다",
-                    level="INFO",
-                    file_name="logic_executor",
-                    include_time=True,
-                    print_to_terminal=True
-                )
-                wait_timer.stop()
-                wait_timer.deleteLater()
-                return
-                
-            # win32api를 사용하여 마우스 왼쪽 버튼의 현재 상태 확인
-            # GetAsyncKeyState 반환값에 0x8000 비트 마스크를 적용하여
-            # 버튼이 눌렸는지 확인
-            # 마우스 왼쪽 버튼과 스페이스바 상태 확인
-            is_mouse_pressed = win32api.GetAsyncKeyState(win32con.VK_LBUTTON) & 0x8000
-            is_space_pressed = win32api.GetAsyncKeyState(win32con.VK_SPACE) & 0x8000
+            is_mouse_pressed = buttons.get(win32con.VK_LBUTTON, False)
+            is_space_pressed = buttons.get(win32con.VK_SPACE, False)
             
             if (is_mouse_pressed or is_space_pressed) and not button_pressed:
                 # 버튼이나 키가 처음 눌린 순간 감지
                 button_pressed = True
-                elapsed_time = time.time() - start_time
                 input_type = "왼쪽 버튼" if is_mouse_pressed else "스페이스바"
                 self.base_log_manager.log(
                     message=f"마우스 왼쪽 버튼 클릭 또는 스페이스바 입력 -- {input_type}가 눌렸습니다",
                     level="INFO",
+                    category=LogCategory.MOUSE_CLICK,
                     file_name="logic_executor",
                     include_time=True
                 )
             elif not (is_mouse_pressed or is_space_pressed) and button_pressed:
                 # 버튼이나 키가 떼진 순간 감지 및 다음 단계 진행
-                elapsed_time = time.time() - start_time
                 self.base_log_manager.log(
                     message="마우스 왼쪽 버튼 클릭 또는 스페이스바 입력 -- 입력이 감지되어 다음 단계로 진행합니다",
                     level="INFO", 
+                    category=LogCategory.MOUSE_CLICK,
                     file_name="logic_executor",
                     include_time=True,
                     print_to_terminal=True
                 )
-                wait_timer.stop()
-                wait_timer.deleteLater()
-        
-        # 타이머에 체크 함수 연결 및 시작
-        wait_timer.timeout.connect(check_click)
-        self._active_timers.append(wait_timer)  # 메모리 관리를 위해 활성 타이머 목록에 추가
-        wait_timer.start()
-        
-        # 타이머 완료 대기
-        # processEvents()로 UI 반응성 유지하면서
-        # 0.005초 간격으로 타이머 상태 확인
-        while wait_timer.isActive() and not self._should_stop:
-            QApplication.processEvents()  # UI 이벤트 처리 허용
-            time.sleep(0.005)  # CPU 부하 감소를 위한 짧은 대기{{ ... }}
+                is_waiting = False
+        
+        system_state_bus = SystemStateBus.instance()
+        subscription = system_state_bus.subscribe(
+            SystemStateBus.TOPIC_BUTTONS,
+            on_buttons_changed,
+            name="logic_executor._execute_wait_click",
+            keys=(win32con.VK_LBUTTON, win32con.VK_SPACE)
+        )
+        
+        run_id = self._run_id
+        cancelled = False
+        try:
+            # 입력 대기
+            # processEvents()로 UI 반응성과 상태 버스 폴링을 유지하면서
+            # 0.005초 간격으로 대기 상태 확인
+            while is_waiting and not cancelled:
+                QApplication.processEvents()  # UI 이벤트 처리 허용
+                cancelled = self._is_run_cancelled(run_id)
+                time.sleep(0.005)  # CPU 부하 감소를 위한 짧은 대기
+        finally:
+            system_state_bus.unsubscribe(subscription)
+        
+        # 강제 중지 요청이 있는 경우
+        if cancelled:
+            self.base_log_manager.log(
+                message="마우스 왼쪽 버튼 클릭 또는 스페이스바 입력 -- 강제 중지되었습니다",
+                level="INFO",
+                category=LogCategory.FORCE_STOP,
+                file_name="logic_executor",
+                include_time=True,
+                print_to_terminal=True
+            )
+
+    @instrumented("logic_executor.image_search")
+    def _execute_image_search(self, step):
+        """이미지 서치 실행
+        
+        저장된 영역(ROI)을 캡처하여 cv2.matchTemplate으로 템플릿을 찾고,
+        결과에 따라 다음 스텝 진행 방식을 결정합니다.
+        wait_until_found가 설정되면 찾거나 timeout이 지날 때까지 반복해서 확인하며,
+        이 과정에서 UI는 계속 반응하며 강제 중지(ESC)도 가능합니다.
+        
+        Args:
+            step (dict): 이미지 서치 아이템 정보
+                - area: ROI 정보 (x_ratio, y_ratio, width_ratio, height_ratio)
+                - template_path: 템플릿 이미지 경로
+                - template_key: 저장 시 전처리된 템플릿 피라미드 키
+                - threshold: 일치 임계값 (기본 DEFAULT_MATCH_THRESHOLD)
+                - multi_scale: 여러 배율로 찾을지 여부
+                - use_edges: 윤곽선 맵으로 비교할지 여부
+                - wait_until_found: 찾을 때까지 대기 여부
+                - timeout: 대기 시간 (초)
+                - not_found_action: 찾지 못했을 때 동작 ("stop", "skip_next", "continue")
+        """
+        try:
+            process = self.process_manager.get_selected_process()
+            if not process or not process.get('hwnd'):
+                raise Exception("선택된 프로세스가 없습니다.")
+            
+            # 저장 시 전처리된 템플릿 피라미드를 우선 사용하고, 없으면 원본 이미지 사용
+            template_path = step.get('template_path')
+            template_key = step.get('template_key')
+            template = TemplatePyramidStore.instance().get(template_key) if template_key else None
+            if template is None:
+                template_key = template_path
+                template = load_template(template_path) if template_path else None
+            if template is None:
+                raise Exception(f"템플릿 이미지를 불러올 수 없습니다: {template_path}")
+            
+            hwnd = process['hwnd']
+            area = step.get('area') or {}
+            threshold = float(step.get('threshold', DEFAULT_MATCH_THRESHOLD))
+            wait_until_found = step.get('wait_until_found', False)
+            timeout = float(step.get('timeout', 0))
+            
+            self._get_window_controller().set_target_window(hwnd)
+            
+            # 영역이 바뀌지 않은 폴링은 매칭을 건너뛰도록 (템플릿, ROI)별 결과 캐시 사용
+            match_cache = TemplateMatchCache.instance()
+            roi_key = tuple(sorted(area.items()))
+            
+            run_id = self._run_id
+            deadline = time.perf_counter() + timeout
+            attempts = 0
+            while True:
+                attempts += 1
+                frame = self._capture_check_region(step, hwnd, use_shared_frame=(attempts == 1))
+                result = match_cache.match(
+                    frame, template, threshold, template_key=template_key, roi_key=roi_key,
+                    multi_scale=step.get('multi_scale', False), use_edges=step.get('use_edges', False)
+                ) if frame is not None else None
+                if result and result.found:
+                    break
+                if not wait_until_found or self._should_stop or time.perf_counter() >= deadline:
+                    break
+                QApplication.processEvents()  # UI 이벤트 처리 허용
+                if self._is_run_cancelled(run_id):
+                    return
+                time.sleep(0.05)
+            
+            found = bool(result and result.found)
+            score = result.score if result else 0.0
+            match_ms = result.elapsed_ms if result else 0.0
+            self.base_log_manager.log(
+                message=(
+                    f"[이미지 서치] {'찾음' if found else '찾지 못함'}"
+                    f" - 점수: {score:.3f} (임계값 {threshold:.2f})"
+                    f" - 매칭 시간: {match_ms:.2f}ms{' (변경 없음, 이전 결과 재사용)' if result and result.cached else ''}"
+                    f" - 시도 횟수: {attempts}"
+                ),
+                level="INFO",
+                file_name="logic_executor",
+                include_time=True
+            )
+            
+            if not found:
+                # 샘플링 모드가 on_failure 등으로 켜져 있을 때만 실패 프레임을 비동기로 저장
+                if frame is not None:
+                    DebugCaptureWriter.instance().submit(
+                        frame,
+                        os.path.join(self._window_controller.debug_dir or 'captures', 'image_search_failures',
+                                     f"not_found_{time.strftime('%Y%m%d_%H%M%S')}_{attempts}.png"),
+                        failed=True
+                    )
+                self._apply_check_failed_action(step.get('not_found_action', 'stop'), "이미지 서치")
+            
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"이미지 서치 실행 중 오류 발생: {str(e)}",
+                level="ERROR",
+                file_name="logic_executor",
+                include_time=True,
+                print_to_terminal=True
+            )
+            raise
+    
+    @instrumented("logic_executor.read_text")
+    def _execute_read_text(self, step):
+        """텍스트 읽기(OCR) 실행
+        
+        저장된 영역(ROI)을 캡처하여 OCR 작업 프로세스에 보내고, 결과를 기다리는 동안
+        UI 이벤트를 처리하므로 모델 로딩이나 추론 중에도 화면과 강제 중지(ESC)가 반응합니다.
+        인식한 텍스트는 변수에 저장하며, 정규식이 지정되면 일치 여부로 다음 진행을 결정합니다.
+        정규식의 이름 있는 그룹((?P<이름>...))은 같은 이름의 변수로도 저장됩니다.
+        
+        Args:
+            step (dict): 텍스트 읽기 아이템 정보
+                - area: ROI 정보 (x_ratio, y_ratio, width_ratio, height_ratio)
+                - variable_name: 인식한 텍스트를 저장할 변수 이름 (선택)
+                - pattern: 일치 여부를 확인할 정규식 (선택)
+                - wait_until_matched: 정규식과 일치할 때까지 대기 여부
+                - timeout: 대기 시간 (초)
+                - not_matched_action: 일치하지 않을 때 동작 ("stop", "skip_next", "continue")
+        """
+        try:
+            process = self.process_manager.get_selected_process()
+            if not process or not process.get('hwnd'):
+                raise Exception("선택된 프로세스가 없습니다.")
+            
+            hwnd = process['hwnd']
+            variable_name = step.get('variable_name')
+            pattern = re.compile(step['pattern']) if step.get('pattern') else None
+            wait_until_matched = step.get('wait_until_matched', False) and pattern is not None
+            timeout = float(step.get('timeout', 0))
+            
+            self._get_window_controller().set_target_window(hwnd)
+            
+            # 모델은 처음 사용할 때 작업 프로세스에 로드됨
+            ocr_worker = OcrWorker.instance()
+            ocr_worker.start()
+            
+            run_id = self._run_id
+            deadline = time.perf_counter() + timeout
+            attempts = 0
+            text = None
+            match = None
+            while not self._is_run_cancelled(run_id):
+                attempts += 1
+                frame = self._capture_check_region(step, hwnd, use_shared_frame=(attempts == 1))
+                if frame is not None:
+                    started = time.perf_counter()
+                    future = ocr_worker.read_texts([frame])
+                    # 첫 요청은 모델 로딩 시간까지 기다림
+                    wait_limit = started + (OcrWorker.READY_TIMEOUT if not ocr_worker.is_ready else max(timeout, 10.0))
+                    while not future.done() and time.perf_counter() < wait_limit:
+                        QApplication.processEvents()  # UI 이벤트 처리 허용
+                        if self._is_run_cancelled(run_id):
+                            return
+                        time.sleep(0.01)
+                    if not future.done():
+                        raise Exception("텍스트 인식 결과를 기다리는 중 시간이 초과되었습니다.")
+                    text = future.result()[0]
+                    match = pattern.search(text) if pattern else None
+                    self.base_log_manager.log(
+                        message=(
+                            f"[텍스트 읽기] 인식 결과: '{text}'"
+                            f" - 소요 시간: {(time.perf_counter() - started) * 1000:.1f}ms"
+                            f" - 시도 횟수: {attempts}"
+                        ),
+                        level="INFO",
+                        file_name="logic_executor",
+                        include_time=True
+                    )
+                if match or not wait_until_matched or time.perf_counter() >= deadline:
+                    break
+                QApplication.processEvents()  # UI 이벤트 처리 허용
+                time.sleep(0.05)
+            
+            if self._is_run_cancelled(run_id):
+                return
+            if variable_name and text is not None:
+                self._variables[variable_name] = text
+            if match:
+                self._variables.update({name: value for name, value in match.groupdict().items() if value is not None})
+            
+            if pattern is not None and not match:
+                self.base_log_manager.log(
+                    message=f"[텍스트 읽기] 정규식과 일치하지 않음 - 정규식: {pattern.pattern}",
+                    level="INFO",
+                    file_name="logic_executor",
+                    include_time=True
+                )
+                self._apply_check_failed_action(step.get('not_matched_action', 'stop'), "텍스트 읽기")
+            
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"텍스트 읽기 실행 중 오류 발생: {str(e)}",
+                level="ERROR",
+                file_name="logic_executor",
+                include_time=True,
+                print_to_terminal=True
+            )
+            raise
+    
+    @instrumented("logic_executor.pixel_check")
+    def _execute_pixel_check(self, step):
+        """픽셀 색상 확인 실행
+        
+        모든 지점을 포함하는 최소 영역만 캡처하고, 지점들의 색상을 NumPy 팬시 인덱싱으로
+        한 번에 비교합니다. wait_until_matched가 설정되면 조건을 충족하거나 timeout이
+        지날 때까지 반복해서 확인하며, 이 과정에서 UI와 강제 중지(ESC)는 계속 반응합니다.
+        
+        Args:
+            step (dict): 픽셀 확인 아이템 정보
+                - probes: 지점 목록 [{'x', 'y', 'rgb': [r, g, b], 'tolerance'}, ...] (클라이언트 좌표)
+                - mode: "all"이면 모든 지점, "any"면 한 지점 이상 일치해야 함
+                - wait_until_matched: 일치할 때까지 대기 여부
+                - timeout: 대기 시간 (초)
+                - not_matched_action: 일치하지 않을 때 동작 ("stop", "skip_next", "continue")
+        """
+        try:
+            process = self.process_manager.get_selected_process()
+            if not process or not process.get('hwnd'):
+                raise Exception("선택된 프로세스가 없습니다.")
+            
+            hwnd = process['hwnd']
+            probe_set = self._get_pixel_probe_set(step)
+            mode = step.get('mode', 'all')
+            wait_until_matched = step.get('wait_until_matched', False)
+            timeout = float(step.get('timeout', 0))
+            
+            self._get_window_controller().set_target_window(hwnd)
+            
+            run_id = self._run_id
+            deadline = time.perf_counter() + timeout
+            attempts = 0
+            matched = False
+            check_us = 0.0
+            while True:
+                attempts += 1
+                frame = self._capture_check_region(step, hwnd, use_shared_frame=(attempts == 1))
+                if frame is not None:
+                    started = time.perf_counter()
+                    matched = probe_set.check(frame, mode)
+                    check_us = (time.perf_counter() - started) * 1e6
+                if matched:
+                    break
+                if not wait_until_matched or self._should_stop or time.perf_counter() >= deadline:
+                    break
+                QApplication.processEvents()  # UI 이벤트 처리 허용
+                if self._is_run_cancelled(run_id):
+                    return
+                time.sleep(0.02)
+            
+            self.base_log_manager.log(
+                message=(
+                    f"[픽셀 확인] {'일치' if matched else '일치하지 않음'}"
+                    f" - 지점 {len(probe_set)}개 ({mode})"
+                    f" - 평가 시간: {check_us:.1f}us"
+                    f" - 시도 횟수: {attempts}"
+                ),
+                level="INFO",
+                file_name="logic_executor",
+                include_time=True
+            )
+            
+            if not matched and not self._is_run_cancelled(run_id):
+                self._apply_check_failed_action(step.get('not_matched_action', 'stop'), "픽셀 확인")
+            
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"픽셀 확인 실행 중 오류 발생: {str(e)}",
+                level="ERROR",
+                file_name="logic_executor",
+                include_time=True,
+                print_to_terminal=True
+            )
+            raise
+    
+    def _get_pixel_probe_set(self, step):
+        """픽셀 확인 스텝의 지점 배열을 반환합니다. 같은 스텝은 한 번만 만듭니다."""
+        cached = self._pixel_probe_sets.get(id(step))
+        if cached is None or cached[0] is not step:
+            cached = (step, PixelProbeSet(step.get('probes') or []))
+            self._pixel_probe_sets[id(step)] = cached
+        return cached[1]
+    
+    def _capture_check_region(self, step, hwnd, use_shared_frame=True):
+        """확인 스텝의 영역(ROI) 이미지 가져오기
+        
+        연속된 확인 스텝(CHECK_STEP_TYPES)은 첫 스텝에서 클라이언트 영역을 한 번만 캡처하여
+        모든 스텝의 영역 뷰를 잘라 두고, 뒤 스텝은 다시 캡처하지 않고 그 뷰를 사용합니다.
+        대기 모드의 재시도처럼 새 프레임이 필요한 경우에는 공유 프레임을 버리고 다시 캡처합니다.
+        
+        Args:
+            step (dict): 현재 확인 스텝
+            hwnd: 대상 윈도우 핸들
+            use_shared_frame (bool): 앞 스텝과 공유하는 프레임을 사용할지 여부
+        
+        Returns:
+            np.ndarray: 영역 이미지 (BGR 뷰, 다음 캡처 전까지만 유효). 실패 시 None
+        """
+        if use_shared_frame:
+            for index, (shared_step, view) in enumerate(self._shared_check_regions):
+                if shared_step is step:
+                    del self._shared_check_regions[index]
+                    return view
+            
+            # 현재 스텝부터 이어지는 확인 스텝들의 영역을 한 번에 캡처
+            group = self._collect_check_group()
+            if not any(item is step for item in group):
+                group = [step]
+        else:
+            group = [step]
+        
+        # 새로 캡처하면 이전 공유 프레임의 뷰는 덮어써지므로 버림
+        self._shared_check_regions = []
+        regions = [self._check_step_client_region(hwnd, item) for item in group]
+        views = self._window_controller.capture_regions(regions)
+        if views is None:
+            return None
+        
+        own_view = None
+        for item, view in zip(group, views):
+            if item is step:
+                own_view = view
+            elif view is not None:
+                self._shared_check_regions.append((item, view))
+        return own_view
+    
+    def _collect_check_group(self):
+        """현재 스텝부터 연속된 확인 스텝 목록을 반환합니다."""
+        items = sorted(self.selected_logic.get('items', []), key=lambda x: x.get('order', 0))
+        group = []
+        # current_step은 실행 직전에 이미 다음 스텝 번호로 증가되어 있음
+        for item in items[self.execution_state['current_step'] - 1:]:
+            if item.get('type') not in self.CHECK_STEP_TYPES:
+                break
+            group.append(item)
+        return group
+    
+    def _check_step_client_region(self, hwnd, step):
+        """확인 스텝이 캡처할 클라이언트 좌표 영역 (x, y, width, height)을 반환합니다.
+        
+        픽셀 확인은 모든 지점을 포함하는 최소 영역, 나머지는 비율로 저장된 ROI입니다.
+        """
+        if step.get('type') == 'pixel_check':
+            return self._get_pixel_probe_set(step).bounds
+        return self._area_to_client_region(hwnd, step.get('area') or {})
+    
+    @staticmethod
+    def _area_to_client_region(hwnd, area):
+        """비율로 저장된 영역을 클라이언트 좌표 영역 (x, y, width, height)으로 변환합니다."""
+        client_width, client_height = (int(v) for v in WindowGeometryCache.instance().get(hwnd).client_size)
+        x = int(client_width * area.get('x_ratio', 0))
+        y = int(client_height * area.get('y_ratio', 0))
+        width = int(client_width * (area.get('x_ratio', 0) + area.get('width_ratio', 0))) - x
+        height = int(client_height * (area.get('y_ratio', 0) + area.get('height_ratio', 0))) - y
+        return (x, y, width, height)
+    
+    def _is_run_cancelled(self, run_id):
+        """processEvents()로 대기하는 동안 현재 실행이 중지되었는지 확인
+        
+        강제 중지는 processEvents() 안에서 실행되어 _should_stop을 다시 False로 되돌리고
+        selected_logic을 비우므로, 플래그 대신 실행 번호와 실행 상태로 확인합니다.
+        
+        Args:
+            run_id (int): 대기를 시작할 때의 실행 번호 (self._run_id)
+        
+        Returns:
+            bool: 중지되었거나 다른 실행이 시작되었으면 True
+        """
+        return (
+            self._should_stop
+            or run_id != self._run_id
+            or self.selected_logic is None
+            or not self.execution_state['is_executing']
+        )
+
+    def _apply_check_failed_action(self, action, step_name):
+        """확인 스텝이 실패했을 때(이미지를 찾지 못함, 텍스트 불일치) 다음 스텝 진행 방식 적용
+        
+        Args:
+            action (str): "stop"이면 현재 로직 종료, "skip_next"면 다음 스텝 건너뛰기,
+                          "continue"면 그대로 진행
+            step_name (str): 로그에 표시할 스텝 이름
+        """
+        if action == 'skip_next':
+            self._update_state(current_step=self.execution_state['current_step'] + 1)
+        elif action == 'stop':
+            # 남은 스텝과 반복을 모두 완료한 것으로 처리하여 현재 로직을 정상 종료
+            self._update_state(
+                current_step=len(self.selected_logic.get('items', [])),
+                current_repeat=self.selected_logic.get('repeat_count', 1)
+            )
+        self.base_log_manager.log(
+            message=f"[{step_name}] 실패 시 동작 적용: {action}",
+            level="INFO",
+            file_name="logic_executor",
+            include_time=True
+        )
 
     def _clear_timers_async(self):
         """타이머를 비동기적으로 정리"""
         self.base_log_manager.log(
             message=f"로직 강제 중지 -- 비동기로 실행된 타이머 정리를 시작합니다 (총 {len(self._active_timers)}개)",
             level="INFO",
+            category=LogCategory.FORCE_STOP,
             file_name="logic_executor",
             include_time=True,
             print_to_terminal=True
@@ -931,6 +1484,7 @@ class LogicExecutor(QObject):
                 self.base_log_manager.log(
                     message="로직 강제 중지 -- 비동기로 실행된 모든 타이머 정리가 완료되었습니다",
                     level="INFO",
+                    category=LogCategory.FORCE_STOP,
                     file_name="logic_executor",
                     include_time=True,
                     print_to_terminal=True
@@ -953,6 +1507,7 @@ class LogicExecutor(QObject):
         # 첫 번째 그룹 처리 시작
         QTimer.singleShot(0, clear_timer_group)
 
+    @instrumented("logic_executor.release_all_keys")
     def _release_all_keys(self):
         """키보드 상태 정리 / 현재 눌려있는 모든 키를 떼는 함수"""
         pressed_keys = []
@@ -975,6 +1530,7 @@ class LogicExecutor(QObject):
         self.base_log_manager.log(
             message=f"로직 강제 중지 -- 키 상태 정리를 시작합니다 (총 {len(pressed_keys)}개의 키)",
             level="INFO",
+            category=LogCategory.FORCE_STOP,
             file_name="logic_executor",
             include_time=True
         )
@@ -982,15 +1538,18 @@ class LogicExecutor(QObject):
         self.base_log_manager.log(
             message="로직 강제 중지 -- 모든 키 떼기가 완료되었습니다",
             level="INFO", 
+            category=LogCategory.FORCE_STOP,
             file_name="logic_executor",
             include_time=True
         )
 
     def force_stop(self):
         """로직 강제 중지"""
+        count("logic_executor.force_stop")
         self.base_log_manager.log(
             message="로직 강제 중지 -- 로직 강제 중지를 시작합니다",
             level="INFO",
+            category=LogCategory.FORCE_STOP,
             file_name="logic_executor",
             include_time=True,
             print_to_terminal=True
@@ -1027,6 +1586,7 @@ class LogicExecutor(QObject):
             self.base_log_manager.log(
                 message="로직 강제 중지 -- ESC 키 세 번 눌렀다 떼기가 완료되었습니다",
                 level="INFO",
+                category=LogCategory.FORCE_STOP,
                 file_name="logic_executor",
                 include_time=True
             )
@@ -1037,6 +1597,7 @@ class LogicExecutor(QObject):
             self.base_log_manager.log(
                 message="로직 강제 중지 -- 중지 상태가 해제되었습니다",
                 level="INFO",
+                category=LogCategory.FORCE_STOP,
                 file_name="logic_executor",
                 include_time=True
             )
@@ -1044,6 +1605,7 @@ class LogicExecutor(QObject):
             self.base_log_manager.log(
                 message="로직 강제 중지 -- 로직 강제 중지가 완료되었습니다",
                 level="INFO",
+                category=LogCategory.FORCE_STOP,
                 file_name="logic_executor", 
                 include_time=True,
                 print_to_terminal=True
@@ -1114,11 +1676,12 @@ class LogicExecutor(QObject):
         # 매칭된 경우에만 로그 출력
         if is_matched:
             self.base_log_manager.log(
-                message=f"""
+                message="""
                 트리거 키 매칭 확인
-                - 트리거 키: {trigger_key}
-                - 입력 키: {formatted_key_info}
+                - 트리거 키: %s
+                - 입력 키: %s
                 """,
+                args=(trigger_key, formatted_key_info),
                 level="DEBUG",
                 file_name="logic_executor",
                 print_to_terminal=True
@@ -1178,36 +1741,40 @@ class LogicExecutor(QObject):
         # 터미널 출력 여부 결정
         print_to_terminal = any(pattern in message for pattern in terminal_patterns)
 
-        # 메시지 스타일 적용
-        if "[오류]" in message:
-            # 오류 메시지 - 어두운 빨간색
-            formatted_message = f"<span style='color: #FFA500; font-size: 12px;'>{message}</span>"
-        elif "로직 강제 중지" in message:
-            formatted_message = f"<span style='color: #FF0000; font-size: 16px; font-weight: bold;'>{message}</span>"
-        elif "중첩로직" in message:
-            formatted_message = f"<span style='color: #008000; font-size: 18px; font-weight: bold;'>{message}</span>"
-        elif "키 입력: 숫자패드 9" in message or "키 입력: 숫자패드 8" in message or "키 입력: 숫자패드 1" in message:
-            formatted_message = f"<span style='color: #FF00FF; font-size: 12px; font-weight: bold;'>{message}</span>"
-        elif "로직 실행" in message and ("실행 시작" in message or "반복 완료" in message):
-            formatted_message = f"<span style='color: #0000FF; font-size: 20px; font-weight: bold;'>{message}</span>"
-        elif "마우스 왼쪽 버튼 클릭" in message:
-            formatted_message = f"<span style='color: #E2C000; font-size: 20px; font-weight: bold;'>{message}</span>"
-        else:
-            formatted_message = message
-
         # BaseLogManager를 통해 로그 출력
         self.base_log_manager.log(
-            message=formatted_message,
+            message=message,
             level="INFO",
             file_name="logic_executor",
+            category=legacy_log_category(message),
             include_time=include_time,
             print_to_terminal=print_to_terminal
         )
 
+    def get_metrics(self):
+        """실행 지표를 반환합니다.
+
+        Returns:
+            dict: {'running_logics', 'nested_depth', 'is_executing', 'current_step', 'current_repeat', 'monitoring'}
+        """
+        with self._state_lock:
+            state = dict(self.execution_state)
+        nested_depth = len(self._logic_stack)
+        return {
+            'running_logics': nested_depth + 1 if state['is_executing'] else 0,
+            'nested_depth': nested_depth,
+            'is_executing': state['is_executing'],
+            'current_step': state['current_step'],
+            'current_repeat': state['current_repeat'],
+            'monitoring': self.keyboard_hook is not None
+        }
+
     # 로직 실행 상태를 완전히 초기화하는 메서드 추가
     def reset_execution_state(self):
         """실행 상태를 완전히 초기화"""
         with self._state_lock:
+            # 대기 중인 스텝이 중지를 알 수 있도록 실행 번호 증가
+            self._run_id += 1
             # execution_state 초기화
             self.execution_state = {
                 'is_executing': False,
@@ -1217,8 +1784,15 @@ class LogicExecutor(QObject):
             }
             # 로직 스택 초기화
             self._logic_stack.clear()
+            # 공유 캡처 프레임 초기화
+            self._shared_check_regions = []
+            # 텍스트 읽기 변수 초기화
+            self._variables = {}
+            # 픽셀 확인 지점 배열 초기화
+            self._pixel_probe_sets = {}
             # 선택된 로직 초기화
             self.selected_logic = None
+            self.base_log_manager.set_logic_context(None)
             
             self.execution_state_changed.emit(self.execution_state.copy())
 
@@ -1267,10 +1841,16 @@ class LogicExecutor(QObject):
             self.running = False
             self.stop_requested = False
 
+    @instrumented("logic_executor.text_input")
     def _execute_text_input(self, item):
         """텍스트 입력 실행"""
         try:
-            text = item.get('text', '')
+            # {{변수명}}을 텍스트 읽기 스텝이 저장한 값으로 치환
+            text = re.sub(
+                r'\{\{(\w+)\}\}',
+                lambda match: self._variables.get(match.group(1), match.group(0)),
+                item.get('text', '')
+            )
             # 텍스트 입력을 시스템 클립보드에 복사
             QApplication.clipboard().setText(text)
             
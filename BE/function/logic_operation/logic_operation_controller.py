@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import QDialog
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject
 from BE.function.logic_operation.logic_operation_widget import LogicOperationWidget
-from BE.function._common_components.window_process_handler import ProcessManager
+from BE.function._common_components.system_state_bus import SystemStateBus
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.log_category import LogCategory
 from BE.settings.force_stop_key_data_settingfile import ForceStopKeyDataSettingFilesManager
 from BE.function._common_components.modal.entered_key_info_modal.entered_key_info_dialog import EnteredKeyInfoDialog
 import win32con
@@ -26,10 +27,14 @@ class LogicOperationController(QObject):
             super().__init__()
             self.setup_connections()
             
-            # 활성 프로세스 업데이트 타이머 설정
-            self.active_process_timer = QTimer()
-            self.active_process_timer.timeout.connect(self._update_active_process)
-            self.active_process_timer.start(100)  # 100ms 간격으로 업데이트
+            # 활성 프로세스가 바뀔 때마다 표시 업데이트
+            system_state_bus = SystemStateBus.instance()
+            system_state_bus.subscribe(
+                SystemStateBus.TOPIC_FOREGROUND,
+                self._update_active_process,
+                name="logic_operation_controller._update_active_process"
+            )
+            self._update_active_process(system_state_bus.get_state(SystemStateBus.TOPIC_FOREGROUND))
             self.base_log_manager.log(
                 message="LogicOperationController 초기화 완료",
                 level="DEBUG",
@@ -133,13 +138,17 @@ class LogicOperationController(QObject):
                 self.base_log_manager.log(
                     message="강제 중지 정리 작업이 완료되었습니다",
                     level="INFO",
+                    category=LogCategory.FORCE_STOP,
                     file_name="logic_operation_controller",
                     method_name="_on_force_stop_cleanup_finished"
                 )
 
-    def _update_active_process(self):
-        """활성 프로세스 정보 업데이트"""
-        process = ProcessManager.get_active_process()
+    def _update_active_process(self, process):
+        """활성 프로세스 정보 업데이트
+        
+        Args:
+            process (dict): 활성 프로세스 정보 (없으면 None)
+        """
         if process:
             text = f"활성 프로세스 : [ PID : {process['pid']} ] {process['name']} - {process['title']}"
             self.widget.active_process_label.setText(text)
@@ -171,6 +180,7 @@ class LogicOperationController(QObject):
                         self.base_log_manager.log(
                             message=f"로직 강제 중지 키가 '{key_info['simple_display_text']}'(으)로 변경되었습니다",
                             level="INFO",
+                            category=LogCategory.FORCE_STOP,
                             file_name="logic_operation_controller",
                             method_name="_handle_edit_force_stop_key"
                         )
@@ -209,6 +219,7 @@ class LogicOperationController(QObject):
                 self.base_log_manager.log(
                     message="로직 강제 중지 키가 'ESC'로 초기화되었습니다",
                     level="INFO",
+                    category=LogCategory.FORCE_STOP,
                     file_name="logic_operation_controller",
                     method_name="_handle_reset_force_stop_key"
                 )
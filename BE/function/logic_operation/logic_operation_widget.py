@@ -10,6 +10,7 @@ from BE.function.constants.styles import (FRAME_STYLE, BUTTON_STYLE,
                              TITLE_FONT_FAMILY, SECTION_FONT_SIZE)
 from BE.function._common_components.modal.window_process_selector.window_process_selector_modal import ProcessSelectorDialog
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.log_category import LogCategory
 from BE.settings.key_input_delays_data_settingfiles_manager import KeyInputDelaysDataSettingFilesManager
 from BE.settings.force_stop_key_data_settingfile import ForceStopKeyDataSettingFilesManager
 
@@ -301,6 +302,7 @@ class LogicOperationWidget(QFrame):
             self.base_log_manager.log(
                 message="강제 중지 시작",
                 level="DEBUG",
+                category=LogCategory.FORCE_STOP,
                 file_name="logic_operation_widget",
                 method_name="_on_force_stop"
             )
@@ -308,6 +310,7 @@ class LogicOperationWidget(QFrame):
             self.base_log_manager.log(
                 message="강제 중지 완료",
                 level="INFO",
+                category=LogCategory.FORCE_STOP,
                 file_name="logic_operation_widget",
                 method_name="_on_force_stop"
             )
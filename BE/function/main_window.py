@@ -24,6 +24,8 @@ from BE.function._common_components.error_handler import ErrorHandler
 from BE.function.make_logic.repository_and_service.all_logics_data_repository_and_service import AllLogicsDataRepositoryAndService
 from BE.function.execute_logic.logic_executor import LogicExecutor
 from BE.function._common_components.window_process_handler import ProcessManager
+from BE.function._common_components.foreground_window_tracker import ForegroundWindowTracker
+from BE.function._common_components.system_state_bus import SystemStateBus
 from BE.function.constants.dimensions import (MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT, BASIC_SECTION_HEIGHT,
                                MIDDLE_SPACE)
 from BE.function.etc_function.countdown.UI.etc_function_widget import EtcFunctionWidget
@@ -336,6 +338,9 @@ class MainWindow(QMainWindow):
         # 프로세스 선택 시 기타 기능 컨트롤러에도 전달
         self.process_manager.process_selected.connect(self.countdown_controller__input_sequence.process_manager.set_selected_process)
         
+        # 프로세스 선택 시 시스템 상태 버스의 생존 감시 대상도 변경
+        self.process_manager.process_selected.connect(SystemStateBus.instance().set_selected_process)
+        
         # 로직 리스트의 logic_detail_updated 시그널을 로직 상세 위젯의 update_logic_detail_data에 연결
         # self.logic_list_controller.logic_detail_updated.connect(self.logic_detail_widget.update_logic_detail_data)
         
@@ -492,9 +497,8 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'keyboard_hook'):
                 self.keyboard_hook.stop()
             
-            # 프로세스 체크 타이머 정리
-            if hasattr(self.countdown_controller__input_sequence, 'process_check_timer'):
-                self.countdown_controller__input_sequence.process_check_timer.stop()
+            # 포그라운드 창 추적 정리
+            ForegroundWindowTracker.instance().stop()
             
             event.accept()
             
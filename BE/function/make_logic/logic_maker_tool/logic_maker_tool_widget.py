@@ -8,6 +8,8 @@ from BE.function.constants.dimensions import LOGIC_MAKER_WIDTH, BASIC_SECTION_HE
 from BE.function._common_components.modal.logic_selector_modal.logic_selector_dialog import LogicSelectorDialog
 from BE.function._common_components.modal.mouse_input_modal.mouse_input_dialog import MouseInputDialog
 from BE.function._common_components.modal.image_search_area_modal.image_search_area_dialog import ImageSearchAreaDialog
+from BE.function._common_components.modal.text_read_area_modal.text_read_area_dialog import TextReadAreaDialog
+from BE.function._common_components.modal.pixel_check_modal.pixel_check_dialog import PixelCheckDialog
 from BE.function._common_components.modal.text_input_modal.text_input_dialog import TextInputDialog
 from .logic_maker_tool_key_info_controller import LogicMakerToolKeyInfoController
 from BE.log.base_log_manager import BaseLogManager
@@ -91,6 +93,18 @@ class LogicMakerToolWidget(QFrame):
         self.image_search_btn.clicked.connect(self._add_image_search)
         button_layout.addWidget(self.image_search_btn)
 
+        # 픽셀 색상 확인 버튼
+        self.pixel_check_btn = QPushButton("픽셀 색상 확인")
+        self.pixel_check_btn.setStyleSheet(BUTTON_STYLE)
+        self.pixel_check_btn.clicked.connect(self._add_pixel_check)
+        button_layout.addWidget(self.pixel_check_btn)
+
+        # 텍스트 읽기 버튼
+        self.read_text_btn = QPushButton("텍스트 읽기")
+        self.read_text_btn.setStyleSheet(BUTTON_STYLE)
+        self.read_text_btn.clicked.connect(self._add_read_text)
+        button_layout.addWidget(self.read_text_btn)
+
         # 텍스트 입력 버튼
         self.text_input_btn = QPushButton("텍스트 입력")
         self.text_input_btn.setStyleSheet(BUTTON_STYLE)
@@ -231,6 +245,7 @@ class LogicMakerToolWidget(QFrame):
                     'logic_detail_item_dp_text': '이미지 서치 체크',
                     'area': area
                 }
+                image_search_info.update(dialog.get_search_settings())
                 # Repository를 통해 아이템 추가
                 self.repository.add_item(image_search_info)
                 self.base_log_manager.log(
@@ -239,6 +254,46 @@ class LogicMakerToolWidget(QFrame):
                     file_name="logic_maker_tool_widget"
                 )
 
+    def _add_pixel_check(self):
+        """픽셀 색상 확인 추가"""
+        dialog = PixelCheckDialog(self)
+        if dialog.exec() == QDialog.Accepted:
+            pixel_check_info = {
+                'type': 'pixel_check'
+            }
+            pixel_check_info.update(dialog.get_check_settings())
+            pixel_check_info['logic_detail_item_dp_text'] = f"픽셀 색상 확인: {len(pixel_check_info['probes'])}개 지점"
+            # Repository를 통해 아이템 추가
+            self.repository.add_item(pixel_check_info)
+            self.base_log_manager.log(
+                message=f"픽셀 색상 확인이 추가되었습니다: {pixel_check_info['probes']}",
+                level="INFO",
+                file_name="logic_maker_tool_widget"
+            )
+
+    def _add_read_text(self):
+        """텍스트 읽기 추가"""
+        dialog = TextReadAreaDialog(self)
+        if dialog.exec() == QDialog.Accepted:
+            area = dialog.captured_rect
+            if area:
+                read_text_info = {
+                    'type': 'read_text',
+                    'area': area
+                }
+                read_text_info.update(dialog.get_read_settings())
+                variable_name = read_text_info['variable_name']
+                read_text_info['logic_detail_item_dp_text'] = (
+                    f"텍스트 읽기: {variable_name}" if variable_name else "텍스트 읽기"
+                )
+                # Repository를 통해 아이템 추가
+                self.repository.add_item(read_text_info)
+                self.base_log_manager.log(
+                    message=f"텍스트 읽기 영역이 추가되었습니다: {area}",
+                    level="INFO",
+                    file_name="logic_maker_tool_widget"
+                )
+
     def _add_text_input(self):
         """텍스트 입력 추가"""
         dialog = TextInputDialog(self)
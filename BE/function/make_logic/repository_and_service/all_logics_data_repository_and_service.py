@@ -2,6 +2,8 @@ from PySide6.QtCore import QObject, Signal
 import uuid
 from datetime import datetime
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.instrumentation import instrumented
+from BE.function._common_components.template_pyramid_store import TemplatePyramidStore
 
 
 class AllLogicsDataRepositoryAndService(QObject):
@@ -22,6 +24,7 @@ class AllLogicsDataRepositoryAndService(QObject):
         self.current_logic_name = None
         self.base_log_manager = BaseLogManager.instance()
 
+    @instrumented("all_logics_repository.load_logic")
     def load_logic(self, logic_name):
         """로직 로드
         Args:
@@ -68,6 +71,7 @@ class AllLogicsDataRepositoryAndService(QObject):
         """
         return self.current_logic_name
 
+    @instrumented("all_logics_repository.get_all_logics_list")
     def get_all_logics_list(self, force=False):
         """모든 로직 반환
         Returns:
@@ -86,6 +90,7 @@ class AllLogicsDataRepositoryAndService(QObject):
             )
             return {}
 
+    @instrumented("all_logics_repository.remove_logic")
     def remove_logic(self, logic_name):
         """로직을 제거합니다.
         Args:
@@ -100,18 +105,20 @@ class AllLogicsDataRepositoryAndService(QObject):
                 file_name="all_logics_data_repository_and_service",
                 method_name="remove_logic"
             )
+        self.remove_unused_templates()
 
     def validate_logic(self, logic_data):
         """로직 데이터 유효성 검사"""
         if not logic_data.get('name'):
             raise ValueError("로직 이름은 필수입니다.")
         if not logic_data.get('isNestedLogicCheckboxSelected', False):
-            if not logic_data.get('trigger_key'):
-                raise ValueError("트리거 키는 필수입니다.")
+            if not logic_data.get('trigger_key') and not logic_data.get('screen_trigger'):
+                raise ValueError("트리거 키 또는 화면 트리거는 필수입니다.")
         if not logic_data.get('items'):
             raise ValueError("최소 하나의 동작이 필요합니다.")
         return True
 
+    @instrumented("all_logics_repository.save_logic")
     def save_logic(self, logic_id, logic_data):
         """로직 저장
         Args:
@@ -162,6 +169,9 @@ class AllLogicsDataRepositoryAndService(QObject):
                 logic_data['created_at'] = current_time
             logic_data['updated_at'] = current_time
 
+            # 이미지 서치 템플릿 전처리
+            self._prepare_image_search_templates(logic_data)
+
             # 로직 저장
             logics[logic_id] = logic_data
             settings['logics'] = logics
@@ -169,6 +179,9 @@ class AllLogicsDataRepositoryAndService(QObject):
             # 설정 저장
             self.settings_manager._save_settings(settings)
 
+            # 수정으로 더 이상 쓰지 않게 된 템플릿 피라미드 정리
+            self.remove_unused_templates(logics)
+
             self.base_log_manager.log(
                 message=f"로직 '{logic_data.get('name')}' 저장 완료",
                 level="INFO",
@@ -188,5 +201,74 @@ class AllLogicsDataRepositoryAndService(QObject):
             )
             return False, str(e)
 
+    def _prepare_image_search_templates(self, logic_data):
+        """이미지 서치 아이템의 템플릿을 미리 전처리하여 저장하고 template_key를 기록합니다.
+        
+        실행할 때마다 템플릿을 그레이스케일/배율 변환하지 않도록 저장 시점에 한 번만 계산합니다.
+        전처리에 실패한 아이템은 실행 시 template_path의 원본 이미지를 사용합니다.
+        
+        Args:
+            logic_data (dict): 저장할 로직 데이터
+        """
+        store = None
+        # 화면 트리거도 이미지 서치와 같은 형식이므로 함께 전처리
+        items = list(logic_data.get('items', []))
+        if logic_data.get('screen_trigger'):
+            items.append(logic_data['screen_trigger'])
+        for item in items:
+            if item.get('type') != 'image_search' or not item.get('template_path'):
+                continue
+            try:
+                if store is None:
+                    store = TemplatePyramidStore.instance()
+                template_key = store.store_from_file(
+                    item['template_path'],
+                    with_edges=item.get('use_edges', False)
+                )
+                if template_key:
+                    item['template_key'] = template_key
+                else:
+                    item.pop('template_key', None)
+                    self.base_log_manager.log(
+                        message=f"템플릿 이미지를 읽을 수 없어 전처리하지 못했습니다: {item['template_path']}",
+                        level="WARNING",
+                        file_name="all_logics_data_repository_and_service",
+                        method_name="_prepare_image_search_templates"
+                    )
+            except Exception as e:
+                self.base_log_manager.log(
+                    message=f"템플릿 전처리 중 오류 발생: {e}",
+                    level="ERROR",
+                    file_name="all_logics_data_repository_and_service",
+                    method_name="_prepare_image_search_templates",
+                    print_to_terminal=True
+                )
+
+    def remove_unused_templates(self, logics=None):
+        """어떤 로직에서도 참조하지 않는 템플릿 피라미드를 DB에서 삭제합니다.
+
+        Args:
+            logics (dict, optional): 저장된 전체 로직 {로직 ID: 로직 데이터}. 없으면 설정에서 다시 읽음
+        """
+        try:
+            if logics is None:
+                # 읽기 실패 시 빈 목록으로 모든 템플릿을 지우지 않도록 get_all_logics_list 대신 직접 읽음
+                logics = self.settings_manager._load_settings().get('logics', {})
+            used_keys = set()
+            for logic in logics.values():
+                items = list(logic.get('items', []))
+                if logic.get('screen_trigger'):
+                    items.append(logic['screen_trigger'])
+                used_keys.update(item['template_key'] for item in items if item.get('template_key'))
+            TemplatePyramidStore.instance().delete_unused(used_keys)
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"사용하지 않는 템플릿 정리 중 오류 발생: {e}",
+                level="ERROR",
+                file_name="all_logics_data_repository_and_service",
+                method_name="remove_unused_templates",
+                print_to_terminal=True
+            )
+
     def __del__(self):
         pass
\ No newline at end of file
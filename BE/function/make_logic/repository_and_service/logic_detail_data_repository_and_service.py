@@ -1,5 +1,6 @@
 from PySide6.QtCore import QObject, Signal
 from BE.log.base_log_manager import BaseLogManager
+from BE.log.instrumentation import instrumented
 from BE.settings.logics_data_settingfiles_manager import LogicsDataSettingFilesManager
 from BE.function.make_logic.repository_and_service.all_logics_data_repository_and_service import AllLogicsDataRepositoryAndService
 
@@ -173,6 +174,7 @@ class LogicDetailDataRepositoryAndService(QObject):
             'items': self.get_logic_detail_items()
         }
 
+    @instrumented("logic_detail_repository.save_logic_detail_data")
     def save_logic_detail_data_data(self, controller) -> tuple[bool, str]:
         """로직을 저장합니다.
         
@@ -194,8 +196,9 @@ class LogicDetailDataRepositoryAndService(QObject):
                 return False, "최소 하나의 아이템이 필요합니다."
 
             # 중첩로직이 아닌데 트리거 키가 없는 경우 검증
-            if not logic_info.get('isNestedLogicCheckboxSelected') and not logic_info.get('trigger_key'):
-                return False, "중첩로직이 아닌 경우 트리거 키가 필요합니다."
+            if (not logic_info.get('isNestedLogicCheckboxSelected') and not logic_info.get('trigger_key')
+                    and not logic_info.get('screen_trigger')):
+                return False, "중첩로직이 아닌 경우 트리거 키 또는 화면 트리거가 필요합니다."
 
             # 3. 이름 중복 검사 (수정 모드가 아닐 때만)
             if not self.current_logic_id: # 새 로직을 생성하는 경우에만 이름 중복 검사 수행
@@ -256,6 +259,7 @@ class LogicDetailDataRepositoryAndService(QObject):
             )
             return False, str(e)
 
+    @instrumented("logic_detail_repository.load_logic_detail_items")
     def load_logic_detail_items(self, logic_info: dict) -> bool:
         """로직을 로드합니다.
         
@@ -1,18 +1,35 @@
-from PySide6.QtCore import QObject, Signal
-from typing import List, Callable, Optional
+from PySide6.QtCore import QObject
+from typing import List, Callable, Optional, Union, Iterable
 import logging
+import threading
 from datetime import datetime
 import time
+from BE.log.log_ring_buffer import LogRecord, LogRingBuffer
+from BE.log.log_category import LogCategory, apply_category_style, display_category, legacy_log_category
+
+# 로그 레벨 이름 -> 숫자 (표준 logging 모듈과 같은 값)
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# 기본 출력 레벨. DEBUG 로그는 set_level()로 낮춰야 출력됨
+DEFAULT_LOG_LEVEL = "INFO"
 
 class BaseLogManager(QObject):
-    """모달 다이얼로그의 로그를 중앙에서 관리하는 매니저
+    """메인 창과 모달 다이얼로그의 로그를 중앙에서 관리하는 로그 버스
     
-    이 클래스는 싱글톤 패턴을 사용하여 모든 모달 다이얼로그의 로그를 
-    중앙에서 수집하고 관리합니다.
+    이 클래스는 싱글톤 패턴을 사용하여 애플리케이션의 모든 로그를 하나의 링 버퍼에 모읍니다.
+    로그 영역은 링 버퍼를 순번으로 직접 읽고, 파일 저장 등 구독자(sink)에게는
+    전달 스레드 하나가 링 버퍼의 레코드를 복사 없이 토픽(모듈)과 레벨로 골라 묶음으로 전달합니다.
     """
     
+    DELIVERY_INTERVAL = 0.1  # 구독자 전달 간격 (초)
+    
     _instance = None
-    log_message = Signal(str)  # 로그 메시지 시그널
     
     @classmethod
     def instance(cls):
@@ -31,19 +48,85 @@ class BaseLogManager(QObject):
             raise RuntimeError("BaseLogManager는 싱글톤입니다. instance()를 사용하세요.")
             
         super().__init__()
-        self._handlers = []
+        self._handlers = []  # 형식이 적용된 문자열을 받는 핸들러
+        self._subscriptions = []  # 구독자 {'sink', 'topics', 'min_level_no', 'start_seq'}
+        self._bus_lock = threading.RLock()  # 구독자 목록 변경과 전달을 직렬화
+        self._bus_thread = None
+        self._bus_wake = threading.Event()
+        self._delivered_seq = 0  # 구독자에게 전달을 마친 마지막 순번
+        self._bus_metrics = {'delivered': 0, 'dropped': 0, 'failed': 0}
+        self._logic_id = None  # 현재 실행 중인 로직 ID (레코드에 함께 기록)
         self._timers = {}  # 각 모달별 타이머 저장
-        self.log_buffer = []
         self.buffer_size = 10000  # 버퍼 최대 크기
+        self.log_buffer = LogRingBuffer(self.buffer_size)  # 구조화된 레코드 보관 (가득 차면 오래된 것부터 덮어씀)
+        self._style_audit_enabled = False
+        self._style_audit = {}  # (파일 이름, 메서드 이름, 레벨, 분류) -> 검사 결과
+        self._level = LOG_LEVELS[DEFAULT_LOG_LEVEL]  # 전체 출력 레벨
+        self._module_levels = {}  # file_name -> 모듈별 출력 레벨 (전체 레벨보다 우선)
+        
+    def set_level(self, level: str, file_name: Optional[str] = None):
+        """출력할 최소 로그 레벨을 설정합니다.
+        
+        Args:
+            level (str): 로그 레벨 이름 (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+                file_name을 지정한 경우 None이면 모듈별 설정을 제거하고 전체 레벨을 따름
+            file_name (str, optional): 모듈(파일 이름)별로 설정할 경우 파일 이름. None이면 전체 레벨 설정
+        """
+        if file_name is None:
+            self._level = self._to_level_number(level)
+        elif level is None:
+            self._module_levels.pop(file_name, None)
+        else:
+            self._module_levels[file_name] = self._to_level_number(level)
+            
+    def get_level(self, file_name: str = "") -> str:
+        """모듈에 적용되는 출력 레벨 이름을 반환합니다.
+        
+        Args:
+            file_name (str, optional): 파일 이름. 모듈별 설정이 없으면 전체 레벨 반환
+            
+        Returns:
+            str: 로그 레벨 이름
+        """
+        return logging.getLevelName(self._module_levels.get(file_name, self._level))
+        
+    def is_enabled(self, level: str, file_name: str = "") -> bool:
+        """해당 레벨의 로그가 출력되는지 확인합니다.
+        
+        메시지를 만드는 비용이 큰 경우 log() 호출 전에 먼저 확인하는 용도로 사용합니다.
+        
+        Args:
+            level (str): 로그 레벨 이름
+            file_name (str, optional): 파일 이름
+            
+        Returns:
+            bool: 출력 여부
+        """
+        return LOG_LEVELS.get(level, logging.INFO) >= self._module_levels.get(file_name, self._level)
+        
+    @staticmethod
+    def _to_level_number(level: str) -> int:
+        """로그 레벨 이름을 숫자로 변환합니다."""
+        try:
+            return LOG_LEVELS[level.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"지원하지 않는 로그 레벨입니다: {level}")
         
     def add_handler(self, handler: Callable[[str], None]):
-        """로그 핸들러를 추가합니다.
+        """형식과 스타일이 적용된 로그 문자열을 받을 핸들러를 추가합니다.
+        
+        핸들러는 로그 버스의 전달 스레드에서 호출됩니다. 문자열은 전달 묶음마다 한 번만 만들어
+        모든 핸들러가 함께 사용합니다. UI에 표시하는 경우에는 핸들러 대신 log_buffer에서 순번으로 가져가세요.
         
         Args:
             handler: 로그 메시지를 처리할 콜백 함수
         """
-        if handler not in self._handlers:
+        with self._bus_lock:
+            if handler in self._handlers:
+                return
             self._handlers.append(handler)
+            if len(self._handlers) == 1:
+                self.subscribe(self._deliver_to_handlers)
             
     def remove_handler(self, handler: Callable[[str], None]):
         """로그 핸들러를 제거합니다.
@@ -51,9 +134,148 @@ class BaseLogManager(QObject):
         Args:
             handler: 제거할 핸들러
         """
-        if handler in self._handlers:
+        with self._bus_lock:
+            if handler not in self._handlers:
+                return
             self._handlers.remove(handler)
+            if not self._handlers:
+                self.unsubscribe(self._deliver_to_handlers)
+            
+    def subscribe(self, sink: Callable[[List[LogRecord]], None], topics: Optional[Iterable[str]] = None,
+                  min_level: Optional[str] = None):
+        """로그 버스에 구독자(sink)를 등록합니다.
+        
+        구독자는 전달 스레드에서 DELIVERY_INTERVAL마다 새 레코드 리스트를 받습니다.
+        레코드는 링 버퍼의 객체 그대로이므로 수정하지 말아야 하며,
+        구독자가 오래 걸리면 다른 구독자의 전달도 늦어지므로 파일 쓰기 정도의 작업만 해야 합니다.
+        등록 이후에 기록된 레코드만 전달됩니다.
+        
+        Args:
+            sink: LogRecord 리스트를 처리할 콜백 함수
+            topics: 받을 토픽(모듈, 파일 이름) 목록. None이면 전체
+            min_level: 받을 최소 로그 레벨 이름. None이면 전체
+        """
+        with self._bus_lock:
+            if any(subscription['sink'] == sink for subscription in self._subscriptions):
+                return
+            self._subscriptions.append({
+                'sink': sink,
+                'topics': frozenset(topics) if topics is not None else None,
+                'min_level_no': self._to_level_number(min_level) if min_level is not None else None,
+                'start_seq': self.log_buffer.last_seq + 1
+            })
+            if self._bus_thread is None:
+                self._delivered_seq = self.log_buffer.last_seq
+                self._bus_thread = threading.Thread(target=self._run_bus, name="LogBus", daemon=True)
+                self._bus_thread.start()
             
+    def unsubscribe(self, sink: Callable[[List[LogRecord]], None]):
+        """구독자를 제거합니다. 진행 중인 전달이 있으면 끝날 때까지 기다립니다.
+        
+        Args:
+            sink: 제거할 구독자
+        """
+        with self._bus_lock:
+            self._subscriptions = [
+                subscription for subscription in self._subscriptions if subscription['sink'] != sink
+            ]
+            
+    def flush(self, timeout: float = 2.0) -> bool:
+        """지금까지 기록된 로그가 구독자에게 전달될 때까지 기다립니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            bool: 시간 안에 전달이 끝나면 True
+        """
+        target_seq = self.log_buffer.last_seq
+        deadline = time.time() + timeout
+        while self._bus_thread is not None and self._delivered_seq < target_seq:
+            if time.time() >= deadline:
+                return False
+            self._bus_wake.set()
+            time.sleep(0.005)
+        return True
+        
+    def get_metrics(self) -> dict:
+        """로그 버스 지표를 반환합니다.
+        
+        Returns:
+            dict: {'buffered', 'last_seq', 'subscribers', 'delivered', 'dropped', 'failed', 'pending'}
+                dropped는 전달 전에 링 버퍼에서 덮어쓰인 레코드 수
+        """
+        last_seq = self.log_buffer.last_seq
+        metrics = dict(self._bus_metrics)
+        metrics['buffered'] = len(self.log_buffer)
+        metrics['last_seq'] = last_seq
+        metrics['subscribers'] = len(self._subscriptions)
+        metrics['pending'] = last_seq - self._delivered_seq if self._bus_thread is not None else 0
+        return metrics
+        
+    def _run_bus(self):
+        """전달 스레드 루프: 링 버퍼에서 전달하지 않은 레코드를 가져와 구독자에게 나눠 줍니다."""
+        while True:
+            self._bus_wake.wait(self.DELIVERY_INTERVAL)
+            self._bus_wake.clear()
+            with self._bus_lock:
+                self._deliver()
+                
+    def _deliver(self):
+        """새 레코드를 구독자별 토픽과 레벨로 골라 전달합니다. (_bus_lock 안에서 호출)"""
+        first_seq = self.log_buffer.first_seq
+        if first_seq > self._delivered_seq + 1:
+            # 전달하기 전에 덮어쓰인 레코드
+            self._bus_metrics['dropped'] += first_seq - (self._delivered_seq + 1)
+        records = self.log_buffer.range(start_seq=self._delivered_seq + 1)
+        if not records:
+            return
+        
+        for subscription in self._subscriptions:
+            topics = subscription['topics']
+            min_level_no = subscription['min_level_no']
+            start_seq = subscription['start_seq']
+            if topics is None and min_level_no is None and records[0].seq >= start_seq:
+                routed = records  # 전체 구독은 같은 리스트를 그대로 전달
+            else:
+                routed = [
+                    record for record in records
+                    if record.seq >= start_seq
+                    and (topics is None or record.file_name in topics)
+                    and (min_level_no is None or record.level_no >= min_level_no)
+                ]
+                if not routed:
+                    continue
+            try:
+                subscription['sink'](routed)
+                self._bus_metrics['delivered'] += len(routed)
+            except Exception as e:
+                self._bus_metrics['failed'] += len(routed)
+                # 실패 로그가 다시 전달되며 반복되지 않도록 터미널에만 출력
+                self.log(
+                    message=f"로그 구독자 실행 중 오류 발생: {e}",
+                    level="ERROR",
+                    file_name="base_log_manager",
+                    method_name="_deliver",
+                    print_only_terminal=True
+                )
+        self._delivered_seq = records[-1].seq
+                
+    def _deliver_to_handlers(self, records: List[LogRecord]):
+        """문자열 핸들러 구독자: 레코드마다 문자열을 한 번 만들어 모든 핸들러에 전달합니다."""
+        for record in records:
+            styled_message = self.format_record(record)
+            for handler in list(self._handlers):
+                handler(styled_message)
+            
+    def set_logic_context(self, logic_id: Optional[str]):
+        """이후 기록되는 로그에 함께 남길 실행 중인 로직 ID를 설정합니다.
+        
+        Args:
+            logic_id: 로직 ID (실행이 끝나면 None)
+        """
+        self._logic_id = logic_id
+        
     def start_timer(self, file_name: str):
         """특정 모달의 타이머 시작
         
@@ -93,88 +315,148 @@ class BaseLogManager(QObject):
             return time.time() - self._timers[file_name]
         return None
         
-    def _apply_message_style(self, message: str) -> str:
-        """메시지 내용에 따라 스타일을 적용합니다.
+    def set_style_audit(self, enabled: bool):
+        """스타일 검사 모드를 설정합니다.
+        
+        검사 모드에서는 분류(category) 없이 기록되는 로그를 예전 문자열 규칙으로 다시 검사하여,
+        아직 분류를 지정하지 않아 스타일이 빠진 호출 위치를 모읍니다.
+        
+        Args:
+            enabled (bool): 검사 모드 사용 여부 (켤 때 이전 결과는 초기화)
+        """
+        if enabled:
+            self._style_audit = {}
+        self._style_audit_enabled = enabled
+        
+    def get_style_audit(self) -> List[dict]:
+        """스타일 검사 결과를 횟수가 많은 순으로 반환합니다.
+        
+        Returns:
+            List[dict]: {'file_name', 'method_name', 'level', 'category', 'count', 'sample'} 리스트
+        """
+        return sorted(self._style_audit.values(), key=lambda entry: entry['count'], reverse=True)
+        
+    def _apply_message_style(self, message: str, record: LogRecord) -> str:
+        """로그 분류에 따라 스타일을 적용합니다.
         
         Args:
-            message (str): 원본 메시지
+            message (str): 형식이 적용된 로그 메시지
+            record (LogRecord): 로그 레코드
             
         Returns:
             str: 스타일이 적용된 메시지
         """
-        # 메시지 스타일 적용
-        if "[ERROR]" in message or "오류" in message:
-            # 오류 메시지 - 주황색
-            return f"<span style='color: #FFA500; font-size: 14px;'>{message}</span>"
-        elif "강제 중지" in message:
-            # 강제 중지 - 빨간색, 굵게
-            return f"<span style='color: #FF0000; font-size: 16px; font-weight: bold;'>{message}</span>"
-        elif "중첩로직" in message:
-            # 중첩로직 - 초록색, 굵게
-            return f"<span style='color: #008000; font-size: 18px; font-weight: bold;'>{message}</span>"
-        elif any(key in message for key in ["키 입력: 숫자패드 9", "키 입력: 숫자패드 8", "키 입력: 숫자패드 1"]):
-            # 특정 키 입력 - 보라색, 굵게
-            return f"<span style='color: #FF00FF; font-size: 12px; font-weight: bold;'>{message}</span>"
-        elif "로직 실행" in message and ("실행 시작" in message or "반복 완료" in message):
-            # 로직 실행 관련 - 파란색, 굵게
-            return f"<span style='color: #0000FF; font-size: 20px; font-weight: bold;'>{message}</span>"
-        elif "마우스 왼쪽 버튼 클릭" in message:
-            # 마우스 클릭 - 노란색, 굵게
-            return f"<span style='color: #E2C000; font-size: 20px; font-weight: bold;'>{message}</span>"
-        
-        # 기본 메시지는 스타일 없이 반환
-        return message
-        
-    def log(self, message: str, level: str = "INFO", file_name: str = "", method_name: str = "", include_time: bool = False, print_to_terminal: bool = False, print_only_terminal: bool = False):
+        return apply_category_style(message, display_category(record.category, record.level_no))
+        
+    def _audit_style(self, record: LogRecord):
+        """분류 없이 기록되어 예전 규칙과 스타일이 달라지는 로그를 모읍니다."""
+        legacy_category = legacy_log_category(self.format_line(record))
+        if legacy_category is None or legacy_category == display_category(None, record.level_no):
+            return
+        key = (record.file_name, record.method_name, record.level, legacy_category)
+        entry = self._style_audit.get(key)
+        if entry is None:
+            entry = self._style_audit[key] = {
+                'file_name': record.file_name,
+                'method_name': record.method_name,
+                'level': record.level,
+                'category': legacy_category.name,
+                'count': 0,
+                'sample': record.message
+            }
+        entry['count'] += 1
+        
+    def log(self, message: Union[str, Callable[[], str]], level: str = "INFO", file_name: str = "", method_name: str = "", include_time: bool = False, print_to_terminal: bool = False, print_only_terminal: bool = False, args: Optional[tuple] = None, category: Optional[LogCategory] = None):
         """로그 메시지를 기록합니다.
+        
+        출력 레벨보다 낮은 로그는 메시지를 만들기 전에 바로 반환합니다.
+        메시지 생성 비용이 큰 경우 callable이나 %-스타일 args를 넘기면
+        실제로 출력될 때만 메시지를 만듭니다.
 
         Args:
-            message (str): 로그 메시지
+            message (str | callable): 로그 메시지, 또는 메시지를 반환하는 함수
             level (str, optional): 로그 레벨. Defaults to "INFO".
             file_name (str, optional): 파일 이름. Defaults to "".
             method_name (str, optional): 메서드 이름. Defaults to "".
             include_time (bool, optional): 경과 시간 포함 여부. Defaults to False.
             print_to_terminal (bool, optional): 터미널 출력 여부. Defaults to False.
             print_only_terminal (bool, optional): 터미널에만 출력할지 여부. True일 경우 로그 영역에는 출력하지 않음. Defaults to False.
+            args (tuple, optional): message에 %-스타일로 적용할 인자. Defaults to None.
+            category (LogCategory, optional): 로그 영역 표시 분류. 없으면 ERROR 이상은 오류 스타일, 나머지는 기본. Defaults to None.
         """
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        level_no = LOG_LEVELS.get(level, logging.INFO)
+        if level_no < self._module_levels.get(file_name, self._level):
+            return
         
-        # 기본 로그 형식 구성
-        log_parts = [f"[{now}]"]
+        # 함수는 기록 시점의 상태로 만들어야 하므로 바로 호출하고, args는 표시할 때 적용
+        if callable(message):
+            message = message()
         
-        # 경과 시간이 필요한 경우 추가
+        # 경과 시간이 필요한 경우 기록 시점에 계산
+        elapsed = None
         if include_time and file_name in self._timers:
             elapsed = time.time() - self._timers[file_name]
-            log_parts.append(f"[{elapsed:.4f}초]")
         
-        # 레벨, 파일 이름, 메서드 이름 추가
-        log_parts.extend([f"[{level}]", f"[{file_name}]"])
-        if method_name:
-            log_parts.append(f"[{method_name}]")
+        # 문자열 조립과 스타일 적용은 실제로 필요한 곳(터미널, 핸들러, 로그 영역)에서 수행
+        if print_only_terminal:
+            # 터미널 전용 출력은 버퍼에 저장하지 않음
+            record = LogRecord(
+                0, time.time(), elapsed, level, level_no, file_name, method_name, message, args, category, self._logic_id
+            )
+            print(self.format_record(record))
+            return
         
-        # 최종 로그 메시지 구성 (메시지 끝에 개행 추가)
-        final_message = " ".join(log_parts + [message]) + "\n"
+        # 버퍼에 추가
+        # 구독자와 로그 영역은 링 버퍼에서 순번으로 가져가므로 여기서는 추가만 함
+        record = self.log_buffer.append(
+            time.time(), elapsed, level, level_no, file_name, method_name, message, args, category, self._logic_id
+        )
+        if self._subscriptions and record.seq - self._delivered_seq > self.buffer_size // 2:
+            # 전달 간격 전에 링 버퍼가 절반 이상 차면 덮어쓰기 전에 바로 전달
+            self._bus_wake.set()
+        if self._style_audit_enabled and category is None:
+            self._audit_style(record)
         
-        # 스타일 적용
-        styled_message = self._apply_message_style(final_message)
+        # 터미널 출력이 요청된 경우
+        if print_to_terminal:
+            print(self.format_record(record))
         
-        # 터미널 출력이 요청된 경우 또는 터미널 전용 출력인 경우
-        if print_to_terminal or print_only_terminal:
-            print(styled_message)
+    def format_record(self, record: LogRecord) -> str:
+        """로그 레코드를 스타일이 적용된 로그 문자열로 만듭니다.
+        
+        Args:
+            record (LogRecord): 로그 레코드
             
-        # 터미널 전용 출력이 아닌 경우에만 로그 영역에 출력
-        if not print_only_terminal:
-            # 핸들러들에게 로그 전달
-            for handler in self._handlers:
-                handler(styled_message)
+        Returns:
+            str: 스타일이 적용된 로그 메시지
+        """
+        # 최종 로그 메시지 구성 (메시지 끝에 개행 추가) 후 스타일 적용
+        return self._apply_message_style(self.format_line(record) + "\n", record)
+        
+    def format_line(self, record: LogRecord) -> str:
+        """로그 레코드를 스타일 없는 로그 문자열로 만듭니다.
+        
+        Args:
+            record (LogRecord): 로그 레코드
             
-            # 버퍼에 추가
-            self.log_buffer.append(styled_message)
-            if len(self.log_buffer) > self.buffer_size:
-                self.log_buffer.pop(0)  # 가장 오래된 로그 제거
-                
-            # 시그널 발생
-            self.log_message.emit(styled_message)
+        Returns:
+            str: [날짜 시간] [경과시간] [레벨] [파일 이름] [메서드이름] 메시지
+        """
+        now = datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        
+        # 기본 로그 형식 구성
+        log_parts = [f"[{now}]"]
+        
+        # 경과 시간이 있는 경우 추가
+        if record.elapsed is not None:
+            log_parts.append(f"[{record.elapsed:.4f}초]")
+        
+        # 레벨, 파일 이름, 메서드 이름 추가
+        log_parts.extend([f"[{record.level}]", f"[{record.file_name}]"])
+        if record.method_name:
+            log_parts.append(f"[{record.method_name}]")
+        
+        return " ".join(log_parts + [record.message])
         
     def clear_buffer(self):
         """로그 버퍼를 비웁니다."""
@@ -189,6 +471,106 @@ class BaseLogManager(QObject):
         Returns:
             List[str]: 로그 메시지 리스트
         """
-        if count is None:
-            return self.log_buffer[:]
-        return self.log_buffer[-count:] 
\ No newline at end of file
+        return [self.format_record(record) for record in self.log_buffer.latest(count)]
+        
+    def query_logs(self, min_level: Optional[str] = None, file_name: Optional[str] = None,
+                   since: Optional[float] = None, contains: Optional[str] = None,
+                   limit: Optional[int] = None) -> List[LogRecord]:
+        """조건에 맞는 로그 레코드를 반환합니다. (문자열 변환 없이 구조화된 레코드 그대로)
+        
+        Args:
+            min_level: 최소 로그 레벨 이름
+            file_name: 파일 이름 (모듈)
+            since: 이 시각(time.time()) 이후의 로그만
+            contains: 메시지에 포함된 문자열
+            limit: 최근 것부터 최대 개수
+            
+        Returns:
+            List[LogRecord]: 오래된 순의 로그 레코드 리스트
+        """
+        return self.log_buffer.query(min_level, file_name, since, contains, limit)
+
+def benchmark_filtered_log(repeats=20000):
+    """출력 레벨보다 낮은 DEBUG 로그 한 번의 비용을 측정합니다.
+
+    스텝 정보를 f-string으로 미리 만드는 방식과 %-스타일 args로 넘기는 방식을 비교합니다.
+
+    Returns:
+        dict: {'eager_us', 'lazy_us', 'guarded_us'}
+    """
+    manager = BaseLogManager.instance()
+    manager.set_level("INFO", "benchmark")
+    step = {'type': 'key_input', 'key_code': 'A', 'action': '누르기', 'virtual_key': 65,
+            'hw_key_scan_code': 30, 'logic_detail_item_dp_text': 'A 누르기', 'order': 3}
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        manager.log(message=f"스텝 정보: {step}", level="DEBUG", file_name="benchmark")
+    eager_us = (time.perf_counter() - started) * 1e6 / repeats
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        manager.log(message="스텝 정보: %s", args=(step,), level="DEBUG", file_name="benchmark")
+    lazy_us = (time.perf_counter() - started) * 1e6 / repeats
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        if manager.is_enabled("DEBUG", "benchmark"):
+            manager.log(message=f"스텝 정보: {step}", level="DEBUG", file_name="benchmark")
+    guarded_us = (time.perf_counter() - started) * 1e6 / repeats
+
+    manager.set_level(None, "benchmark")
+    return {'eager_us': eager_us, 'lazy_us': lazy_us, 'guarded_us': guarded_us}
+
+
+def benchmark_log_bus(records=50000):
+    """구독자가 있을 때 log()를 호출한 스레드의 로그 한 번 비용을 측정합니다.
+
+    예전 방식(로그마다 레코드 핸들러가 큐에 넣고, 모달용 매니저가 문자열을 한 번 더 만들어 리스트 버퍼에 저장)과
+    로그 버스(링 버퍼에 추가만 하고 전달 스레드가 묶음으로 전달)를 비교합니다.
+
+    Returns:
+        dict: {'legacy_us', 'bus_us', 'delivered'}
+    """
+    import queue
+    manager = BaseLogManager.instance()
+    received = [0]
+
+    # 예전 방식: 동기 레코드 핸들러(큐) + 중복 매니저의 문자열 버퍼
+    record_queue = queue.Queue()
+    modal_buffer = []
+    started = time.perf_counter()
+    for index in range(records):
+        manager.log(message="스텝 실행 완료: %s (%d)", args=("키 입력 A 누르기", index), level="INFO", file_name="benchmark")
+        record_queue.put_nowait(manager.log_buffer.get(manager.log_buffer.last_seq))
+        modal_buffer.append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] [benchmark] 스텝 실행 완료")
+        if len(modal_buffer) > 1000:
+            modal_buffer.pop(0)
+    legacy_us = (time.perf_counter() - started) * 1e6 / records
+
+    def count_records(batch):
+        received[0] += len(batch)
+
+    manager.subscribe(count_records)
+    manager.subscribe(lambda batch: None, topics=("logic_executor",), min_level="WARNING")
+    started = time.perf_counter()
+    for index in range(records):
+        manager.log(message="스텝 실행 완료: %s (%d)", args=("키 입력 A 누르기", index), level="INFO", file_name="benchmark")
+    bus_us = (time.perf_counter() - started) * 1e6 / records
+    manager.flush()
+    manager.unsubscribe(count_records)
+
+    return {'legacy_us': legacy_us, 'bus_us': bus_us, 'delivered': received[0]}
+
+
+if __name__ == '__main__':
+    result = benchmark_filtered_log()
+    print(
+        f"꺼진 DEBUG 로그 1회: f-string {result['eager_us']:.2f}us"
+        f" / args {result['lazy_us']:.2f}us / is_enabled 확인 {result['guarded_us']:.2f}us"
+    )
+    result = benchmark_log_bus()
+    print(
+        f"구독자가 있을 때 로그 1회: 예전 방식 {result['legacy_us']:.2f}us / 로그 버스 {result['bus_us']:.2f}us"
+        f" (전달된 레코드 {result['delivered']}개)"
+    )
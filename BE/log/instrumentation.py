@@ -0,0 +1,350 @@
+"""실행 구간 계측 (span, 카운터, 히스토그램)
+
+이름 붙인 구간의 실행 시간을 perf_counter_ns로 재고, 구간별 히스토그램(미리 할당한 배열)에 누적합니다.
+
+    from BE.log.instrumentation import span, instrumented, count
+
+    @instrumented("window_controller.capture_client")
+    def capture_client(self): ...
+
+    with span("logic_executor.update_state"):
+        ...
+
+    count("keyboard_hook.key_down")
+
+    observe("logic_executor.step_jitter", delay_ns)  # 직접 잰 시간 기록
+
+계측은 환경 변수 BE_INSTRUMENTATION=1로 실행했을 때만 켜집니다.
+꺼져 있으면 모듈을 불러올 때 span/count는 아무 일도 하지 않는 함수로, instrumented는 원래 함수를
+그대로 돌려주는 데코레이터로 정해지므로 계측 코드가 실행 경로에 비용을 거의 남기지 않습니다.
+(데코레이터는 함수 정의 시점에 적용되므로 실행 중에 켜고 끌 수 없습니다.)
+
+히스토그램은 export_histograms()로 JSON 파일에 저장하고, 이 파일을 스크립트로 실행해 표로 봅니다.
+    python BE/log/instrumentation.py "BE/log/log files/instrumentation_20240101_120000.json"
+"""
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from functools import wraps
+
+# 계측 사용 여부 (모듈을 불러올 때 한 번만 결정)
+INSTRUMENTATION_ENABLED = os.environ.get("BE_INSTRUMENTATION", "") == "1"
+
+# 히스토그램 구간: 2의 거듭제곱 구간마다 2^SUB_BUCKET_BITS개로 나눔 (상대 오차 약 12.5% 이내)
+SUB_BUCKET_BITS = 3
+BUCKET_COUNT = 64 << SUB_BUCKET_BITS  # 2^64 ns까지 표현
+PERCENTILES = (50, 90, 99)
+
+
+def bucket_index(duration_ns):
+    """실행 시간(ns)이 들어갈 히스토그램 구간 번호를 반환합니다."""
+    shift = duration_ns.bit_length() - SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return duration_ns
+    return (shift << SUB_BUCKET_BITS) + (duration_ns >> shift)
+
+
+def bucket_lower_bound(index):
+    """히스토그램 구간의 최솟값(ns)을 반환합니다."""
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    if shift <= 0:
+        return index
+    return (index - (shift << SUB_BUCKET_BITS)) << shift
+
+
+def bucket_width(index):
+    """히스토그램 구간의 폭(ns)을 반환합니다."""
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    return 1 << shift if shift > 0 else 1
+
+
+class SpanHistogram:
+    """구간 하나의 실행 시간 히스토그램
+
+    구간별 개수를 미리 할당한 배열에 누적하므로 기록 횟수와 관계없이 메모리가 일정합니다.
+    """
+
+    __slots__ = ('name', 'buckets', 'count', 'total_ns', 'min_ns', 'max_ns', '_lock')
+
+    def __init__(self, name):
+        self.name = name
+        self.buckets = array('Q', bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration_ns):
+        """실행 시간(ns)을 기록합니다."""
+        index = bucket_index(duration_ns)
+        with self._lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.total_ns += duration_ns
+            if self.min_ns is None or duration_ns < self.min_ns:
+                self.min_ns = duration_ns
+            if duration_ns > self.max_ns:
+                self.max_ns = duration_ns
+
+    def percentile(self, percent):
+        """백분위수 실행 시간(ns)을 반환합니다. (구간 가운데 값 기준 근사치)"""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                middle = bucket_lower_bound(index) + bucket_width(index) // 2
+                return min(max(middle, self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def snapshot(self):
+        """요약을 반환합니다.
+
+        Returns:
+            dict: {'name', 'count', 'total_ms', 'mean_us', 'min_us', 'p50_us', 'p90_us', 'p99_us', 'max_us',
+                   'buckets': [[구간 최솟값(ns), 개수], ...]}
+        """
+        with self._lock:
+            buckets = [[bucket_lower_bound(index), value] for index, value in enumerate(self.buckets) if value]
+            summary = {
+                'name': self.name,
+                'count': self.count,
+                'total_ms': self.total_ns / 1e6,
+                'mean_us': self.total_ns / self.count / 1e3 if self.count else 0.0,
+                'min_us': (self.min_ns or 0) / 1e3,
+                'max_us': self.max_ns / 1e3,
+            }
+            for percent in PERCENTILES:
+                summary[f'p{percent}_us'] = self.percentile(percent) / 1e3
+        summary['buckets'] = buckets
+        return summary
+
+
+class _Span:
+    """실행 시간을 재는 컨텍스트 매니저"""
+
+    __slots__ = ('histogram', 'started_ns')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.started_ns = 0
+
+    def __enter__(self):
+        self.started_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.histogram.record(time.perf_counter_ns() - self.started_ns)
+        return False
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 사용하는 아무 일도 하지 않는 컨텍스트 매니저"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_histograms = {}  # 구간 이름 -> SpanHistogram
+_counters = {}  # 카운터 이름 -> 값
+_registry_lock = threading.Lock()
+
+
+def get_histogram(name):
+    """구간 이름의 히스토그램을 반환합니다. 없으면 만듭니다."""
+    histogram = _histograms.get(name)
+    if histogram is None:
+        with _registry_lock:
+            histogram = _histograms.setdefault(name, SpanHistogram(name))
+    return histogram
+
+
+def _span(name):
+    return _Span(get_histogram(name))
+
+
+def _null_span(name):
+    return _NULL_SPAN
+
+
+def _count(name, value=1):
+    with _registry_lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def _null_count(name, value=1):
+    pass
+
+
+def _observe(name, duration_ns):
+    get_histogram(name).record(max(int(duration_ns), 0))
+
+
+def _null_observe(name, duration_ns):
+    pass
+
+
+def _instrumented(name):
+    def decorator(func):
+        histogram = get_histogram(name)
+        perf_counter_ns = time.perf_counter_ns
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started_ns = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter_ns() - started_ns)
+        return wrapper
+    return decorator
+
+
+def _null_instrumented(name):
+    def decorator(func):
+        return func
+    return decorator
+
+
+# 계측 API: 꺼져 있으면 불러올 때 아무 일도 하지 않는 구현으로 정해짐
+if INSTRUMENTATION_ENABLED:
+    span = _span  # span(name) -> 컨텍스트 매니저
+    count = _count  # count(name, value=1)
+    observe = _observe  # observe(name, duration_ns)
+    instrumented = _instrumented  # @instrumented(name)
+else:
+    span = _null_span
+    count = _null_count
+    observe = _null_observe
+    instrumented = _null_instrumented
+
+
+def get_snapshot():
+    """모든 구간 히스토그램과 카운터의 요약을 반환합니다.
+
+    Returns:
+        dict: {'enabled', 'created_at', 'spans': [구간 요약, ...], 'counters': {이름: 값}}
+    """
+    with _registry_lock:
+        histograms = list(_histograms.values())
+        counters = dict(_counters)
+    spans = [histogram.snapshot() for histogram in histograms if histogram.count]
+    spans.sort(key=lambda summary: summary['total_ms'], reverse=True)
+    return {
+        'enabled': INSTRUMENTATION_ENABLED,
+        'created_at': time.time(),
+        'spans': spans,
+        'counters': dict(sorted(counters.items()))
+    }
+
+
+def reset():
+    """기록된 히스토그램과 카운터를 모두 지웁니다."""
+    with _registry_lock:
+        for histogram in _histograms.values():
+            with histogram._lock:
+                histogram.buckets = array('Q', bytes(8 * BUCKET_COUNT))
+                histogram.count = 0
+                histogram.total_ns = 0
+                histogram.min_ns = None
+                histogram.max_ns = 0
+        _counters.clear()
+
+
+def export_histograms(path=None, directory=os.path.join("BE", "log", "log files")):
+    """히스토그램과 카운터를 JSON 파일로 저장합니다.
+
+    Args:
+        path (str, optional): 저장할 파일 경로. 없으면 directory에 시각이 들어간 이름으로 저장
+        directory (str, optional): path가 없을 때 저장할 디렉토리
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    if path is None:
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(directory, f"instrumentation_{stamp}.json")
+    with open(path, 'w', encoding='utf-8') as export_file:
+        json.dump(get_snapshot(), export_file, ensure_ascii=False, indent=2)
+    return path
+
+
+def format_snapshot(snapshot):
+    """요약을 표 형식의 문자열로 만듭니다."""
+    lines = [
+        f"{'구간':<48} {'횟수':>8} {'합계(ms)':>10} {'평균(us)':>10} {'p50(us)':>10}"
+        f" {'p90(us)':>10} {'p99(us)':>10} {'최대(us)':>10}"
+    ]
+    for summary in snapshot['spans']:
+        lines.append(
+            f"{summary['name']:<48} {summary['count']:>8} {summary['total_ms']:>10.2f} {summary['mean_us']:>10.1f}"
+            f" {summary['p50_us']:>10.1f} {summary['p90_us']:>10.1f} {summary['p99_us']:>10.1f}"
+            f" {summary['max_us']:>10.1f}"
+        )
+    if snapshot['counters']:
+        lines.append("")
+        lines.append(f"{'카운터':<48} {'값':>8}")
+        for name, value in snapshot['counters'].items():
+            lines.append(f"{name:<48} {value:>8}")
+    return "\n".join(lines)
+
+
+def benchmark_instrumentation(repeats=200000):
+    """계측을 켜고 껐을 때 구간 하나의 비용을 측정합니다.
+
+    Returns:
+        dict: {'baseline_ns', 'null_span_ns', 'span_ns', 'decorator_ns'}
+    """
+    def work():
+        return None
+
+    def plain():
+        work()
+
+    def measure(func):
+        started = time.perf_counter_ns()
+        for _ in range(repeats):
+            func()
+        return (time.perf_counter_ns() - started) / repeats
+
+    def with_null_span():
+        with _null_span("benchmark.null"):
+            work()
+
+    def with_span():
+        with _span("benchmark.span"):
+            work()
+
+    baseline_ns = measure(plain)  # 꺼진 데코레이터는 원래 함수 그대로이므로 추가 비용 없음
+    null_span_ns = measure(with_null_span)
+    span_ns = measure(with_span)
+    decorator_ns = measure(_instrumented("benchmark.decorator")(work))
+    with _registry_lock:
+        for name in ("benchmark.null", "benchmark.span", "benchmark.decorator"):
+            _histograms.pop(name, None)
+    return {'baseline_ns': baseline_ns, 'null_span_ns': null_span_ns, 'span_ns': span_ns, 'decorator_ns': decorator_ns}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as snapshot_file:
+            print(format_snapshot(json.load(snapshot_file)))
+    else:
+        result = benchmark_instrumentation()
+        print(
+            f"호출 1회: 계측 없음 {result['baseline_ns']:.0f}ns / 꺼진 span {result['null_span_ns']:.0f}ns"
+            f" / 켜진 span {result['span_ns']:.0f}ns / 켜진 데코레이터 {result['decorator_ns']:.0f}ns"
+        )
@@ -0,0 +1,127 @@
+import logging
+import time
+from enum import Enum
+
+
+class LogCategory(Enum):
+    """로그 분류
+
+    로그 영역에서의 표시 스타일을 정하는 분류입니다. log()를 호출할 때 category로 지정하며,
+    지정하지 않은 ERROR 이상 로그는 ERROR로 표시합니다.
+    """
+
+    DEFAULT = "default"
+    ERROR = "error"  # 오류 - 주황색
+    FORCE_STOP = "force_stop"  # 강제 중지 - 빨간색, 굵게
+    NESTED_LOGIC = "nested_logic"  # 중첩로직 - 초록색, 굵게
+    LOGIC_RUN = "logic_run"  # 로직 실행 시작/반복 완료 - 파란색, 굵게
+    MOUSE_CLICK = "mouse_click"  # 마우스 클릭 대기 - 노란색, 굵게
+
+
+# 분류별 표시 형식 (글자색, HTML 글자 크기(px), 굵게)
+LOG_CATEGORY_FORMATS = {
+    LogCategory.ERROR: ("#FFA500", 14, False),
+    LogCategory.FORCE_STOP: ("#FF0000", 16, True),
+    LogCategory.NESTED_LOGIC: ("#008000", 18, True),
+    LogCategory.LOGIC_RUN: ("#0000FF", 20, True),
+    LogCategory.MOUSE_CLICK: ("#E2C000", 20, True),
+}
+
+# 분류별 HTML 스타일 (표시할 때 표에서 바로 찾음)
+LOG_CATEGORY_STYLES = {
+    category: f"color: {color}; font-size: {size}px;" + (" font-weight: bold;" if bold else "")
+    for category, (color, size, bold) in LOG_CATEGORY_FORMATS.items()
+}
+
+# 예전에 메시지 문자열을 검사해 스타일을 정하던 규칙 (검사 모드에서 분류가 빠진 로그를 찾는 용도)
+LEGACY_STYLE_RULES = (
+    (LogCategory.ERROR, lambda message: "[ERROR]" in message or "오류" in message),
+    (LogCategory.FORCE_STOP, lambda message: "강제 중지" in message),
+    (LogCategory.NESTED_LOGIC, lambda message: "중첩로직" in message),
+    (LogCategory.LOGIC_RUN, lambda message: "로직 실행" in message and ("실행 시작" in message or "반복 완료" in message)),
+    (LogCategory.MOUSE_CLICK, lambda message: "마우스 왼쪽 버튼 클릭" in message),
+)
+
+
+def display_category(category, level_no):
+    """표시에 사용할 분류를 반환합니다. 분류가 없는 ERROR 이상 로그는 ERROR로 표시합니다.
+
+    Args:
+        category (LogCategory): 로그에 지정된 분류 (없으면 None)
+        level_no (int): 로그 레벨 숫자
+
+    Returns:
+        LogCategory: 표시 분류 (스타일이 없으면 None)
+    """
+    if category is None and level_no >= logging.ERROR:
+        return LogCategory.ERROR
+    return category
+
+
+def legacy_log_category(message):
+    """예전 문자열 규칙으로 분류를 추정합니다.
+
+    Args:
+        message (str): 로그 메시지
+
+    Returns:
+        LogCategory: 추정한 분류 (해당하는 규칙이 없으면 None)
+    """
+    for category, matches in LEGACY_STYLE_RULES:
+        if matches(message):
+            return category
+    return None
+
+
+def apply_category_style(message, category):
+    """분류에 해당하는 스타일을 메시지에 적용합니다.
+
+    Args:
+        message (str): 로그 메시지
+        category (LogCategory): 로그 분류 (None이면 스타일 없음)
+
+    Returns:
+        str: 스타일이 적용된 메시지
+    """
+    style = LOG_CATEGORY_STYLES.get(category)
+    if style is None:
+        return message
+    return f"<span style='{style}'>{message}</span>"
+
+
+def benchmark_log_styling(records=100000):
+    """로그 한 건의 스타일 적용 시간을 측정합니다.
+
+    예전 문자열 검사 방식과 분류 표 조회 방식을 같은 메시지 묶음으로 비교합니다.
+
+    Returns:
+        dict: {'legacy_us', 'table_us', 'speedup'}
+    """
+    samples = [
+        ("[2024-01-01 12:34:56] [INFO] [logic_executor] 키 입력 실행 완료: A 누르기\n", None),
+        ("[2024-01-01 12:34:56] [INFO] [logic_executor] 지연시간 0.1초 대기 완료\n", None),
+        ("[2024-01-01 12:34:56] [INFO] [logic_executor] [로직 실행 시작]- 로직 이름: 사냥\n", LogCategory.LOGIC_RUN),
+        ("[2024-01-01 12:34:56] [INFO] [logic_executor] 로직 강제 중지 -- 모든 키 떼기가 완료되었습니다\n",
+         LogCategory.FORCE_STOP),
+    ]
+    messages = [samples[index % len(samples)] for index in range(records)]
+
+    started = time.perf_counter()
+    for message, _ in messages:
+        apply_category_style(message, legacy_log_category(message))
+    legacy_us = (time.perf_counter() - started) * 1e6 / records
+
+    started = time.perf_counter()
+    for message, category in messages:
+        apply_category_style(message, category)
+    table_us = (time.perf_counter() - started) * 1e6 / records
+
+    return {'legacy_us': legacy_us, 'table_us': table_us, 'speedup': legacy_us / table_us if table_us else 0.0}
+
+
+if __name__ == '__main__':
+    result = benchmark_log_styling()
+    print(
+        f"스타일 적용 1건: 문자열 검사 {result['legacy_us']:.2f}us"
+        f" / 분류 표 조회 {result['table_us']:.2f}us ({result['speedup']:.1f}배)"
+    )
@@ -0,0 +1,324 @@
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from BE.log.base_log_manager import BaseLogManager
+from BE.log.log_query import (
+    ACTIVE_SUFFIX, COMPRESSED_SUFFIX, DEFAULT_LOG_DIRECTORY, INDEX_SUFFIX, SEGMENT_PREFIX, list_segments
+)
+
+
+class LogFileSink:
+    """세션 로그 파일 저장기 (싱글톤, 선택 사항)
+
+    BaseLogManager 로그 버스의 구독자로 등록되어, 버스 전달 스레드에서 받은 레코드를 JSONL 세그먼트 파일로 저장합니다.
+    별도의 큐나 스레드 없이 링 버퍼의 레코드를 그대로 받으며, log()를 호출한 스레드는 기다리지 않습니다.
+
+    세그먼트는 크기나 시간 제한을 넘으면 닫히고, 레코드 BLOCK_RECORDS개 단위의 gzip 블록으로 압축됩니다.
+    블록마다 시간 범위, 레벨, 모듈, 로직 ID를 인덱스(.idx.json)에 남기므로
+    log_query.py는 조건에 맞지 않는 세그먼트와 블록을 읽지 않고 건너뜁니다.
+    전체 사용량이 max_total_bytes를 넘으면 오래된 세그먼트부터 삭제합니다.
+    """
+
+    DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024  # 8MB
+    DEFAULT_MAX_SEGMENT_SECONDS = 60 * 60  # 1시간
+    DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024  # 200MB
+    BLOCK_RECORDS = 1000  # 인덱스/압축 블록당 레코드 수
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if LogFileSink._instance is not None:
+            raise RuntimeError("LogFileSink는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self.directory = DEFAULT_LOG_DIRECTORY
+        self.max_segment_bytes = self.DEFAULT_MAX_SEGMENT_BYTES
+        self.max_segment_seconds = self.DEFAULT_MAX_SEGMENT_SECONDS
+        self.max_total_bytes = self.DEFAULT_MAX_TOTAL_BYTES
+        self._running = False
+        self._recovered = False
+        self._lock = threading.Lock()
+
+        # 로그 버스 전달 스레드에서만 사용하는 현재 세그먼트 상태
+        self._file = None
+        self._path = None
+        self._opened_at = 0.0
+        self._size = 0
+        self._blocks = []
+        self._block = None
+
+        # 지표
+        self._metrics = {'written': 0, 'segments': 0, 'evicted': 0, 'failed': 0}
+
+    def configure(self, directory=None, max_segment_bytes=None, max_segment_seconds=None, max_total_bytes=None):
+        """저장 위치와 회전/보관 제한을 설정합니다. (start() 전에 호출)
+
+        Args:
+            directory (str, optional): 세그먼트 저장 디렉토리
+            max_segment_bytes (int, optional): 세그먼트 최대 크기 (압축 전 bytes)
+            max_segment_seconds (float, optional): 세그먼트 최대 기록 시간 (초)
+            max_total_bytes (int, optional): 닫힌 세그먼트의 최대 전체 사용량 (bytes)
+        """
+        if directory is not None:
+            self.directory = str(directory)
+        if max_segment_bytes is not None:
+            self.max_segment_bytes = int(max_segment_bytes)
+        if max_segment_seconds is not None:
+            self.max_segment_seconds = float(max_segment_seconds)
+        if max_total_bytes is not None:
+            self.max_total_bytes = int(max_total_bytes)
+
+    def is_running(self):
+        """저장 중인지 여부"""
+        return self._running
+
+    def start(self):
+        """로그 파일 저장을 시작합니다."""
+        with self._lock:
+            if self._running:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            self._running = True
+        self.base_log_manager.subscribe(self._on_records)
+
+    def stop(self, timeout=5.0):
+        """남은 레코드를 저장하고 현재 세그먼트를 닫은 뒤 저장을 멈춥니다.
+
+        Args:
+            timeout (float): 남은 레코드 전달을 기다릴 최대 시간 (초)
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self.base_log_manager.flush(timeout)
+        # unsubscribe()는 진행 중인 전달이 끝나길 기다리므로 이후에는 이 스레드에서 파일을 닫아도 안전
+        self.base_log_manager.unsubscribe(self._on_records)
+        try:
+            if self._file is not None:
+                self._rotate()
+        except Exception as e:
+            self.base_log_manager.log(
+                message=f"로그 파일 닫기 실패: {e}",
+                level="ERROR",
+                file_name="log_file_sink",
+                method_name="stop",
+                print_only_terminal=True
+            )
+
+    def get_metrics(self):
+        """저장 지표를 반환합니다.
+
+        Returns:
+            dict: {'running', 'written', 'segments', 'evicted', 'failed'}
+                전달 전에 덮어쓰인 레코드 수는 BaseLogManager.get_metrics()의 dropped
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics['running'] = self._running
+        return metrics
+
+    def _on_records(self, records):
+        """로그 버스 구독자 (버스 전달 스레드에서 실행)"""
+        try:
+            if not self._recovered:
+                self._recovered = True
+                self._recover_segments()
+            if self._file is not None and time.time() - self._opened_at >= self.max_segment_seconds:
+                self._rotate()
+            self._write(records)
+        except Exception as e:
+            with self._lock:
+                self._metrics['failed'] += len(records)
+            # 저장 실패 로그가 다시 저장되며 반복되지 않도록 터미널에만 출력
+            self.base_log_manager.log(
+                message=f"로그 파일 저장 실패: {e}",
+                level="ERROR",
+                file_name="log_file_sink",
+                method_name="_on_records",
+                print_only_terminal=True
+            )
+
+    def _write(self, records):
+        """레코드를 현재 세그먼트에 쓰고, 크기 제한을 넘으면 세그먼트를 닫습니다."""
+        for record in records:
+            if self._file is None:
+                self._open_segment()
+
+            entry = {
+                'seq': record.seq,
+                't': round(record.timestamp, 6),
+                'lv': record.level,
+                'mod': record.file_name,
+                'fn': record.method_name,
+                'msg': record.message
+            }
+            if record.elapsed is not None:
+                entry['el'] = round(record.elapsed, 4)
+            if record.category is not None:
+                entry['cat'] = record.category.value
+            if record.logic_id is not None:
+                entry['logic'] = record.logic_id
+            line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+            if self._block is None:
+                self._block = self._new_block(self._size)
+            self._add_to_block(self._block, entry, len(line))
+            self._file.write(line)
+            self._size += len(line)
+
+            if self._block['count'] >= self.BLOCK_RECORDS:
+                self._blocks.append(self._block)
+                self._block = None
+            if self._size >= self.max_segment_bytes:
+                self._rotate()
+
+        if self._file is not None:
+            self._file.flush()
+        with self._lock:
+            self._metrics['written'] += len(records)
+
+    def _open_segment(self):
+        """새 세그먼트 파일을 엽니다. 파일 이름에 시작 시각이 들어가므로 이름순이 시간순입니다."""
+        now = time.time()
+        stamp = datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S_%f")
+        self._path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{stamp}{ACTIVE_SUFFIX}")
+        self._file = open(self._path, 'ab')
+        self._opened_at = now
+        self._size = 0
+        self._blocks = []
+        self._block = None
+
+    def _rotate(self):
+        """현재 세그먼트를 닫고 압축한 뒤 보관 제한을 적용합니다."""
+        self._file.close()
+        if self._block is not None:
+            self._blocks.append(self._block)
+        path, blocks = self._path, self._blocks
+        self._file, self._path, self._blocks, self._block = None, None, [], None
+
+        self._compress_segment(path, blocks)
+        with self._lock:
+            self._metrics['segments'] += 1
+        self._enforce_budget()
+
+    def _compress_segment(self, path, blocks):
+        """세그먼트를 블록별 gzip으로 압축하고 인덱스를 저장한 뒤 원본을 삭제합니다.
+
+        블록마다 독립된 gzip 멤버로 저장하므로, 이어 붙인 파일 전체도 gzip으로 읽을 수 있고
+        인덱스의 위치로 블록 하나만 읽을 수도 있습니다.
+        """
+        base = path[:-len(ACTIVE_SUFFIX)]
+        with open(path, 'rb') as raw_file:
+            raw = raw_file.read()
+        if not raw:
+            os.remove(path)
+            return
+
+        offset = 0
+        compressed_blocks = []
+        with open(base + COMPRESSED_SUFFIX, 'wb') as compressed_file:
+            for block in blocks:
+                data = gzip.compress(raw[block['offset']:block['offset'] + block['length']])
+                compressed_file.write(data)
+                compressed_blocks.append(dict(block, offset=offset, length=len(data)))
+                offset += len(data)
+
+        index = self._summarize(compressed_blocks)
+        index['blocks'] = [
+            dict(block, levels=sorted(block['levels']), modules=sorted(block['modules']),
+                 logic_ids=sorted(block['logic_ids']))
+            for block in compressed_blocks
+        ]
+        with open(base + INDEX_SUFFIX, 'w', encoding='utf-8') as index_file:
+            json.dump(index, index_file, ensure_ascii=False, separators=(',', ':'))
+        os.remove(path)
+
+    def _recover_segments(self):
+        """이전 실행에서 닫히지 못한 세그먼트를 다시 읽어 인덱스를 만들고 압축합니다."""
+        for path in list_segments(self.directory):
+            if not path.endswith(ACTIVE_SUFFIX):
+                continue
+            blocks = []
+            block = None
+            offset = 0
+            with open(path, 'rb') as raw_file:
+                for line in raw_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # 기록 중 잘린 줄 이후는 버림
+                    if block is None:
+                        block = self._new_block(offset)
+                    self._add_to_block(block, entry, len(line))
+                    offset += len(line)
+                    if block['count'] >= self.BLOCK_RECORDS:
+                        blocks.append(block)
+                        block = None
+            if block is not None:
+                blocks.append(block)
+            self._compress_segment(path, blocks)
+
+    def _enforce_budget(self):
+        """닫힌 세그먼트의 전체 사용량이 제한을 넘으면 오래된 것부터 삭제합니다."""
+        segments = [path for path in list_segments(self.directory) if path.endswith(COMPRESSED_SUFFIX)]
+        sizes = {}
+        for path in segments:
+            index_path = path[:-len(COMPRESSED_SUFFIX)] + INDEX_SUFFIX
+            sizes[path] = os.path.getsize(path) + (os.path.getsize(index_path) if os.path.exists(index_path) else 0)
+        used = sum(sizes.values())
+        for path in segments:
+            if used <= self.max_total_bytes:
+                break
+            try:
+                os.remove(path)
+                index_path = path[:-len(COMPRESSED_SUFFIX)] + INDEX_SUFFIX
+                if os.path.exists(index_path):
+                    os.remove(index_path)
+                used -= sizes[path]
+                with self._lock:
+                    self._metrics['evicted'] += 1
+            except OSError:
+                continue
+
+    @staticmethod
+    def _new_block(offset):
+        """새 인덱스 블록"""
+        return {'offset': offset, 'length': 0, 'count': 0, 'start': None, 'end': None,
+                'levels': set(), 'modules': set(), 'logic_ids': set()}
+
+    @staticmethod
+    def _add_to_block(block, entry, line_length):
+        """블록 요약에 레코드를 반영합니다."""
+        block['length'] += line_length
+        block['count'] += 1
+        if block['start'] is None:
+            block['start'] = entry['t']
+        block['end'] = entry['t']
+        block['levels'].add(entry['lv'])
+        block['modules'].add(entry['mod'])
+        if entry.get('logic') is not None:
+            block['logic_ids'].add(entry['logic'])
+
+    @staticmethod
+    def _summarize(blocks):
+        """블록 요약을 합쳐 세그먼트 요약을 만듭니다."""
+        return {
+            'start': min(block['start'] for block in blocks),
+            'end': max(block['end'] for block in blocks),
+            'count': sum(block['count'] for block in blocks),
+            'levels': sorted(set().union(*(block['levels'] for block in blocks))),
+            'modules': sorted(set().union(*(block['modules'] for block in blocks))),
+            'logic_ids': sorted(set().union(*(block['logic_ids'] for block in blocks)))
+        }
@@ -0,0 +1,136 @@
+import logging
+from collections import deque
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QFont
+from BE.log.log_category import LOG_CATEGORY_FORMATS, display_category
+
+
+class LogListModel(QAbstractListModel):
+    """로그 링 버퍼를 보여주는 목록 모델
+
+    BaseLogManager의 링 버퍼에서 순번으로 새 레코드만 가져와 필터에 맞는 것만 행으로 추가합니다.
+    행은 레코드 참조만 보관하고, 문자열은 화면에 보이는 행을 그릴 때만 만듭니다.
+    링 버퍼에서 덮어쓰인 레코드는 행에서도 제거하므로 세션 길이와 관계없이 행 수가 버퍼 크기를 넘지 않습니다.
+    """
+
+    RecordRole = Qt.UserRole + 1  # 행의 LogRecord
+
+    def __init__(self, log_manager, parent=None):
+        """초기화
+
+        Args:
+            log_manager (BaseLogManager): 로그 매니저 (log_buffer와 format_line 사용)
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.log_manager = log_manager
+        self.log_buffer = log_manager.log_buffer
+        self._rows = deque()
+        self._last_seq = 0  # 이미 가져온 마지막 순번 (처음에는 버퍼에 남아 있는 로그부터 표시)
+        self._cleared_seq = 0  # 초기화한 시점의 순번 (이전 레코드는 다시 표시하지 않음)
+        self._min_level_no = None
+        self._module = None
+        self._search_text = None
+        self.modules = set()  # 지금까지 본 모듈(파일 이름) 목록
+
+        # 분류별 글자색/굵게 (그릴 때 표에서 바로 찾음)
+        self._colors = {category: QColor(color) for category, (color, _, _) in LOG_CATEGORY_FORMATS.items()}
+        self._bold_categories = {category for category, (_, _, bold) in LOG_CATEGORY_FORMATS.items() if bold}
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        record = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            # 줄 높이를 일정하게 유지하도록 여러 줄 메시지는 한 줄로 합침
+            return " ".join(self.log_manager.format_line(record).split())
+        if role == Qt.ToolTipRole:
+            return self.log_manager.format_line(record)
+        if role == Qt.ForegroundRole:
+            return self._colors.get(display_category(record.category, record.level_no))
+        if role == Qt.FontRole:
+            bold = display_category(record.category, record.level_no) in self._bold_categories
+            return self._bold_font if bold else None
+        if role == self.RecordRole:
+            return record
+        return None
+
+    def record_at(self, row):
+        """행의 LogRecord를 반환합니다."""
+        return self._rows[row]
+
+    def fetch_new(self):
+        """링 버퍼에서 새 레코드를 가져와 행에 추가하고, 덮어쓰인 레코드의 행은 제거합니다.
+
+        Returns:
+            tuple: (추가된 행 수, 가져오기 전에 덮어쓰여 표시하지 못한 레코드 수)
+        """
+        first_seq = self.log_buffer.first_seq
+        skipped = max(first_seq - (self._last_seq + 1), 0)
+
+        # 링 버퍼에서 사라진 레코드의 행 제거
+        stale = 0
+        for record in self._rows:
+            if record.seq >= first_seq:
+                break
+            stale += 1
+        if stale:
+            self.beginRemoveRows(QModelIndex(), 0, stale - 1)
+            for _ in range(stale):
+                self._rows.popleft()
+            self.endRemoveRows()
+
+        records = self.log_buffer.range(start_seq=self._last_seq + 1)
+        if not records:
+            return 0, skipped
+        self._last_seq = records[-1].seq
+        for record in records:
+            self.modules.add(record.file_name)
+
+        matched = [record for record in records if self._matches(record)]
+        if matched:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(matched) - 1)
+            self._rows.extend(matched)
+            self.endInsertRows()
+        return len(matched), skipped
+
+    def set_filter(self, min_level=None, module=None, search_text=None):
+        """표시 조건을 바꾸고 링 버퍼에 남아 있는 레코드로 행을 다시 만듭니다.
+
+        Args:
+            min_level (str, optional): 최소 로그 레벨 이름
+            module (str, optional): 모듈(파일 이름)
+            search_text (str, optional): 메시지에 포함된 문자열 (대소문자 무시)
+        """
+        self._min_level_no = logging.getLevelName(min_level) if min_level else None
+        self._module = module or None
+        self._search_text = search_text.lower() if search_text else None
+
+        self.beginResetModel()
+        records = self.log_buffer.range(start_seq=self._cleared_seq + 1, end_seq=self._last_seq + 1)
+        self._rows = deque(record for record in records if self._matches(record))
+        self.endResetModel()
+
+    def clear(self):
+        """표시 중인 행을 모두 지웁니다. (링 버퍼의 레코드는 유지)"""
+        self.beginResetModel()
+        self._rows.clear()
+        self._cleared_seq = self._last_seq
+        self.endResetModel()
+
+    def _matches(self, record):
+        """레코드가 표시 조건에 맞는지 확인합니다."""
+        if self._min_level_no is not None and record.level_no < self._min_level_no:
+            return False
+        if self._module is not None and record.file_name != self._module:
+            return False
+        if self._search_text is not None and self._search_text not in record.message.lower():
+            return False
+        return True
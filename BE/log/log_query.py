@@ -0,0 +1,219 @@
+"""세션 로그 파일 조회 도구
+
+LogFileSink가 저장한 로그 세그먼트에서 시간 범위, 레벨, 모듈, 로직 ID로 로그를 찾습니다.
+닫힌 세그먼트는 옆에 저장된 인덱스(.idx.json)로 조건에 맞지 않는 세그먼트와 블록을 건너뛰고,
+필요한 블록만 압축을 풀어 읽습니다.
+
+GUI 패키지를 불러오지 않도록 표준 라이브러리만 사용하므로 스크립트로 바로 실행합니다.
+
+사용 예:
+    python BE/log/log_query.py --since "2024-01-01 12:00" --level WARNING --module logic_executor
+    python BE/log/log_query.py --logic 1234-abcd --contains 오류 --limit 50
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+from collections import deque
+from datetime import datetime
+
+# 세그먼트 파일 형식 (LogFileSink와 공유)
+SEGMENT_PREFIX = "log_"
+ACTIVE_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".idx.json"
+DEFAULT_LOG_DIRECTORY = os.path.join("BE", "log", "log files")
+
+LEVEL_NUMBERS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+def level_number(level):
+    """로그 레벨 이름을 숫자로 변환합니다. 모르는 이름은 INFO로 취급합니다."""
+    return LEVEL_NUMBERS.get(level, LEVEL_NUMBERS["INFO"])
+
+
+def summary_matches(summary, since=None, until=None, min_level=None, module=None, logic_id=None):
+    """세그먼트/블록 요약이 조건에 맞는 레코드를 포함할 수 있는지 확인합니다.
+
+    Args:
+        summary (dict): {'start', 'end', 'levels', 'modules', 'logic_ids'}
+        since (float, optional): 시작 시각 (time.time() 기준)
+        until (float, optional): 끝 시각
+        min_level (str, optional): 최소 로그 레벨
+        module (str, optional): 모듈(파일 이름)
+        logic_id (str, optional): 로직 ID
+
+    Returns:
+        bool: 포함할 수 있으면 True (False면 읽지 않아도 됨)
+    """
+    if since is not None and summary['end'] < since:
+        return False
+    if until is not None and summary['start'] > until:
+        return False
+    if min_level is not None and max(map(level_number, summary['levels']), default=0) < level_number(min_level):
+        return False
+    if module is not None and module not in summary['modules']:
+        return False
+    if logic_id is not None and logic_id not in summary['logic_ids']:
+        return False
+    return True
+
+
+def record_matches(entry, since=None, until=None, min_level=None, module=None, logic_id=None, contains=None):
+    """레코드 하나가 조건에 맞는지 확인합니다."""
+    if since is not None and entry['t'] < since:
+        return False
+    if until is not None and entry['t'] > until:
+        return False
+    if min_level is not None and level_number(entry['lv']) < level_number(min_level):
+        return False
+    if module is not None and entry['mod'] != module:
+        return False
+    if logic_id is not None and entry.get('logic') != logic_id:
+        return False
+    if contains is not None and contains not in entry['msg']:
+        return False
+    return True
+
+
+def list_segments(directory):
+    """디렉토리의 세그먼트 파일을 오래된 순으로 반환합니다. (파일 이름에 시작 시각 포함)"""
+    if not os.path.isdir(directory):
+        return []
+    names = [
+        name for name in os.listdir(directory)
+        if name.startswith(SEGMENT_PREFIX) and (name.endswith(COMPRESSED_SUFFIX) or name.endswith(ACTIVE_SUFFIX))
+    ]
+    return [os.path.join(directory, name) for name in sorted(names)]
+
+
+def iter_log_records(directory=DEFAULT_LOG_DIRECTORY, since=None, until=None, min_level=None, module=None,
+                     logic_id=None, contains=None, stats=None):
+    """조건에 맞는 로그 레코드를 오래된 순으로 반환합니다.
+
+    Args:
+        directory (str): 로그 세그먼트 디렉토리
+        since, until (float, optional): 시간 범위 (time.time() 기준)
+        min_level (str, optional): 최소 로그 레벨
+        module (str, optional): 모듈(파일 이름)
+        logic_id (str, optional): 로직 ID
+        contains (str, optional): 메시지에 포함된 문자열
+        stats (dict, optional): 읽은 세그먼트/블록 수를 기록할 딕셔너리
+
+    Yields:
+        dict: 레코드 {'seq', 't', 'lv', 'mod', 'fn', 'msg', 'cat'?, 'logic'?, 'el'?}
+    """
+    if stats is None:
+        stats = {}
+    for key in ('segments', 'segments_skipped', 'blocks', 'blocks_skipped'):
+        stats.setdefault(key, 0)
+    filters = dict(since=since, until=until, min_level=min_level, module=module, logic_id=logic_id)
+
+    for path in list_segments(directory):
+        stats['segments'] += 1
+        if path.endswith(COMPRESSED_SUFFIX):
+            index_path = path[:-len(COMPRESSED_SUFFIX)] + INDEX_SUFFIX
+            try:
+                with open(index_path, encoding='utf-8') as index_file:
+                    index = json.load(index_file)
+            except (OSError, ValueError):
+                index = None
+
+            if index is None:
+                # 인덱스가 없으면 전체를 읽음
+                with gzip.open(path, 'rb') as segment_file:
+                    yield from _iter_lines(segment_file, filters, contains)
+                continue
+
+            if not summary_matches(index, **filters):
+                stats['segments_skipped'] += 1
+                continue
+            with open(path, 'rb') as segment_file:
+                for block in index['blocks']:
+                    if not summary_matches(block, **filters):
+                        stats['blocks_skipped'] += 1
+                        continue
+                    stats['blocks'] += 1
+                    segment_file.seek(block['offset'])
+                    data = gzip.decompress(segment_file.read(block['length']))
+                    yield from _iter_lines(data.splitlines(), filters, contains)
+        else:
+            # 기록 중인 세그먼트는 인덱스가 없으므로 전체를 읽음
+            with open(path, 'rb') as segment_file:
+                yield from _iter_lines(segment_file, filters, contains)
+
+
+def _iter_lines(lines, filters, contains):
+    """JSONL 줄에서 조건에 맞는 레코드를 반환합니다. (기록 중 잘린 마지막 줄은 무시)"""
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if record_matches(entry, contains=contains, **filters):
+            yield entry
+
+
+def format_entry(entry):
+    """레코드를 로그 영역과 같은 형식의 한 줄로 만듭니다."""
+    parts = [f"[{datetime.fromtimestamp(entry['t']).strftime('%Y-%m-%d %H:%M:%S')}]"]
+    if entry.get('el') is not None:
+        parts.append(f"[{entry['el']:.4f}초]")
+    parts.extend([f"[{entry['lv']}]", f"[{entry['mod']}]"])
+    if entry.get('fn'):
+        parts.append(f"[{entry['fn']}]")
+    if entry.get('logic'):
+        parts.append(f"[logic:{entry['logic']}]")
+    parts.append(entry['msg'])
+    return " ".join(parts)
+
+
+def _parse_time(text):
+    """명령줄 시각 문자열을 time.time() 기준 초로 변환합니다."""
+    for pattern in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, pattern).timestamp()
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f"시각 형식이 올바르지 않습니다 (예: 2024-01-01 12:34:56): {text}")
+
+
+def main(argv=None):
+    """명령줄 조회 도구"""
+    parser = argparse.ArgumentParser(description="세션 로그 파일 조회")
+    parser.add_argument("--dir", default=DEFAULT_LOG_DIRECTORY, help="로그 세그먼트 디렉토리")
+    parser.add_argument("--since", type=_parse_time, help="시작 시각 (YYYY-MM-DD[ HH:MM[:SS]])")
+    parser.add_argument("--until", type=_parse_time, help="끝 시각 (YYYY-MM-DD[ HH:MM[:SS]])")
+    parser.add_argument("--level", choices=list(LEVEL_NUMBERS), help="최소 로그 레벨")
+    parser.add_argument("--module", help="모듈(파일 이름), 예: logic_executor")
+    parser.add_argument("--logic", help="로직 ID")
+    parser.add_argument("--contains", help="메시지에 포함된 문자열")
+    parser.add_argument("--limit", type=int, help="최근 것부터 최대 개수")
+    parser.add_argument("--json", action="store_true", help="JSONL 그대로 출력")
+    options = parser.parse_args(argv)
+
+    stats = {}
+    records = iter_log_records(
+        options.dir, options.since, options.until, options.level, options.module, options.logic,
+        options.contains, stats
+    )
+    if options.limit:
+        # 오래된 순으로 읽으므로 마지막 limit개만 보관
+        records = deque(records, maxlen=options.limit)
+
+    count = 0
+    for entry in records:
+        print(json.dumps(entry, ensure_ascii=False) if options.json else format_entry(entry))
+        count += 1
+
+    print(
+        f"{count}건 (세그먼트 {stats['segments']}개 중 {stats['segments_skipped']}개 건너뜀,"
+        f" 블록 {stats['blocks']}개 읽음 / {stats['blocks_skipped']}개 건너뜀)",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
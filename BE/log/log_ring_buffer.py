@@ -0,0 +1,226 @@
+import logging
+import threading
+import time
+from typing import Iterator, List
+
+
+class LogRecord:
+    """로그 한 건의 구조화된 레코드
+
+    메시지는 템플릿과 인자로 보관하고, 문자열은 message를 읽을 때 만듭니다.
+    args에 딕셔너리 같은 가변 객체를 넘기면 표시 시점의 값으로 출력되므로,
+    기록 후 바뀌는 값은 호출하는 쪽에서 복사해서 넘겨야 합니다.
+    """
+
+    __slots__ = ('seq', 'timestamp', 'elapsed', 'level', 'level_no', 'file_name', 'method_name', 'template', 'args',
+                 'category', 'logic_id')
+
+    def __init__(self, seq, timestamp, elapsed, level, level_no, file_name, method_name, template, args, category=None,
+                 logic_id=None):
+        self.seq = seq  # 기록 순번 (1부터 증가, 버퍼가 비워져도 이어짐)
+        self.timestamp = timestamp
+        self.elapsed = elapsed  # 타이머 경과 시간 (초), 없으면 None
+        self.level = level
+        self.level_no = level_no
+        self.file_name = file_name
+        self.method_name = method_name
+        self.template = template
+        self.args = args
+        self.category = category  # 표시 스타일 분류 (LogCategory), 없으면 None
+        self.logic_id = logic_id  # 기록 시점에 실행 중이던 로직 ID, 없으면 None
+
+    @property
+    def message(self):
+        """인자가 적용된 메시지"""
+        if not self.args:
+            return self.template
+        try:
+            return self.template % self.args
+        except (TypeError, ValueError):
+            # 템플릿과 인자가 맞지 않아도 로그는 잃지 않도록 그대로 이어 붙임
+            return f"{self.template} {self.args}"
+
+
+class LogRingBuffer:
+    """고정 크기 링 버퍼 로그 저장소
+
+    미리 할당한 슬롯을 순환하며 덮어쓰므로 가득 찬 상태에서도 추가와 제거가 O(1)입니다.
+    조회는 순번 범위나 조건으로 필요한 레코드만 꺼내며 전체를 복사하지 않습니다.
+    여러 스레드에서 추가할 수 있습니다.
+    """
+
+    def __init__(self, capacity=10000):
+        """초기화
+
+        Args:
+            capacity (int): 보관할 최대 레코드 수
+        """
+        if capacity <= 0:
+            raise ValueError("링 버퍼 크기는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._next_seq = 1
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def first_seq(self):
+        """보관 중인 가장 오래된 레코드의 순번 (비어 있으면 다음 순번)"""
+        return self._next_seq - self._count
+
+    @property
+    def last_seq(self):
+        """가장 최근 레코드의 순번 (기록이 없으면 0)"""
+        return self._next_seq - 1
+
+    def append(self, timestamp, elapsed, level, level_no, file_name, method_name, template, args, category=None,
+               logic_id=None):
+        """레코드를 추가합니다. 가득 차면 가장 오래된 레코드를 덮어씁니다.
+
+        Returns:
+            LogRecord: 추가된 레코드
+        """
+        with self._lock:
+            seq = self._next_seq
+            record = LogRecord(
+                seq, timestamp, elapsed, level, level_no, file_name, method_name, template, args, category, logic_id
+            )
+            self._slots[seq % self.capacity] = record
+            self._next_seq = seq + 1
+            if self._count < self.capacity:
+                self._count += 1
+        return record
+
+    def clear(self):
+        """모든 레코드를 비웁니다. 순번은 이어서 증가합니다."""
+        with self._lock:
+            self._slots = [None] * self.capacity
+            self._count = 0
+
+    def get(self, seq):
+        """순번으로 레코드를 반환합니다. 이미 덮어써졌거나 없으면 None"""
+        with self._lock:
+            if not self._next_seq - self._count <= seq < self._next_seq:
+                return None
+            return self._slots[seq % self.capacity]
+
+    def range(self, start_seq=None, end_seq=None):
+        """순번 범위의 레코드를 오래된 순으로 반환합니다.
+
+        Args:
+            start_seq (int, optional): 시작 순번 (포함). 없으면 가장 오래된 레코드부터
+            end_seq (int, optional): 끝 순번 (미포함). 없으면 가장 최근 레코드까지
+
+        Returns:
+            list: LogRecord 리스트
+        """
+        with self._lock:
+            first = self._next_seq - self._count
+            start = first if start_seq is None else max(start_seq, first)
+            end = self._next_seq if end_seq is None else min(end_seq, self._next_seq)
+            return [self._slots[seq % self.capacity] for seq in range(start, end)]
+
+    def latest(self, count=None):
+        """최근 레코드를 오래된 순으로 반환합니다.
+
+        Args:
+            count (int, optional): 가져올 개수. 없으면 보관 중인 전체
+
+        Returns:
+            list: LogRecord 리스트
+        """
+        if count is None:
+            return self.range()
+        return self.range(start_seq=self._next_seq - count)
+
+    def query(self, min_level=None, file_name=None, since=None, contains=None, limit=None) -> List[LogRecord]:
+        """조건에 맞는 레코드를 최근 것부터 찾아 오래된 순으로 반환합니다.
+
+        슬롯을 최근 것부터 하나씩 확인하고 limit개를 찾으면 멈추므로 전체를 복사하지 않습니다.
+
+        Args:
+            min_level (str, optional): 최소 로그 레벨 이름
+            file_name (str, optional): 파일 이름 (모듈)
+            since (float, optional): 이 시각(time.time()) 이후의 레코드만
+            contains (str, optional): 메시지에 포함된 문자열
+            limit (int, optional): 최대 개수
+
+        Returns:
+            list: LogRecord 리스트
+        """
+        min_level_no = logging.getLevelName(min_level) if min_level else None
+        if min_level_no is not None and not isinstance(min_level_no, int):
+            raise ValueError(f"지원하지 않는 로그 레벨입니다: {min_level}")
+        matched = []
+        for record in self._iter_newest():
+            if since is not None and record.timestamp < since:
+                break  # 오래된 방향으로 진행하므로 이후 레코드는 모두 더 오래됨
+            if min_level_no is not None and record.level_no < min_level_no:
+                continue
+            if file_name is not None and record.file_name != file_name:
+                continue
+            if contains is not None and contains not in record.message:
+                continue
+            matched.append(record)
+            if limit is not None and len(matched) >= limit:
+                break
+        matched.reverse()
+        return matched
+
+    def _iter_newest(self) -> Iterator[LogRecord]:
+        """최근 레코드부터 오래된 순서로 순회합니다."""
+        with self._lock:
+            last = self._next_seq - 1
+            first = self._next_seq - self._count
+            slots = self._slots
+        for seq in range(last, first - 1, -1):
+            record = slots[seq % self.capacity]
+            # 순회 중 덮어쓰인 슬롯(더 최근 레코드)에 도달하면 중단
+            if record is None or record.seq != seq:
+                break
+            yield record
+
+
+def benchmark_log_buffer(capacity=10000, records=200000):
+    """가득 찬 로그 버퍼에 추가하는 비용을 측정합니다.
+
+    리스트 + pop(0) 방식과 링 버퍼 방식을 비교합니다.
+
+    Returns:
+        dict: {'list_us', 'ring_us', 'query_ms'}
+    """
+    message = "스텝 실행 완료: %s"
+    args = ("키 입력 A 누르기",)
+
+    buffer = []
+    started = time.perf_counter()
+    for _ in range(records):
+        buffer.append((time.time(), None, "INFO", "benchmark", "", message, args))
+        if len(buffer) > capacity:
+            buffer.pop(0)
+    list_us = (time.perf_counter() - started) * 1e6 / records
+
+    ring = LogRingBuffer(capacity)
+    started = time.perf_counter()
+    for index in range(records):
+        level, level_no = ("WARNING", logging.WARNING) if index % 100 == 0 else ("INFO", logging.INFO)
+        ring.append(time.time(), None, level, level_no, "benchmark", "", message, args)
+    ring_us = (time.perf_counter() - started) * 1e6 / records
+
+    started = time.perf_counter()
+    ring.query(min_level="WARNING", limit=50)
+    query_ms = (time.perf_counter() - started) * 1000
+
+    return {'list_us': list_us, 'ring_us': ring_us, 'query_ms': query_ms}
+
+
+if __name__ == '__main__':
+    for capacity in (10000, 100000):
+        result = benchmark_log_buffer(capacity)
+        print(
+            f"버퍼 {capacity}개: list.pop(0) {result['list_us']:.2f}us / 링 버퍼 {result['ring_us']:.2f}us"
+            f" (WARNING 최근 50개 조회 {result['query_ms']:.2f}ms)"
+        )
@@ -1,106 +1,286 @@
-from PySide6.QtWidgets import (QFrame, QVBoxLayout, QLabel, QTextEdit, 
-                              QSizePolicy, QHBoxLayout, QPushButton)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+import time
+from PySide6.QtWidgets import (QFrame, QVBoxLayout, QLabel, QTableView, QHeaderView, QTextEdit,
+                              QSizePolicy, QHBoxLayout, QPushButton, QComboBox, QLineEdit,
+                              QAbstractItemView, QApplication)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QAction, QKeySequence
 
-from BE.function.constants.styles import (FRAME_STYLE, CONTAINER_STYLE, LOG_TEXT_STYLE,
+from BE.function.constants.styles import (FRAME_STYLE, CONTAINER_STYLE, LOG_LIST_STYLE,
                              TITLE_FONT_FAMILY, SECTION_FONT_SIZE)
 from BE.function.constants.dimensions import LOG_FRAME_WIDTH, LOG_CONTAINER_MIN_HEIGHT
-from BE.log.base_log_manager import BaseLogManager
+from BE.log.base_log_manager import BaseLogManager, LOG_LEVELS
+from BE.log.log_list_model import LogListModel
 
 class LogWidget(QFrame):
-    """로그를 표시하는 위젯"""
-    
+    """로그를 표시하는 위젯
+
+    BaseLogManager의 링 버퍼를 LogListModel/QTableView(한 열, 고정 행 높이)로 보여줍니다.
+    일정한 프레임 간격으로 새 로그만 모델에 추가하고, 화면에 보이는 줄만 그리므로
+    세션이 길어져도 추가/스크롤 속도와 메모리 사용량이 일정합니다.
+    로그를 남기는 쪽(실행기 등)은 UI 갱신을 기다리지 않습니다.
+    """
+
+    FLUSH_INTERVAL_MS = 33  # 약 30fps
+    SEARCH_DELAY_MS = 150  # 검색어 입력 후 필터 적용까지 대기 시간
+    ROW_HEIGHT = 18  # 로그 한 줄 높이 (px)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.log_model = LogListModel(BaseLogManager.instance(), self)
+        self._skipped_count = 0
         self.init_ui()
-        # BaseLogManager에 핸들러로 등록
-        BaseLogManager.instance().add_handler(self.append)
-        
+
+        # 검색어는 입력이 잠시 멈췄을 때 적용
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.apply_filter)
+
+        # 링 버퍼의 새 로그를 프레임마다 가져와 표시
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self.refresh_logs)
+        self._flush_timer.start(self.FLUSH_INTERVAL_MS)
+
     def init_ui(self):
         """UI 초기화"""
         self.setStyleSheet(FRAME_STYLE)
         self.setFixedWidth(LOG_FRAME_WIDTH)
-        
+
         # 메인 레이아웃
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
-        
+
         # 타이틀
         title = QLabel("로그 영역")
         title.setFont(QFont(TITLE_FONT_FAMILY, SECTION_FONT_SIZE, QFont.Weight.Bold))
         layout.addWidget(title)
-        
+
         # 로그 기능 버튼 영역
         button_layout = QHBoxLayout()
-        
+
         # 초기화 버튼
         clear_btn = QPushButton("초기화")
         clear_btn.clicked.connect(self.clear_log)
         button_layout.addWidget(clear_btn)
-        
+
         # 맨 위로 버튼
         scroll_top_btn = QPushButton("맨 위로")
         scroll_top_btn.clicked.connect(self.scroll_to_top)
         button_layout.addWidget(scroll_top_btn)
-        
+
         # 맨 아래로 버튼
         scroll_bottom_btn = QPushButton("맨 아래로")
         scroll_bottom_btn.clicked.connect(self.scroll_to_bottom)
         button_layout.addWidget(scroll_bottom_btn)
-        
+
         button_layout.addStretch()  # 남은 공간을 채움
+
+        # 생략된 로그 수 표시
+        self.skipped_label = QLabel()
+        button_layout.addWidget(self.skipped_label)
         layout.addLayout(button_layout)
-        
+
+        # 필터 영역 (레벨, 모듈, 검색어)
+        filter_layout = QHBoxLayout()
+
+        self.level_combo = QComboBox()
+        self.level_combo.addItem("전체 레벨", None)
+        for level in LOG_LEVELS:
+            self.level_combo.addItem(f"{level} 이상", level)
+        self.level_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.level_combo)
+
+        self.module_combo = QComboBox()
+        self.module_combo.addItem("전체 모듈", None)
+        self.module_combo.setMinimumContentsLength(16)
+        self.module_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.module_combo)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("검색")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(lambda: self._search_timer.start(self.SEARCH_DELAY_MS))
+        filter_layout.addWidget(self.search_input, 1)
+        layout.addLayout(filter_layout)
+
         # 로그 박스
         log_box = QFrame()
         log_box.setStyleSheet(CONTAINER_STYLE)
         log_box.setMinimumSize(LOG_FRAME_WIDTH - 20, LOG_CONTAINER_MIN_HEIGHT)
-        
+
         # 로그 박스가 수직으로 늘어날 수 있도록 설정
         size_policy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
         log_box.setSizePolicy(size_policy)
-        
+
         # 로그 박스 내부 레이아웃
         log_box_layout = QVBoxLayout()
         log_box.setLayout(log_box_layout)
-        
-        # 로그 출력을 위한 QTextEdit
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        self.log_text.setStyleSheet(LOG_TEXT_STYLE)
-        self.log_text.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse | 
-            Qt.TextInteractionFlag.TextSelectableByKeyboard
-        )
-        # HTML 지원 활성화
-        self.log_text.setAcceptRichText(True)
-        
-        # 로그 텍스트의 크기 정책을 Expanding으로 설정
-        log_text_size_policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.log_text.setSizePolicy(log_text_size_policy)
-        
-        log_box_layout.addWidget(self.log_text)
+
+        # 로그 출력을 위한 QTableView
+        # 행 높이를 고정하면 행이 추가/제거될 때 전체 배치를 다시 계산하지 않고 보이는 행만 그림
+        # (QListView는 행이 늘어날수록 배치 시간이 길어짐)
+        self.log_view = QTableView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.horizontalHeader().hide()
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        self.log_view.verticalHeader().hide()
+        self.log_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.log_view.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.log_view.setShowGrid(False)
+        self.log_view.setWordWrap(False)
+        self.log_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.log_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.log_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.log_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+        self.log_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.log_view.setStyleSheet(LOG_LIST_STYLE)
+
+        # 선택한 로그 복사 (Ctrl+C)
+        copy_action = QAction("복사", self.log_view)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_action.triggered.connect(self.copy_selected)
+        self.log_view.addAction(copy_action)
+        self.log_view.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+
+        # 로그 목록의 크기 정책을 Expanding으로 설정
+        log_view_size_policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.log_view.setSizePolicy(log_view_size_policy)
+
+        log_box_layout.addWidget(self.log_view)
         layout.addWidget(log_box)
-        
+
         self.setLayout(layout)
-        
-    def append(self, message):
-        """로그 메시지 추가"""
-        if message and message.strip():  # 빈 메시지가 아닌 경우에만 추가
-            self.log_text.append(message)
-            
+
+    def refresh_logs(self):
+        """링 버퍼의 새 로그를 목록에 추가 (프레임 타이머에서 호출)"""
+        scroll_bar = self.log_view.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+
+        added, skipped = self.log_model.fetch_new()
+        if skipped:
+            self._skipped_count += skipped
+            self.skipped_label.setText(f"표시하지 못한 로그 {self._skipped_count}개")
+        self._update_module_combo()
+
+        if added and at_bottom:
+            self.log_view.scrollToBottom()
+
+    def apply_filter(self):
+        """레벨, 모듈, 검색어 필터를 적용"""
+        self._search_timer.stop()
+        self.log_model.set_filter(
+            min_level=self.level_combo.currentData(),
+            module=self.module_combo.currentData(),
+            search_text=self.search_input.text().strip()
+        )
+        self.log_view.scrollToBottom()
+
+    def _update_module_combo(self):
+        """새로 기록된 모듈을 모듈 필터에 추가"""
+        if self.module_combo.count() - 1 == len(self.log_model.modules):
+            return
+        known = {self.module_combo.itemData(index) for index in range(1, self.module_combo.count())}
+        for module in sorted(self.log_model.modules - known):
+            self.module_combo.addItem(module or "(이름 없음)", module)
+
+    def copy_selected(self):
+        """선택한 로그를 클립보드에 복사"""
+        rows = sorted(index.row() for index in self.log_view.selectionModel().selectedRows())
+        if not rows:
+            return
+        manager = BaseLogManager.instance()
+        text = "\n".join(manager.format_line(self.log_model.record_at(row)) for row in rows)
+        QApplication.clipboard().setText(text)
+
     def clear_log(self):
         """로그 메시지 초기화"""
-        self.log_text.clear()
-        
+        self.log_model.clear()
+        self._skipped_count = 0
+        self.skipped_label.clear()
+
     def scroll_to_top(self):
         """로그 맨 위로 스크롤"""
-        self.log_text.verticalScrollBar().setValue(0)
-        
+        self.log_view.scrollToTop()
+
     def scroll_to_bottom(self):
         """로그 맨 아래로 스크롤"""
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        self.log_view.scrollToBottom()
+
+
+def benchmark_log_viewer(total_records=100000, records_per_frame=200, sample_frames=20):
+    """세션이 길어질 때 로그 영역 갱신 시간을 측정합니다.
+
+    프레임마다 로그를 추가하면서, 예전 방식(QTextEdit에 HTML 누적)과
+    LogListModel/QTableView의 처음과 마지막 프레임 갱신 시간(그리기 포함)을 비교합니다.
+    QApplication이 필요합니다.
+
+    Returns:
+        dict: {'records', 'text_first_ms', 'text_last_ms', 'text_characters',
+               'list_first_ms', 'list_last_ms', 'list_rows'}
+    """
+    manager = BaseLogManager.instance()
+    app = QApplication.instance()
+    frames = total_records // records_per_frame
+
+    def run(add_frame):
+        times = []
+        for frame in range(frames):
+            for index in range(records_per_frame):
+                manager.log(
+                    message="스텝 실행 완료: %s (%d)",
+                    args=("키 입력 A 누르기", frame * records_per_frame + index),
+                    level="INFO",
+                    file_name="benchmark"
+                )
+            started = time.perf_counter()
+            add_frame()
+            app.processEvents()
+            times.append((time.perf_counter() - started) * 1000)
+        first = sum(times[:sample_frames]) / sample_frames
+        last = sum(times[-sample_frames:]) / sample_frames
+        return first, last
+
+    # 예전 방식: 프레임마다 스타일 HTML을 QTextEdit에 누적
+    text_edit = QTextEdit()
+    text_edit.resize(LOG_FRAME_WIDTH, 600)
+    text_edit.show()
+    last_seq = [manager.log_buffer.last_seq]
+
+    def add_text_frame():
+        records = manager.log_buffer.range(start_seq=last_seq[0] + 1)
+        last_seq[0] = records[-1].seq
+        text_edit.append("<div>" + "<br>".join(manager.format_record(record).strip() for record in records) + "</div>")
+        text_edit.verticalScrollBar().setValue(text_edit.verticalScrollBar().maximum())
+
+    text_first, text_last = run(add_text_frame)
+    text_characters = text_edit.document().characterCount()
+    text_edit.close()
+
+    widget = LogWidget()
+    widget._flush_timer.stop()
+    widget.resize(LOG_FRAME_WIDTH, 600)
+    widget.show()
+    list_first, list_last = run(widget.refresh_logs)
+    list_rows = widget.log_model.rowCount()
+    widget.close()
+
+    return {
+        'records': total_records,
+        'text_first_ms': text_first,
+        'text_last_ms': text_last,
+        'text_characters': text_characters,
+        'list_first_ms': list_first,
+        'list_last_ms': list_last,
+        'list_rows': list_rows
+    }
+
+
+if __name__ == '__main__':
+    app = QApplication.instance() or QApplication([])
+    result = benchmark_log_viewer()
+    print(
+        f"로그 {result['records']}개: QTextEdit 프레임 {result['text_first_ms']:.2f}ms -> {result['text_last_ms']:.2f}ms"
+        f" (문서 {result['text_characters']}자 누적)"
+        f" / 목록 모델 프레임 {result['list_first_ms']:.2f}ms -> {result['list_last_ms']:.2f}ms"
+        f" (행 {result['list_rows']}개 유지)"
+    )
@@ -0,0 +1,327 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+from BE.log.base_log_manager import BaseLogManager
+from BE.log import instrumentation
+
+# 상태 요약(health)에 따로 보여주는 계측 구간
+HEALTH_SPANS = {
+    'trigger_dispatch': "logic_executor.trigger_dispatch",  # 키가 떼진 시각 -> 로직 시작
+    'step_jitter': "logic_executor.step_jitter",  # 다음 스텝 예약 -> 실행
+    'hook_callback': "keyboard_hook.callback",  # 키보드 후킹 콜백 소요 시간
+}
+CAPTURE_SPAN = "window_controller.capture_client"
+RATE_WINDOW_SECONDS = 60  # 캡처 빈도를 계산하는 구간 (초)
+
+
+class MetricsServer:
+    """실행 지표 조회 서버 (싱글톤, 선택 사항)
+
+    GUI를 열지 않고도 상태를 확인할 수 있도록 로컬(127.0.0.1)에서만 접속할 수 있는 HTTP 서버로
+    계측 히스토그램, 카운터, 등록된 컴포넌트의 get_metrics() 결과와 프로세스 메모리를 제공합니다.
+
+        GET /metrics       Prometheus 텍스트 형식
+        GET /metrics.json  JSON
+
+    요청은 서버 스레드에서 처리하며, 지표는 요청이 올 때만 모읍니다.
+    """
+
+    DEFAULT_PORT = 9464
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """싱글톤 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        """초기화"""
+        if MetricsServer._instance is not None:
+            raise RuntimeError("MetricsServer는 싱글톤입니다. instance()를 사용하세요.")
+
+        self.base_log_manager = BaseLogManager.instance()
+        self._providers = {}  # 이름 -> get_metrics 함수
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._capture_samples = deque()  # (시각, 누적 캡처 수)
+        self._process = psutil.Process(os.getpid())
+        self._started_at = time.time()
+
+    def register_provider(self, name, provider):
+        """지표 제공 함수를 등록합니다.
+
+        Args:
+            name (str): 컴포넌트 이름 (Prometheus의 component 레이블)
+            provider (callable): 숫자 값을 담은 dict를 반환하는 함수 (예: OcrWorker.get_metrics)
+        """
+        with self._lock:
+            self._providers[name] = provider
+
+    def unregister_provider(self, name):
+        """지표 제공 함수를 제거합니다."""
+        with self._lock:
+            self._providers.pop(name, None)
+
+    def is_running(self):
+        """서버 실행 여부"""
+        return self._server is not None
+
+    @property
+    def port(self):
+        """실제로 열린 포트 (실행 중이 아니면 None)"""
+        return self._server.server_address[1] if self._server is not None else None
+
+    def start(self, port=DEFAULT_PORT):
+        """서버를 시작합니다.
+
+        Args:
+            port (int): 포트 (0이면 비어 있는 포트를 자동으로 사용)
+
+        Returns:
+            bool: 시작 성공 여부
+        """
+        with self._lock:
+            if self._server is not None:
+                return True
+            try:
+                server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsRequestHandler)
+            except OSError as e:
+                self.base_log_manager.log(
+                    message=f"지표 서버 시작 실패 (포트 {port}): {e}",
+                    level="ERROR",
+                    file_name="metrics_server",
+                    method_name="start",
+                    print_to_terminal=True
+                )
+                return False
+            server.daemon_threads = True
+            server.metrics_server = self
+            self._server = server
+            self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+            self._thread.start()
+
+        self.base_log_manager.log(
+            message=f"지표 서버 시작: http://127.0.0.1:{self.port}/metrics",
+            level="INFO",
+            file_name="metrics_server",
+            method_name="start"
+        )
+        return True
+
+    def stop(self):
+        """서버를 중지합니다."""
+        with self._lock:
+            server, self._server = self._server, None
+            thread, self._thread = self._thread, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2.0)
+
+    def collect(self):
+        """현재 지표를 모읍니다.
+
+        Returns:
+            dict: {
+                'timestamp', 'uptime_seconds',
+                'health': {'trigger_dispatch_ms', 'step_jitter_ms', 'hook_callback_us', 'log_queue_depth',
+                           'capture_rate_per_second', 'running_logics', 'process_memory_bytes'},
+                'process': {'rss_bytes', 'vms_bytes', 'cpu_percent', 'threads'},
+                'spans': [구간 요약, ...], 'counters': {이름: 값},
+                'components': {이름: get_metrics() 결과}
+            }
+        """
+        now = time.time()
+        snapshot = instrumentation.get_snapshot()
+        spans = {summary['name']: summary for summary in snapshot['spans']}
+        for summary in snapshot['spans']:
+            summary.pop('buckets', None)
+
+        with self._lock:
+            providers = list(self._providers.items())
+        components = {}
+        for name, provider in providers:
+            try:
+                components[name] = provider()
+            except Exception as e:
+                components[name] = {'error': str(e)}
+
+        process = self._collect_process()
+        capture_total = spans[CAPTURE_SPAN]['count'] if CAPTURE_SPAN in spans else 0
+
+        def span_value(key, scale):
+            summary = spans.get(HEALTH_SPANS[key])
+            return {'p50': summary['p50_us'] * scale, 'p99': summary['p99_us'] * scale,
+                    'max': summary['max_us'] * scale, 'count': summary['count']} if summary else None
+
+        health = {
+            'trigger_dispatch_ms': span_value('trigger_dispatch', 1e-3),
+            'step_jitter_ms': span_value('step_jitter', 1e-3),
+            'hook_callback_us': span_value('hook_callback', 1),
+            'log_queue_depth': components.get('log', {}).get('pending'),
+            'capture_rate_per_second': self._capture_rate(now, capture_total),
+            'running_logics': components.get('logic_executor', {}).get('running_logics'),
+            'process_memory_bytes': process.get('rss_bytes')
+        }
+        return {
+            'timestamp': now,
+            'uptime_seconds': now - self._started_at,
+            'instrumentation_enabled': snapshot['enabled'],
+            'health': health,
+            'process': process,
+            'spans': snapshot['spans'],
+            'counters': snapshot['counters'],
+            'components': components
+        }
+
+    def _collect_process(self):
+        """프로세스 메모리/CPU 지표"""
+        try:
+            with self._process.oneshot():
+                memory = self._process.memory_info()
+                return {
+                    'rss_bytes': memory.rss,
+                    'vms_bytes': memory.vms,
+                    'cpu_percent': self._process.cpu_percent(None),
+                    'threads': self._process.num_threads()
+                }
+        except psutil.Error:
+            return {}
+
+    def _capture_rate(self, now, capture_total):
+        """최근 RATE_WINDOW_SECONDS 동안의 초당 캡처 수 (요청할 때 남긴 표본으로 계산)"""
+        with self._lock:
+            samples = self._capture_samples
+            samples.append((now, capture_total))
+            while len(samples) > 2 and now - samples[1][0] >= RATE_WINDOW_SECONDS:
+                samples.popleft()
+            started, started_total = samples[0]
+        if now - started < 1.0:
+            return None
+        return (capture_total - started_total) / (now - started)
+
+    def format_prometheus(self, metrics):
+        """지표를 Prometheus 텍스트 형식으로 만듭니다."""
+        lines = []
+
+        def gauge(name, value, help_text, labels=""):
+            if value is None:
+                return
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name}{labels} {_number(value)}")
+
+        health = metrics['health']
+        gauge("be_log_queue_depth", health['log_queue_depth'], "Log records not yet delivered to subscribers")
+        gauge("be_capture_rate_per_second", health['capture_rate_per_second'], "Window captures per second")
+        gauge("be_running_logics", health['running_logics'], "Running logics including nested logics")
+        gauge("be_process_resident_memory_bytes", health['process_memory_bytes'], "Resident memory size")
+        gauge("be_process_cpu_percent", metrics['process'].get('cpu_percent'), "Process CPU usage")
+        gauge("be_process_threads", metrics['process'].get('threads'), "Process thread count")
+        gauge("be_uptime_seconds", metrics['uptime_seconds'], "Seconds since the metrics server was created")
+
+        if metrics['spans']:
+            lines.append("# HELP be_span_seconds Instrumented span durations")
+            lines.append("# TYPE be_span_seconds summary")
+            for summary in metrics['spans']:
+                label = _escape_label(summary['name'])
+                for percent in instrumentation.PERCENTILES:
+                    lines.append(
+                        f'be_span_seconds{{span="{label}",quantile="{percent / 100}"}}'
+                        f" {_number(summary[f'p{percent}_us'] / 1e6)}"
+                    )
+                lines.append(f'be_span_seconds_sum{{span="{label}"}} {_number(summary["total_ms"] / 1e3)}')
+                lines.append(f'be_span_seconds_count{{span="{label}"}} {summary["count"]}')
+
+        if metrics['counters']:
+            lines.append("# HELP be_events_total Instrumentation counters")
+            lines.append("# TYPE be_events_total counter")
+            for name, value in metrics['counters'].items():
+                lines.append(f'be_events_total{{name="{_escape_label(name)}"}} {_number(value)}')
+
+        component_lines = []
+        for component, values in metrics['components'].items():
+            if not isinstance(values, dict):
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if isinstance(value, (int, float)):
+                    component_lines.append(
+                        f'be_component{{component="{_escape_label(component)}",key="{_escape_label(key)}"}}'
+                        f" {_number(value)}"
+                    )
+        if component_lines:
+            lines.append("# HELP be_component Numeric values reported by component get_metrics()")
+            lines.append("# TYPE be_component gauge")
+            lines.extend(component_lines)
+
+        return "\n".join(lines) + "\n"
+
+
+def _number(value):
+    """Prometheus 숫자 표기"""
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+def _escape_label(value):
+    """Prometheus 레이블 값 이스케이프"""
+    return re.sub(r'(["\\])', r'\\\1', str(value)).replace("\n", "\\n")
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """지표 요청 처리 (서버 스레드)"""
+
+    def do_GET(self):
+        metrics_server = self.server.metrics_server
+        path = self.path.split('?', 1)[0]
+        try:
+            if path == "/metrics":
+                body = metrics_server.format_prometheus(metrics_server.collect()).encode('utf-8')
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(metrics_server.collect(), ensure_ascii=False, default=str).encode('utf-8')
+                content_type = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 터미널에 출력하지 않음
+        pass
+
+
+if __name__ == '__main__':
+    # 로컬 클라이언트로 확인: 임의 포트로 서버를 열고 두 형식을 한 번씩 조회
+    from urllib.request import urlopen
+
+    metrics_server = MetricsServer.instance()
+    metrics_server.register_provider("log", BaseLogManager.instance().get_metrics)
+    metrics_server.start(port=0)
+    base_url = f"http://127.0.0.1:{metrics_server.port}"
+    with urlopen(base_url + "/metrics") as response:
+        print(response.read().decode('utf-8'))
+    with urlopen(base_url + "/metrics.json") as response:
+        print(json.dumps(json.loads(response.read()), ensure_ascii=False, indent=2)[:2000])
+    metrics_server.stop()
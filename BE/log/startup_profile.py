@@ -0,0 +1,224 @@
+"""시작 시간 측정 (startup profile)
+
+프로그램을 시작할 때 모듈을 불러오고 컴포넌트를 초기화하는 단계별 시간을 perf_counter_ns로 잽니다.
+이 모듈은 표준 라이브러리만 사용하므로 BE/main.py에서 가장 먼저 불러와 시작 시각으로 삼습니다.
+
+    with startup_profile.phase("init:database"):
+        initialize_database()
+
+    startup_profile.finish()  # 창을 띄운 뒤 이벤트 루프가 처음 돌 때
+
+단계별 예산(STARTUP_BUDGET_MS)을 넘거나, Qt를 불러온 뒤 창이 뜨기 전에 무거운 모듈(HEAVY_MODULES)을
+불러온 경우 finish()에서 경고 로그를 남깁니다. 창을 띄운 뒤 백그라운드에서 미리 불러온 모듈은
+record_background()로 따로 기록하며 예산에 포함하지 않습니다.
+
+--startup-profile 옵션으로 실행하면 표를 터미널에 출력하고 JSON 파일로 저장하며, 저장한 파일은 표로 봅니다.
+    python BE/log/startup_profile.py "BE/log/log files/startup_20240101_120000.json"
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_started_ns = time.perf_counter_ns()  # 시작 기준 시각 (이 모듈을 처음 불러온 시각)
+
+# 단계별 예산 (ms), 'total'은 시작부터 finish()까지
+STARTUP_BUDGET_MS = {
+    'import:qt': 800,
+    'import:core': 150,
+    'init:qapplication': 300,
+    'init:database': 100,
+    'import:main_window': 700,
+    'init:main_window': 500,
+    'show:main_window': 300,
+    'event_loop': 200,
+    'total': 2500,
+}
+
+# 창이 뜨기 전에 불러오면 안 되는 무거운 모듈 (처음 사용할 때나 창을 띄운 뒤 불러옴)
+HEAVY_MODULES = ("cv2", "numpy", "torch", "easyocr")
+
+_phases = []  # (이름, 시작 시각(ns, 기준 시각부터), 소요 시간(ns))
+_background = {}  # 이름 -> 소요 시간(ms), 없으면 None (실패)
+_baseline_modules = None  # set_module_baseline() 시점에 이미 불러와 있던 무거운 모듈
+_eager_modules = None  # finish() 시점에 새로 불러와 있던 무거운 모듈
+_finished_ns = None
+_lock = threading.Lock()
+
+
+@contextmanager
+def phase(name):
+    """시작 단계 하나의 소요 시간을 잽니다.
+
+    Args:
+        name (str): 단계 이름 ("import:..." 모듈 불러오기, "init:..." 초기화)
+    """
+    started_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        record(name, started_ns)
+
+
+def record(name, started_ns):
+    """started_ns(perf_counter_ns 값)부터 지금까지를 시작 단계 하나로 기록합니다.
+
+    with 블록으로 감쌀 수 없는 구간(예: 창을 띄운 뒤 이벤트 루프가 처음 돌 때까지)에 사용합니다.
+    """
+    elapsed_ns = time.perf_counter_ns() - started_ns
+    with _lock:
+        _phases.append((name, started_ns - _started_ns, elapsed_ns))
+
+
+def set_module_baseline():
+    """지금 이미 불러와 있는 무거운 모듈을 기준으로 기록합니다.
+
+    Qt 등 외부 패키지가 스스로 불러오는 모듈(예: shiboken6이 불러오는 numpy)은 BE 코드 탓이 아니므로
+    Qt를 불러온 직후에 호출해 finish()의 확인에서 제외합니다.
+    """
+    global _baseline_modules
+    _baseline_modules = {name for name in HEAVY_MODULES if name in sys.modules}
+
+
+def record_background(name, elapsed_ms):
+    """창을 띄운 뒤 백그라운드에서 실행한 작업의 시간을 기록합니다. (예산에 포함하지 않음)
+
+    Args:
+        name (str): 작업 이름 (예: "preload:cv2")
+        elapsed_ms (float | None): 소요 시간(ms), 실패한 경우 None
+    """
+    with _lock:
+        _background[name] = elapsed_ms
+
+
+def is_finished():
+    """finish()를 호출했는지 여부"""
+    return _finished_ns is not None
+
+
+def finish():
+    """시작을 마친 것으로 기록하고, 예산 초과와 미리 불러온 무거운 모듈을 확인해 로그를 남깁니다.
+
+    Returns:
+        dict: get_report() 결과
+    """
+    global _finished_ns, _eager_modules
+    if _finished_ns is None:
+        _finished_ns = time.perf_counter_ns() - _started_ns
+        baseline = _baseline_modules or set()
+        _eager_modules = [name for name in HEAVY_MODULES if name in sys.modules and name not in baseline]
+
+    report = get_report()
+    # Qt를 불러오기 전에 이 모듈을 불러오므로 로그 매니저는 여기서 불러옴
+    from BE.log.base_log_manager import BaseLogManager
+    base_log_manager = BaseLogManager.instance()
+    base_log_manager.log(
+        message=f"시작 완료: {report['total_ms']:.0f}ms (모듈 {report['module_count']}개)",
+        level="INFO",
+        file_name="startup_profile",
+        method_name="finish"
+    )
+    if report['over_budget']:
+        over = ", ".join(
+            f"{item['name']} {item['ms']:.0f}ms > {item['budget_ms']}ms" for item in report['over_budget']
+        )
+        base_log_manager.log(
+            message=f"시작 시간 예산 초과: {over}",
+            level="WARNING",
+            file_name="startup_profile",
+            method_name="finish"
+        )
+    if report['eager_heavy_modules']:
+        base_log_manager.log(
+            message=f"창을 띄우기 전에 불러온 무거운 모듈: {', '.join(report['eager_heavy_modules'])}",
+            level="WARNING",
+            file_name="startup_profile",
+            method_name="finish"
+        )
+    return report
+
+
+def get_report(budget=None):
+    """시작 단계별 시간과 예산 확인 결과를 반환합니다.
+
+    Args:
+        budget (dict, optional): 단계 이름 -> 예산(ms). 없으면 STARTUP_BUDGET_MS
+
+    Returns:
+        dict: {'total_ms', 'module_count', 'phases': [{'name', 'start_ms', 'ms', 'budget_ms'}, ...],
+               'background': {이름: ms}, 'eager_heavy_modules': [...], 'over_budget': [{'name', 'ms', 'budget_ms'}, ...]}
+    """
+    budget = STARTUP_BUDGET_MS if budget is None else budget
+    with _lock:
+        phases = list(_phases)
+        background = dict(_background)
+    total_ns = _finished_ns if _finished_ns is not None else time.perf_counter_ns() - _started_ns
+
+    rows = [
+        {'name': name, 'start_ms': start_ns / 1e6, 'ms': elapsed_ns / 1e6, 'budget_ms': budget.get(name)}
+        for name, start_ns, elapsed_ns in phases
+    ]
+    rows.append({'name': 'total', 'start_ms': 0.0, 'ms': total_ns / 1e6, 'budget_ms': budget.get('total')})
+    over_budget = [
+        {'name': row['name'], 'ms': row['ms'], 'budget_ms': row['budget_ms']}
+        for row in rows if row['budget_ms'] is not None and row['ms'] > row['budget_ms']
+    ]
+    return {
+        'created_at': time.time(),
+        'total_ms': total_ns / 1e6,
+        'module_count': len(sys.modules),
+        'phases': rows,
+        'background': background,
+        'eager_heavy_modules': list(_eager_modules or []),
+        'over_budget': over_budget
+    }
+
+
+def export_report(report, path=None, directory=os.path.join("BE", "log", "log files")):
+    """시작 시간 측정 결과를 JSON 파일로 저장합니다.
+
+    Args:
+        report (dict): get_report() 결과
+        path (str, optional): 저장할 파일 경로. 없으면 directory에 시각이 들어간 이름으로 저장
+        directory (str, optional): path가 없을 때 저장할 디렉토리
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    if path is None:
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(directory, f"startup_{stamp}.json")
+    with open(path, 'w', encoding='utf-8') as export_file:
+        json.dump(report, export_file, ensure_ascii=False, indent=2)
+    return path
+
+
+def format_report(report):
+    """측정 결과를 표 형식의 문자열로 만듭니다."""
+    lines = [f"{'단계':<28} {'시작(ms)':>10} {'소요(ms)':>10} {'예산(ms)':>10}"]
+    for row in report['phases']:
+        budget_ms = row['budget_ms']
+        mark = " 초과" if budget_ms is not None and row['ms'] > budget_ms else ""
+        budget_text = f"{budget_ms:>10}" if budget_ms is not None else f"{'-':>10}"
+        lines.append(f"{row['name']:<28} {row['start_ms']:>10.1f} {row['ms']:>10.1f} {budget_text}{mark}")
+    if report['background']:
+        lines.append("")
+        lines.append(f"{'백그라운드 (예산 제외)':<28} {'소요(ms)':>10}")
+        for name, elapsed_ms in report['background'].items():
+            elapsed_text = f"{elapsed_ms:>10.1f}" if elapsed_ms is not None else f"{'실패':>10}"
+            lines.append(f"{name:<28} {elapsed_text}")
+    if report['eager_heavy_modules']:
+        lines.append("")
+        lines.append(f"창을 띄우기 전에 불러온 무거운 모듈: {', '.join(report['eager_heavy_modules'])}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as report_file:
+            print(format_report(json.load(report_file)))
+    else:
+        print("사용법: python BE/log/startup_profile.py <startup_*.json>")
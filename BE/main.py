@@ -1,8 +1,25 @@
 import sys
-from PySide6.QtWidgets import QApplication, QMessageBox
-from BE.function.main_window import MainWindow
-from BE.database.connection import DatabaseConnection
-from BE.database.migrations.json_to_db_migration import JsonToDbMigration
+import time
+import multiprocessing
+# 시작 시간 측정 (표준 라이브러리만 사용하므로 가장 먼저 불러옴)
+from BE.log import startup_profile
+
+with startup_profile.phase("import:qt"):
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication, QMessageBox
+startup_profile.set_module_baseline()
+
+with startup_profile.phase("import:core"):
+    from BE.function._common_components.lazy_import import preload
+    from BE.database.connection import DatabaseConnection
+    from BE.database.migrations.json_to_db_migration import JsonToDbMigration
+    from BE.log.log_file_sink import LogFileSink
+    from BE.log.base_log_manager import BaseLogManager
+    from BE.log import instrumentation
+
+# 창을 띄운 뒤 백그라운드에서 미리 불러오는 모듈 (처음 이미지 서치/캡처할 때 기다리지 않도록)
+# torch/easyocr는 OCR 작업 프로세스에서만 불러오므로 포함하지 않음
+PRELOAD_MODULES = ("numpy", "cv2")
 
 def initialize_database():
     """데이터베이스 초기화 및 마이그레이션을 수행합니다."""
@@ -20,15 +37,111 @@ def initialize_database():
             else:
                 QMessageBox.critical(None, "마이그레이션 실패", message)
 
+def export_instrumentation():
+    """계측 히스토그램을 파일로 저장합니다."""
+    path = instrumentation.export_histograms()
+    BaseLogManager.instance().log(
+        message=f"계측 히스토그램 저장 완료: {path}",
+        level="INFO",
+        file_name="main",
+        method_name="export_instrumentation",
+        print_to_terminal=True
+    )
+
+def start_metrics_server(app, window, port=None):
+    """로컬 지표 서버를 시작하고 컴포넌트 지표를 등록합니다. (port가 없으면 기본 포트)"""
+    # 지표 서버를 쓰는 경우에만 불러옴 (psutil 등)
+    from BE.log.metrics_server import MetricsServer
+    from BE.function._common_components.system_state_bus import SystemStateBus
+    from BE.function._common_components.image_matcher import TemplateMatchCache
+    from BE.function._common_components.debug_capture_writer import DebugCaptureWriter
+    from BE.function._common_components.ocr_worker import OcrWorker
+    from BE.function._common_components.roi_watcher import RoiWatcherService
+    
+    metrics_server = MetricsServer.instance()
+    metrics_server.register_provider("log", BaseLogManager.instance().get_metrics)
+    metrics_server.register_provider("log_file", LogFileSink.instance().get_metrics)
+    metrics_server.register_provider("logic_executor", window.logic_executor.get_metrics)
+    metrics_server.register_provider("system_state_bus", SystemStateBus.instance().get_metrics)
+    metrics_server.register_provider("template_match_cache", TemplateMatchCache.instance().get_metrics)
+    metrics_server.register_provider("debug_capture", DebugCaptureWriter.instance().get_metrics)
+    metrics_server.register_provider("ocr", OcrWorker.instance().get_metrics)
+    metrics_server.register_provider("roi_watcher", RoiWatcherService.instance().get_metrics)
+    if metrics_server.start(port if port is not None else MetricsServer.DEFAULT_PORT):
+        app.aboutToQuit.connect(metrics_server.stop)
+
+def finish_startup(app, print_profile, check_budget):
+    """이벤트 루프가 처음 돌 때 시작 시간 측정을 마치고, 무거운 모듈을 백그라운드에서 불러옵니다."""
+    report = startup_profile.finish()
+    
+    # 시작 시간 확인만 하는 경우 (--startup-check): 예산을 넘거나 무거운 모듈을 미리 불러왔으면 종료 코드 1
+    if check_budget:
+        print(startup_profile.format_report(report))
+        app.exit(1 if report['over_budget'] or report['eager_heavy_modules'] else 0)
+        return
+    
+    def on_preloaded(results):
+        for name, elapsed_ms in results.items():
+            startup_profile.record_background(f"preload:{name}", elapsed_ms)
+        if print_profile:
+            report = startup_profile.get_report()
+            print(startup_profile.format_report(report))
+            path = startup_profile.export_report(report)
+            BaseLogManager.instance().log(
+                message=f"시작 시간 측정 결과 저장 완료: {path}",
+                level="INFO",
+                file_name="main",
+                method_name="finish_startup",
+                print_to_terminal=True
+            )
+    
+    preload(PRELOAD_MODULES, on_loaded=on_preloaded)
+
 def main():
-    app = QApplication(sys.argv)
+    with startup_profile.phase("init:qapplication"):
+        app = QApplication(sys.argv)
+    
+    # 세션 로그 파일 저장 (선택 사항, BE/log/log_query.py로 조회)
+    if "--log-files" in sys.argv:
+        LogFileSink.instance().start()
+        app.aboutToQuit.connect(LogFileSink.instance().stop)
+    
+    # 실행 구간 계측 (BE_INSTRUMENTATION=1로 실행한 경우), 종료할 때 히스토그램 저장
+    if instrumentation.INSTRUMENTATION_ENABLED:
+        app.aboutToQuit.connect(export_instrumentation)
+    
+    # DB 초기화 및 마이그레이션 (저장소가 창을 만들 때 로직을 읽으므로 창보다 먼저 실행)
+    with startup_profile.phase("init:database"):
+        initialize_database()
+    
+    # 위젯/컨트롤러 모듈은 창을 만들 때 불러옴
+    with startup_profile.phase("import:main_window"):
+        from BE.function.main_window import MainWindow
+    with startup_profile.phase("init:main_window"):
+        window = MainWindow()
+    with startup_profile.phase("show:main_window"):
+        window.show()
+    
+    # 시작 시간 측정 (--startup-profile: 표 출력 및 저장, --startup-check: 예산 확인 후 종료)
+    print_profile = "--startup-profile" in sys.argv
+    check_budget = "--startup-check" in sys.argv
+    shown_ns = time.perf_counter_ns()
+    
+    def on_event_loop_started():
+        startup_profile.record("event_loop", shown_ns)  # 창을 띄운 뒤 이벤트 루프가 처음 돌 때까지
+        finish_startup(app, print_profile, check_budget)
     
-    # DB 초기화 및 마이그레이션
-    initialize_database()
+    QTimer.singleShot(0, on_event_loop_started)
     
-    window = MainWindow()
-    window.show()
+    # 로컬 지표 서버 (선택 사항, --metrics-port [포트])
+    if "--metrics-port" in sys.argv:
+        index = sys.argv.index("--metrics-port")
+        value = sys.argv[index + 1] if index + 1 < len(sys.argv) else ""
+        port = int(value) if value.isdigit() else None
+        start_metrics_server(app, window, port)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 OCR 작업 프로세스(spawn)를 시작할 수 있도록 함
+    multiprocessing.freeze_support()
     main()
@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 import os
 import subprocess
 try:
@@ -59,4 +60,6 @@ def main():
         input("계속하려면 아무 키나 누르세요...")
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 OCR 작업 프로세스(spawn)를 시작할 수 있도록 함
+    multiprocessing.freeze_support()
     main()
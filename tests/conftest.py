@@ -0,0 +1,10 @@
+import os
+import sys
+
+# 프로젝트 루트에서 `python -m pytest tests`로 실행: BE 패키지를 찾을 수 있도록 루트를 경로에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# 화면이 없는 환경(CI, Linux)에서도 Qt 객체를 만들 수 있도록 오프스크린 플랫폼 사용
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
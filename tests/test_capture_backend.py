@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from conftest import ROOT_DIR
+from BE.function._common_components.capture_backend import (
+    SyntheticCaptureBackend, benchmark_batched_regions, crop_regions, measure_capture_rate
+)
+
+
+def test_synthetic_frames_change_every_capture():
+    backend = SyntheticCaptureBackend(size=(64, 32), seed=1)
+    first = backend.capture(None).copy()
+    second = backend.capture(None)
+    assert first.shape == (32, 64, 4)
+    assert not np.array_equal(first[:8, :8], second[:8, :8])
+    assert np.array_equal(first[8:], second[8:])
+    assert backend.capture_count == 2
+
+
+def test_synthetic_fixed_frame_and_slots():
+    backend = SyntheticCaptureBackend(size=(64, 32))
+    image = np.zeros((32, 64, 3), dtype=np.uint8)
+    image[5, 7] = (1, 2, 3)
+    backend.set_frame(image)
+
+    shared = backend.capture(None)
+    watcher = backend.capture(None, slot="watcher")
+    assert watcher is not shared  # slot마다 다른 버퍼
+    assert tuple(watcher[5, 7]) == (1, 2, 3, 255)
+    assert backend.capture(None) is shared  # 같은 slot은 버퍼를 다시 씀
+
+    backend.set_frame(None)
+    assert backend.capture(None).shape == (32, 64, 4)
+
+
+def test_crop_regions_returns_views_and_none_outside():
+    frame = np.arange(10 * 20 * 4, dtype=np.uint32).astype(np.uint8).reshape(10, 20, 4)
+    inside, outside = crop_regions(frame, [(2, 3, 4, 5), (18, 0, 4, 4)])
+    assert inside.shape == (5, 4, 3)
+    assert np.shares_memory(inside, frame)
+    assert outside is None
+
+
+def test_benchmarks_run_with_synthetic_backend():
+    backend = SyntheticCaptureBackend(size=(200, 100))
+    rate = measure_capture_rate(backend, iterations=5)
+    assert rate['iterations'] == 5 and rate['failures'] == 0
+    batched = benchmark_batched_regions(backend, [(0, 0, 10, 10), (20, 20, 10, 10)], iterations=3)
+    assert batched['regions'] == 2
+
+
+def test_benchmark_entry_point_runs_headless():
+    """화면이 없는 환경에서도 `python -m`으로 벤치마크를 실행할 수 있어야 함"""
+    env = {key: value for key, value in os.environ.items() if key != 'DISPLAY'}
+    result = subprocess.run(
+        [sys.executable, "-m", "BE.function._common_components.capture_backend"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    assert "[캡처 속도] synthetic 800x600" in result.stdout
+    assert "[다중 영역 캡처] synthetic 800x600, 영역 8개" in result.stdout
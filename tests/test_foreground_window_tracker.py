@@ -0,0 +1,107 @@
+import pytest
+
+from BE.function._common_components import foreground_window_tracker
+from BE.function._common_components.foreground_window_tracker import (
+    ForegroundWindowTracker, FakeForegroundBackend, WinEventForegroundBackend
+)
+from BE.function._common_components.win_event_hook import (
+    EVENT_OBJECT_NAMECHANGE, EVENT_SYSTEM_FOREGROUND, OBJID_WINDOW
+)
+
+NOTEPAD = {'pid': 100, 'name': "메모장", 'title': "메모장", 'hwnd': 1}
+BROWSER = {'pid': 200, 'name': "브라우저", 'title': "브라우저", 'hwnd': 2}
+
+
+@pytest.fixture
+def tracker():
+    """가짜 백엔드로 만든 추적기 (싱글톤 인스턴스는 건드리지 않음)"""
+    saved = ForegroundWindowTracker._instance
+    ForegroundWindowTracker._instance = None
+    tracker = ForegroundWindowTracker(backend=FakeForegroundBackend(NOTEPAD))
+    ForegroundWindowTracker._instance = saved
+    yield tracker
+    tracker.stop()
+
+
+def test_start_reads_initial_foreground(tracker):
+    tracker.start()
+    assert tracker.active_process == NOTEPAD
+
+
+def test_set_foreground_updates_cache_and_emits_once(tracker):
+    changes = []
+    tracker.active_process_changed.connect(changes.append)
+    tracker.start()
+    changes.clear()
+
+    tracker.backend.set_foreground(BROWSER)
+    tracker.backend.set_foreground(BROWSER)  # 같은 프로세스면 시그널 없음
+    tracker.backend.set_foreground(None)
+
+    assert changes == [BROWSER, None]
+    assert tracker.active_process is None
+
+
+def test_stop_detaches_backend(tracker):
+    tracker.start()
+    tracker.stop()
+    tracker.backend.set_foreground(BROWSER)
+    assert tracker.active_process == NOTEPAD
+
+
+def test_set_backend_restarts_with_new_backend(tracker):
+    tracker.start()
+    tracker.set_backend(FakeForegroundBackend(BROWSER))
+    assert tracker.active_process == BROWSER
+    tracker.backend.set_foreground(NOTEPAD)
+    assert tracker.active_process == NOTEPAD
+
+
+class FakeWinEventHook:
+    """WinEventHook 대신 설치된 훅을 기록하고, fire()로 이벤트를 흉내내는 가짜 훅"""
+
+    WINDOW_PIDS = {1: 100, 2: 200, 3: 200}
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.hooks = set()  # (event, pid)
+
+    def install(self, event, pid=0):
+        self.hooks.add((event, pid))
+        return True
+
+    def uninstall(self, event, pid=0):
+        self.hooks.discard((event, pid))
+
+    def uninstall_all(self):
+        self.hooks = set()
+
+    def get_foreground_window(self):
+        return 1
+
+    def get_window_pid(self, hwnd):
+        return self.WINDOW_PIDS.get(hwnd, 0)
+
+    def fire(self, event, hwnd):
+        self.callback(event, hwnd, OBJID_WINDOW, 0)
+
+
+def test_name_change_hook_follows_foreground_process(monkeypatch):
+    monkeypatch.setattr(foreground_window_tracker, 'WinEventHook', FakeWinEventHook)
+    changes = []
+    backend = WinEventForegroundBackend()
+    assert backend.start(lambda: changes.append(backend._foreground_hwnd))
+    hook = backend._win_event_hook
+
+    # 모든 프로세스가 아니라 포그라운드 창의 프로세스에만 제목 변경 훅 설치
+    assert hook.hooks == {(EVENT_SYSTEM_FOREGROUND, 0), (EVENT_OBJECT_NAMECHANGE, 100)}
+
+    hook.fire(EVENT_SYSTEM_FOREGROUND, 2)
+    assert hook.hooks == {(EVENT_SYSTEM_FOREGROUND, 0), (EVENT_OBJECT_NAMECHANGE, 200)}
+
+    hook.fire(EVENT_OBJECT_NAMECHANGE, 3)  # 같은 프로세스의 다른 창은 무시
+    hook.fire(EVENT_OBJECT_NAMECHANGE, 2)
+    assert changes == [2, 2]
+
+    backend.stop()
+    assert backend._win_event_hook is None
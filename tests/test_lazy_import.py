@@ -0,0 +1,34 @@
+import sys
+import textwrap
+
+from BE.function._common_components.lazy_import import get_load_times, lazy_import, preload
+
+
+def test_lazy_module_waits_for_module_being_preloaded(tmp_path, monkeypatch):
+    """preload가 불러오는 중인 모듈을 사용하면 초기화가 끝날 때까지 기다려야 함"""
+    (tmp_path / "lazy_import_slow_module.py").write_text(textwrap.dedent("""
+        import time
+        time.sleep(0.3)
+
+        def zeros():
+            return 0
+    """), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_import_slow_module", raising=False)
+
+    results = {}
+    thread = preload(["lazy_import_slow_module"], on_loaded=results.update)
+    while "lazy_import_slow_module" not in sys.modules:
+        pass  # 다른 스레드가 모듈을 sys.modules에 넣고 초기화하는 중
+
+    assert lazy_import("lazy_import_slow_module").zeros() == 0
+    thread.join(5)
+    assert results["lazy_import_slow_module"] is not None
+    assert "lazy_import_slow_module" in get_load_times()
+    monkeypatch.delitem(sys.modules, "lazy_import_slow_module", raising=False)
+
+
+def test_lazy_module_loads_on_first_attribute():
+    json_module = lazy_import("json")
+    assert json_module.dumps([1]) == "[1]"
+    assert json_module.is_loaded()
@@ -0,0 +1,24 @@
+import json
+from urllib.request import urlopen
+
+from BE.log.metrics_server import MetricsServer
+
+
+def test_metrics_server_serves_prometheus_and_json():
+    """Windows가 아닌 환경에서도 서버를 열고 두 형식을 조회할 수 있어야 함"""
+    server = MetricsServer.instance()
+    server.register_provider("test", lambda: {'value': 3, 'label': "text"})
+    assert server.start(port=0)
+    try:
+        base_url = f"http://127.0.0.1:{server.port}"
+        with urlopen(base_url + "/metrics") as response:
+            text = response.read().decode('utf-8')
+        with urlopen(base_url + "/metrics.json") as response:
+            data = json.loads(response.read())
+    finally:
+        server.stop()
+        server.unregister_provider("test")
+
+    assert 'be_component{component="test",key="value"} 3' in text
+    assert data['components']['test'] == {'value': 3, 'label': "text"}
+    assert data['process']['rss_bytes'] > 0
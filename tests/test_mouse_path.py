@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from BE.function._common_components.mouse_path import (
+    RecordingMouseBackend, generate_mouse_path, play_mouse_path
+)
+
+
+class FakeClock:
+    """가짜 시계: 읽을 때마다 tick만큼, sleep하면 그만큼 흐름 (스케줄 지연은 delays로 흉내냄)"""
+
+    def __init__(self, tick=0.0001, delays=None):
+        self.now = 0.0
+        self._tick = tick  # 바쁜 대기 중에도 시간이 흐르도록 읽을 때마다 더하는 시간 (초)
+        self._delays = dict(delays or {})  # sleep 호출 순번 -> 추가로 밀리는 시간 (초)
+        self._sleeps = 0
+        self.slept = 0.0  # sleep으로 보낸 시간 합계 (초)
+
+    def __call__(self):
+        self.now += self._tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds + self._delays.get(self._sleeps, 0.0)
+        self._sleeps += 1
+
+
+@pytest.mark.parametrize("curve", ['linear', 'ease', 'bezier'])
+def test_generate_mouse_path_ends_at_target(curve):
+    points, offsets = generate_mouse_path((0, 0), (300, 100), duration=0.1, rate_hz=500, curve=curve)
+    assert len(points) == len(offsets) == 50
+    assert tuple(points[-1]) == (300, 100)
+    assert np.all(np.diff(offsets) > 0)
+
+
+def test_play_mouse_path_sends_each_point_on_its_deadline():
+    clock = FakeClock()
+    backend = RecordingMouseBackend(clock=clock)
+    points, offsets = generate_mouse_path((0, 0), (100, 0), duration=0.02, rate_hz=500)
+
+    start_time = play_mouse_path(points, offsets, backend, clock=clock, sleep=clock.sleep)
+
+    assert backend.points == [tuple(point) for point in points.tolist()]
+    assert np.allclose(backend.get_point_spacing(), 10.0)
+    errors = backend.get_timing_errors(offsets, start_time)
+    assert np.all(errors >= 0)
+    assert np.all(errors < 0.002)
+
+
+def test_play_mouse_path_sleeps_between_points_at_default_rate():
+    """500Hz(2ms 간격)에서도 대부분의 시간을 바쁜 대기가 아니라 sleep으로 보내야 함"""
+    clock = FakeClock(tick=0.00001)
+    backend = RecordingMouseBackend(clock=clock)
+    points, offsets = generate_mouse_path((0, 0), (400, 0), duration=0.2)
+
+    play_mouse_path(points, offsets, backend, clock=clock, sleep=clock.sleep)
+
+    assert len(backend.points) == len(points)
+    assert clock.slept > 0.2 * 0.7
+
+
+def test_play_mouse_path_batches_overdue_points_without_drift():
+    # 세 번째 대기에서 25ms 밀림 -> 밀린 좌표는 한 배치로 보내고, 이후 좌표는 원래 시각을 지킴
+    clock = FakeClock(delays={2: 0.025})
+    backend = RecordingMouseBackend(clock=clock)
+    points, offsets = generate_mouse_path((0, 0), (200, 0), duration=0.1, rate_hz=100)
+
+    start_time = play_mouse_path(points, offsets, backend, clock=clock, sleep=clock.sleep)
+
+    assert len(backend.points) == len(points)
+    assert max(backend.batch_sizes) > 1
+    errors = backend.get_timing_errors(offsets, start_time)
+    late = errors > 0.002
+    assert late.any()
+    assert not late[-5:].any()
+
+
+def test_recording_backend_records_buttons():
+    clock = FakeClock(tick=0.0)
+    backend = RecordingMouseBackend(clock=clock)
+    backend.button("left", True)
+    clock.sleep(0.01)
+    backend.button("left", False)
+    assert backend.button_events == [("left", True, 0.0), ("left", False, 0.01)]
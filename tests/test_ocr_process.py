@@ -0,0 +1,37 @@
+import multiprocessing
+import subprocess
+import sys
+
+from conftest import ROOT_DIR
+from BE.function._common_components.ocr_process import ocr_process_main
+
+
+def test_ocr_process_module_does_not_import_gui_or_log_modules():
+    """spawn 자식 프로세스가 불러오는 모듈은 Qt, 로그 매니저, win32, OCR 모델을 함께 불러오지 않아야 함"""
+    code = (
+        "import sys\n"
+        "import BE.function._common_components.ocr_process\n"
+        "prefixes = ('PySide6', 'BE.log', 'win32', 'cv2', 'torch', 'easyocr')\n"
+        "print(','.join(name for name in sys.modules if name.startswith(prefixes)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_ocr_process_main_starts_under_spawn():
+    """spawn으로 시작한 작업 프로세스가 준비 또는 로딩 실패 응답을 보내고, 종료 요청에 끝나야 함"""
+    context = multiprocessing.get_context('spawn')
+    requests, responses = context.Queue(), context.Queue()
+    process = context.Process(target=ocr_process_main, args=(requests, responses, ('en',), False, 1), daemon=True)
+    process.start()
+    try:
+        request_id, status, value = responses.get(timeout=180)
+        assert request_id is None
+        assert status in ('ready', 'error')
+        requests.put(None)
+        process.join(30)
+        assert not process.is_alive()
+    finally:
+        if process.is_alive():
+            process.terminate()
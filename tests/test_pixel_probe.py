@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from BE.function._common_components.pixel_probe import PixelProbeSet
+
+
+def _frame(width=20, height=10, channels=4):
+    """검은 바탕 BGR(A) 프레임"""
+    return np.zeros((height, width, channels), dtype=np.uint8)
+
+
+def test_expected_color_is_rgb_compared_against_bgr_frame():
+    probes = PixelProbeSet([{'x': 3, 'y': 2, 'rgb': [255, 0, 0], 'tolerance': 0}])  # 빨강
+    frame = _frame()
+    frame[2, 3] = (0, 0, 255, 255)  # BGRA 빨강
+    assert probes.check(frame, origin=(0, 0))
+
+    frame[2, 3] = (255, 0, 0, 255)  # BGRA 파랑
+    assert not probes.check(frame, origin=(0, 0))
+
+
+@pytest.mark.parametrize("value, expected", [(110, True), (90, True), (111, False), (89, False)])
+def test_tolerance_bounds_are_inclusive(value, expected):
+    probes = PixelProbeSet([{'x': 0, 'y': 0, 'rgb': [100, 100, 100], 'tolerance': 10}])
+    frame = _frame(channels=3)
+    frame[0, 0] = (100, value, 100)
+    assert probes.check(frame, origin=(0, 0)) is expected
+
+
+def test_tolerance_is_clipped_at_channel_limits():
+    probes = PixelProbeSet([{'x': 0, 'y': 0, 'rgb': [250, 5, 0], 'tolerance': 20}])
+    frame = _frame()
+    frame[0, 0] = (0, 0, 255, 255)
+    assert probes.check(frame, origin=(0, 0))
+
+
+def test_all_and_any_modes():
+    probes = PixelProbeSet([
+        {'x': 1, 'y': 1, 'rgb': [0, 255, 0], 'tolerance': 0},
+        {'x': 5, 'y': 4, 'rgb': [0, 255, 0], 'tolerance': 0},
+    ])
+    frame = _frame()
+    frame[1, 1] = (0, 255, 0, 255)
+
+    assert probes.evaluate(frame, origin=(0, 0)).tolist() == [True, False]
+    assert not probes.check(frame, mode='all', origin=(0, 0))
+    assert probes.check(frame, mode='any', origin=(0, 0))
+    with pytest.raises(ValueError):
+        probes.check(frame, mode='most', origin=(0, 0))
+
+
+def test_bounds_and_default_origin():
+    probes = PixelProbeSet([
+        {'x': 10, 'y': 20, 'rgb': [1, 2, 3]},
+        {'x': 14, 'y': 22, 'rgb': [1, 2, 3]},
+    ])
+    assert probes.bounds == (10, 20, 5, 3)
+
+    # bounds 영역만 잘라낸 프레임은 origin 없이 평가
+    crop = _frame(width=5, height=3)
+    crop[0, 0] = crop[2, 4] = (3, 2, 1, 255)
+    assert probes.check(crop)
+
+
+def test_points_outside_frame_are_false():
+    probes = PixelProbeSet([
+        {'x': 2, 'y': 2, 'rgb': [0, 0, 0], 'tolerance': 0},
+        {'x': 50, 'y': 2, 'rgb': [0, 0, 0], 'tolerance': 0},  # 프레임 오른쪽 밖
+        {'x': 2, 'y': -1, 'rgb': [0, 0, 0], 'tolerance': 0},  # 프레임 위쪽 밖
+    ])
+    result = probes.evaluate(_frame(), origin=(0, 0))
+    assert result.tolist() == [True, False, False]
+    assert probes.check(_frame(), mode='any', origin=(0, 0))
+    assert not probes.check(_frame(), mode='all', origin=(0, 0))
+
+
+def test_empty_probe_list_is_rejected():
+    with pytest.raises(ValueError):
+        PixelProbeSet([])
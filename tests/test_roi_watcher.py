@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from BE.function._common_components.capture_backend import SyntheticCaptureBackend
+from BE.function._common_components.roi_watcher import INTERVAL_BACKOFF, RoiWatcher, RoiWatcherService
+
+PROBES = [{'x': 10, 'y': 5, 'rgb': [255, 0, 255], 'tolerance': 0},
+          {'x': 12, 'y': 6, 'rgb': [255, 0, 255], 'tolerance': 0}]
+
+
+def _frame(lit=False):
+    """검은 프레임. lit이면 감시 지점들을 기대 색상으로 칠함"""
+    frame = np.zeros((40, 64, 4), dtype=np.uint8)
+    if lit:
+        for probe in PROBES:
+            frame[probe['y'], probe['x']] = (255, 0, 255, 255)
+    return frame
+
+
+class StopAfter:
+    """_run 루프가 기다린 시간을 기록하고 count번 기다린 뒤 멈추게 하는 _stop_event 대체"""
+
+    def __init__(self, count, on_wait=None):
+        self.waits = []
+        self._count = count
+        self._on_wait = on_wait
+
+    def is_set(self):
+        return len(self.waits) >= self._count
+
+    def wait(self, seconds):
+        self.waits.append(seconds)
+        if self._on_wait:
+            self._on_wait(len(self.waits))
+
+
+@pytest.fixture
+def service():
+    """합성 백엔드와 픽셀 조건 하나로 구성한 감시 서비스 (싱글톤 인스턴스는 건드리지 않음)"""
+    saved = RoiWatcherService._instance
+    RoiWatcherService._instance = None
+    service = RoiWatcherService()
+    RoiWatcherService._instance = saved
+
+    backend = SyntheticCaptureBackend(size=(64, 40))
+    backend.set_frame(_frame())
+    service._backend, service._hwnd = backend, None
+    service.set_watchers({'logic-1': {'type': 'pixel_check', 'probes': PROBES, 'mode': 'all', 'cooldown': 1.0}})
+    service.fired = []
+    service.triggered.connect(service.fired.append)
+    return service
+
+
+def test_should_fire_on_rising_edge_after_cooldown():
+    watcher = RoiWatcher('logic-1', {'type': 'pixel_check', 'probes': PROBES, 'cooldown': 1.0})
+    assert watcher.should_fire(True, now=10.0)
+    assert not watcher.should_fire(True, now=10.1)   # 계속 충족 중이면 다시 트리거하지 않음
+    assert not watcher.should_fire(False, now=10.2)
+    assert not watcher.should_fire(True, now=10.5)   # 상승 에지지만 cooldown 안
+    assert not watcher.should_fire(False, now=11.2)
+    assert watcher.should_fire(True, now=11.5)
+
+
+def test_unknown_condition_type_is_rejected():
+    with pytest.raises(ValueError):
+        RoiWatcher('logic-1', {'type': 'read_text'})
+
+
+def test_tick_fires_once_when_condition_becomes_true(service):
+    assert service.tick() is True  # 첫 평가는 변화로 보지만 조건이 거짓이므로 트리거 없음
+    assert service.fired == []
+    assert service.tick() is False  # 화면이 그대로면 비활성
+
+    service._backend.set_frame(_frame(lit=True))
+    assert service.tick() is True
+    assert service.fired == ['logic-1']
+
+    service.tick()
+    assert service.fired == ['logic-1']
+
+    # cooldown 안에 꺼졌다 다시 켜져도 트리거하지 않음
+    service._backend.set_frame(_frame())
+    service.tick()
+    service._backend.set_frame(_frame(lit=True))
+    service.tick()
+    assert service.fired == ['logic-1']
+    assert service.get_metrics()['fired'] == 1
+
+
+def test_run_backs_off_while_idle_and_resets_on_change(service):
+    service.configure(min_interval=0.01, max_interval=0.05, cpu_budget=1.0)
+    service.interval = service.min_interval
+
+    def on_wait(count):
+        if count == 8:
+            service._backend.set_frame(_frame(lit=True))  # 화면 변화 -> 다음 틱에서 최소 간격으로
+
+    service._stop_event = StopAfter(9, on_wait)
+    service._run()
+
+    intervals = [0.01 * INTERVAL_BACKOFF ** step for step in range(1, 8)]
+    expected = [min(interval, 0.05) for interval in intervals]
+    waits = service._stop_event.waits
+    # 틱 작업 시간만큼 덜 기다리므로 간격 이하이며, 간격은 최대 간격을 넘지 않음
+    assert all(wait <= interval + 1e-9 for wait, interval in zip(waits[1:8], expected))
+    assert waits[7] > 0.04
+    assert service.interval == service.min_interval
+    assert service.fired == ['logic-1']
@@ -0,0 +1,62 @@
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from BE.function._common_components.system_state_bus import SystemStateBus
+
+
+@pytest.fixture
+def bus():
+    """기본 간격의 새 상태 버스 (싱글톤 인스턴스는 건드리지 않음)"""
+    app = QCoreApplication.instance() or QCoreApplication([])  # QTimer 사용
+    saved = SystemStateBus._instance
+    SystemStateBus._instance = None
+    bus = SystemStateBus()
+    SystemStateBus._instance = saved
+    yield bus
+    bus._timer.stop()
+    del app
+
+
+def test_timer_runs_only_while_polled_topics_have_subscribers(bus):
+    assert not bus.is_polling
+    subscription = bus.subscribe(SystemStateBus.TOPIC_FOREGROUND, lambda value: None)
+    assert not bus.is_polling
+    bus.unsubscribe(subscription)
+
+
+def test_fast_interval_only_while_buttons_subscribed(bus):
+    alive = bus.subscribe(SystemStateBus.TOPIC_PROCESS_ALIVE, lambda value: None)
+    assert bus.is_polling
+    assert bus.interval_ms == bus.get_interval(SystemStateBus.TOPIC_PROCESS_ALIVE) == 250
+
+    buttons = bus.subscribe(SystemStateBus.TOPIC_BUTTONS, lambda value: None, keys=(0x01,))
+    assert bus.interval_ms == 5
+
+    bus.unsubscribe(buttons)
+    assert bus.interval_ms == 250
+    bus.unsubscribe(alive)
+    assert not bus.is_polling
+
+
+def test_poll_samples_each_topic_at_its_own_rate(bus, monkeypatch):
+    samples = []
+    now = [100.0]
+    monkeypatch.setattr('BE.function._common_components.system_state_bus.time.perf_counter', lambda: now[0])
+    monkeypatch.setattr(bus, '_is_selected_process_alive', lambda: samples.append('alive') or True)
+    bus.subscribe(SystemStateBus.TOPIC_PROCESS_ALIVE, lambda value: None)
+    bus.subscribe(SystemStateBus.TOPIC_BUTTONS, lambda value: None, keys=(0x01,))
+    samples.clear()
+
+    for _ in range(100):  # 5ms 간격으로 0.5초
+        now[0] += 0.005
+        bus._poll()
+
+    assert samples.count('alive') == 2  # 250ms 간격
+
+
+def test_set_interval_updates_running_timer(bus):
+    bus.subscribe(SystemStateBus.TOPIC_PROCESS_ALIVE, lambda value: None)
+    bus.set_interval(SystemStateBus.TOPIC_PROCESS_ALIVE, 100)
+    assert bus.interval_ms == 100
+    with pytest.raises(ValueError):
+        bus.set_interval(SystemStateBus.TOPIC_FOREGROUND, 10)
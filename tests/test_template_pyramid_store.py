@@ -0,0 +1,84 @@
+import sqlite3
+
+import cv2
+import numpy as np
+import pytest
+
+from BE.function._common_components import template_pyramid_store
+from BE.function._common_components.template_pyramid_store import TemplatePyramidStore
+from BE.function.make_logic.repository_and_service.all_logics_data_repository_and_service import (
+    AllLogicsDataRepositoryAndService
+)
+
+
+class FakeDatabaseConnection:
+    """임시 DB 경로만 제공하는 DatabaseConnection 대체"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def get_instance(self):
+        return self
+
+
+class FakeSettingsManager:
+    def __init__(self, logics):
+        self.settings = {'logics': logics}
+
+    def _load_settings(self):
+        return self.settings
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 DB를 쓰는 템플릿 저장소 (싱글톤 인스턴스는 건드리지 않음)"""
+    db_path = tmp_path / "logic.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("""
+            CREATE TABLE template_pyramids (
+                template_key TEXT NOT NULL, kind TEXT NOT NULL, level INTEGER NOT NULL,
+                scale REAL NOT NULL, width INTEGER NOT NULL, height INTEGER NOT NULL, data BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (template_key, kind, level)
+            )
+        """)
+    monkeypatch.setattr(template_pyramid_store, 'DatabaseConnection', FakeDatabaseConnection(db_path))
+    saved = TemplatePyramidStore._instance
+    TemplatePyramidStore._instance = None
+    store = TemplatePyramidStore()
+    TemplatePyramidStore._instance = store
+    yield store
+    TemplatePyramidStore._instance = saved
+
+
+def _write_template(path, seed):
+    cv2.imwrite(str(path), np.random.default_rng(seed).integers(0, 256, (24, 24), dtype=np.uint8))
+    return str(path)
+
+
+def test_delete_unused_removes_only_unreferenced_templates(store, tmp_path):
+    kept = store.store_from_file(_write_template(tmp_path / "kept.png", 1))
+    dropped = store.store_from_file(_write_template(tmp_path / "dropped.png", 2))
+    assert store.get(dropped) is not None
+
+    store.delete_unused({kept})
+
+    assert store.get(kept) is not None
+    assert store.get(dropped) is None
+
+
+def test_repository_removes_templates_no_logic_references(store, tmp_path):
+    kept = store.store_from_file(_write_template(tmp_path / "step.png", 3))
+    trigger = store.store_from_file(_write_template(tmp_path / "trigger.png", 4))
+    dropped = store.store_from_file(_write_template(tmp_path / "old.png", 5))
+    logics = {
+        'logic-1': {
+            'items': [{'type': 'image_search', 'template_key': kept}, {'type': 'delay'}],
+            'screen_trigger': {'type': 'image_search', 'template_key': trigger}
+        }
+    }
+
+    AllLogicsDataRepositoryAndService(FakeSettingsManager(logics)).remove_unused_templates()
+
+    assert store.get(kept) is not None
+    assert store.get(trigger) is not None
+    assert store.get(dropped) is None